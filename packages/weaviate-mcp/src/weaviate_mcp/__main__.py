@@ -12,6 +12,7 @@ from weaviate_mcp.tools import (
     data_tools,  # noqa: F401
     ingestion_tools,  # noqa: F401
     schema_tools,  # noqa: F401
+    tenant_tools,  # noqa: F401
 )
 
 
@@ -2,7 +2,28 @@
 Central application instance definition.
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from mcp.server.fastmcp import FastMCP
 
+from .services.embedding_service import close_query_embedder
+from .services.ingestion_service import close_http_client, close_signature_index, shutdown_chunking_executor
+from .services.weaviate_service import close_weaviate_service
+
+
+@asynccontextmanager
+async def app_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Own the shared clients, query embedder, chunking pool and signature index for the lifetime of the server."""
+    try:
+        yield
+    finally:
+        shutdown_chunking_executor()
+        await close_http_client()
+        await close_query_embedder()
+        close_signature_index()
+        await close_weaviate_service()
+
+
 # Central FastMCP instance
-mcp = FastMCP(name="weaviate-mcp")
+mcp = FastMCP(name="weaviate-mcp", lifespan=app_lifespan)
@@ -44,3 +44,176 @@ def get_weaviate_config():
 
     logger.info(f"Parsed Weaviate config from environment: {config}")
     return config
+
+
+def get_chunking_workers() -> int | None:
+    """
+    Parse WEAVIATE_CHUNKING_WORKERS from environment variables.
+
+    Returns:
+        int or None: Number of chunking worker processes, or None to use one per CPU
+    """
+    workers = os.environ.get("WEAVIATE_CHUNKING_WORKERS")
+    if workers is None:
+        return None
+    try:
+        value = int(workers)
+    except ValueError:
+        logger.warning(f"Environment variable WEAVIATE_CHUNKING_WORKERS is not a valid integer: {workers}")
+        return None
+    return value if value > 0 else None
+
+
+def get_tokenizer_config():
+    """
+    Parse WEAVIATE_TOKENIZER and WEAVIATE_TIKTOKEN_BPE_FILE from environment variables.
+
+    Returns:
+        dict: {
+            "tokenizer": str, name of the tokenizer used for chunking ("tiktoken" by default),
+            "bpe_file": str or None, local path of the cl100k_base BPE file
+        }
+    """
+    return {
+        "tokenizer": os.environ.get("WEAVIATE_TOKENIZER") or "tiktoken",
+        "bpe_file": os.environ.get("WEAVIATE_TIKTOKEN_BPE_FILE") or None,
+    }
+
+
+def get_crawl_checkpoint_dir() -> str:
+    """
+    Parse WEAVIATE_CRAWL_CHECKPOINT_DIR from environment variables.
+
+    Returns:
+        str: Directory where crawl checkpoints are stored (~/.cache/weaviate-mcp/crawls by default)
+    """
+    return os.environ.get("WEAVIATE_CRAWL_CHECKPOINT_DIR") or os.path.expanduser("~/.cache/weaviate-mcp/crawls")
+
+
+def get_html_extractor_name() -> str:
+    """
+    Parse WEAVIATE_HTML_EXTRACTOR from environment variables.
+
+    Returns:
+        str: HTML extraction backend ("auto" by default: lxml if installed, otherwise stdlib)
+    """
+    return os.environ.get("WEAVIATE_HTML_EXTRACTOR") or "auto"
+
+
+def get_max_download_bytes() -> int:
+    """
+    Parse WEAVIATE_MAX_DOWNLOAD_BYTES from environment variables.
+
+    Returns:
+        int: Largest response body downloaded for URL ingestion, in bytes (20 MiB by default)
+    """
+    value = os.environ.get("WEAVIATE_MAX_DOWNLOAD_BYTES")
+    if value is None:
+        return 20 * 1024 * 1024
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        logger.warning(f"Environment variable WEAVIATE_MAX_DOWNLOAD_BYTES is not a valid integer: {value}")
+        return 20 * 1024 * 1024
+
+
+def get_query_cache_config():
+    """
+    Parse WEAVIATE_QUERY_CACHE_SIZE and WEAVIATE_QUERY_CACHE_TTL from environment variables.
+
+    Returns:
+        dict: {
+            "max_entries": int, maximum number of cached search results (256 by default, 0 disables the cache),
+            "ttl_seconds": float, seconds a cached result is served (300 by default, 0 disables the cache)
+        }
+    """
+    size = os.environ.get("WEAVIATE_QUERY_CACHE_SIZE")
+    ttl = os.environ.get("WEAVIATE_QUERY_CACHE_TTL")
+
+    def parse(value, var_name, default, cast):
+        if value is None:
+            return default
+        try:
+            return max(cast(value), 0)
+        except ValueError:
+            logger.warning(f"Environment variable {var_name} is not a valid number: {value}")
+            return default
+
+    return {
+        "max_entries": parse(size, "WEAVIATE_QUERY_CACHE_SIZE", 256, int),
+        "ttl_seconds": parse(ttl, "WEAVIATE_QUERY_CACHE_TTL", 300.0, float),
+    }
+
+
+def get_schema_cache_ttl() -> float:
+    """
+    Parse WEAVIATE_SCHEMA_CACHE_TTL from environment variables.
+
+    Returns:
+        float: Seconds the collection schema is served from cache (30 by default, 0 disables the cache)
+    """
+    ttl = os.environ.get("WEAVIATE_SCHEMA_CACHE_TTL")
+    if ttl is None:
+        return 30.0
+    try:
+        return max(float(ttl), 0.0)
+    except ValueError:
+        logger.warning(f"Environment variable WEAVIATE_SCHEMA_CACHE_TTL is not a valid number: {ttl}")
+        return 30.0
+
+
+def get_embedding_config():
+    """
+    Parse the client-side query embedding settings from environment variables.
+
+    Returns:
+        dict: {
+            "provider": str or None, WEAVIATE_QUERY_EMBEDDING ("openai", "hash" or a registered provider;
+                unset to let Weaviate's vectorizer module embed queries),
+            "model": str, WEAVIATE_EMBEDDING_MODEL ("text-embedding-3-small" by default),
+            "base_url": str, WEAVIATE_EMBEDDING_BASE_URL (the OpenAI API by default),
+            "cache_dir": str, WEAVIATE_EMBEDDING_CACHE_DIR (~/.cache/weaviate-mcp/embeddings by default),
+            "cache_size_mb": int, WEAVIATE_EMBEDDING_CACHE_SIZE_MB (100 by default, 0 disables the vector cache)
+        }
+    """
+    cache_size = os.environ.get("WEAVIATE_EMBEDDING_CACHE_SIZE_MB")
+    try:
+        cache_size_mb = max(int(cache_size), 0) if cache_size is not None else 100
+    except ValueError:
+        logger.warning(f"Environment variable WEAVIATE_EMBEDDING_CACHE_SIZE_MB is not a valid integer: {cache_size}")
+        cache_size_mb = 100
+
+    return {
+        "provider": os.environ.get("WEAVIATE_QUERY_EMBEDDING") or None,
+        "model": os.environ.get("WEAVIATE_EMBEDDING_MODEL") or "text-embedding-3-small",
+        "base_url": os.environ.get("WEAVIATE_EMBEDDING_BASE_URL") or "https://api.openai.com/v1",
+        "cache_dir": os.environ.get("WEAVIATE_EMBEDDING_CACHE_DIR") or os.path.expanduser("~/.cache/weaviate-mcp/embeddings"),
+        "cache_size_mb": cache_size_mb,
+    }
+
+
+def get_near_duplicate_config():
+    """
+    Parse the near-duplicate chunk filter settings from environment variables.
+
+    Returns:
+        dict: {
+            "index_dir": str, WEAVIATE_NEAR_DUPLICATE_DIR, where chunk signatures are stored
+                (~/.cache/weaviate-mcp/near_duplicates by default),
+            "threshold": float, WEAVIATE_NEAR_DUPLICATE_THRESHOLD, estimated Jaccard similarity of
+                the word shingles from which chunks count as near-duplicates (0.8 by default,
+                between 0.5 and 1; 1 only matches chunks with the same shingles)
+        }
+    """
+    value = os.environ.get("WEAVIATE_NEAR_DUPLICATE_THRESHOLD")
+    try:
+        threshold = min(max(float(value), 0.5), 1.0) if value is not None else 0.8
+    except ValueError:
+        logger.warning(f"Environment variable WEAVIATE_NEAR_DUPLICATE_THRESHOLD is not a valid number: {value}")
+        threshold = 0.8
+
+    return {
+        "index_dir": os.environ.get("WEAVIATE_NEAR_DUPLICATE_DIR")
+        or os.path.expanduser("~/.cache/weaviate-mcp/near_duplicates"),
+        "threshold": threshold,
+    }
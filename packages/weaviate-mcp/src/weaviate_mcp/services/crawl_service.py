@@ -0,0 +1,307 @@
+"""
+Crawl service for ingesting whole sites from a sitemap or a seed URL.
+
+Pages are fetched by a fixed number of workers sharing a frontier queue and
+fed into the IngestionService's streaming chunk-and-insert pipeline, so
+inserts overlap with fetching. Progress is checkpointed to disk so that an
+interrupted crawl can be resumed.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Any
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from ..config import get_crawl_checkpoint_dir
+from ..utils.crawl import (
+    CRAWLER_USER_AGENT,
+    UrlFilter,
+    checkpoint_path,
+    load_checkpoint,
+    normalize_url,
+    parse_sitemap,
+    save_checkpoint,
+)
+from .ingestion_service import IngestionService, validate_near_duplicate_options
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checkpoint writes while a crawl is running
+CHECKPOINT_INTERVAL = 5.0
+
+# Maximum number of sitemap files read from a sitemap index
+MAX_SITEMAPS = 50
+
+
+class CrawlService:
+    """Service for crawling sites into Weaviate collections."""
+
+    def __init__(self, ingestion_service: IngestionService):
+        """
+        Initialize the crawl service.
+
+        Args:
+            ingestion_service: IngestionService used to fetch, chunk and insert pages
+        """
+        self.ingestion_service = ingestion_service
+        # robots.txt rules per origin, fetched once per crawl service
+        self._robots: dict[str, asyncio.Future] = {}
+
+    async def crawl(
+        self,
+        start_url: str,
+        collection_name: str,
+        max_depth: int = 2,
+        max_pages: int = 100,
+        allowed_domains: list[str] | None = None,
+        include_patterns: list[str] | None = None,
+        exclude_patterns: list[str] | None = None,
+        respect_robots: bool = True,
+        concurrency: int = 8,
+        per_host_limit: int = 4,
+        max_tokens_per_chunk: int = 500,
+        chunk_overlap: int = 50,
+        insert_batch_size: int = 200,
+        crawl_id: str | None = None,
+        force: bool = False,
+        near_duplicates: str | None = None,
+        near_duplicate_scope: str = "collection",
+    ) -> dict[str, Any]:
+        """
+        Crawl a site and ingest its pages.
+
+        If start_url is a sitemap (ends in .xml), the pages it lists (following
+        sitemap indexes) are the depth-0 pages; otherwise start_url is the only
+        one. Links of pages above max_depth are followed while they pass the
+        domain, pattern and robots.txt checks, until max_pages pages were found.
+
+        Args:
+            start_url: Seed page or sitemap.xml URL
+            collection_name: Target Weaviate collection name
+            max_depth: Maximum number of links followed from a depth-0 page
+            max_pages: Maximum number of pages visited
+            allowed_domains: Domains (with subdomains) that may be visited, defaults to the start URL's host
+            include_patterns: Regular expressions of which a page URL must match at least one
+            exclude_patterns: Regular expressions of which a page URL must match none
+            respect_robots: Skip pages disallowed by the site's robots.txt
+            concurrency: Number of pages fetched concurrently
+            per_host_limit: Maximum number of concurrent fetches per host
+            max_tokens_per_chunk: Maximum tokens per chunk
+            chunk_overlap: Number of tokens to overlap between chunks
+            insert_batch_size: Target number of chunks per insert call
+            crawl_id: Identifier under which progress is checkpointed; running
+                an unfinished crawl again with the same ID resumes it
+            force: Re-ingest pages even if they are unchanged
+            near_duplicates: Optional near-duplicate chunk filter, "skip" or "link"
+                (see IngestionService.sync_source_chunks)
+            near_duplicate_scope: "collection" (default) or "source"
+
+        Returns:
+            Dictionary with per-page status and throughput statistics, or error details
+        """
+        start_time = time.perf_counter()
+
+        if error := validate_near_duplicate_options(near_duplicates, near_duplicate_scope):
+            return {"error": True, "message": error}
+
+        seed = normalize_url(start_url)
+        if seed is None:
+            return {"error": True, "message": f"Invalid start URL: {start_url}"}
+
+        try:
+            url_filter = UrlFilter(allowed_domains or [urlparse(seed).hostname], include_patterns, exclude_patterns)
+        except ValueError as e:
+            return {"error": True, "message": str(e)}
+
+        path = checkpoint_path(get_crawl_checkpoint_dir(), crawl_id) if crawl_id else None
+        try:
+            state = load_checkpoint(path) if path else None
+        except (OSError, ValueError) as e:
+            return {"error": True, "message": f"Failed to read crawl checkpoint {path}: {e}"}
+
+        resumed = bool(state and not state.get("completed"))
+        if resumed:
+            if state["collection_name"] != collection_name:
+                return {
+                    "error": True,
+                    "message": f"Crawl '{crawl_id}' was started for collection '{state['collection_name']}'",
+                }
+            # Depth of every page found so far, and the status of every finished page
+            discovered: dict[str, int] = state["discovered"]
+            statuses: dict[str, dict[str, Any]] = state["pages"]
+            logger.info(f"Resuming crawl '{crawl_id}': {len(statuses)} of {len(discovered)} pages done")
+        else:
+            seeds = [seed]
+            if urlparse(seed).path.lower().endswith(".xml"):
+                sitemap_result = await self._read_sitemaps(seed, url_filter, max_pages)
+                if sitemap_result.get("error"):
+                    return sitemap_result
+                seeds = sitemap_result["urls"]
+            discovered = dict.fromkeys(seeds[: max(max_pages, 0)], 0)
+            statuses = {}
+
+        def save() -> None:
+            snapshot = {
+                "start_url": seed,
+                "collection_name": collection_name,
+                "completed": completed,
+                "discovered": discovered,
+                "pages": {url: status for url, status in statuses.items() if status["status"] != "pending"},
+            }
+            try:
+                save_checkpoint(path, snapshot)
+            except OSError as e:
+                logger.warning(f"Failed to write crawl checkpoint {path}: {e}")
+
+        frontier: asyncio.Queue = asyncio.Queue()
+        for url in discovered:
+            if url not in statuses:
+                frontier.put_nowait(url)
+
+        host_semaphores: defaultdict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(max(per_host_limit, 1)))
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(concurrency, 1) * 2)
+        bytes_downloaded = 0
+        completed = False
+
+        async def visit(url: str) -> None:
+            nonlocal bytes_downloaded
+            depth = discovered[url]
+            status = statuses[url] = {"url": url, "status": "pending", "depth": depth}
+            if respect_robots and not await self._allowed_by_robots(url):
+                status.update(status="skipped", message="Disallowed by robots.txt")
+                return
+
+            async with host_semaphores[urlparse(url).netloc]:
+                content_result = await self.ingestion_service.fetch_source(
+                    url, collection_name, force, extract_links=depth < max_depth
+                )
+
+            for link in content_result.get("links", []):
+                if len(discovered) >= max_pages:
+                    break
+                if link not in discovered and url_filter.allows(link):
+                    discovered[link] = depth + 1
+                    frontier.put_nowait(link)
+
+            bytes_downloaded += await self.ingestion_service.queue_source(
+                url,
+                collection_name,
+                content_result,
+                queue,
+                status,
+                max_tokens_per_chunk,
+                chunk_overlap,
+                near_duplicates,
+                near_duplicate_scope,
+            )
+
+        async def work() -> None:
+            while True:
+                url = await frontier.get()
+                try:
+                    await visit(url)
+                except Exception as e:
+                    logger.error(f"Error crawling {url}: {e}")
+                    statuses.setdefault(url, {"url": url}).update(status="failed", message=str(e))
+                finally:
+                    frontier.task_done()
+
+        async def checkpoint() -> None:
+            while True:
+                await asyncio.sleep(CHECKPOINT_INTERVAL)
+                save()
+
+        async def crawl_frontier() -> None:
+            await frontier.join()
+            await queue.put(None)
+
+        tasks = [asyncio.create_task(work()) for _ in range(max(concurrency, 1))]
+        if path:
+            tasks.append(asyncio.create_task(checkpoint()))
+        try:
+            await self.ingestion_service.run_pipeline(
+                crawl_frontier(),
+                self.ingestion_service.consume_source_queue(collection_name, queue, statuses, insert_batch_size),
+            )
+            completed = True
+        finally:
+            for task in tasks:
+                task.cancel()
+            if path:
+                save()
+
+        result = self.ingestion_service.summarize_url_results(
+            collection_name, statuses, time.perf_counter() - start_time, bytes_downloaded
+        )
+        result.update(start_url=seed, pages_discovered=len(discovered), resumed=resumed)
+        if path:
+            result.update(crawl_id=crawl_id, checkpoint_path=path)
+        return result
+
+    async def _read_sitemaps(self, sitemap_url: str, url_filter: UrlFilter, max_pages: int) -> dict[str, Any]:
+        """
+        Collect the allowed page URLs of a sitemap, following sitemap indexes.
+
+        Sitemaps are downloaded with the size limit and content-type check of URL ingestion.
+        """
+        pending = [sitemap_url]
+        seen: set[str] = set()
+        urls: dict[str, None] = {}
+
+        while pending and len(seen) < MAX_SITEMAPS and len(urls) < max_pages:
+            current = pending.pop(0)
+            if current in seen:
+                continue
+            seen.add(current)
+
+            try:
+                fetched = await self.ingestion_service.download_text(current)
+                if fetched.get("error"):
+                    raise ValueError(fetched["message"])
+                if fetched["status_code"] >= 400:
+                    raise ValueError(f"HTTP error {fetched['status_code']}")
+                pages, sitemaps = parse_sitemap(fetched["text"])
+            except Exception as e:
+                if current == sitemap_url:
+                    return {"error": True, "message": f"Failed to read sitemap {current}: {e}"}
+                logger.warning(f"Skipping sitemap {current}: {e}")
+                continue
+
+            pending.extend(sitemaps)
+            for page in pages:
+                url = normalize_url(page)
+                if url and url_filter.allows(url):
+                    urls[url] = None
+
+        logger.info(f"Found {len(urls)} pages in {len(seen)} sitemaps of {sitemap_url}")
+        return {"urls": list(urls)}
+
+    async def _allowed_by_robots(self, url: str) -> bool:
+        """Check a URL against its site's robots.txt, fetched once per origin."""
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        if origin not in self._robots:
+            self._robots[origin] = asyncio.ensure_future(self._fetch_robots(origin))
+        rules = await self._robots[origin]
+        return rules.can_fetch(CRAWLER_USER_AGENT, url)
+
+    async def _fetch_robots(self, origin: str) -> RobotFileParser:
+        """Fetch and parse the robots.txt of an origin, with the size limit of URL ingestion."""
+        rules = RobotFileParser(f"{origin}/robots.txt")
+        fetched = await self.ingestion_service.download_text(rules.url)
+        if fetched.get("error"):
+            logger.warning(f"Failed to fetch {rules.url}, allowing all pages: {fetched['message']}")
+            rules.allow_all = True
+            return rules
+
+        # Same interpretation as RobotFileParser.read
+        if fetched["status_code"] in (401, 403):
+            rules.disallow_all = True
+        elif fetched["status_code"] >= 400:
+            rules.allow_all = True
+        else:
+            rules.parse(fetched["text"].splitlines())
+        return rules
@@ -0,0 +1,316 @@
+"""
+Client-side embedding of search queries with a persistent vector cache.
+
+When enabled with WEAVIATE_QUERY_EMBEDDING, search text is embedded here
+instead of by the collection's vectorizer module, and each vector is cached
+on disk keyed by a hash of the provider and text. Repeated searches, also
+with different filters or limits, then skip the embedding call. The provider
+must produce the same vectors as the collection's vectorizer, e.g. "openai"
+with the model configured in text2vec_openai. Available providers:
+
+- "openai": the OpenAI embeddings API, using WEAVIATE_OPENAI_API_KEY
+- "hash": a deterministic local stand-in based on hashed tokens, for tests
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from collections.abc import Callable
+from typing import Protocol
+
+import httpx
+
+from ..auth import get_openai_api_key
+from ..config import get_embedding_config
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+")
+
+
+class EmbeddingProvider(Protocol):
+    """Interface of an embedding provider."""
+
+    # Identifies the provider and model; part of every cache key
+    name: str
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, returning one vector per text in order."""
+        ...
+
+    async def aclose(self) -> None:
+        """Release the provider's resources."""
+        ...
+
+
+class OpenAIEmbeddingProvider:
+    """Embeddings from the OpenAI API."""
+
+    def __init__(self, model: str | None = None, base_url: str | None = None):
+        """
+        Initialize the provider.
+
+        Args:
+            model: Embedding model, defaults to WEAVIATE_EMBEDDING_MODEL or "text-embedding-3-small"
+            base_url: API base URL, defaults to WEAVIATE_EMBEDDING_BASE_URL or the OpenAI API
+
+        Raises:
+            ValueError: If WEAVIATE_OPENAI_API_KEY is not set
+        """
+        config = get_embedding_config()
+        self.model = model or config["model"]
+        self.base_url = (base_url or config["base_url"]).rstrip("/")
+        self.name = f"openai:{self.model}"
+        self._api_key = get_openai_api_key()
+        self._client: httpx.AsyncClient | None = None
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts with one API request."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=httpx.Timeout(30.0))
+        response = await self._client.post(
+            f"{self.base_url}/embeddings",
+            headers={"Authorization": f"Bearer {self._api_key}"},
+            json={"model": self.model, "input": texts},
+        )
+        response.raise_for_status()
+        data = response.json()["data"]
+        return [item["embedding"] for item in sorted(data, key=lambda item: item["index"])]
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class HashEmbeddingProvider:
+    """Deterministic embeddings from hashed word tokens, for tests and offline use."""
+
+    def __init__(self, dimensions: int = 256):
+        self.dimensions = dimensions
+        self.name = f"hash:{dimensions}"
+
+    def embed_one(self, text: str) -> list[float]:
+        """Embed one text: each lowercased word adds +1 or -1 to a hashed dimension."""
+        vector = [0.0] * self.dimensions
+        for token in _TOKEN.findall(text.lower()):
+            digest = int.from_bytes(hashlib.sha256(token.encode("utf-8")).digest()[:8], "big")
+            vector[digest % self.dimensions] += 1.0 if digest >> 63 else -1.0
+        norm = math.sqrt(sum(value * value for value in vector))
+        return [value / norm for value in vector] if norm else vector
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts locally."""
+        return [self.embed_one(text) for text in texts]
+
+    async def aclose(self) -> None:
+        """Nothing to release."""
+
+
+class VectorCache:
+    """Size-bounded vector store in a SQLite file, evicting least recently used vectors."""
+
+    def __init__(self, path: str, max_bytes: int):
+        """
+        Open or create the cache.
+
+        Args:
+            path: Path of the SQLite file
+            max_bytes: Maximum total size of the stored vectors
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS vectors (key TEXT PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.commit()
+        self.size_bytes = self._db.execute("SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM vectors").fetchone()[0]
+
+    def get(self, key: str) -> list[float] | None:
+        """Return the vector stored under a key, or None."""
+        with self._lock:
+            row = self._db.execute("SELECT vector FROM vectors WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE vectors SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+        return array("f", row[0]).tolist()
+
+    def put(self, key: str, vector: list[float]) -> None:
+        """Store a vector as float32, evicting the least recently used vectors beyond max_bytes."""
+        blob = array("f", vector).tobytes()
+        with self._lock:
+            previous = self._db.execute("SELECT LENGTH(vector) FROM vectors WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO vectors (key, vector, last_used) VALUES (?, ?, ?)", (key, blob, time.time())
+            )
+            self.size_bytes += len(blob) - (previous[0] if previous else 0)
+
+            if self.size_bytes > self.max_bytes:
+                evicted = []
+                for old_key, length in self._db.execute("SELECT key, LENGTH(vector) FROM vectors ORDER BY last_used"):
+                    if self.size_bytes <= self.max_bytes:
+                        break
+                    evicted.append((old_key,))
+                    self.size_bytes -= length
+                self._db.executemany("DELETE FROM vectors WHERE key = ?", evicted)
+            self._db.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+
+class QueryEmbedder:
+    """Embed search queries through a provider, reusing cached vectors."""
+
+    def __init__(self, provider: EmbeddingProvider, cache: VectorCache | None = None):
+        """
+        Initialize the embedder.
+
+        Args:
+            provider: Provider computing vectors that are not cached
+            cache: Optional persistent vector cache
+        """
+        self.provider = provider
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+        # Embeddings in progress, so that concurrent identical queries share one provider call
+        self._pending: dict[str, asyncio.Future] = {}
+
+    def cache_key(self, text: str) -> str:
+        """Content hash of a query for this provider."""
+        return hashlib.sha256(f"{self.provider.name}\0{text}".encode()).hexdigest()
+
+    async def embed(self, text: str) -> list[float]:
+        """
+        Return the vector of a query text, from the cache if possible.
+
+        Raises:
+            Exception: Whatever the provider raises when the vector is not cached
+        """
+        key = self.cache_key(text)
+        if self.cache is not None:
+            vector = await asyncio.to_thread(self.cache.get, key)
+            if vector is not None:
+                self.hits += 1
+                return vector
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            vector = (await self.provider.embed([text]))[0]
+            if self.cache is not None:
+                try:
+                    await asyncio.to_thread(self.cache.put, key, vector)
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to cache query vector in {self.cache.path}: {e}")
+            future.set_result(vector)
+            return vector
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when no concurrent query awaits it
+            future.exception()
+            raise
+        finally:
+            del self._pending[key]
+
+    async def aclose(self) -> None:
+        """Close the provider and the vector cache."""
+        await self.provider.aclose()
+        if self.cache is not None:
+            self.cache.close()
+
+
+_provider_factories: dict[str, Callable[[], EmbeddingProvider]] = {
+    "openai": OpenAIEmbeddingProvider,
+    "hash": HashEmbeddingProvider,
+}
+
+# Process-wide embedder, created on first use
+_query_embedder: QueryEmbedder | None = None
+_query_embedder_loaded = False
+
+
+def register_embedding_provider(name: str, factory: Callable[[], EmbeddingProvider]) -> None:
+    """
+    Register an embedding provider under a name usable in WEAVIATE_QUERY_EMBEDDING.
+
+    Args:
+        name: Name to register the provider under
+        factory: Callable returning the provider, invoked on first use
+    """
+    _provider_factories[name] = factory
+
+
+def get_query_embedder() -> QueryEmbedder | None:
+    """
+    Get the process-wide query embedder configured by WEAVIATE_QUERY_EMBEDDING.
+
+    Returns:
+        The embedder, or None if client-side query embedding is disabled or
+        its provider could not be created
+    """
+    global _query_embedder, _query_embedder_loaded
+    if _query_embedder_loaded:
+        return _query_embedder
+    _query_embedder_loaded = True
+
+    config = get_embedding_config()
+    if not config["provider"]:
+        return None
+
+    factory = _provider_factories.get(config["provider"])
+    if factory is None:
+        logger.error(f"Unknown embedding provider '{config['provider']}'. Available providers: {sorted(_provider_factories)}")
+        return None
+
+    try:
+        provider = factory()
+        cache = None
+        if config["cache_size_mb"] > 0:
+            cache = VectorCache(
+                os.path.join(config["cache_dir"], "query_vectors.sqlite3"), config["cache_size_mb"] * 1_000_000
+            )
+    except Exception as e:
+        logger.error(f"Client-side query embedding disabled, failed to set up '{config['provider']}': {e}")
+        return None
+
+    _query_embedder = QueryEmbedder(provider, cache)
+    logger.info(f"Embedding search queries with '{provider.name}'")
+    return _query_embedder
+
+
+async def close_query_embedder() -> None:
+    """Close the process-wide query embedder, so that the next use re-reads the configuration."""
+    global _query_embedder, _query_embedder_loaded
+    if _query_embedder is not None:
+        await _query_embedder.aclose()
+    _query_embedder = None
+    _query_embedder_loaded = False
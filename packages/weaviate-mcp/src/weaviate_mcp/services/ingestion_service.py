@@ -5,32 +5,131 @@ This service implements optimal text chunking strategies using tiktoken for
 token-aware chunking and semantic splitting for better context preservation.
 """
 
+import asyncio
+import codecs
+import hashlib
+import importlib.util
+import json
 import logging
+import os
 import re
+import sqlite3
+import time
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor
 from typing import Any
 from urllib.parse import urlparse
 
 import httpx
-import tiktoken
-from bs4 import BeautifulSoup
+from weaviate.classes.query import Filter, Sort
 
-from .weaviate_service import WeaviateService
+from ..config import get_chunking_workers, get_max_download_bytes, get_near_duplicate_config
+from ..utils.chunking import chunk_with_tokenizer, get_chunker, split_into_shards
+from ..utils.crawl import extract_html_links
+from ..utils.html_extraction import get_html_extractor
+from ..utils.near_duplicates import SignatureIndex, minhash
+from ..utils.tokenizer import Tokenizer, get_tokenizer
+from .weaviate_service import WeaviateService, generate_object_uuid
 
 logger = logging.getLogger(__name__)
 
+# Texts up to this many characters are chunked inline rather than in the worker
+# pool: tokenizing them takes less time than handing them to a worker. Every
+# larger document, such as a typical web page, is chunked in the pool, so that
+# concurrently fetched pages are chunked in parallel off the event loop.
+INLINE_CHUNKING_LIMIT = 4_000
+
+# Properties that identify a chunk, used to derive deterministic object IDs.
+# Keying by content hash keeps a chunk's ID stable when text before it changes.
+CHUNK_UNIQUE_PROPERTIES = ["source_url", "chunk_hash"]
+
+# Properties stored on every chunk that record the state of its source for conditional re-fetch
+SOURCE_STATE_PROPERTIES = ["source_etag", "source_last_modified", "source_hash"]
+
+# Properties that describe the whole source rather than one chunk. They are
+# written with every new chunk, but among kept chunks only updated on the
+# source's first chunk (which _get_source_state reads), so that a changed
+# source does not patch and re-vectorize every chunk it keeps.
+SOURCE_LEVEL_PROPERTIES = frozenset([*SOURCE_STATE_PROPERTIES, "content_length", "status_code", "total_chunks"])
+
+# Page size used when reading the chunks already stored for a source
+STORED_CHUNKS_PAGE_SIZE = 1000
+
+# Maximum number of concurrent property updates of kept chunks
+CHUNK_UPDATE_CONCURRENCY = 16
+
+# Handling of near-duplicate chunks: "skip" does not store them, "link" stores
+# them with a duplicate_of reference and the vector of the chunk they duplicate
+NEAR_DUPLICATE_MODES = ("skip", "link")
+
+# Chunks that near-duplicates are looked up among: the whole collection, or the same source
+NEAR_DUPLICATE_SCOPES = ("collection", "source")
+
+# Counts reported for a source when near-duplicate filtering is enabled
+NEAR_DUPLICATE_COUNTS = ("chunks_near_duplicate", "chunks_linked", "dedup_ratio")
+
+# Media types downloaded for ingestion, besides text/* and *+json / *+xml.
+# Other types are rejected from the response headers, before the body is read.
+TEXT_MEDIA_TYPES = ("application/json", "application/xml", "application/javascript", "application/x-ndjson")
+
+
+def is_text_media_type(content_type: str) -> bool:
+    """Whether a Content-Type header value names text that can be ingested; a missing type is allowed."""
+    media_type = content_type.split(";")[0].strip().lower()
+    return (
+        not media_type
+        or media_type.startswith("text/")
+        or media_type.endswith(("+json", "+xml"))
+        or media_type in TEXT_MEDIA_TYPES
+    )
+
+
+class DownloadRejectedError(Exception):
+    """Raised when a download is stopped because of its size or content."""
+
+
+def validate_near_duplicate_options(near_duplicates: str | None, near_duplicate_scope: str) -> str | None:
+    """Return an error message if the near-duplicate filter options are invalid."""
+    if near_duplicates is not None and near_duplicates not in NEAR_DUPLICATE_MODES:
+        return f"Unsupported near_duplicates mode: '{near_duplicates}'. Supported: {', '.join(NEAR_DUPLICATE_MODES)}"
+    if near_duplicate_scope not in NEAR_DUPLICATE_SCOPES:
+        return f"Unsupported near_duplicate_scope: '{near_duplicate_scope}'. Supported: {', '.join(NEAR_DUPLICATE_SCOPES)}"
+    return None
+
+
+def dedup_ratio(duplicates: int, new_chunks: int) -> float:
+    """Share of new chunks that were near-duplicates of stored ones."""
+    return round(duplicates / new_chunks, 4) if new_chunks else 0.0
+
 
 class IngestionService:
     """Service for ingesting and processing documents into Weaviate collections."""
 
-    def __init__(self, weaviate_service: WeaviateService):
+    def __init__(
+        self,
+        weaviate_service: WeaviateService,
+        tokenizer_name: str | None = None,
+        html_extractor_name: str | None = None,
+    ):
         """
         Initialize the ingestion service.
 
+        The tokenizer and HTML extractor are not loaded here; they are shared
+        process-wide and loaded on first use.
+
         Args:
             weaviate_service: WeaviateService instance for database operations
+            tokenizer_name: Tokenizer used for chunking, defaults to WEAVIATE_TOKENIZER or "tiktoken"
+            html_extractor_name: HTML extraction backend, defaults to WEAVIATE_HTML_EXTRACTOR or "auto"
         """
         self.weaviate_service = weaviate_service
-        self._encoding = tiktoken.get_encoding("cl100k_base")  # GPT-4 encoding
+        self.tokenizer_name = tokenizer_name
+        self.html_extractor_name = html_extractor_name
+
+    @property
+    def tokenizer(self) -> Tokenizer:
+        """The shared tokenizer used for chunking."""
+        return get_tokenizer(self.tokenizer_name)
 
     async def ingest_from_url(
         self,
@@ -39,12 +138,17 @@ class IngestionService:
         chunk_size: int = 1000,
         chunk_overlap: int = 100,
         max_tokens_per_chunk: int = 500,
+        force: bool = False,
+        near_duplicates: str | None = None,
+        near_duplicate_scope: str = "collection",
     ) -> dict[str, Any]:
         """
         Ingest and vectorize content from a public URL.
 
         Uses optimal chunking strategies combining token-aware splitting
         with semantic boundary detection for better context preservation.
+        Sources that were ingested before are re-fetched conditionally and
+        skipped when unchanged.
 
         Args:
             url: Public URL to ingest content from
@@ -52,23 +156,41 @@ class IngestionService:
             chunk_size: Target character count per chunk (fallback)
             chunk_overlap: Character overlap between chunks
             max_tokens_per_chunk: Maximum tokens per chunk (primary constraint)
+            force: Re-ingest even if the source is unchanged
+            near_duplicates: Optional near-duplicate filter, see NEAR_DUPLICATE_MODES
+            near_duplicate_scope: Chunks that near-duplicates are looked up among, see NEAR_DUPLICATE_SCOPES
 
         Returns:
             Dictionary with success status and ingestion results or error details
         """
+        if error := validate_near_duplicate_options(near_duplicates, near_duplicate_scope):
+            return {"error": True, "message": error}
+
         try:
             logger.info(f"Starting ingestion from URL: {url}")
 
-            # Step 1: Download and extract content
-            content_result = await self._download_and_extract_content(url)
+            # Step 1: Download and extract content, unless unchanged
+            content_result = await self.fetch_source(url, collection_name, force)
             if content_result.get("error"):
                 return content_result
 
+            if content_result.get("not_modified"):
+                logger.info(f"Skipping unchanged source {url}: {content_result['reason']}")
+                return {
+                    "success": True,
+                    "skipped": True,
+                    "reason": content_result["reason"],
+                    "chunks_ingested": 0,
+                    "collection_name": collection_name,
+                    "source_url": url,
+                    "inserted_ids": [],
+                }
+
             content = content_result["content"]
             metadata = content_result["metadata"]
 
             # Step 2: Perform optimal chunking
-            chunks = self._create_optimal_chunks(content, max_tokens_per_chunk, chunk_overlap)
+            chunks = await self.chunk_text(content, max_tokens_per_chunk, chunk_overlap)
 
             if not chunks:
                 return {
@@ -79,38 +201,35 @@ class IngestionService:
             logger.info(f"Created {len(chunks)} chunks from content")
 
             # Step 3: Prepare objects for Weaviate insertion
-            objects = []
-            for i, chunk in enumerate(chunks):
-                obj = {
-                    "content": chunk,
-                    "source_url": url,
-                    "chunk_index": i,
-                    "total_chunks": len(chunks),
-                    **metadata,  # Include extracted metadata
-                }
-                objects.append(obj)
-
-            # Step 4: Batch insert into Weaviate
-            insert_result = await self.weaviate_service.batch_insert_objects(
-                collection_name=collection_name,
-                objects=objects,
-                unique_properties=["source_url", "chunk_index"],
-                batch_size=50,  # Smaller batches for better error handling
+            objects = self.build_chunk_objects(url, chunks, metadata)
+
+            # Step 4: Write only the difference to what is stored for the source
+            sync_result = await self.sync_source_chunks(
+                collection_name,
+                url,
+                objects,
+                near_duplicates=near_duplicates,
+                near_duplicate_scope=near_duplicate_scope,
             )
-
-            if insert_result.get("error"):
-                return insert_result
+            if sync_result.get("error"):
+                return sync_result
 
             logger.info(f"Successfully ingested {len(chunks)} chunks from {url} into collection '{collection_name}'")
 
-            return {
+            result = {
                 "success": True,
                 "chunks_ingested": len(chunks),
+                "chunks_inserted": sync_result["chunks_inserted"],
+                "chunks_deleted": sync_result["chunks_deleted"],
+                "chunks_updated": sync_result["chunks_updated"],
+                "chunks_unchanged": sync_result["chunks_unchanged"],
                 "collection_name": collection_name,
                 "source_url": url,
-                "inserted_ids": insert_result.get("inserted_ids", []),
+                "inserted_ids": sync_result["inserted_ids"],
                 "metadata": metadata,
             }
+            result.update({key: sync_result[key] for key in NEAR_DUPLICATE_COUNTS if key in sync_result})
+            return result
 
         except Exception as e:
             logger.error(f"Error during URL ingestion: {e}")
@@ -124,69 +243,784 @@ class IngestionService:
                 },
             }
 
-    async def _download_and_extract_content(self, url: str) -> dict[str, Any]:
+    async def ingest_urls(
+        self,
+        urls: list[str],
+        collection_name: str,
+        max_tokens_per_chunk: int = 500,
+        chunk_overlap: int = 50,
+        concurrency: int = 16,
+        per_host_limit: int = 4,
+        insert_batch_size: int = 200,
+        force: bool = False,
+        near_duplicates: str | None = None,
+        near_duplicate_scope: str = "collection",
+    ) -> dict[str, Any]:
+        """
+        Ingest many URLs through a concurrent download, chunk and insert pipeline.
+
+        Downloads run concurrently over the shared HTTP client, bounded overall
+        and per host. Each downloaded document is chunked (in the worker pool
+        when large) and queued; an inserter drains the queue and batch-inserts
+        new chunks from several documents at once, so inserts overlap with
+        downloads of the remaining URLs. Unchanged sources are skipped, and
+        changed sources only write the difference to their stored chunks.
+
+        Args:
+            urls: Public URLs to ingest (duplicates are ingested once)
+            collection_name: Target Weaviate collection name
+            max_tokens_per_chunk: Maximum tokens per chunk
+            chunk_overlap: Number of tokens to overlap between chunks
+            concurrency: Maximum number of concurrent downloads
+            per_host_limit: Maximum number of concurrent downloads per host
+            insert_batch_size: Target number of chunks per insert call
+            force: Re-ingest sources even if they are unchanged
+            near_duplicates: Optional near-duplicate filter, see NEAR_DUPLICATE_MODES
+            near_duplicate_scope: Chunks that near-duplicates are looked up among, see NEAR_DUPLICATE_SCOPES
+
+        Returns:
+            Dictionary with per-URL status and throughput statistics, or error details
+        """
+        if error := validate_near_duplicate_options(near_duplicates, near_duplicate_scope):
+            return {"error": True, "message": error}
+
+        start_time = time.perf_counter()
+        urls = list(dict.fromkeys(urls))
+        statuses: dict[str, dict[str, Any]] = {url: {"url": url, "status": "pending"} for url in urls}
+        bytes_downloaded = 0
+
+        download_semaphore = asyncio.Semaphore(max(concurrency, 1))
+        host_semaphores: defaultdict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(max(per_host_limit, 1)))
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(concurrency, 1) * 2)
+
+        async def produce(url: str) -> None:
+            nonlocal bytes_downloaded
+            try:
+                # Wait for a slot on the host before taking a global one, so downloads
+                # queued behind a busy host don't hold slots other hosts could use
+                async with host_semaphores[urlparse(url).netloc], download_semaphore:
+                    content_result = await self.fetch_source(url, collection_name, force)
+                bytes_downloaded += await self.queue_source(
+                    url,
+                    collection_name,
+                    content_result,
+                    queue,
+                    statuses[url],
+                    max_tokens_per_chunk,
+                    chunk_overlap,
+                    near_duplicates,
+                    near_duplicate_scope,
+                )
+            except Exception as e:
+                logger.error(f"Error ingesting {url}: {e}")
+                statuses[url].update(status="failed", message=str(e))
+
+        async def produce_all() -> None:
+            await asyncio.gather(*(produce(url) for url in urls))
+            await queue.put(None)
+
+        await self.run_pipeline(produce_all(), self.consume_source_queue(collection_name, queue, statuses, insert_batch_size))
+
+        return self.summarize_url_results(collection_name, statuses, time.perf_counter() - start_time, bytes_downloaded)
+
+    async def queue_source(
+        self,
+        url: str,
+        collection_name: str,
+        content_result: dict[str, Any],
+        queue: asyncio.Queue,
+        status: dict[str, Any],
+        max_tokens_per_chunk: int,
+        chunk_overlap: int,
+        near_duplicates: str | None = None,
+        near_duplicate_scope: str = "collection",
+    ) -> int:
+        """
+        Chunk a fetched source and queue its chunk diff for insertion.
+
+        Failed and unchanged sources are recorded in status and not queued.
+        With near_duplicates, new chunks that nearly duplicate stored ones are
+        left out of the diff or queued to be linked.
+
+        Returns:
+            Number of bytes downloaded for the source
+        """
+        if content_result.get("error"):
+            status.update(status="failed", message=content_result["message"])
+            return 0
+        if content_result.get("not_modified"):
+            status.update(status="unchanged", message=content_result["reason"], chunks_ingested=0)
+            return 0
+
+        metadata = content_result["metadata"]
+        chunks = await self.chunk_text(content_result["content"], max_tokens_per_chunk, chunk_overlap)
+        if not chunks:
+            status.update(status="failed", message="No content chunks were created from the URL")
+            return metadata.get("content_length", 0)
+
+        status["title"] = metadata.get("title")
+        objects = self.build_chunk_objects(url, chunks, metadata)
+        plan = await self._plan_chunk_changes(collection_name, url, objects, near_duplicates, near_duplicate_scope)
+        if plan.get("error"):
+            status.update(status="failed", message=plan["message"])
+            return metadata.get("content_length", 0)
+        await queue.put((url, plan))
+        return metadata.get("content_length", 0)
+
+    async def consume_source_queue(
+        self,
+        collection_name: str,
+        queue: asyncio.Queue,
+        statuses: dict[str, dict[str, Any]],
+        insert_batch_size: int,
+    ) -> None:
+        """Drain queued chunk diffs into batched inserts until a None sentinel arrives."""
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+
+            # Insert everything that is already waiting along with this document
+            batch = [item]
+            batch_objects = len(item[1]["insert"])
+            stop = False
+            while batch_objects < insert_batch_size:
+                try:
+                    next_item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if next_item is None:
+                    stop = True
+                    break
+                batch.append(next_item)
+                batch_objects += len(next_item[1]["insert"])
+
+            await self._insert_url_batch(collection_name, batch, statuses, insert_batch_size)
+            if stop:
+                return
+
+    @staticmethod
+    async def run_pipeline(*stages: Any) -> None:
+        """
+        Run the stages of a pipeline together until all finish or one fails.
+
+        If a stage raises, the other stages are cancelled and the exception is
+        re-raised, so a failed consumer can't leave producers blocked forever on
+        a full queue (and vice versa).
+
+        Args:
+            stages: Coroutines to run concurrently
+        """
+        tasks = [asyncio.ensure_future(stage) for stage in stages]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def summarize_url_results(
+        collection_name: str,
+        statuses: dict[str, dict[str, Any]],
+        elapsed: float,
+        bytes_downloaded: int,
+    ) -> dict[str, Any]:
+        """Summarize per-URL statuses into totals and throughput statistics."""
+        results = list(statuses.values())
+        succeeded = sum(1 for result in results if result["status"] == "ingested")
+        unchanged = sum(1 for result in results if result["status"] == "unchanged")
+        skipped = sum(1 for result in results if result["status"] == "skipped")
+        failed = len(results) - succeeded - unchanged - skipped
+        chunks_ingested = sum(result.get("chunks_ingested", 0) for result in results)
+        chunks_inserted = sum(result.get("chunks_inserted", 0) for result in results)
+        chunks_deleted = sum(result.get("chunks_deleted", 0) for result in results)
+        near_duplicate_results = [result for result in results if "chunks_near_duplicate" in result]
+
+        logger.info(
+            f"Ingested {succeeded}/{len(results)} URLs ({chunks_ingested} chunks) into '{collection_name}' in {elapsed:.2f}s"
+        )
+
+        summary = {
+            "success": failed == 0,
+            "collection_name": collection_name,
+            "total_urls": len(results),
+            "succeeded": succeeded,
+            "unchanged": unchanged,
+            "skipped": skipped,
+            "failed": failed,
+            "chunks_ingested": chunks_ingested,
+            "chunks_inserted": chunks_inserted,
+            "chunks_deleted": chunks_deleted,
+            "bytes_downloaded": bytes_downloaded,
+            "elapsed_seconds": round(elapsed, 3),
+            "urls_per_second": round(len(results) / elapsed, 2) if elapsed > 0 else None,
+            "chunks_per_second": round(chunks_ingested / elapsed, 2) if elapsed > 0 else None,
+            "results": results,
+        }
+        if near_duplicate_results:
+            duplicates = sum(result["chunks_near_duplicate"] for result in near_duplicate_results)
+            new_chunks = duplicates + sum(result["chunks_inserted"] for result in near_duplicate_results)
+            summary.update(
+                chunks_near_duplicate=duplicates,
+                chunks_linked=sum(result["chunks_linked"] for result in near_duplicate_results),
+                dedup_ratio=dedup_ratio(duplicates, new_chunks),
+            )
+        return summary
+
+    async def _insert_url_batch(
+        self,
+        collection_name: str,
+        batch: list[tuple[str, dict[str, Any]]],
+        statuses: dict[str, dict[str, Any]],
+        insert_batch_size: int,
+    ) -> None:
+        """Apply the chunk changes of several documents at once and record each URL's status."""
+        objects = [obj for _, plan in batch for obj in plan["insert"]]
+        insert_result: dict[str, Any] = {}
+        if objects:
+            try:
+                insert_result = await self.weaviate_service.batch_insert_objects(
+                    collection_name=collection_name,
+                    objects=objects,
+                    unique_properties=CHUNK_UNIQUE_PROPERTIES,
+                    batch_size=insert_batch_size,
+                    upsert="replace",  # Deterministic IDs make re-ingestion idempotent
+                )
+            except Exception as e:
+                insert_result = {"error": True, "message": str(e)}
+
+        failed_objects = {failure["index"]: failure["message"] for failure in insert_result.get("failed_objects", [])}
+        if insert_result.get("error") and not failed_objects:
+            # The whole insert failed, so every document in the batch did
+            failed_objects = dict.fromkeys(range(len(objects)), insert_result.get("message", "Unknown insertion error"))
+
+        # Removed and moved chunks are only touched once the new ones are stored
+        inserted = []
+        offset = 0
+        for url, plan in batch:
+            failures = [failed_objects[i] for i in range(offset, offset + len(plan["insert"])) if i in failed_objects]
+            offset += len(plan["insert"])
+
+            if failures:
+                statuses[url].update(
+                    status="failed",
+                    message=f"{len(failures)} of {len(plan['insert'])} chunks failed to insert: {failures[0]}",
+                    chunks_inserted=len(plan["insert"]) - len(failures),
+                )
+                await self._forget_signatures(collection_name, url, plan)
+            else:
+                inserted.append((url, plan))
+
+        # Near-duplicates are linked once the chunks they duplicate are stored
+        links = [link for _, plan in inserted for link in plan.get("link", [])]
+        link_result = await self._insert_near_duplicate_links(collection_name, links, insert_batch_size)
+        if link_result.get("error"):
+            for url, plan in inserted:
+                if plan.get("link"):
+                    statuses[url].update(
+                        status="failed",
+                        message=f"Failed to store near-duplicate chunks: {link_result['message']}",
+                        chunks_inserted=len(plan["insert"]),
+                    )
+            inserted = [(url, plan) for url, plan in inserted if not plan.get("link")]
+
+        if not inserted:
+            return
+
+        changes = await self._apply_chunk_changes(
+            collection_name,
+            [object_id for _, plan in inserted for object_id in plan["delete"]],
+            [update for _, plan in inserted for update in plan["update"] + plan["source_state"]],
+        )
+        for url, plan in inserted:
+            status = statuses[url]
+            if changes.get("error"):
+                status.update(
+                    status="failed",
+                    message=f"Failed to remove or update stale chunks: {changes['message']}",
+                    chunks_inserted=len(plan["insert"]),
+                )
+            else:
+                status.update(status="ingested", **self._chunk_change_counts(plan))
+
+    async def sync_source_chunks(
+        self,
+        collection_name: str,
+        source_url: str,
+        objects: list[dict[str, Any]],
+        batch_size: int = 50,
+        near_duplicates: str | None = None,
+        near_duplicate_scope: str = "collection",
+    ) -> dict[str, Any]:
+        """
+        Store the chunks of a source, writing only what changed.
+
+        Chunks are keyed by source and content hash. Compared to what is
+        already stored for the source, new chunks are inserted, chunks that
+        no longer occur are deleted in bulk, and kept chunks only have their
+        changed properties (such as chunk_index) updated, so their content is
+        not re-sent or re-vectorized.
+
+        With near_duplicates, new chunks are also matched against the
+        signatures of chunks ingested with the filter before (in the same
+        collection, or only the same source with near_duplicate_scope
+        "source"). Chunks that nearly duplicate one are not vectorized: "skip"
+        does not store them, "link" stores them with a duplicate_of property
+        holding the ID of the matched chunk and that chunk's vector.
+
+        Args:
+            collection_name: Target Weaviate collection name
+            source_url: Source the chunks belong to
+            objects: Chunk objects built for the source, each with a chunk_hash
+            batch_size: Number of objects per insert request
+            near_duplicates: Optional near-duplicate filter, "skip" or "link"
+            near_duplicate_scope: "collection" (default) or "source"
+
+        Returns:
+            Dictionary with inserted_ids and chunk change counts, or error
+            details. With near_duplicates, also chunks_near_duplicate,
+            chunks_linked and dedup_ratio (the share of new chunks that were
+            near-duplicates).
+        """
+        if error := validate_near_duplicate_options(near_duplicates, near_duplicate_scope):
+            return {"error": True, "message": error}
+
+        plan = await self._plan_chunk_changes(collection_name, source_url, objects, near_duplicates, near_duplicate_scope)
+        if plan.get("error"):
+            return plan
+
+        insert_result: dict[str, Any] = {}
+        if plan["insert"]:
+            insert_result = await self.weaviate_service.batch_insert_objects(
+                collection_name=collection_name,
+                objects=plan["insert"],
+                unique_properties=CHUNK_UNIQUE_PROPERTIES,
+                batch_size=batch_size,  # Smaller batches for better error handling
+                upsert="replace",  # Deterministic IDs make re-ingestion idempotent
+            )
+            if insert_result.get("error"):
+                await self._forget_signatures(collection_name, source_url, plan)
+                return insert_result
+
+        link_result = await self._insert_near_duplicate_links(collection_name, plan.get("link", []), batch_size)
+        if link_result.get("error"):
+            return link_result
+
+        # Removed and moved chunks are only touched once the new ones are stored
+        changes = await self._apply_chunk_changes(collection_name, plan["delete"], plan["update"] + plan["source_state"])
+        if changes.get("error"):
+            return changes
+
+        return {
+            "success": True,
+            "inserted_ids": insert_result.get("inserted_ids", []) + link_result.get("inserted_ids", []),
+            **self._chunk_change_counts(plan),
+        }
+
+    async def _plan_chunk_changes(
+        self,
+        collection_name: str,
+        source_url: str,
+        objects: list[dict[str, Any]],
+        near_duplicates: str | None = None,
+        near_duplicate_scope: str = "collection",
+    ) -> dict[str, Any]:
+        """
+        Diff the chunks of a source against the chunks stored for it.
+
+        Kept chunks are compared without their content and without
+        SOURCE_LEVEL_PROPERTIES. Only the source's first chunk has those
+        updated, counted as a source_state update rather than a chunk update.
+
+        Returns:
+            Dictionary with the objects to insert, the IDs to delete, the
+            (ID, changed properties) updates for kept chunks, the number of
+            chunks that are stored unchanged and the source_state update (a
+            list of at most one). With near_duplicates, also the
+            number of new chunks that were near-duplicates, the (object,
+            original ID) pairs to link and the chunk hashes whose signatures
+            were added to the index. Error details if the stored chunks could
+            not be read.
+        """
+        stored = await self._get_stored_chunks(collection_name, source_url)
+        if "error" in stored:
+            return stored
+        stored = stored["chunks"]
+
+        # Repeated chunks within a document share an ID and are stored once
+        planned: dict[str, dict[str, Any]] = {}
+        for obj in objects:
+            planned.setdefault(generate_object_uuid(obj, CHUNK_UNIQUE_PROPERTIES), obj)
+
+        plan: dict[str, Any] = {
+            "total": len(objects),
+            "insert": [],
+            "delete": [],
+            "update": [],
+            "unchanged": 0,
+            "source_state": [],
+        }
+        for object_id, obj in planned.items():
+            previous = stored.get(object_id)
+            if previous is None:
+                plan["insert"].append(obj)
+                continue
+
+            changed = {
+                prop: value
+                for prop, value in obj.items()
+                if prop != "content" and prop not in SOURCE_LEVEL_PROPERTIES and previous.get(prop) != value
+            }
+            state = {}
+            if obj.get("chunk_index") == 0:
+                # The first chunk carries the source state that _get_source_state reads
+                state = {
+                    prop: value
+                    for prop, value in obj.items()
+                    if prop in SOURCE_LEVEL_PROPERTIES and previous.get(prop) != value
+                }
+            if changed:
+                plan["update"].append((object_id, {**changed, **state}))
+            else:
+                plan["unchanged"] += 1
+                if state:
+                    plan["source_state"].append((object_id, state))
+
+        plan["delete"] = [object_id for object_id in stored if object_id not in planned]
+        if near_duplicates:
+            await self._filter_near_duplicates(
+                collection_name, source_url, plan, stored, near_duplicates, near_duplicate_scope
+            )
+
+        logger.info(
+            f"Chunk diff for {source_url}: {len(plan['insert'])} new, {len(plan['delete'])} removed, "
+            f"{len(plan['update'])} moved, {plan['unchanged']} unchanged"
+            + (f", {plan['near_duplicate']} near-duplicate" if "near_duplicate" in plan else "")
+        )
+        return plan
+
+    async def _filter_near_duplicates(
+        self,
+        collection_name: str,
+        source_url: str,
+        plan: dict[str, Any],
+        stored: dict[str, dict[str, Any]],
+        mode: str,
+        scope: str,
+    ) -> None:
+        """
+        Take the new chunks of a plan that nearly duplicate indexed chunks out of its inserts.
+
+        The signatures of the other new chunks are added to the index, and
+        those of the source's removed chunks are dropped from it.
+        """
+        index = get_signature_index()
+        if index is None:
+            return
+
+        threshold = get_near_duplicate_config()["threshold"]
+        removed = [stored[object_id]["chunk_hash"] for object_id in plan["delete"] if stored[object_id].get("chunk_hash")]
+
+        def match() -> list[dict[str, Any] | None]:
+            if removed:
+                index.remove(collection_name, source_url, removed)
+            chunks = [
+                {
+                    "source_url": source_url,
+                    "chunk_hash": obj["chunk_hash"],
+                    "object_id": generate_object_uuid(obj, CHUNK_UNIQUE_PROPERTIES),
+                    "signature": minhash(obj["content"]),
+                }
+                for obj in plan["insert"]
+            ]
+            return index.filter(collection_name, chunks, threshold, per_source=scope == "source")
+
+        try:
+            matches = await asyncio.to_thread(match)
+        except sqlite3.Error as e:
+            logger.error(f"Near-duplicate filtering skipped, failed to use the signature index {index.path}: {e}")
+            return
+
+        kept = []
+        plan["link"] = []
+        for obj, duplicate in zip(plan["insert"], matches, strict=True):
+            if duplicate is None:
+                kept.append(obj)
+            elif mode == "link":
+                plan["link"].append(({**obj, "duplicate_of": duplicate["object_id"]}, duplicate["object_id"]))
+        plan["near_duplicate"] = len(plan["insert"]) - len(kept)
+        plan["insert"] = kept
+        plan["signatures"] = [obj["chunk_hash"] for obj in kept]
+
+    async def _forget_signatures(self, collection_name: str, source_url: str, plan: dict[str, Any]) -> None:
+        """Drop the signatures a plan added to the index, once its chunks failed to insert."""
+        index = get_signature_index() if plan.get("signatures") else None
+        if index is None:
+            return
+        try:
+            await asyncio.to_thread(index.remove, collection_name, source_url, plan["signatures"])
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to remove signatures from {index.path}: {e}")
+
+    async def _insert_near_duplicate_links(
+        self,
+        collection_name: str,
+        links: list[tuple[dict[str, Any], str]],
+        batch_size: int,
+    ) -> dict[str, Any]:
+        """
+        Store near-duplicate chunks with the vectors of the chunks they duplicate.
+
+        Chunks whose original has no stored vector (e.g. because it was
+        deleted since) are vectorized as usual.
+        """
+        if not links:
+            return {"success": True, "inserted_ids": []}
+
+        vector_result = await self.weaviate_service.get_vectors(
+            collection_name, list(dict.fromkeys(original for _, original in links))
+        )
+        if vector_result.get("error"):
+            logger.warning(f"Failed to read the vectors of near-duplicate originals: {vector_result['message']}")
+        vectors = vector_result.get("vectors", {})
+
+        return await self.weaviate_service.batch_insert_objects(
+            collection_name=collection_name,
+            objects=[obj for obj, _ in links],
+            unique_properties=CHUNK_UNIQUE_PROPERTIES,
+            batch_size=batch_size,
+            upsert="replace",
+            vectors=[vectors.get(original) for _, original in links],
+        )
+
+    async def _get_stored_chunks(self, collection_name: str, source_url: str) -> dict[str, Any]:
+        """
+        Read the properties of every chunk stored for a source.
+
+        Returns:
+            Dictionary with "chunks", the stored chunks keyed by object ID, or
+            error details. A failed lookup fails the sync rather than leaving
+            unseen chunks stored.
+        """
+        result = await self.weaviate_service.get_all_objects(
+            collection_name,
+            filters=Filter.by_property("source_url").equal(source_url),
+            batch_size=STORED_CHUNKS_PAGE_SIZE,
+        )
+        if result.get("error"):
+            return {"error": True, "message": f"Failed to read the stored chunks of {source_url}: {result['message']}"}
+        return {"chunks": {obj["id"]: obj for obj in result.get("objects", [])}}
+
+    async def _apply_chunk_changes(
+        self,
+        collection_name: str,
+        delete_ids: list[str],
+        updates: list[tuple[str, dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Delete removed chunks in bulk and update the changed properties of kept chunks."""
+        delete_result = await self.weaviate_service.delete_objects(collection_name, delete_ids)
+        if delete_result.get("error"):
+            return delete_result
+
+        semaphore = asyncio.Semaphore(CHUNK_UPDATE_CONCURRENCY)
+
+        async def update(object_id: str, properties: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await self.weaviate_service.update_object(collection_name, object_id, properties)
+
+        results = await asyncio.gather(*(update(object_id, properties) for object_id, properties in updates))
+        failures = [result for result in results if result.get("error")]
+        if failures:
+            return {
+                "error": True,
+                "message": f"{len(failures)} of {len(updates)} chunk updates failed: {failures[0].get('message')}",
+            }
+
+        return {"success": True, "deleted_count": delete_result.get("deleted_count", 0), "updated_count": len(updates)}
+
+    @staticmethod
+    def _chunk_change_counts(plan: dict[str, Any]) -> dict[str, Any]:
+        """Summarize a chunk diff as the counts reported per source."""
+        counts = {
+            "chunks_ingested": plan["total"],
+            "chunks_inserted": len(plan["insert"]),
+            "chunks_deleted": len(plan["delete"]),
+            "chunks_updated": len(plan["update"]),
+            "chunks_unchanged": plan["unchanged"],
+        }
+        if "near_duplicate" in plan:
+            counts.update(
+                chunks_near_duplicate=plan["near_duplicate"],
+                chunks_linked=len(plan["link"]),
+                dedup_ratio=dedup_ratio(plan["near_duplicate"], len(plan["insert"]) + plan["near_duplicate"]),
+            )
+        return counts
+
+    def build_chunk_objects(self, url: str, chunks: list[str], metadata: dict[str, Any]) -> list[dict[str, Any]]:
+        """Build the Weaviate objects for the chunks of one document."""
+        return [
+            {
+                "content": chunk,
+                "chunk_hash": hashlib.sha256(chunk.encode("utf-8")).hexdigest(),
+                "source_url": url,
+                "chunk_index": i,
+                "total_chunks": len(chunks),
+                **metadata,  # Include extracted metadata
+            }
+            for i, chunk in enumerate(chunks)
+        ]
+
+    async def fetch_source(
+        self,
+        url: str,
+        collection_name: str,
+        force: bool = False,
+        extract_links: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Download a source unless it is unchanged since it was last ingested.
+
+        The ETag and Last-Modified validators stored with the source's chunks
+        are sent as a conditional request, and the extracted content is
+        compared against the stored content hash.
+
+        Args:
+            url: URL to download from
+            collection_name: Collection the source is ingested into
+            force: Skip the change detection and always download
+            extract_links: Also return the links of HTML pages. The request is
+                then not conditional, since a 304 response has no links.
+
+        Returns:
+            Dictionary with content and metadata, {"not_modified": True, "reason": ...}
+            for unchanged sources, or error details. With extract_links, both
+            also carry the page's "links".
+        """
+        previous_state = None if force else await self._get_source_state(collection_name, url)
+
+        content_result = await self._download_and_extract_content(
+            url, None if extract_links else previous_state, extract_links=extract_links
+        )
+        if content_result.get("error") or content_result.get("not_modified"):
+            return content_result
+
+        source_hash = hashlib.sha256(content_result["content"].encode("utf-8")).hexdigest()
+        if previous_state and previous_state.get("source_hash") == source_hash:
+            unchanged = {"not_modified": True, "reason": "Content hash unchanged"}
+            if extract_links:
+                unchanged["links"] = content_result.get("links", [])
+            return unchanged
+
+        content_result["metadata"]["source_hash"] = source_hash
+        return content_result
+
+    async def _get_source_state(self, collection_name: str, url: str) -> dict[str, Any] | None:
+        """Look up the stored validators and content hash of a previously ingested source, from its first chunk."""
+        result = await self.weaviate_service.get_objects(
+            collection_name,
+            filters=Filter.by_property("source_url").equal(url),
+            limit=1,
+            sort=Sort.by_property("chunk_index"),
+            return_properties=SOURCE_STATE_PROPERTIES,
+        )
+        # Collections created before change tracking have no state properties
+        if result.get("error") or not result.get("objects"):
+            return None
+
+        stored = result["objects"][0]
+        state = {prop: stored.get(prop) for prop in SOURCE_STATE_PROPERTIES if stored.get(prop)}
+        return state or None
+
+    async def _download_and_extract_content(
+        self,
+        url: str,
+        previous_state: dict[str, Any] | None = None,
+        extract_links: bool = False,
+    ) -> dict[str, Any]:
         """
         Download content from URL and extract text with metadata.
 
+        The body is streamed, so memory use is bounded by WEAVIATE_MAX_DOWNLOAD_BYTES.
+        Responses whose Content-Type is not text are rejected before the body is read.
+
         Args:
             url: URL to download from
+            previous_state: Stored source state whose validators make the request conditional
+            extract_links: Also return the absolute links found in HTML content
 
         Returns:
-            Dictionary with content, metadata, or error details
+            Dictionary with content, metadata (and links if requested),
+            {"not_modified": True} on HTTP 304, or error details
         """
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(30.0),
-                follow_redirects=True,
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            ) as client:
-                logger.info(f"Downloading content from: {url}")
-                response = await client.get(url)
+            client = get_http_client()
+            headers = {}
+            if previous_state:
+                if previous_state.get("source_etag"):
+                    headers["If-None-Match"] = previous_state["source_etag"]
+                if previous_state.get("source_last_modified"):
+                    headers["If-Modified-Since"] = previous_state["source_last_modified"]
+
+            logger.info(f"Downloading content from: {url}")
+            async with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304:
+                    return {"not_modified": True, "reason": "HTTP 304 Not Modified"}
                 response.raise_for_status()
 
                 content_type = response.headers.get("content-type", "").lower()
+                if not is_text_media_type(content_type):
+                    return {"error": True, "message": f"Unsupported content type: {content_type}"}
+
+                text, size = await self._read_text(response, sniff_binary=not content_type)
+                final_url = str(response.url)
 
                 # Extract metadata
                 metadata = {
                     "content_type": content_type,
-                    "content_length": len(response.content),
+                    "content_length": size,
                     "status_code": response.status_code,
                 }
 
-                # Handle different content types
-                if "text/html" in content_type:
-                    content, html_metadata = self._extract_html_content(response.text, url)
-                    metadata.update(html_metadata)
-                elif "text/plain" in content_type:
-                    content = response.text
-                    metadata["title"] = self._extract_title_from_url(url)
-                elif "application/json" in content_type:
-                    # Handle JSON content by converting to readable text
-                    import json
-
-                    json_data = response.json()
-                    content = json.dumps(json_data, indent=2)
-                    metadata["title"] = self._extract_title_from_url(url)
-                else:
-                    # Try to decode as text
-                    try:
-                        content = response.text
-                        metadata["title"] = self._extract_title_from_url(url)
-                    except UnicodeDecodeError:
-                        return {
-                            "error": True,
-                            "message": f"Unsupported content type: {content_type}",
-                        }
-
-                if not content or len(content.strip()) < 10:
-                    return {
-                        "error": True,
-                        "message": "No meaningful content extracted from URL",
-                    }
-
-                logger.info(f"Extracted {len(content)} characters from {url}")
-                return {"content": content, "metadata": metadata}
+                # Validators for conditional re-fetch
+                if response.headers.get("etag"):
+                    metadata["source_etag"] = response.headers["etag"]
+                if response.headers.get("last-modified"):
+                    metadata["source_last_modified"] = response.headers["last-modified"]
+
+            links = []
+
+            # Handle different content types
+            if "text/html" in content_type:
+                content, html_metadata = self._extract_html_content(text, url)
+                metadata.update(html_metadata)
+                if extract_links:
+                    links = extract_html_links(text, final_url)
+            elif "json" in content_type:
+                # Handle JSON content by converting to readable text
+                content = json.dumps(json.loads(text), indent=2)
+                metadata["title"] = self._extract_title_from_url(url)
+            else:
+                content = text
+                metadata["title"] = self._extract_title_from_url(url)
+
+            if not content or len(content.strip()) < 10:
+                return {
+                    "error": True,
+                    "message": "No meaningful content extracted from URL",
+                }
+
+            logger.info(f"Extracted {len(content)} characters from {url}")
+            result = {"content": content, "metadata": metadata}
+            if extract_links:
+                result["links"] = links
+            return result
 
+        except DownloadRejectedError as e:
+            return {"error": True, "message": f"{e} for {url}"}
         except httpx.TimeoutException:
             return {"error": True, "message": f"Timeout while downloading from {url}"}
         except httpx.HTTPStatusError as e:
@@ -197,63 +1031,101 @@ class IngestionService:
         except Exception as e:
             return {"error": True, "message": f"Download error: {str(e)}"}
 
-    def _extract_html_content(self, html: str, url: str) -> tuple[str, dict[str, Any]]:
+    async def download_text(self, url: str) -> dict[str, Any]:
         """
-        Extract clean text content and metadata from HTML.
+        Download a text document such as a sitemap or robots.txt, within the limits of URL ingestion.
+
+        The body is streamed through _read_text, so it is capped at
+        WEAVIATE_MAX_DOWNLOAD_BYTES, and non-text content types are rejected
+        from the headers. The body of an error status is not read.
 
         Args:
-            html: HTML content
-            url: Source URL for context
+            url: URL to download
 
         Returns:
-            Tuple of (cleaned_text, metadata_dict)
+            Dictionary with status_code and text (empty for status codes of
+            400 and above), or error details
         """
-        soup = BeautifulSoup(html, "html.parser")
+        try:
+            async with get_http_client().stream("GET", url) as response:
+                if response.status_code >= 400:
+                    return {"status_code": response.status_code, "text": ""}
 
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
+                content_type = response.headers.get("content-type", "").lower()
+                if not is_text_media_type(content_type):
+                    return {"error": True, "message": f"Unsupported content type: {content_type}"}
 
-        # Extract metadata
-        metadata = {}
+                text, _ = await self._read_text(response, sniff_binary=not content_type)
+                return {"status_code": response.status_code, "text": text}
 
-        # Title
-        title_tag = soup.find("title")
-        if title_tag:
-            metadata["title"] = title_tag.get_text().strip()
-        else:
-            metadata["title"] = self._extract_title_from_url(url)
+        except DownloadRejectedError as e:
+            return {"error": True, "message": f"{e} for {url}"}
+        except httpx.TimeoutException:
+            return {"error": True, "message": f"Timeout while downloading from {url}"}
+        except Exception as e:
+            return {"error": True, "message": f"Download error: {str(e)}"}
 
-        # Meta description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc:
-            metadata["description"] = meta_desc.get("content", "").strip()
+    async def _read_text(self, response: httpx.Response, sniff_binary: bool = False) -> tuple[str, int]:
+        """
+        Read and decode a streamed response body, holding at most max_download_bytes of it.
 
-        # Author
-        meta_author = soup.find("meta", attrs={"name": "author"})
-        if meta_author:
-            metadata["author"] = meta_author.get("content", "").strip()
+        A declared Content-Length above the limit is rejected before reading.
+        The body is decoded chunk by chunk with the response's charset (UTF-8
+        if it is unknown), so multi-byte characters split across chunks are
+        decoded correctly.
 
-        # Extract main content
-        # Try to find main content areas first
-        main_content = None
-        for selector in ["main", "article", ".content", "#content", ".post-content"]:
-            element = soup.select_one(selector)
-            if element:
-                main_content = element
-                break
+        Args:
+            response: Streamed response whose body has not been read
+            sniff_binary: Reject the body if its first chunk contains NUL bytes,
+                for responses without a Content-Type
 
-        if not main_content:
-            # Fall back to body
-            main_content = soup.find("body") or soup
+        Returns:
+            Tuple of the decoded text and the number of bytes read
 
-        # Get text and clean it
-        text = main_content.get_text()
+        Raises:
+            DownloadRejectedError: If the body exceeds the limit or looks binary
+        """
+        max_bytes = get_max_download_bytes()
+        declared = response.headers.get("content-length", "")
+        if declared.isdigit() and int(declared) > max_bytes:
+            raise DownloadRejectedError(f"Content length {declared} exceeds the download limit of {max_bytes} bytes")
 
-        # Clean up whitespace and normalize
-        text = re.sub(r"\s+", " ", text)
-        text = text.strip()
+        try:
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        parts = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            if sniff_binary and size == 0 and b"\x00" in chunk:
+                raise DownloadRejectedError("Unsupported binary content")
+            size += len(chunk)
+            # The body may be compressed, so the limit is also enforced while reading
+            if size > max_bytes:
+                raise DownloadRejectedError(f"Response exceeds the download limit of {max_bytes} bytes")
+            parts.append(decoder.decode(chunk))
+        parts.append(decoder.decode(b"", final=True))
+        return "".join(parts), size
+
+    def _extract_html_content(self, html: str, url: str) -> tuple[str, dict[str, Any]]:
+        """
+        Extract clean text content and metadata from HTML.
+
+        Boilerplate such as navigation and footers is removed, and blocks of
+        the main content are separated by blank lines so that chunking can
+        split on paragraph boundaries.
+
+        Args:
+            html: HTML content
+            url: Source URL for context
 
+        Returns:
+            Tuple of (cleaned_text, metadata_dict)
+        """
+        text, metadata = get_html_extractor(self.html_extractor_name).extract(html)
+        if not metadata.get("title"):
+            metadata["title"] = self._extract_title_from_url(url)
         return text, metadata
 
     def _extract_title_from_url(self, url: str) -> str:
@@ -271,19 +1143,19 @@ class IngestionService:
 
         return title.title() if title else parsed.netloc
 
-    def _create_optimal_chunks(
+    async def chunk_text(
         self,
         text: str,
         max_tokens: int = 500,
         overlap_tokens: int = 50,
     ) -> list[str]:
         """
-        Create optimal text chunks using token-aware semantic splitting.
+        Chunk text without blocking the event loop.
 
-        This method combines several strategies:
-        1. Token-aware chunking using tiktoken
-        2. Semantic boundary detection (paragraphs, sentences)
-        3. Overlap management for context preservation
+        Texts of a few KB are chunked inline. Larger texts are chunked in the
+        shared worker pool, so concurrent calls for different documents run in
+        parallel, and very large documents are split into paragraph-aligned
+        shards that are chunked in parallel.
 
         Args:
             text: Input text to chunk
@@ -293,167 +1165,127 @@ class IngestionService:
         Returns:
             List of text chunks
         """
-        if not text or not text.strip():
-            return []
-
-        # First, split by paragraphs to respect semantic boundaries
-        paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-
-        if not paragraphs:
-            # Fallback to sentence splitting
-            paragraphs = self._split_into_sentences(text)
-
-        chunks = []
-        current_chunk = ""
-        current_tokens = 0
-
-        for paragraph in paragraphs:
-            paragraph_tokens = len(self._encoding.encode(paragraph))
-
-            # If paragraph alone exceeds max_tokens, split it further
-            if paragraph_tokens > max_tokens:
-                # Add current chunk if it has content
-                if current_chunk.strip():
-                    chunks.append(current_chunk.strip())
-                    current_chunk = ""
-                    current_tokens = 0
-
-                # Split large paragraph
-                sub_chunks = self._split_large_text(paragraph, max_tokens, overlap_tokens)
-                chunks.extend(sub_chunks)
-                continue
-
-            # Check if adding this paragraph would exceed limit
-            if current_tokens + paragraph_tokens > max_tokens and current_chunk.strip():
-                # Save current chunk
-                chunks.append(current_chunk.strip())
-
-                # Start new chunk with overlap
-                overlap_text = self._get_overlap_text(current_chunk, overlap_tokens)
-                current_chunk = overlap_text + "\n\n" + paragraph if overlap_text else paragraph
-                current_tokens = len(self._encoding.encode(current_chunk))
-            else:
-                # Add paragraph to current chunk
-                if current_chunk:
-                    current_chunk += "\n\n" + paragraph
-                else:
-                    current_chunk = paragraph
-                current_tokens += paragraph_tokens
-
-        # Add final chunk
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
-
-        # Filter out very small chunks
-        chunks = [chunk for chunk in chunks if len(self._encoding.encode(chunk)) >= 10]
+        if len(text) <= INLINE_CHUNKING_LIMIT:
+            return self._create_optimal_chunks(text, max_tokens, overlap_tokens)
+
+        loop = asyncio.get_running_loop()
+        executor = get_chunking_executor()
+        shards = split_into_shards(text)
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, chunk_with_tokenizer, self.tokenizer_name, shard, max_tokens, overlap_tokens)
+                for shard in shards
+            )
+        )
+        chunks = [chunk for shard_chunks in results for chunk in shard_chunks]
 
-        logger.info(f"Created {len(chunks)} chunks with token-aware splitting")
+        logger.info(f"Created {len(chunks)} chunks from {len(shards)} shards in the worker pool")
         return chunks
 
-    def _split_into_sentences(self, text: str) -> list[str]:
-        """Split text into sentences using simple regex."""
-        # Simple sentence splitting - can be enhanced with spaCy if needed
-        sentences = re.split(r"(?<=[.!?])\s+", text)
-        return [s.strip() for s in sentences if s.strip()]
-
-    def _split_large_text(self, text: str, max_tokens: int, overlap_tokens: int) -> list[str]:
+    def _create_optimal_chunks(
+        self,
+        text: str,
+        max_tokens: int = 500,
+        overlap_tokens: int = 50,
+    ) -> list[str]:
         """
-        Split text that's too large into smaller chunks.
+        Create optimal text chunks using token-aware semantic splitting.
+
+        This method combines several strategies:
+        1. Token-aware chunking with the shared tokenizer, encoding the text only once
+        2. Semantic boundary detection (paragraphs, sentences)
+        3. Overlap management for context preservation
 
         Args:
-            text: Text to split
+            text: Input text to chunk
             max_tokens: Maximum tokens per chunk
-            overlap_tokens: Overlap between chunks
+            overlap_tokens: Number of tokens to overlap between chunks
 
         Returns:
             List of text chunks
         """
-        chunks = []
-        sentences = self._split_into_sentences(text)
+        chunks = get_chunker(self.tokenizer_name).chunk(text, max_tokens=max_tokens, overlap_tokens=overlap_tokens)
 
-        current_chunk = ""
-        current_tokens = 0
+        logger.info(f"Created {len(chunks)} chunks with token-aware splitting")
+        return chunks
 
-        for sentence in sentences:
-            sentence_tokens = len(self._encoding.encode(sentence))
 
-            if sentence_tokens > max_tokens:
-                # Split very long sentences by words
-                if current_chunk.strip():
-                    chunks.append(current_chunk.strip())
-                    current_chunk = ""
-                    current_tokens = 0
+_chunking_executor: Executor | None = None
 
-                word_chunks = self._split_by_words(sentence, max_tokens)
-                chunks.extend(word_chunks)
-                continue
 
-            if current_tokens + sentence_tokens > max_tokens and current_chunk.strip():
-                chunks.append(current_chunk.strip())
+def get_chunking_executor() -> Executor:
+    """
+    Get the process-wide worker pool used for chunking.
 
-                # Start new chunk with overlap
-                overlap_text = self._get_overlap_text(current_chunk, overlap_tokens)
-                current_chunk = overlap_text + " " + sentence if overlap_text else sentence
-                current_tokens = len(self._encoding.encode(current_chunk))
-            else:
-                if current_chunk:
-                    current_chunk += " " + sentence
-                else:
-                    current_chunk = sentence
-                current_tokens += sentence_tokens
+    The pool is created on first use and shut down by the app lifespan.
+    """
+    global _chunking_executor
+    if _chunking_executor is None:
+        _chunking_executor = ProcessPoolExecutor(max_workers=get_chunking_workers())
+    return _chunking_executor
 
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
 
-        return chunks
+def shutdown_chunking_executor() -> None:
+    """Shut down the process-wide chunking worker pool, if one was created."""
+    global _chunking_executor
+    if _chunking_executor is not None:
+        _chunking_executor.shutdown(wait=False, cancel_futures=True)
+        _chunking_executor = None
 
-    def _split_by_words(self, text: str, max_tokens: int) -> list[str]:
-        """Split text by words when sentences are too long."""
-        words = text.split()
-        chunks = []
-        current_chunk = ""
-
-        for word in words:
-            test_chunk = current_chunk + " " + word if current_chunk else word
-            if len(self._encoding.encode(test_chunk)) > max_tokens and current_chunk:
-                chunks.append(current_chunk.strip())
-                current_chunk = word
-            else:
-                current_chunk = test_chunk
 
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+_http_client: httpx.AsyncClient | None = None
 
-        return chunks
 
-    def _get_overlap_text(self, text: str, overlap_tokens: int) -> str:
-        """
-        Get the last part of text for overlap with next chunk.
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client used for downloads.
 
-        Args:
-            text: Source text
-            overlap_tokens: Number of tokens to include in overlap
+    The client pools connections across requests and negotiates HTTP/2 when
+    the optional h2 package is installed. It is closed by the app lifespan.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=httpx.Timeout(30.0),
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _http_client
 
-        Returns:
-            Overlap text
-        """
-        if overlap_tokens <= 0:
-            return ""
 
-        # Split into sentences and take from the end
-        sentences = self._split_into_sentences(text)
-        if not sentences:
-            return ""
+async def close_http_client() -> None:
+    """Close the process-wide HTTP client, if one was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
-        overlap_text = ""
-        current_tokens = 0
 
-        # Build overlap from end backwards
-        for sentence in reversed(sentences):
-            sentence_tokens = len(self._encoding.encode(sentence))
-            if current_tokens + sentence_tokens > overlap_tokens:
-                break
-            overlap_text = sentence + " " + overlap_text if overlap_text else sentence
-            current_tokens += sentence_tokens
+_signature_index: SignatureIndex | None = None
 
-        return overlap_text.strip()
+
+def get_signature_index() -> SignatureIndex | None:
+    """
+    Get the process-wide near-duplicate signature index in WEAVIATE_NEAR_DUPLICATE_DIR.
+
+    Returns:
+        The index, opened on first use, or None if it could not be opened
+    """
+    global _signature_index
+    if _signature_index is None:
+        path = os.path.join(get_near_duplicate_config()["index_dir"], "signatures.sqlite3")
+        try:
+            _signature_index = SignatureIndex(path)
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Near-duplicate filtering disabled, failed to open the signature index {path}: {e}")
+            return None
+    return _signature_index
+
+
+def close_signature_index() -> None:
+    """Close the process-wide signature index, if one was opened."""
+    global _signature_index
+    if _signature_index is not None:
+        _signature_index.close()
+        _signature_index = None
@@ -1,19 +1,93 @@
 """Weaviate service implementation for MCP server."""
 
+import asyncio
+import copy
+import functools
+import json
 import logging
+import os
+import time
 from typing import Any
 
 from weaviate import WeaviateAsyncClient
+from weaviate.classes.aggregate import GroupByAggregate
 from weaviate.classes.config import Configure, Property
+from weaviate.classes.data import DataObject
 from weaviate.classes.init import AdditionalConfig, Timeout
 from weaviate.classes.query import Filter, MetadataQuery, Sort
+from weaviate.classes.tenants import Tenant, TenantActivityStatus
 from weaviate.connect import ConnectionParams
+from weaviate.util import generate_uuid5
 
 from ..auth import get_openai_api_key
-from ..config import get_weaviate_config
+from ..config import get_query_cache_config, get_schema_cache_ttl, get_weaviate_config
+from ..utils.object_files import detect_file_format, open_object_writer, read_object_batches
+from ..utils.query_cache import QueryCache, filter_cache_key, normalize_collection_name
+from ..utils.rank_fusion import DEFAULT_RRF_K, FUSION_METHODS, fuse_ranked_lists
+from .embedding_service import get_query_embedder
 
 logger = logging.getLogger(__name__)
 
+# Seconds between liveness probes on an already connected client
+HEALTH_CHECK_INTERVAL = 30.0
+
+# Supported upsert modes for deterministic-ID inserts
+UPSERT_MODES = ("skip", "replace")
+
+# Tenant activity statuses that can be set
+TENANT_STATUSES = {
+    "active": TenantActivityStatus.ACTIVE,
+    "inactive": TenantActivityStatus.INACTIVE,
+    "offloaded": TenantActivityStatus.OFFLOADED,
+}
+
+
+def generate_object_uuid(data: dict[str, Any], unique_properties: list[str]) -> str:
+    """
+    Derive a deterministic UUIDv5 from an object's unique property values.
+
+    Objects with the same values for `unique_properties` always map to the
+    same ID, so inserting by this ID is an idempotent upsert.
+    """
+    identifier = json.dumps([[prop, data.get(prop)] for prop in unique_properties], sort_keys=True, default=str)
+    return generate_uuid5(identifier)
+
+
+def _import_vector(record: dict[str, Any]) -> Any:
+    """Vector of an imported record; a lone "default" vector is the collection's unnamed vector."""
+    vector = record["vector"]
+    if isinstance(vector, dict) and list(vector) == ["default"]:
+        return vector["default"]
+    return vector
+
+
+def _invalidates_queries(method):
+    """Invalidate cached query results of the collection a write method was called for, once it finishes."""
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            collection_name = args[0] if args else kwargs.get("collection_name", kwargs.get("name"))
+            if collection_name:
+                self._query_cache.invalidate(collection_name)
+
+    return wrapper
+
+
+def _invalidates_schema(method):
+    """Invalidate the cached schema once a method changing the collections finishes."""
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            self.invalidate_schema()
+
+    return wrapper
+
 
 class WeaviateService:
     """Weaviate service for MCP server with fail-safe error handling."""
@@ -22,12 +96,89 @@ class WeaviateService:
         """Initialize the Weaviate service."""
         self._client = None
         self._connected = False
+        self._loop = None
+        self._last_health_check = 0.0
+        self._connect_lock = asyncio.Lock()
+        # Search results, invalidated per collection by the write methods below
+        self._query_cache = QueryCache(**get_query_cache_config())
+        # Collection schema from list_all, with an index of collections and properties by name
+        self._schema_ttl = get_schema_cache_ttl()
+        self._schema: dict[str, Any] | None = None
+        self._schema_expires = 0.0
+        self._schema_index: dict[str, dict[str, Any]] = {}
+        self._schema_version = 0
+        self._schema_lock = asyncio.Lock()
+        # Last database statistics as (monotonic time taken, result)
+        self._stats_snapshot: tuple[float, dict[str, Any]] | None = None
 
     async def _ensure_connected(self) -> bool:
-        """Ensure the client is connected."""
-        if self._client and self._connected:
+        """
+        Ensure the client is connected.
+
+        An existing connection is reused as long as it belongs to the running
+        event loop and passes a liveness probe (at most once every
+        HEALTH_CHECK_INTERVAL seconds); otherwise the client is reconnected.
+        """
+        if self._client and self._connected and await self._is_healthy():
             return True
 
+        async with self._connect_lock:
+            # Another caller may have reconnected while we waited for the lock
+            if self._client and self._connected:
+                return True
+            await self._discard_client()
+            return await self._connect()
+
+    async def _is_healthy(self) -> bool:
+        """
+        Check whether the current client can still be used.
+
+        A stale client is only marked as disconnected here; it is closed by
+        _ensure_connected while holding the connect lock.
+        """
+        client = self._client
+        if self._loop is not asyncio.get_running_loop():
+            # Clients are bound to the loop they were connected on
+            logger.warning("WeaviateService client belongs to another event loop, reconnecting")
+            self._connected = False
+            return False
+
+        now = time.monotonic()
+        if now - self._last_health_check < HEALTH_CHECK_INTERVAL:
+            return True
+
+        try:
+            healthy = await client.is_live()
+        except Exception as e:
+            logger.warning(f"WeaviateService health check failed: {e}")
+            healthy = False
+
+        if healthy:
+            self._last_health_check = now
+            return True
+
+        logger.warning("WeaviateService connection is not live, reconnecting")
+        # Another caller may have replaced the client during the probe
+        if self._client is client:
+            self._connected = False
+        return False
+
+    async def _discard_client(self) -> None:
+        """Close and drop the current client, if any. Callers hold the connect lock."""
+        client = self._client
+        self._client = None
+        self._connected = False
+        self._loop = None
+        if client is not None:
+            try:
+                await client.close()
+                logger.info("WeaviateService connection closed")
+            except Exception as e:
+                # A client of a closed event loop may fail to close cleanly
+                logger.error(f"Error closing WeaviateService: {e}")
+
+    async def _connect(self) -> bool:
+        """Create and connect a new client."""
         try:
             # Get configuration from environment
             config = get_weaviate_config()
@@ -57,6 +208,8 @@ class WeaviateService:
             # Connect the client
             await self._client.connect()
             self._connected = True
+            self._loop = asyncio.get_running_loop()
+            self._last_health_check = time.monotonic()
             logger.info("WeaviateService connected successfully")
             return True
 
@@ -68,28 +221,99 @@ class WeaviateService:
 
     async def close(self):
         """Close the Weaviate connection."""
-        if self._client and self._connected:
-            try:
-                await self._client.close()
-                logger.info("WeaviateService connection closed")
-            except Exception as e:
-                logger.error(f"Error closing WeaviateService: {e}")
-            finally:
-                self._client = None
-                self._connected = False
+        async with self._connect_lock:
+            await self._discard_client()
+
+    def _collection(self, collection_name: str, tenant: str | None = None) -> Any:
+        """Handle of a collection, scoped to one tenant of a multi-tenant collection if given."""
+        collection = self._client.collections.get(collection_name)
+        return collection.with_tenant(tenant) if tenant else collection
 
     # Collection management methods
-    async def get_schema(self) -> dict[str, Any]:
-        """Get current schema."""
-        try:
-            if not await self._ensure_connected():
-                return {"error": True, "message": "Failed to connect to Weaviate"}
+    async def get_schema(self, use_cache: bool = True) -> dict[str, Any]:
+        """
+        Get current schema.
 
-            return await self._client.collections.list_all()
+        The schema is cached for WEAVIATE_SCHEMA_CACHE_TTL seconds and
+        invalidated when collections are created or deleted through this
+        service. Concurrent callers share one fetch. Pass use_cache=False to
+        always fetch it from Weaviate.
+        """
+        try:
+            if use_cache and self._schema is not None and time.monotonic() < self._schema_expires:
+                return dict(self._schema)
+
+            async with self._schema_lock:
+                if use_cache and self._schema is not None and time.monotonic() < self._schema_expires:
+                    return dict(self._schema)
+
+                if not await self._ensure_connected():
+                    return {"error": True, "message": "Failed to connect to Weaviate"}
+
+                version = self._schema_version
+                schema = await self._client.collections.list_all()
+                # Keep the result only if no collection changed while fetching it
+                if self._schema_ttl > 0 and version == self._schema_version:
+                    self._schema = schema
+                    self._schema_expires = time.monotonic() + self._schema_ttl
+                    self._schema_index = {
+                        normalize_collection_name(name): self._collection_entry(name, config)
+                        for name, config in schema.items()
+                    }
+                return dict(schema)
         except Exception as e:
             logger.error(f"Error getting schema: {e}")
             return {"error": True, "message": str(e)}
 
+    async def get_collection_schema(self, collection_name: str) -> dict[str, Any]:
+        """
+        Get the configuration and properties of one collection from the cached schema.
+
+        Args:
+            collection_name: Name of the collection, matched as Weaviate does
+                (the first letter is case-insensitive)
+
+        Returns:
+            Dictionary with the collection's name, config and properties (by
+            name), or an error with the available collections if it does not exist
+        """
+        schema = await self.get_schema()
+        if schema.get("error"):
+            return schema
+
+        key = normalize_collection_name(collection_name)
+        entry = self._schema_index.get(key)
+        if entry is None or entry["name"] not in schema:
+            # The index is empty when the schema cache is disabled or was just invalidated
+            name = next((name for name in schema if normalize_collection_name(name) == key), None)
+            if name is None:
+                return {
+                    "error": True,
+                    "message": f"Collection '{collection_name}' does not exist",
+                    "available_collections": list(schema.keys()),
+                }
+            entry = self._collection_entry(name, schema[name])
+        return {"success": True, **entry, "properties": dict(entry["properties"])}
+
+    @staticmethod
+    def _collection_entry(name: str, config: Any) -> dict[str, Any]:
+        """Index entry of a collection: its name, config and properties by name."""
+        return {
+            "name": name,
+            "config": config,
+            "properties": {prop.name: prop for prop in getattr(config, "properties", None) or []},
+        }
+
+    def invalidate_schema(self) -> None:
+        """Drop the cached schema, so that the next lookup fetches it from Weaviate."""
+        self._schema_version += 1
+        self._schema = None
+        self._schema_expires = 0.0
+        self._schema_index = {}
+        self._stats_snapshot = None
+
+    @_invalidates_schema
+    @_invalidates_queries
     async def create_collection(
         self,
         name: str,
@@ -97,8 +321,17 @@ class WeaviateService:
         properties: list[Property],
         vectorizer_config: Configure.Vectorizer | None = None,
         generative_config: Configure.Generative | None = None,
+        vector_index_config: Any | None = None,
+        sharding_config: Any | None = None,
+        replication_config: Any | None = None,
+        multi_tenancy_config: Any | None = None,
     ) -> dict[str, Any]:
-        """Create a new collection."""
+        """
+        Create a new collection.
+
+        The index, sharding, replication and multi-tenancy configs are built
+        with utils.collection_config; None keeps Weaviate's defaults.
+        """
         try:
             if not await self._ensure_connected():
                 return {"error": True, "message": "Failed to connect to Weaviate"}
@@ -109,6 +342,10 @@ class WeaviateService:
                 properties=properties,
                 vectorizer_config=vectorizer_config,
                 generative_config=generative_config,
+                vector_index_config=vector_index_config,
+                sharding_config=sharding_config,
+                replication_config=replication_config,
+                multi_tenancy_config=multi_tenancy_config,
             )
             return {
                 "success": True,
@@ -131,6 +368,8 @@ class WeaviateService:
             logger.error(f"Error creating collection {name}: {error_message}")
             return {"error": True, "message": error_message}
 
+    @_invalidates_schema
+    @_invalidates_queries
     async def delete_collection(self, name: str) -> dict[str, Any]:
         """Delete a collection."""
         try:
@@ -161,45 +400,177 @@ class WeaviateService:
             logger.error(f"Error deleting collection {name}: {error_message}")
             return {"error": True, "message": error_message}
 
+    # Tenant management methods
+    async def create_tenants(
+        self,
+        collection_name: str,
+        tenants: list[str],
+        activity_status: str = "active",
+    ) -> dict[str, Any]:
+        """
+        Add tenants to a multi-tenant collection.
+
+        Args:
+            collection_name: Name of the collection
+            tenants: Tenant names
+            activity_status: Initial status, "active" or "inactive"
+
+        Returns:
+            Dictionary with the number of tenants created
+        """
+        try:
+            status = TENANT_STATUSES.get(activity_status)
+            if status is None or status == TenantActivityStatus.OFFLOADED:
+                return {
+                    "error": True,
+                    "message": f"Unsupported initial tenant status: {activity_status}. Supported: active, inactive",
+                }
+            if not await self._ensure_connected():
+                return {"error": True, "message": "Failed to connect to Weaviate"}
+
+            collection = self._client.collections.get(collection_name)
+            await collection.tenants.create([Tenant(name=name, activity_status=status) for name in tenants])
+            return {
+                "success": True,
+                "created_count": len(tenants),
+                "message": f"Created {len(tenants)} tenants in collection '{collection_name}'",
+            }
+        except Exception as e:
+            logger.error(f"Error creating tenants in {collection_name}: {e}")
+            return {"error": True, "message": str(e)}
+
+    async def list_tenants(self, collection_name: str) -> dict[str, Any]:
+        """
+        List the tenants of a multi-tenant collection with their activity status.
+
+        Returns:
+            Dictionary with the tenants sorted by name and a count per status
+        """
+        try:
+            if not await self._ensure_connected():
+                return {"error": True, "message": "Failed to connect to Weaviate"}
+
+            collection = self._client.collections.get(collection_name)
+            tenants = await collection.tenants.get()
+            listed = [
+                {"name": name, "activity_status": tenant.activity_status.value.lower()}
+                for name, tenant in sorted(tenants.items())
+            ]
+            status_counts: dict[str, int] = {}
+            for tenant in listed:
+                status_counts[tenant["activity_status"]] = status_counts.get(tenant["activity_status"], 0) + 1
+            return {"tenants": listed, "count": len(listed), "status_counts": status_counts}
+        except Exception as e:
+            logger.error(f"Error listing tenants of {collection_name}: {e}")
+            return {"error": True, "message": str(e)}
+
+    @_invalidates_queries
+    async def update_tenant_status(
+        self,
+        collection_name: str,
+        tenants: list[str],
+        activity_status: str,
+    ) -> dict[str, Any]:
+        """
+        Change the activity status of tenants.
+
+        Inactive tenants keep their data on local disk but free its memory;
+        offloaded tenants are moved to cloud storage (requires an offload
+        module on the server). Only active tenants can be read or written.
+
+        Args:
+            collection_name: Name of the collection
+            tenants: Tenant names
+            activity_status: "active", "inactive" or "offloaded"
+
+        Returns:
+            Dictionary with the number of tenants updated
+        """
+        try:
+            status = TENANT_STATUSES.get(activity_status)
+            if status is None:
+                return {
+                    "error": True,
+                    "message": f"Unsupported tenant status: {activity_status}. Supported: {', '.join(TENANT_STATUSES)}",
+                }
+            if not await self._ensure_connected():
+                return {"error": True, "message": "Failed to connect to Weaviate"}
+
+            collection = self._client.collections.get(collection_name)
+            await collection.tenants.update([Tenant(name=name, activity_status=status) for name in tenants])
+            return {
+                "success": True,
+                "updated_count": len(tenants),
+                "message": f"Set {len(tenants)} tenants of collection '{collection_name}' to {activity_status}",
+            }
+        except Exception as e:
+            logger.error(f"Error updating tenants of {collection_name}: {e}")
+            return {"error": True, "message": str(e)}
+
+    @_invalidates_queries
+    async def delete_tenants(self, collection_name: str, tenants: list[str]) -> dict[str, Any]:
+        """Remove tenants, and all their objects, from a multi-tenant collection."""
+        try:
+            if not await self._ensure_connected():
+                return {"error": True, "message": "Failed to connect to Weaviate"}
+
+            collection = self._client.collections.get(collection_name)
+            await collection.tenants.remove(tenants)
+            return {
+                "success": True,
+                "deleted_count": len(tenants),
+                "message": f"Deleted {len(tenants)} tenants from collection '{collection_name}'",
+            }
+        except Exception as e:
+            logger.error(f"Error deleting tenants from {collection_name}: {e}")
+            return {"error": True, "message": str(e)}
+
     # Object operations
+    @_invalidates_queries
     async def insert_object(
         self,
         collection_name: str,
         data: dict[str, Any],
         unique_properties: list[str] | None = None,
+        upsert: str | None = None,
+        tenant: str | None = None,
     ) -> dict[str, Any]:
-        """Insert a new object."""
+        """
+        Insert a new object.
+
+        Without `upsert`, `unique_properties` triggers a duplicate query before
+        inserting. With `upsert` ("skip" or "replace"), the object ID is derived
+        from the unique property values instead: "skip" keeps an existing object
+        with that ID, "replace" overwrites it.
+        """
         try:
+            if upsert_error := self._validate_upsert(upsert, unique_properties):
+                return upsert_error
+
             if not await self._ensure_connected():
                 return {"error": True, "message": "Failed to connect to Weaviate"}
 
-            collection = self._client.collections.get(collection_name)
+            collection = self._collection(collection_name, tenant)
+
+            if upsert:
+                object_uuid = generate_object_uuid(data, unique_properties)
+                if upsert == "replace":
+                    await self._insert_single(collection, data, object_uuid)
+                    return {"success": True, "object_id": object_uuid}
+                try:
+                    await collection.data.insert(data, uuid=object_uuid)
+                except Exception as e:
+                    if "already exists" not in str(e).lower():
+                        raise
+                    logger.info(f"Object {object_uuid} already exists, skipping")
+                    return {"success": True, "object_id": object_uuid, "existing": True}
+                return {"success": True, "object_id": object_uuid}
 
             if unique_properties:
-                # Build list of filters for unique properties
-                filter_conditions = [
-                    Filter.by_property(prop).equal(data.get(prop))
-                    for prop in unique_properties
-                    if prop in data and data.get(prop) is not None
-                ]
-
-                if filter_conditions:
-                    # Use Filter.all_of() with a list of conditions
-                    filters = Filter.all_of(filter_conditions)
-                    existing_result = await self.get_objects(
-                        collection_name, filters=filters, limit=1
-                    )
-                else:
-                    # No valid filter conditions, skip duplicate check
-                    existing_result = {"objects": []}
-                if existing_result.get("objects"):
-                    logger.warning(
-                        f"Object with properties {unique_properties} already exists"
-                    )
-                    return {
-                        "success": True,
-                        "object_id": existing_result["objects"][0]["id"],
-                    }
+                existing_id = await self._find_existing_object_id(collection_name, data, unique_properties, tenant)
+                if existing_id:
+                    logger.warning(f"Object with properties {unique_properties} already exists")
+                    return {"success": True, "object_id": existing_id}
 
             object_id = await collection.data.insert(data)
             return {"success": True, "object_id": str(object_id)}
@@ -213,13 +584,14 @@ class WeaviateService:
         uuid: str,
         include_vector: bool = False,
         return_properties: list[str] | None = None,
+        tenant: str | None = None,
     ) -> dict[str, Any]:
         """Get object by ID."""
         try:
             if not await self._ensure_connected():
                 return {"error": True, "message": "Failed to connect to Weaviate"}
 
-            collection = self._client.collections.get(collection_name)
+            collection = self._collection(collection_name, tenant)
             result = await collection.query.fetch_object_by_id(
                 uuid,
                 include_vector=include_vector,
@@ -244,13 +616,14 @@ class WeaviateService:
         sort: Sort | None = None,
         return_properties: list[str] | None = None,
         include_vector: bool = False,
+        tenant: str | None = None,
     ) -> dict[str, Any]:
         """Get objects from a collection."""
         try:
             if not await self._ensure_connected():
                 return {"error": True, "message": "Failed to connect to Weaviate"}
 
-            collection = self._client.collections.get(collection_name)
+            collection = self._collection(collection_name, tenant)
             results = await collection.query.fetch_objects(
                 filters=filters,
                 limit=limit,
@@ -273,6 +646,373 @@ class WeaviateService:
             )
             return {"error": True, "message": str(e)}
 
+    async def get_all_objects(
+        self,
+        collection_name: str,
+        filters: Filter,
+        return_properties: list[str] | None = None,
+        batch_size: int = 1000,
+        tenant: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get every object matching a filter, beyond the server's cap on offsets.
+
+        A filter matching fewer than batch_size objects is answered with one
+        query. Otherwise, as Weaviate's cursor cannot be combined with a
+        filter, the collection's IDs are paged through by cursor and each page
+        is narrowed to the matching objects with one filtered query, until as
+        many objects as matched at the start were found.
+
+        Args:
+            collection_name: Name of the collection
+            filters: Filter selecting the objects
+            return_properties: Properties to return, all properties if omitted
+            batch_size: Number of objects per page
+            tenant: Tenant of a multi-tenant collection to operate on
+
+        Returns:
+            Dictionary with objects and count, or error details. A failure
+            part way through returns the error, never a partial list.
+        """
+        try:
+            if not await self._ensure_connected():
+                return {"error": True, "message": "Failed to connect to Weaviate"}
+
+            collection = self._collection(collection_name, tenant)
+            batch_size = max(batch_size, 1)
+            first_page = await collection.query.fetch_objects(
+                filters=filters, limit=batch_size, return_properties=return_properties
+            )
+            objects = list(first_page.objects)
+
+            if len(objects) == batch_size:
+                count = await collection.aggregate.over_all(filters=filters, total_count=True)
+                matches = count.total_count or 0
+                objects = []
+                after = None
+                while len(objects) < matches:
+                    page = await collection.query.fetch_objects(limit=batch_size, after=after, return_properties=[])
+                    if not page.objects:
+                        break
+                    after = page.objects[-1].uuid
+                    page_ids = [obj.uuid for obj in page.objects]
+                    matching = await collection.query.fetch_objects(
+                        filters=Filter.all_of([filters, Filter.by_id().contains_any(page_ids)]),
+                        limit=len(page_ids),
+                        return_properties=return_properties,
+                    )
+                    objects.extend(matching.objects)
+                    if len(page.objects) < batch_size:
+                        break
+
+            results = []
+            for obj in objects:
+                properties = obj.properties
+                properties["id"] = str(obj.uuid)
+                results.append(properties)
+
+            return {"objects": results, "count": len(results)}
+        except Exception as e:
+            logger.error(f"Error retrieving all matching objects from collection {collection_name}: {e}")
+            return {"error": True, "message": str(e)}
+
+    async def get_vectors(
+        self,
+        collection_name: str,
+        object_ids: list[str],
+        batch_size: int = 100,
+        tenant: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get the stored vectors of objects by ID, with one query per batch of IDs.
+
+        Args:
+            collection_name: Name of the collection
+            object_ids: IDs of the objects
+            batch_size: Maximum number of IDs per query
+            tenant: Tenant of a multi-tenant collection to operate on
+
+        Returns:
+            Dictionary with "vectors", mapping each found ID to its vector (a
+            list, or a mapping of vector name to list for named vectors), or
+            error details
+        """
+        try:
+            if not object_ids:
+                return {"vectors": {}}
+
+            if not await self._ensure_connected():
+                return {"error": True, "message": "Failed to connect to Weaviate"}
+
+            collection = self._collection(collection_name, tenant)
+            vectors = {}
+            for start in range(0, len(object_ids), batch_size):
+                chunk = object_ids[start : start + batch_size]
+                results = await collection.query.fetch_objects(
+                    filters=Filter.by_id().contains_any(chunk),
+                    limit=len(chunk),
+                    return_properties=[],
+                    include_vector=True,
+                )
+                for obj in results.objects:
+                    if obj.vector:
+                        vectors[str(obj.uuid)] = _import_vector({"vector": obj.vector})
+
+            return {"vectors": vectors}
+        except Exception as e:
+            logger.error(f"Error getting vectors from {collection_name}: {e}")
+            return {"error": True, "message": str(e)}
+
+    async def export_collection(
+        self,
+        collection_name: str,
+        path: str,
+        file_format: str | None = None,
+        include_vector: bool = False,
+        return_properties: list[str] | None = None,
+        batch_size: int = 1000,
+        tenant: str | None = None,
+        overwrite: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Stream all objects of a collection to a local JSONL or Parquet file.
+
+        Objects are paged with a cursor on the object ID rather than an offset,
+        so every page is equally fast and there is no server-side cap on the
+        number of objects. The next page is fetched while the previous one is
+        written, and at most two pages are held in memory. The file is written
+        under a temporary name and moved into place once complete. An existing
+        file at the path is only replaced if overwrite is set.
+
+        Args:
+            collection_name: Name of the collection
+            path: Path of the file to write
+            file_format: "jsonl" or "parquet", inferred from the path's extension if omitted
+            include_vector: Whether to export the objects' vectors
+            return_properties: Properties to export, all properties if omitted
+            batch_size: Number of objects per page
+            tenant: Tenant of a multi-tenant collection to operate on
+            overwrite: Whether to replace an existing file at the path
+
+        Returns:
+            Dictionary with the object count, bytes written and throughput, or error details
+        """
+        start_time = time.perf_counter()
+        partial_path = f"{path}.partial"
+        writer = None
+        page = None
+        try:
+            file_format = detect_file_format(path, file_format)
+            if not overwrite and os.path.exists(path):
+                return {"error": True, "message": f"File {path} already exists, set overwrite to replace it"}
+            if not await self._ensure_connected():
+                return {"error": True, "message": "Failed to connect to Weaviate"}
+
+            collection = self._collection(collection_name, tenant)
+            batch_size = max(batch_size, 1)
+
+            def fetch_page(after: Any) -> asyncio.Future:
+                return asyncio.ensure_future(
+                    collection.query.fetch_objects(
+                        limit=batch_size,
+                        after=after,
+                        return_properties=return_properties,
+                        include_vector=include_vector,
+                    )
+                )
+
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            writer = await asyncio.to_thread(open_object_writer, partial_path, file_format)
+            exported = 0
+            page = fetch_page(None)
+            while page is not None:
+                objects = (await page).objects
+                # Start fetching the next page before writing this one, unless this was the last page
+                page = fetch_page(objects[-1].uuid) if len(objects) == batch_size else None
+                records = [
+                    {
+                        "id": str(obj.uuid),
+                        "properties": obj.properties,
+                        "vector": (obj.vector or None) if include_vector else None,
+                    }
+                    for obj in objects
+                ]
+                if records:
+                    await asyncio.to_thread(writer.write, records)
+                exported += len(records)
+
+            await asyncio.to_thread(writer.close)
+            writer = None
+            # The file may have been created while the export ran
+            if not overwrite and os.path.exists(path):
+                return {"error": True, "message": f"File {path} already exists, set overwrite to replace it"}
+            os.replace(partial_path, path)
+
+            elapsed = time.perf_counter() - start_time
+            bytes_written = os.path.getsize(path)
+            logger.info(f"Exported {exported} objects from '{collection_name}' to {path} in {elapsed:.2f}s")
+            return {
+                "success": True,
+                "collection_name": collection_name,
+                "path": path,
+                "file_format": file_format,
+                "objects_exported": exported,
+                "bytes_written": bytes_written,
+                "elapsed_seconds": round(elapsed, 3),
+                "objects_per_second": round(exported / elapsed, 2) if elapsed > 0 else None,
+                "megabytes_per_second": round(bytes_written / 1_000_000 / elapsed, 2) if elapsed > 0 else None,
+            }
+        except Exception as e:
+            logger.error(f"Error exporting collection {collection_name} to {path}: {e}")
+            return {"error": True, "message": str(e)}
+        finally:
+            # Stop a prefetch that is no longer needed, or retrieve its error so it is not reported as unhandled
+            if page is not None and not page.cancel():
+                page.exception()
+            if writer is not None:
+                await asyncio.to_thread(writer.close)
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+    @_invalidates_queries
+    async def import_file(
+        self,
+        collection_name: str,
+        path: str,
+        file_format: str | None = None,
+        batch_size: int = 200,
+        concurrency: int = 4,
+        start_offset: int = 0,
+        tenant: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Stream objects from a local JSONL or Parquet file into a collection.
+
+        Records are read in batches in a worker thread and sent with
+        `insert_many` (gRPC), with up to `concurrency` batches in flight.
+        Precomputed vectors are imported as is, so the vectorizer is not
+        called for them. Records with an ID overwrite existing objects, which
+        makes re-importing part of a file safe.
+
+        A batch is committed once Weaviate has answered its request; objects
+        it rejected are reported in `failed_objects`. If a request fails, no
+        further batches are read and `committed_offset` is the number of
+        records, from the start of the file, of which every batch was
+        committed. Passing it as `start_offset` resumes the import.
+
+        Args:
+            collection_name: Name of the collection to import into
+            path: Path of the file to read
+            file_format: "jsonl" or "parquet", inferred from the path's extension if omitted
+            batch_size: Number of objects per batch request
+            concurrency: Maximum number of batch requests in flight
+            start_offset: Number of records to skip from the start of the file
+            tenant: Tenant of a multi-tenant collection to operate on
+
+        Returns:
+            Dictionary with imported and failed counts, committed_offset and
+            throughput, or error details including committed_offset
+        """
+        start_time = time.perf_counter()
+        committed_offset = start_offset
+        reader = None
+        try:
+            file_format = detect_file_format(path, file_format)
+            if not os.path.isfile(path):
+                return {"error": True, "message": f"File not found: {path}"}
+            if not await self._ensure_connected():
+                return {"error": True, "message": "Failed to connect to Weaviate"}
+
+            collection = self._collection(collection_name, tenant)
+            reader = read_object_batches(path, file_format, max(batch_size, 1), start_offset)
+            semaphore = asyncio.Semaphore(max(concurrency, 1))
+            in_flight: set[asyncio.Task] = set()
+            # End offset of every finished batch not yet contiguous with committed_offset, keyed by start offset
+            finished: dict[int, int] = {}
+            failed_objects: list[dict[str, Any]] = []
+            imported = 0
+            request_error: Exception | None = None
+
+            async def send(first_offset: int, records: list[dict[str, Any]]) -> None:
+                nonlocal committed_offset, imported, request_error
+                try:
+                    response = await collection.data.insert_many(
+                        [
+                            DataObject(properties=record["properties"], uuid=record["id"], vector=_import_vector(record))
+                            for record in records
+                        ]
+                    )
+                    for position, error in response.errors.items():
+                        failed_objects.append(
+                            {
+                                "offset": first_offset + position,
+                                "id": records[position]["id"],
+                                "message": getattr(error, "message", str(error)),
+                            }
+                        )
+                    imported += len(records) - len(response.errors)
+                    finished[first_offset] = first_offset + len(records)
+                    while committed_offset in finished:
+                        committed_offset = finished.pop(committed_offset)
+                except Exception as e:
+                    logger.error(f"Batch at offset {first_offset} of {path} failed: {e}")
+                    request_error = request_error or e
+                finally:
+                    semaphore.release()
+
+            offset = start_offset
+            try:
+                while request_error is None:
+                    await semaphore.acquire()
+                    records = None
+                    try:
+                        records = await asyncio.to_thread(next, reader, None)
+                    finally:
+                        if records is None:
+                            semaphore.release()
+                    if records is None:
+                        break
+                    task = asyncio.create_task(send(offset, records))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+                    offset += len(records)
+            finally:
+                # Let batches already sent finish, so that committed_offset is accurate
+                if in_flight:
+                    await asyncio.gather(*in_flight)
+
+            elapsed = time.perf_counter() - start_time
+            failed_objects.sort(key=lambda failure: failure["offset"])
+            result = {
+                "success": request_error is None and not failed_objects,
+                "collection_name": collection_name,
+                "path": path,
+                "file_format": file_format,
+                "objects_imported": imported,
+                "failed_count": len(failed_objects),
+                "committed_offset": committed_offset,
+                "elapsed_seconds": round(elapsed, 3),
+                "objects_per_second": round(imported / elapsed, 2) if elapsed > 0 else None,
+            }
+            if failed_objects:
+                result["failed_objects"] = failed_objects
+            if request_error is not None:
+                result.update(
+                    error=True,
+                    message=f"Import stopped at offset {committed_offset}: {request_error}. "
+                    f"Resume with start_offset={committed_offset}",
+                )
+            elif failed_objects:
+                result.update(error=True, message=f"{len(failed_objects)} objects failed to import")
+            logger.info(f"Imported {imported} objects from {path} into '{collection_name}' in {elapsed:.2f}s")
+            return result
+        except Exception as e:
+            logger.error(f"Error importing {path} into collection {collection_name}: {e}")
+            return {"error": True, "message": str(e), "committed_offset": committed_offset}
+        finally:
+            if reader is not None:
+                reader.close()
+
     # Search operations
     async def search(
         self,
@@ -283,22 +1023,56 @@ class WeaviateService:
         offset: int = 0,
         include_vector: bool = False,
         return_properties: list[str] | None = None,
+        use_cache: bool = True,
+        tenant: str | None = None,
     ) -> dict[str, Any]:
-        """Perform semantic search."""
+        """
+        Perform semantic search.
+
+        Results are cached per collection, query and options until the TTL
+        passes or the collection is written through this service. Pass
+        use_cache=False to always query Weaviate.
+        """
         try:
+            cache_key = self._query_cache.key(
+                collection_name,
+                tenant,
+                "near_text",
+                query_text,
+                filter_cache_key(filters),
+                limit,
+                offset,
+                include_vector,
+                tuple(return_properties) if return_properties is not None else None,
+            )
+            if use_cache and (cached := self._query_cache.get(cache_key)) is not None:
+                return cached
+
             if not await self._ensure_connected():
                 return {"error": True, "message": "Failed to connect to Weaviate"}
 
-            collection = self._client.collections.get(collection_name)
-            results = await collection.query.near_text(
-                query=query_text,
-                filters=filters,
-                limit=limit,
-                offset=offset,
-                include_vector=include_vector,
-                return_properties=return_properties,
-                return_metadata=MetadataQuery(distance=True, certainty=True),
-            )
+            collection = self._collection(collection_name, tenant)
+            query_vector = await self._embed_query(query_text)
+            if query_vector is not None:
+                results = await collection.query.near_vector(
+                    near_vector=query_vector,
+                    filters=filters,
+                    limit=limit,
+                    offset=offset,
+                    include_vector=include_vector,
+                    return_properties=return_properties,
+                    return_metadata=MetadataQuery(distance=True, certainty=True),
+                )
+            else:
+                results = await collection.query.near_text(
+                    query=query_text,
+                    filters=filters,
+                    limit=limit,
+                    offset=offset,
+                    include_vector=include_vector,
+                    return_properties=return_properties,
+                    return_metadata=MetadataQuery(distance=True, certainty=True),
+                )
 
             objects = []
             for obj in results.objects:
@@ -308,7 +1082,9 @@ class WeaviateService:
                 properties["certainty"] = obj.metadata.certainty
                 objects.append(properties)
 
-            return {"objects": objects, "count": len(objects)}
+            result = {"objects": objects, "count": len(objects)}
+            self._query_cache.set(cache_key, result)
+            return result
         except Exception as e:
             logger.error(f"Error searching in {collection_name}: {e}")
             return {"error": True, "message": str(e)}
@@ -322,21 +1098,42 @@ class WeaviateService:
         alpha: float = 0.5,
         include_vector: bool = False,
         return_properties: list[str] | None = None,
+        use_cache: bool = True,
+        tenant: str | None = None,
     ) -> dict[str, Any]:
-        """Perform hybrid search (semantic + keyword)."""
+        """
+        Perform hybrid search (semantic + keyword).
+
+        Results are cached like those of search().
+        """
         try:
+            cache_key = self._query_cache.key(
+                collection_name,
+                tenant,
+                "hybrid",
+                query_text,
+                filter_cache_key(filters),
+                limit,
+                alpha,
+                include_vector,
+                tuple(return_properties) if return_properties is not None else None,
+            )
+            if use_cache and (cached := self._query_cache.get(cache_key)) is not None:
+                return cached
+
             if not await self._ensure_connected():
                 return {"error": True, "message": "Failed to connect to Weaviate"}
 
-            collection = self._client.collections.get(collection_name)
+            collection = self._collection(collection_name, tenant)
             results = await collection.query.hybrid(
                 query=query_text,
+                vector=await self._embed_query(query_text),
                 alpha=alpha,
                 filters=filters,
                 limit=limit,
                 include_vector=include_vector,
                 return_properties=return_properties,
-                return_metadata=MetadataQuery(distance=True, certainty=True),
+                return_metadata=MetadataQuery(distance=True, certainty=True, score=True),
             )
 
             objects = []
@@ -345,122 +1142,718 @@ class WeaviateService:
                 properties["id"] = str(obj.uuid)
                 properties["distance"] = obj.metadata.distance
                 properties["certainty"] = obj.metadata.certainty
+                properties["score"] = obj.metadata.score
                 objects.append(properties)
 
-            return {"objects": objects, "count": len(objects)}
+            result = {"objects": objects, "count": len(objects)}
+            self._query_cache.set(cache_key, result)
+            return result
         except Exception as e:
             logger.error(f"Error performing hybrid search in {collection_name}: {e}")
             return {"error": True, "message": str(e)}
 
+    async def multi_search(
+        self,
+        queries: list[dict[str, Any]],
+        concurrency: int = 8,
+        dedup: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Run several searches concurrently over the shared client.
+
+        Each query is a dictionary with "collection_name" and "query_text", and
+        optionally "mode" ("vector" or "hybrid", default "hybrid"), "filters"
+        (a Filter), "limit", "alpha", "return_properties", "include_vector"
+        and "tenant".
+        A failing query is reported in its own result without failing the others.
+
+        Args:
+            queries: Search specifications
+            concurrency: Maximum number of searches in flight
+            dedup: Drop objects already returned by an earlier query (same
+                collection and ID), so each object appears once
+
+        Returns:
+            Dictionary with one result per query, in order, and totals
+        """
+        start_time = time.perf_counter()
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def run(query: dict[str, Any]) -> dict[str, Any]:
+            mode = query.get("mode", "hybrid")
+            options = {
+                "collection_name": query["collection_name"],
+                "query_text": query["query_text"],
+                "filters": query.get("filters"),
+                "limit": query.get("limit", 10),
+                "include_vector": query.get("include_vector", False),
+                "return_properties": query.get("return_properties"),
+                "tenant": query.get("tenant"),
+            }
+            async with semaphore:
+                if mode == "vector":
+                    return await self.search(**options)
+                if mode == "hybrid":
+                    return await self.hybrid_search(alpha=query.get("alpha", 0.5), **options)
+            return {"error": True, "message": f"Unsupported search mode: {mode}. Supported: vector, hybrid"}
+
+        responses = await asyncio.gather(*(run(query) for query in queries))
+
+        results = []
+        seen: set[tuple[str, str]] = set()
+        duplicates_removed = 0
+        for index, (query, response) in enumerate(zip(queries, responses, strict=True)):
+            result = {
+                "query_index": index,
+                "collection_name": query["collection_name"],
+                "query_text": query["query_text"],
+                "mode": query.get("mode", "hybrid"),
+            }
+            if response.get("error"):
+                result.update(error=True, message=response.get("message"))
+            else:
+                objects = response["objects"]
+                if dedup:
+                    collection = normalize_collection_name(query["collection_name"])
+                    unique = []
+                    for obj in objects:
+                        key = (collection, obj["id"])
+                        if key not in seen:
+                            seen.add(key)
+                            unique.append(obj)
+                    duplicates_removed += len(objects) - len(unique)
+                    objects = unique
+                result.update(objects=objects, count=len(objects))
+            results.append(result)
+
+        failed = sum(1 for result in results if result.get("error"))
+        return {
+            "success": failed == 0,
+            "results": results,
+            "query_count": len(queries),
+            "failed_count": failed,
+            "total_objects": sum(result.get("count", 0) for result in results),
+            "duplicates_removed": duplicates_removed,
+            "elapsed_seconds": round(time.perf_counter() - start_time, 3),
+        }
+
+    async def federated_search(
+        self,
+        collection_names: list[str],
+        query_text: str,
+        filters: Filter | None = None,
+        limit: int = 10,
+        alpha: float = 0.5,
+        fusion: str = "rrf",
+        rrf_k: int = DEFAULT_RRF_K,
+        return_properties: list[str] | None = None,
+        concurrency: int = 8,
+        tenant: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Hybrid search over several collections, fused into one ranking.
+
+        Every collection is queried concurrently for the top `limit` objects,
+        which is enough for the fused top `limit`. A collection that fails is
+        reported without failing the search.
+
+        Args:
+            collection_names: Collections to search
+            query_text: Text query
+            filters: Optional filter applied in every collection
+            limit: Number of fused results to return
+            alpha: Hybrid balance between semantic (0.0) and keyword (1.0) search
+            fusion: "rrf" (reciprocal rank fusion) or "relative_score" (min-max normalized scores)
+            rrf_k: Damping constant of reciprocal rank fusion
+            return_properties: Optional list of properties to return
+            concurrency: Maximum number of collections queried at once
+            tenant: Tenant to search in every collection, for multi-tenant collections
+
+        Returns:
+            Dictionary with the fused objects, each with its collection_name and fused_score
+        """
+        try:
+            if fusion not in FUSION_METHODS:
+                return {
+                    "error": True,
+                    "message": f"Unsupported fusion method: {fusion}. Supported: {', '.join(FUSION_METHODS)}",
+                }
+
+            start_time = time.perf_counter()
+            semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+            async def run(collection_name: str) -> dict[str, Any]:
+                async with semaphore:
+                    return await self.hybrid_search(
+                        collection_name=collection_name,
+                        query_text=query_text,
+                        filters=filters,
+                        limit=limit,
+                        alpha=alpha,
+                        return_properties=return_properties,
+                        tenant=tenant,
+                    )
+
+            responses = await asyncio.gather(*(run(name) for name in collection_names))
+
+            ranked_lists = []
+            failed_collections = []
+            for collection_name, response in zip(collection_names, responses, strict=True):
+                if response.get("error"):
+                    failed_collections.append({"collection_name": collection_name, "message": response.get("message")})
+                else:
+                    ranked_lists.append([{**obj, "collection_name": collection_name} for obj in response["objects"]])
+
+            if not ranked_lists and failed_collections:
+                return {
+                    "error": True,
+                    "message": f"Search failed in all {len(failed_collections)} collections",
+                    "failed_collections": failed_collections,
+                }
+
+            objects = fuse_ranked_lists(ranked_lists, method=fusion, limit=limit, rrf_k=rrf_k)
+            result = {
+                "objects": objects,
+                "count": len(objects),
+                "fusion": fusion,
+                "collections_searched": len(ranked_lists),
+                "candidates": sum(len(objects) for objects in ranked_lists),
+                "elapsed_seconds": round(time.perf_counter() - start_time, 3),
+            }
+            if failed_collections:
+                result["failed_collections"] = failed_collections
+            return result
+        except Exception as e:
+            logger.error(f"Error in federated search over {collection_names}: {e}")
+            return {"error": True, "message": str(e)}
+
+    @staticmethod
+    async def _embed_query(query_text: str) -> list[float] | None:
+        """
+        Embed a query client-side if WEAVIATE_QUERY_EMBEDDING is set.
+
+        Returns:
+            The query vector, or None to let the collection's vectorizer embed the query
+        """
+        embedder = get_query_embedder()
+        if embedder is None:
+            return None
+        try:
+            return await embedder.embed(query_text)
+        except Exception as e:
+            logger.warning(f"Client-side query embedding failed, using the collection's vectorizer: {e}")
+            return None
+
     # Additional object operations
+    @_invalidates_queries
     async def update_object(
         self,
         collection_name: str,
         uuid: str,
         data: dict[str, Any],
+        tenant: str | None = None,
     ) -> dict[str, Any]:
         """Update an existing object."""
         try:
             if not await self._ensure_connected():
                 return {"error": True, "message": "Failed to connect to Weaviate"}
 
-            collection = self._client.collections.get(collection_name)
+            collection = self._collection(collection_name, tenant)
             await collection.data.update(uuid, data)
             return {"success": True, "message": f"Object {uuid} updated successfully"}
         except Exception as e:
             logger.error(f"Error updating object {uuid} in {collection_name}: {e}")
             return {"error": True, "message": str(e)}
 
+    @_invalidates_queries
     async def delete_object(
         self,
         collection_name: str,
         uuid: str,
+        tenant: str | None = None,
     ) -> dict[str, Any]:
         """Delete an object."""
         try:
             if not await self._ensure_connected():
                 return {"error": True, "message": "Failed to connect to Weaviate"}
 
-            collection = self._client.collections.get(collection_name)
+            collection = self._collection(collection_name, tenant)
             await collection.data.delete_by_id(uuid)
             return {"success": True, "message": f"Object {uuid} deleted successfully"}
         except Exception as e:
             logger.error(f"Error deleting object {uuid} from {collection_name}: {e}")
             return {"error": True, "message": str(e)}
 
+    @_invalidates_queries
+    async def delete_objects(
+        self,
+        collection_name: str,
+        object_ids: list[str],
+        batch_size: int = 1000,
+        tenant: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Delete many objects by ID with server-side bulk deletes.
+
+        Args:
+            collection_name: Name of the collection
+            object_ids: IDs of the objects to delete
+            batch_size: Maximum number of IDs per delete request
+            tenant: Tenant of a multi-tenant collection to operate on
+
+        Returns:
+            Dictionary with success status and deleted_count, or error details
+        """
+        try:
+            if not object_ids:
+                return {"success": True, "deleted_count": 0}
+
+            if not await self._ensure_connected():
+                return {"error": True, "message": "Failed to connect to Weaviate"}
+
+            collection = self._collection(collection_name, tenant)
+            deleted_count = 0
+            for start in range(0, len(object_ids), batch_size):
+                result = await collection.data.delete_many(
+                    where=Filter.by_id().contains_any(object_ids[start : start + batch_size])
+                )
+                deleted_count += result.successful
+
+            return {"success": True, "deleted_count": deleted_count}
+        except Exception as e:
+            logger.error(f"Error deleting objects from {collection_name}: {e}")
+            return {"error": True, "message": str(e)}
+
+    @_invalidates_queries
+    async def delete_many(
+        self,
+        collection_name: str,
+        filters: Filter,
+        dry_run: bool = False,
+        tenant: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Delete all objects matching a filter with server-side bulk deletes.
+
+        Weaviate deletes at most QUERY_MAXIMUM_RESULTS objects per request, so
+        requests are repeated until nothing matches or nothing more could be
+        deleted.
+
+        Args:
+            collection_name: Name of the collection
+            filters: Filter selecting the objects to delete
+            dry_run: Only count the matching objects
+            tenant: Tenant of a multi-tenant collection to operate on
+
+        Returns:
+            Dictionary with matches, deleted_count and failed_count, or error details
+        """
+        try:
+            if not await self._ensure_connected():
+                return {"error": True, "message": "Failed to connect to Weaviate"}
+
+            collection = self._collection(collection_name, tenant)
+            if dry_run:
+                count = await collection.aggregate.over_all(filters=filters, total_count=True)
+                return {"success": True, "dry_run": True, "matches": count.total_count, "deleted_count": 0}
+
+            matches = deleted_count = failed_count = 0
+            while True:
+                result = await collection.data.delete_many(where=filters)
+                if not matches:
+                    matches = result.matches
+                deleted_count += result.successful
+                failed_count += result.failed
+                if result.matches == 0 or result.successful == 0:
+                    break
+
+            response = {
+                "success": failed_count == 0,
+                "dry_run": False,
+                "matches": matches,
+                "deleted_count": deleted_count,
+                "failed_count": failed_count,
+            }
+            if failed_count:
+                response.update(error=True, message=f"{failed_count} matching objects could not be deleted")
+            logger.info(f"Deleted {deleted_count} objects matching filter from {collection_name}")
+            return response
+        except Exception as e:
+            logger.error(f"Error deleting objects by filter from {collection_name}: {e}")
+            return {"error": True, "message": str(e)}
+
+    @_invalidates_queries
+    async def update_many(
+        self,
+        collection_name: str,
+        filters: Filter,
+        properties: dict[str, Any],
+        batch_size: int = 500,
+        concurrency: int = 16,
+        dry_run: bool = False,
+        tenant: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Apply a property patch to all objects matching a filter.
+
+        Weaviate's cursor cannot be combined with a filter, and offsets are
+        capped, so the collection's IDs are paged through by cursor and each
+        page is narrowed to the matching objects with one filtered query.
+        This stays correct when the patch changes whether objects match.
+        Matches are patched concurrently while the next page is read, and the
+        scan stops once as many objects as matched at the start were found.
+
+        Args:
+            collection_name: Name of the collection
+            filters: Filter selecting the objects to update
+            properties: Property values to set on every matching object
+            batch_size: Number of IDs per cursor page
+            concurrency: Maximum number of updates in flight
+            dry_run: Only count the matching objects
+            tenant: Tenant of a multi-tenant collection to operate on
+
+        Returns:
+            Dictionary with matches, updated_count, failed_count and
+            throughput, or error details
+        """
+        start_time = time.perf_counter()
+        try:
+            if not await self._ensure_connected():
+                return {"error": True, "message": "Failed to connect to Weaviate"}
+
+            collection = self._collection(collection_name, tenant)
+            count = await collection.aggregate.over_all(filters=filters, total_count=True)
+            matches = count.total_count or 0
+            if dry_run or not matches:
+                return {"success": True, "dry_run": dry_run, "matches": matches, "updated_count": 0}
+
+            batch_size = max(batch_size, 1)
+            semaphore = asyncio.Semaphore(max(concurrency, 1))
+            in_flight: set[asyncio.Task] = set()
+            failed_objects: list[dict[str, Any]] = []
+            updated_count = 0
+
+            async def update(object_id: Any) -> None:
+                nonlocal updated_count
+                try:
+                    await collection.data.update(object_id, properties)
+                    updated_count += 1
+                except Exception as e:
+                    failed_objects.append({"id": str(object_id), "message": str(e)})
+                finally:
+                    semaphore.release()
+
+            found = 0
+            after = None
+            try:
+                while found < matches:
+                    page = await collection.query.fetch_objects(limit=batch_size, after=after, return_properties=[])
+                    if not page.objects:
+                        break
+                    after = page.objects[-1].uuid
+                    page_ids = [obj.uuid for obj in page.objects]
+                    matching = await collection.query.fetch_objects(
+                        filters=Filter.all_of([filters, Filter.by_id().contains_any(page_ids)]),
+                        limit=len(page_ids),
+                        return_properties=[],
+                    )
+                    found += len(matching.objects)
+                    for obj in matching.objects:
+                        await semaphore.acquire()
+                        task = asyncio.create_task(update(obj.uuid))
+                        in_flight.add(task)
+                        task.add_done_callback(in_flight.discard)
+                    if len(page.objects) < batch_size:
+                        break
+            finally:
+                if in_flight:
+                    await asyncio.gather(*in_flight)
+
+            elapsed = time.perf_counter() - start_time
+            result = {
+                "success": not failed_objects,
+                "dry_run": False,
+                "matches": matches,
+                "updated_count": updated_count,
+                "failed_count": len(failed_objects),
+                "elapsed_seconds": round(elapsed, 3),
+                "objects_per_second": round(updated_count / elapsed, 2) if elapsed > 0 else None,
+            }
+            if failed_objects:
+                result.update(
+                    error=True,
+                    message=f"{len(failed_objects)} of {found} matching objects failed to update",
+                    failed_objects=failed_objects,
+                )
+            logger.info(f"Updated {updated_count} objects matching filter in {collection_name} in {elapsed:.2f}s")
+            return result
+        except Exception as e:
+            logger.error(f"Error updating objects by filter in {collection_name}: {e}")
+            return {"error": True, "message": str(e)}
+
+    @_invalidates_queries
     async def batch_insert_objects(
         self,
         collection_name: str,
         objects: list[dict[str, Any]],
         unique_properties: list[str] | None = None,
         batch_size: int = 100,
+        concurrency: int = 4,
+        upsert: str | None = None,
+        tenant: str | None = None,
+        vectors: list[Any] | None = None,
     ) -> dict[str, Any]:
-        """Batch insert objects."""
+        """
+        Batch insert objects using Weaviate's native batch API.
+
+        Objects are sent in batches of `batch_size` via `insert_many` (gRPC),
+        with up to `concurrency` batches in flight at once. Objects rejected by
+        a batch are retried individually; those that still fail are reported
+        per object in `failed_objects`.
+
+        Args:
+            collection_name: Name of the collection to insert into
+            objects: List of object property dictionaries
+            unique_properties: Optional properties identifying duplicate objects
+            batch_size: Number of objects per batch request
+            concurrency: Maximum number of batch requests in flight
+            upsert: Optional deterministic-ID mode. Object IDs are derived from
+                `unique_properties`; "skip" leaves existing IDs untouched (one
+                ID lookup per batch), "replace" overwrites them (no lookups).
+                Without it, `unique_properties` costs one query per object.
+            tenant: Tenant of a multi-tenant collection to operate on
+            vectors: Optional vectors in the order of objects; objects with a
+                vector are stored with it instead of being vectorized, None
+                entries are vectorized as usual
+
+        Returns:
+            Dictionary with inserted_ids (in input order), count, elapsed_seconds
+            and objects_per_second. If any object failed, `error` is True and
+            `failed_objects` lists each failure with its index and message.
+        """
         try:
+            if upsert_error := self._validate_upsert(upsert, unique_properties):
+                return upsert_error
+
             if not await self._ensure_connected():
                 return {"error": True, "message": "Failed to connect to Weaviate"}
 
-            inserted_ids: list[str] = []
-            for start_idx in range(0, len(objects), batch_size):
-                chunk = objects[start_idx : start_idx + batch_size]
-
-                # Process each object in the chunk
-                chunk_results = []
-                for obj in chunk:
+            start_time = time.monotonic()
+            collection = self._collection(collection_name, tenant)
+            batch_size = max(1, batch_size)
+            object_ids: list[str | None] = [None] * len(objects)
+            object_uuids: list[str | None] = [None] * len(objects)
+
+            pending_indexes = []
+            if upsert:
+                # Collapse repeated IDs within the input: first wins for skip, last for replace
+                index_by_uuid: dict[str, int] = {}
+                for index, obj in enumerate(objects):
+                    object_uuid = generate_object_uuid(obj, unique_properties)
+                    object_uuids[index] = object_ids[index] = object_uuid
+                    if upsert == "replace" or object_uuid not in index_by_uuid:
+                        index_by_uuid[object_uuid] = index
+                pending_indexes = sorted(index_by_uuid.values())
+
+                if upsert == "skip":
+                    existing_uuids = await self._fetch_existing_uuids(
+                        collection, [object_uuids[index] for index in pending_indexes], batch_size
+                    )
+                    existing_count = len(existing_uuids)
+                    if existing_uuids:
+                        logger.info(f"Skipping {existing_count} objects that already exist")
+                    pending_indexes = [index for index in pending_indexes if object_uuids[index] not in existing_uuids]
+            else:
+                for index, obj in enumerate(objects):
                     if unique_properties:
-                        # Check for existing objects with unique properties
-                        filter_conditions = [
-                            Filter.by_property(prop).equal(obj.get(prop))
-                            for prop in unique_properties
-                            if prop in obj and obj.get(prop) is not None
-                        ]
-
-                        if filter_conditions:
-                            # Use Filter.all_of() with a list of conditions
-                            filters = Filter.all_of(filter_conditions)
-                            existing_result = await self.get_objects(
-                                collection_name, filters=filters, limit=1
-                            )
-                        else:
-                            # No valid filter conditions, skip duplicate check
-                            existing_result = {"objects": []}
-                        if existing_result.get("objects"):
-                            logger.warning(
-                                f"Object with properties {unique_properties} already exists"
-                            )
-                            chunk_results.append(existing_result["objects"][0]["id"])
+                        existing_id = await self._find_existing_object_id(collection_name, obj, unique_properties, tenant)
+                        if existing_id:
+                            logger.warning(f"Object with properties {unique_properties} already exists")
+                            object_ids[index] = existing_id
                             continue
+                    pending_indexes.append(index)
 
-                    # Insert new object
-                    insert_result = await self.insert_object(collection_name, obj)
-                    if insert_result.get("success"):
-                        chunk_results.append(insert_result["object_id"])
-                    else:
-                        return insert_result  # Return error if any insertion fails
-
-                inserted_ids.extend(chunk_results)
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+            batches = [pending_indexes[i : i + batch_size] for i in range(0, len(pending_indexes), batch_size)]
+            batch_results = await asyncio.gather(
+                *(self._insert_batch(collection, objects, object_uuids, batch, semaphore, vectors) for batch in batches)
+            )
 
-            return {
-                "success": True,
+            failed_objects = []
+            for inserted, failed in batch_results:
+                for index, object_id in inserted.items():
+                    object_ids[index] = object_id
+                failed_objects.extend(failed)
+            failed_objects.sort(key=lambda failure: failure["index"])
+
+            failed_indexes = {failure["index"] for failure in failed_objects}
+            failed_uuids = {object_uuids[index] for index in failed_indexes} - {None}
+            inserted_ids = [
+                object_id
+                for index, object_id in enumerate(object_ids)
+                if object_id is not None and index not in failed_indexes and object_id not in failed_uuids
+            ]
+            elapsed = time.monotonic() - start_time
+            result = {
+                "success": not failed_objects,
                 "inserted_ids": inserted_ids,
                 "count": len(inserted_ids),
+                "elapsed_seconds": round(elapsed, 3),
+                "objects_per_second": round(len(inserted_ids) / elapsed, 1) if elapsed > 0 else None,
             }
+            if upsert == "skip":
+                result["existing_count"] = existing_count
+            if failed_objects:
+                result.update(
+                    {
+                        "error": True,
+                        "message": f"{len(failed_objects)} of {len(objects)} objects failed to insert",
+                        "failed_objects": failed_objects,
+                        "failed_count": len(failed_objects),
+                    }
+                )
+            return result
         except Exception as e:
             logger.error(f"Error batch inserting objects into {collection_name}: {e}")
             return {"error": True, "message": str(e)}
 
+    async def _find_existing_object_id(
+        self,
+        collection_name: str,
+        obj: dict[str, Any],
+        unique_properties: list[str],
+        tenant: str | None = None,
+    ) -> str | None:
+        """
+        Return the ID of an object matching all unique property values, if any.
+
+        Raises:
+            RuntimeError: If the lookup fails, so that a failed lookup does not
+                count as "not found" and insert a duplicate
+        """
+        filter_conditions = [
+            Filter.by_property(prop).equal(obj.get(prop))
+            for prop in unique_properties
+            if prop in obj and obj.get(prop) is not None
+        ]
+        if not filter_conditions:
+            # No valid filter conditions, skip duplicate check
+            return None
+
+        existing_result = await self.get_objects(
+            collection_name, filters=Filter.all_of(filter_conditions), limit=1, tenant=tenant
+        )
+        if existing_result.get("error"):
+            raise RuntimeError(f"Duplicate lookup failed: {existing_result.get('message')}")
+        if existing_result.get("objects"):
+            return existing_result["objects"][0]["id"]
+        return None
+
+    @staticmethod
+    def _validate_upsert(upsert: str | None, unique_properties: list[str] | None) -> dict[str, Any] | None:
+        """Return an error dict if the upsert options are invalid."""
+        if upsert is None:
+            return None
+        if upsert not in UPSERT_MODES:
+            return {
+                "error": True,
+                "message": f"Unsupported upsert mode: '{upsert}'. Supported: {', '.join(UPSERT_MODES)}",
+            }
+        if not unique_properties:
+            return {"error": True, "message": "upsert requires unique_properties to derive object IDs"}
+        return None
+
+    async def _fetch_existing_uuids(self, collection, uuids: list[str], batch_size: int) -> set[str]:
+        """Return which of the given IDs already exist, using one ID query per batch."""
+        existing: set[str] = set()
+        for start in range(0, len(uuids), batch_size):
+            chunk = uuids[start : start + batch_size]
+            results = await collection.query.fetch_objects(
+                filters=Filter.by_id().contains_any(chunk),
+                limit=len(chunk),
+                return_properties=[],
+            )
+            existing.update(str(obj.uuid) for obj in results.objects)
+        return existing
+
+    @staticmethod
+    async def _insert_single(collection, obj: dict[str, Any], object_uuid: str | None = None, vector: Any = None) -> str:
+        """Insert one object, upserting by ID when one is given."""
+        if object_uuid is None:
+            if vector is None:
+                return str(await collection.data.insert(obj))
+            return str(await collection.data.insert(obj, vector=vector))
+
+        response = await collection.data.insert_many([DataObject(properties=obj, uuid=object_uuid, vector=vector)])
+        if response.errors:
+            error = next(iter(response.errors.values()))
+            raise RuntimeError(getattr(error, "message", str(error)))
+        return object_uuid
+
+    async def _insert_batch(
+        self,
+        collection,
+        objects: list[dict[str, Any]],
+        object_uuids: list[str | None],
+        indexes: list[int],
+        semaphore: asyncio.Semaphore,
+        vectors: list[Any] | None = None,
+    ) -> tuple[dict[int, str], list[dict[str, Any]]]:
+        """
+        Insert one batch with insert_many, retrying rejected objects one by one.
+
+        Returns:
+            Tuple of (inserted IDs keyed by original index, per-object failures)
+        """
+        inserted: dict[int, str] = {}
+        errors: dict[int, str] = {}
+
+        async with semaphore:
+            try:
+                batch = [
+                    DataObject(
+                        properties=objects[index],
+                        uuid=object_uuids[index],
+                        vector=vectors[index] if vectors else None,
+                    )
+                    if object_uuids[index] or vectors
+                    else objects[index]
+                    for index in indexes
+                ]
+                response = await collection.data.insert_many(batch)
+                for position, object_id in response.uuids.items():
+                    inserted[indexes[position]] = str(object_id)
+                for position, error in response.errors.items():
+                    errors[indexes[position]] = getattr(error, "message", str(error))
+            except Exception as e:
+                logger.warning(f"Batch of {len(indexes)} objects failed, retrying individually: {e}")
+                errors = {index: str(e) for index in indexes}
+
+            failed = []
+            for index, batch_error in errors.items():
+                try:
+                    inserted[index] = await self._insert_single(
+                        collection, objects[index], object_uuids[index], vectors[index] if vectors else None
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to insert object at index {index}: {e}")
+                    failed.append({"index": index, "message": str(e), "batch_error": batch_error})
+
+        return inserted, failed
+
     async def aggregate(
         self,
         collection_name: str,
         group_by: list[str] | None = None,
         properties: list[str] | None = None,
+        tenant: str | None = None,
     ) -> dict[str, Any]:
         """Perform aggregation on a collection."""
         try:
             if not await self._ensure_connected():
                 return {"error": True, "message": "Failed to connect to Weaviate"}
 
-            collection = self._client.collections.get(collection_name)
+            collection = self._collection(collection_name, tenant)
             query = collection.aggregate
 
             if group_by:
@@ -495,23 +1888,112 @@ class WeaviateService:
             )
             return {"error": True, "message": str(e)}
 
+    async def get_database_stats(self, concurrency: int = 16, max_age_seconds: float = 0.0) -> dict[str, Any]:
+        """
+        Count the objects and shards of every collection.
+
+        Object counts are aggregated concurrently, and shard counts come from
+        one verbose cluster nodes request issued alongside them, so they add
+        no latency. The result is kept as a snapshot that later calls may
+        accept instead of recounting.
+
+        Args:
+            concurrency: Maximum number of aggregations in flight
+            max_age_seconds: Return the last snapshot if it is at most this
+                old (0 always recounts)
+
+        Returns:
+            Dictionary with totals, per-collection counts, the wall time of the
+            count and the snapshot's age
+        """
+        try:
+            if self._stats_snapshot is not None and max_age_seconds > 0:
+                taken, snapshot = self._stats_snapshot
+                age = time.monotonic() - taken
+                if age <= max_age_seconds:
+                    return {**copy.deepcopy(snapshot), "cached": True, "snapshot_age_seconds": round(age, 3)}
+
+            start_time = time.perf_counter()
+            schema = await self.get_schema()
+            if schema.get("error"):
+                return schema
+            # The schema may come from the cache without a live client
+            if not await self._ensure_connected():
+                return {"error": True, "message": "Failed to connect to Weaviate"}
+
+            semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+            async def count(collection_name: str) -> dict[str, Any]:
+                async with semaphore:
+                    return await self.aggregate(collection_name)
+
+            async def list_shards() -> list[Any] | str:
+                try:
+                    nodes = await self._client.cluster.nodes(output="verbose")
+                except Exception as e:
+                    return str(e)
+                return [shard for node in nodes for shard in node.shards or []]
+
+            shards, *counts = await asyncio.gather(list_shards(), *(count(name) for name in schema))
+            if isinstance(shards, str):
+                logger.error(f"Failed to get shard information from the cluster nodes: {shards}")
+                return {"error": True, "message": f"Failed to get shard information: {shards}"}
+
+            shard_names: dict[str, set[str]] = {}
+            for shard in shards:
+                # Replicas of a shard are listed once per node
+                shard_names.setdefault(normalize_collection_name(shard.collection), set()).add(shard.name)
+
+            collections = {}
+            failed_collections = []
+            for collection_name, count_result in zip(schema, counts, strict=True):
+                if count_result.get("success"):
+                    object_count = (count_result.get("results") or {}).get("total_count", 0) or 0
+                else:
+                    object_count = 0
+                    failed_collections.append({"collection_name": collection_name, "message": count_result.get("message")})
+                shard_count = len(shard_names.get(normalize_collection_name(collection_name), ()))
+                collections[collection_name] = {"object_count": object_count, "shard_count": shard_count}
+
+            result = {
+                "success": True,
+                "total_collections": len(collections),
+                "total_objects": sum(stats["object_count"] for stats in collections.values()),
+                "collections": collections,
+                "elapsed_seconds": round(time.perf_counter() - start_time, 3),
+            }
+            if failed_collections:
+                result["failed_collections"] = failed_collections
+            self._stats_snapshot = (time.monotonic(), copy.deepcopy(result))
+            return {**result, "cached": False, "snapshot_age_seconds": 0.0}
+        except Exception as e:
+            logger.error(f"Error getting database statistics: {e}")
+            return {"error": True, "message": str(e)}
+
     async def batch_check_existing_files(
         self,
         collection_name: str,
         file_keys: list[str],
         source_field: str = "source_pdf",
+        batch_size: int = 500,
+        concurrency: int = 8,
+        tenant: str | None = None,
     ) -> dict[str, Any]:
         """Check which files from a list already exist in Weaviate.
 
-        This method efficiently checks multiple files in a single query,
-        filtering them into 'new' and 'existing' categories based on
-        whether they already exist in the specified collection.
+        The keys are split into batches that are checked concurrently. Each
+        batch is one aggregation grouped by `source_field` over the objects
+        whose `source_field` is one of the batch's keys, so only the distinct
+        matching values are transferred, however many chunks each file has.
 
         Args:
             collection_name: Name of the Weaviate collection to check
             file_keys: List of file identifiers to check (e.g., S3 keys, file paths)
             source_field: Name of the field containing the source identifier
                          (default: "source_pdf")
+            batch_size: Maximum number of keys per aggregation query
+            concurrency: Maximum number of aggregation queries in flight
+            tenant: Tenant of a multi-tenant collection to operate on
 
         Returns:
             Dictionary containing:
@@ -539,42 +2021,20 @@ class WeaviateService:
                     "total_checked": 0,
                 }
 
-            collection = self._client.collections.get(collection_name)
-
-            # Build OR filter for all file keys
-            # Use containsAny filter which is more efficient for this use case
-            filter_conditions = [
-                Filter.by_property(source_field).equal(file_key)
-                for file_key in file_keys
-            ]
+            collection = self._collection(collection_name, tenant)
+            unique_keys = list(dict.fromkeys(file_keys))
+            batch_size = max(batch_size, 1)
+            semaphore = asyncio.Semaphore(max(concurrency, 1))
 
-            # Combine with OR operator if we have multiple conditions
-            if len(filter_conditions) > 1:
-                filters = Filter.any_of(filter_conditions)
-            elif len(filter_conditions) == 1:
-                filters = filter_conditions[0]
-            else:
-                filters = None
+            async def check_batch(keys: list[str]) -> set[str]:
+                async with semaphore:
+                    return await self._existing_source_values(collection, source_field, keys)
 
-            # Query for objects with matching source field
-            # Use a high limit since each file may have multiple chunks
-            # We only need unique source_field values, but must fetch enough objects
-            results = await collection.query.fetch_objects(
-                filters=filters,
-                limit=10000,  # High limit to capture all unique files even with many chunks each
-                return_properties=[source_field],
-                include_vector=False,
+            found = await asyncio.gather(
+                *(check_batch(unique_keys[start : start + batch_size]) for start in range(0, len(unique_keys), batch_size))
             )
-
-            # Extract unique existing file keys from results
-            existing_keys = set()
-            for obj in results.objects:
-                if source_field in obj.properties:
-                    existing_keys.add(obj.properties[source_field])
-
-            # Determine which files are new
-            file_keys_set = set(file_keys)
-            new_keys = file_keys_set - existing_keys
+            existing_keys = set().union(*found)
+            new_keys = set(unique_keys) - existing_keys
 
             # Return sorted lists for consistency
             return {
@@ -590,3 +2050,51 @@ class WeaviateService:
                 f"Error batch checking files in collection {collection_name}: {e}"
             )
             return {"error": True, "message": str(e)}
+
+    @staticmethod
+    async def _existing_source_values(collection: Any, source_field: str, keys: list[str]) -> set[str]:
+        """
+        Return the keys that at least one object has as its `source_field` value.
+
+        With word tokenization the filter can also match objects with other
+        values sharing the keys' tokens. Those groups are discarded, and while
+        they fill the group limit the query is repeated with a larger limit.
+        """
+        wanted = set(keys)
+        limit = len(keys)
+        while True:
+            result = await collection.aggregate.over_all(
+                filters=Filter.by_property(source_field).contains_any(keys),
+                group_by=GroupByAggregate(prop=source_field, limit=limit),
+                total_count=True,
+            )
+            values = {group.grouped_by.value for group in result.groups}
+            found = wanted & values
+            if len(result.groups) < limit or found == wanted:
+                return found
+            limit *= 4
+
+
+# Process-wide service shared by all tools
+_shared_service: WeaviateService | None = None
+
+
+def get_weaviate_service() -> WeaviateService:
+    """
+    Get the process-wide WeaviateService shared by all tools.
+
+    The underlying client is connected lazily on first use and reused across
+    calls, so tools must not close it; the app lifespan does that on shutdown.
+    """
+    global _shared_service
+    if _shared_service is None:
+        _shared_service = WeaviateService()
+    return _shared_service
+
+
+async def close_weaviate_service() -> None:
+    """Close the process-wide WeaviateService, if one was created."""
+    global _shared_service
+    if _shared_service is not None:
+        await _shared_service.close()
+        _shared_service = None
@@ -8,7 +8,13 @@ from typing import Any
 from weaviate.classes.config import Configure, DataType, Property
 
 from ..app import mcp  # Import from central app module
-from ..services.weaviate_service import WeaviateService
+from ..services.weaviate_service import get_weaviate_service
+from ..utils.collection_config import (
+    build_multi_tenancy_config,
+    build_replication_config,
+    build_sharding_config,
+    build_vector_index_config,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +31,10 @@ async def weaviate_create_collection(
     description: str,
     properties: list[dict[str, Any]],
     vectorizer_config: dict[str, Any] | None = None,
+    vector_index_config: dict[str, Any] | None = None,
+    sharding_config: dict[str, Any] | None = None,
+    replication_config: dict[str, Any] | None = None,
+    multi_tenancy_config: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """
     Create a new collection in Weaviate.
@@ -53,6 +63,27 @@ async def weaviate_create_collection(
             - type: Vectorizer type ("text2vec_openai", "text2vec_transformers", "text2vec_cohere", "text2vec_huggingface", "none")
             - model: Model name (e.g., "text-embedding-3-small" for OpenAI, "sentence-transformers/all-MiniLM-L6-v2" for transformers)
             - pooling_strategy: For transformers only ("masked_mean", "cls", "mean")
+        vector_index_config: Optional vector index configuration dict with:
+            - type: "hnsw" (default), "flat" (brute force, for small collections) or
+              "dynamic" (flat until `threshold` objects, then hnsw; requires async indexing)
+            - distance: "cosine" (default), "dot", "l2-squared", "hamming" or "manhattan"
+            - ef, ef_construction, max_connections: HNSW search/build quality vs speed
+              (ef=-1 picks ef dynamically from the query limit)
+            - dynamic_ef_min, dynamic_ef_max, dynamic_ef_factor, flat_search_cutoff,
+              vector_cache_max_objects, cleanup_interval_seconds: further HNSW tuning
+            - threshold: Object count at which a dynamic index switches to hnsw
+            - quantizer: Optional compression to cut vector memory:
+                * {"type": "pq", "segments": 96, "centroids": 256, "training_limit": 100000}
+                * {"type": "bq", "rescore_limit": 200, "cache": True} (also for flat indexes)
+                * {"type": "sq", "rescore_limit": 200, "training_limit": 100000}
+        sharding_config: Optional dict with desired_count (number of shards),
+            virtual_per_physical and desired_virtual_count
+        replication_config: Optional dict with factor (copies of each shard) and
+            async_enabled (asynchronous replica repair)
+        multi_tenancy_config: Optional dict making the collection multi-tenant, with
+            enabled (default: True), auto_tenant_creation and auto_tenant_activation.
+            Each tenant's objects live in their own shard; manage tenants with the
+            weaviate_*_tenants tools and pass `tenant` to the data and search tools.
 
     Returns:
         Dictionary with one of the following formats:
@@ -62,6 +93,7 @@ async def weaviate_create_collection(
         Common error cases:
         - Collection already exists: "Collection 'X' already exists. Delete it first..."
         - Invalid property: "Invalid property configuration..."
+        - Invalid index, sharding or replication option: "Unknown vector_index_config option(s)..."
         - Connection failure: "Failed to connect to Weaviate"
 
         GUARANTEED: Always returns a dict, never None or empty string.
@@ -95,12 +127,29 @@ async def weaviate_create_collection(
             vectorizer_config={
                 "type": "text2vec_openai",
                 "model": "text-embedding-3-small"
-            }
+            },
+            vector_index_config={
+                "type": "hnsw",
+                "ef_construction": 256,
+                "max_connections": 32,
+                "quantizer": {"type": "pq", "segments": 192}
+            },
+            replication_config={"factor": 3}
         )
         ```
     """
-    service = WeaviateService()
     try:
+        service = get_weaviate_service()
+
+        # Validate index, sharding, replication and multi-tenancy options before anything else
+        try:
+            vector_index = build_vector_index_config(vector_index_config)
+            sharding = build_sharding_config(sharding_config)
+            replication = build_replication_config(replication_config)
+            multi_tenancy = build_multi_tenancy_config(multi_tenancy_config)
+        except ValueError as e:
+            return {"error": True, "message": str(e)}
+
         # Convert property dictionaries to Property objects
         weaviate_properties = []
         for prop in properties:
@@ -212,6 +261,10 @@ async def weaviate_create_collection(
             properties=weaviate_properties,
             vectorizer_config=vectorizer,
             generative_config=Configure.Generative.openai() if vectorizer else None,
+            vector_index_config=vector_index,
+            sharding_config=sharding,
+            replication_config=replication,
+            multi_tenancy_config=multi_tenancy,
         )
 
         logger.info(f"Collection creation result: {result}")
@@ -220,8 +273,6 @@ async def weaviate_create_collection(
     except Exception as e:
         logger.error(f"Error in weaviate_create_collection: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
 
 
 @mcp.tool(
@@ -254,8 +305,8 @@ async def weaviate_delete_collection(name: str) -> dict[str, Any]:
             print(f"Error: {result['message']}")
         ```
     """
-    service = WeaviateService()
     try:
+        service = get_weaviate_service()
         result = await service.delete_collection(name)
 
         logger.info(f"Collection deletion result: {result}")
@@ -264,8 +315,6 @@ async def weaviate_delete_collection(name: str) -> dict[str, Any]:
     except Exception as e:
         logger.error(f"Error in weaviate_delete_collection: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
 
 
 @mcp.tool(
@@ -288,8 +337,8 @@ async def weaviate_get_schema() -> dict[str, Any]:
             pass
         ```
     """
-    service = WeaviateService()
     try:
+        service = get_weaviate_service()
         result = await service.get_schema()
 
         logger.info(
@@ -300,8 +349,6 @@ async def weaviate_get_schema() -> dict[str, Any]:
     except Exception as e:
         logger.error(f"Error in weaviate_get_schema: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
 
 
 @mcp.tool(
@@ -313,6 +360,10 @@ async def weaviate_create_collection_with_vectorizer(
     description: str,
     use_openai_vectorizer: bool = True,
     openai_model: str = "text-embedding-3-small",
+    vector_index_config: dict[str, Any] | None = None,
+    sharding_config: dict[str, Any] | None = None,
+    replication_config: dict[str, Any] | None = None,
+    multi_tenancy_config: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """
     Create a new collection with optimal settings for document ingestion.
@@ -326,6 +377,11 @@ async def weaviate_create_collection_with_vectorizer(
         description: Description of the collection
         use_openai_vectorizer: Whether to use OpenAI vectorizer (default: True)
         openai_model: OpenAI model to use (default: "text-embedding-3-small")
+        vector_index_config: Optional vector index and compression settings
+            (same format as weaviate_create_collection)
+        sharding_config: Optional sharding settings (same format as weaviate_create_collection)
+        replication_config: Optional replication settings (same format as weaviate_create_collection)
+        multi_tenancy_config: Optional multi-tenancy settings (same format as weaviate_create_collection)
 
     Returns:
         Dictionary with success status and message or error details.
@@ -401,6 +457,10 @@ async def weaviate_create_collection_with_vectorizer(
             description=description,
             properties=properties,
             vectorizer_config=vectorizer_config,
+            vector_index_config=vector_index_config,
+            sharding_config=sharding_config,
+            replication_config=replication_config,
+            multi_tenancy_config=multi_tenancy_config,
         )
 
         if result.get("success"):
@@ -8,14 +8,66 @@ from typing import Any
 from weaviate.classes.query import Filter
 
 from ..app import mcp  # Import from central app module
-from ..services.weaviate_service import WeaviateService
+from ..services.weaviate_service import get_weaviate_service
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the searches of one weaviate_multi_search call
+MAX_MULTI_SEARCH_QUERIES = 50
+
 
 # --- Data Management Tool Functions --- #
 
 
+def _build_filter(where_filter: dict[str, Any] | None) -> Filter | None:
+    """
+    Convert a simple filter dictionary to a Weaviate Filter.
+
+    Args:
+        where_filter: Dictionary with "property", "operator" (default "equal") and "value"
+
+    Returns:
+        The Filter, or None if no filter was given
+
+    Raises:
+        ValueError: If the dictionary is incomplete or the operator is unsupported
+    """
+    if not where_filter:
+        return None
+
+    property_name = where_filter.get("property")
+    operator = where_filter.get("operator", "equal")
+    value = where_filter.get("value")
+
+    # Validate filter format
+    if not property_name:
+        raise ValueError(
+            "Invalid filter format: missing 'property' field. "
+            "Expected format: {'property': 'field_name', 'operator': 'equal', 'value': 'some_value'}"
+        )
+    if value is None:
+        raise ValueError(
+            "Invalid filter format: missing 'value' field. "
+            "Expected format: {'property': 'field_name', 'operator': 'equal', 'value': 'some_value'}"
+        )
+
+    if operator == "equal":
+        return Filter.by_property(property_name).equal(value)
+    if operator == "not_equal":
+        return Filter.by_property(property_name).not_equal(value)
+    if operator == "greater_than":
+        return Filter.by_property(property_name).greater_than(value)
+    if operator == "less_than":
+        return Filter.by_property(property_name).less_than(value)
+    if operator == "like":
+        return Filter.by_property(property_name).like(value)
+    if operator == "contains_any":
+        return Filter.by_property(property_name).contains_any(value if isinstance(value, list) else [value])
+    raise ValueError(
+        f"Unsupported operator: {operator}. Supported: equal, not_equal, greater_than, less_than, like, contains_any"
+    )
+
+
 @mcp.tool(
     name="weaviate_insert_object",
     description="Insert a new object into a Weaviate collection.",
@@ -24,6 +76,8 @@ async def weaviate_insert_object(
     collection_name: str,
     data: dict[str, Any],
     unique_properties: list[str] | None = None,
+    upsert: str | None = None,
+    tenant: str | None = None,
 ) -> dict[str, Any]:
     """
     Insert a new object into a Weaviate collection.
@@ -34,6 +88,10 @@ async def weaviate_insert_object(
         unique_properties: Optional list of property names that should be unique.
                           If provided, will check for existing objects with same values
                           and return existing object ID instead of creating duplicate.
+        upsert: Optional deterministic-ID mode ("skip" or "replace"). The object ID
+               is derived from the unique_properties values, so no duplicate query
+               is needed: "skip" keeps an existing object, "replace" overwrites it.
+        tenant: Optional tenant of a multi-tenant collection
 
     Returns:
         Dictionary with success status, object_id, and message or error details.
@@ -51,12 +109,14 @@ async def weaviate_insert_object(
         )
         ```
     """
-    service = WeaviateService()
     try:
+        service = get_weaviate_service()
         result = await service.insert_object(
             collection_name=collection_name,
             data=data,
             unique_properties=unique_properties,
+            upsert=upsert,
+            tenant=tenant,
         )
 
         logger.info(f"Object insertion result: {result}")
@@ -65,8 +125,6 @@ async def weaviate_insert_object(
     except Exception as e:
         logger.error(f"Error in weaviate_insert_object: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
 
 
 @mcp.tool(
@@ -78,6 +136,7 @@ async def weaviate_get_object(
     uuid: str,
     include_vector: bool = False,
     return_properties: list[str] | None = None,
+    tenant: str | None = None,
 ) -> dict[str, Any]:
     """
     Get a specific object from a Weaviate collection by its UUID.
@@ -88,6 +147,7 @@ async def weaviate_get_object(
         include_vector: Whether to include the vector in the response
         return_properties: Optional list of specific properties to return.
                           If None, returns all properties.
+        tenant: Optional tenant of a multi-tenant collection
 
     Returns:
         Dictionary containing the object data or error details.
@@ -101,13 +161,14 @@ async def weaviate_get_object(
         )
         ```
     """
-    service = WeaviateService()
     try:
+        service = get_weaviate_service()
         result = await service.get_object(
             collection_name=collection_name,
             uuid=uuid,
             include_vector=include_vector,
             return_properties=return_properties,
+            tenant=tenant,
         )
 
         logger.info(f"Object retrieval result: {result}")
@@ -116,8 +177,6 @@ async def weaviate_get_object(
     except Exception as e:
         logger.error(f"Error in weaviate_get_object: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
 
 
 @mcp.tool(
@@ -131,6 +190,7 @@ async def weaviate_get_objects(
     where_filter: dict[str, Any] | None = None,
     return_properties: list[str] | None = None,
     include_vector: bool = False,
+    tenant: str | None = None,
 ) -> dict[str, Any]:
     """
     Get multiple objects from a Weaviate collection.
@@ -141,10 +201,11 @@ async def weaviate_get_objects(
         offset: Number of objects to skip for pagination (default: 0)
         where_filter: Optional filter criteria as a dictionary with:
             - property: Property name to filter on
-            - operator: Operator ("equal", "not_equal", "greater_than", "less_than", "like")
+            - operator: Operator ("equal", "not_equal", "greater_than", "less_than", "like", "contains_any")
             - value: Value to compare against
         return_properties: Optional list of specific properties to return
         include_vector: Whether to include vectors in the response
+        tenant: Optional tenant of a multi-tenant collection
 
     Returns:
         Dictionary containing objects array, count, and metadata or error details.
@@ -163,45 +224,13 @@ async def weaviate_get_objects(
         )
         ```
     """
-    service = WeaviateService()
     try:
+        service = get_weaviate_service()
         # Convert simple filter dict to Weaviate Filter object if provided
-        filters = None
-        if where_filter:
-            property_name = where_filter.get("property")
-            operator = where_filter.get("operator", "equal")
-            value = where_filter.get("value")
-
-            # Validate filter format
-            if not property_name:
-                return {
-                    "error": True,
-                    "message": "Invalid filter format: missing 'property' field. "
-                    "Expected format: {'property': 'field_name', 'operator': 'equal', 'value': 'some_value'}",
-                }
-            if value is None:
-                return {
-                    "error": True,
-                    "message": "Invalid filter format: missing 'value' field. "
-                    "Expected format: {'property': 'field_name', 'operator': 'equal', 'value': 'some_value'}",
-                }
-
-            if operator == "equal":
-                filters = Filter.by_property(property_name).equal(value)
-            elif operator == "not_equal":
-                filters = Filter.by_property(property_name).not_equal(value)
-            elif operator == "greater_than":
-                filters = Filter.by_property(property_name).greater_than(value)
-            elif operator == "less_than":
-                filters = Filter.by_property(property_name).less_than(value)
-            elif operator == "like":
-                filters = Filter.by_property(property_name).like(value)
-            else:
-                return {
-                    "error": True,
-                    "message": f"Unsupported operator: {operator}. "
-                    "Supported: equal, not_equal, greater_than, less_than, like",
-                }
+        try:
+            filters = _build_filter(where_filter)
+        except ValueError as e:
+            return {"error": True, "message": str(e)}
 
         result = await service.get_objects(
             collection_name=collection_name,
@@ -210,6 +239,7 @@ async def weaviate_get_objects(
             offset=offset,
             return_properties=return_properties,
             include_vector=include_vector,
+            tenant=tenant,
         )
 
         logger.info(f"Objects retrieval result: {result}")
@@ -218,8 +248,6 @@ async def weaviate_get_objects(
     except Exception as e:
         logger.error(f"Error in weaviate_get_objects: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
 
 
 @mcp.tool(
@@ -234,6 +262,7 @@ async def weaviate_vector_search(
     where_filter: dict[str, Any] | None = None,
     return_properties: list[str] | None = None,
     include_vector: bool = False,
+    tenant: str | None = None,
 ) -> dict[str, Any]:
     """
     Perform semantic vector search in a Weaviate collection.
@@ -246,6 +275,7 @@ async def weaviate_vector_search(
         where_filter: Optional filter criteria (same format as weaviate_get_objects)
         return_properties: Optional list of specific properties to return
         include_vector: Whether to include vectors in the response
+        tenant: Optional tenant of a multi-tenant collection
 
     Returns:
         Dictionary containing search results with similarity scores or error details.
@@ -264,45 +294,13 @@ async def weaviate_vector_search(
         )
         ```
     """
-    service = WeaviateService()
     try:
+        service = get_weaviate_service()
         # Convert simple filter dict to Weaviate Filter object if provided
-        filters = None
-        if where_filter:
-            property_name = where_filter.get("property")
-            operator = where_filter.get("operator", "equal")
-            value = where_filter.get("value")
-
-            # Validate filter format
-            if not property_name:
-                return {
-                    "error": True,
-                    "message": "Invalid filter format: missing 'property' field. "
-                    "Expected format: {'property': 'field_name', 'operator': 'equal', 'value': 'some_value'}",
-                }
-            if value is None:
-                return {
-                    "error": True,
-                    "message": "Invalid filter format: missing 'value' field. "
-                    "Expected format: {'property': 'field_name', 'operator': 'equal', 'value': 'some_value'}",
-                }
-
-            if operator == "equal":
-                filters = Filter.by_property(property_name).equal(value)
-            elif operator == "not_equal":
-                filters = Filter.by_property(property_name).not_equal(value)
-            elif operator == "greater_than":
-                filters = Filter.by_property(property_name).greater_than(value)
-            elif operator == "less_than":
-                filters = Filter.by_property(property_name).less_than(value)
-            elif operator == "like":
-                filters = Filter.by_property(property_name).like(value)
-            else:
-                return {
-                    "error": True,
-                    "message": f"Unsupported operator: {operator}. "
-                    "Supported: equal, not_equal, greater_than, less_than, like",
-                }
+        try:
+            filters = _build_filter(where_filter)
+        except ValueError as e:
+            return {"error": True, "message": str(e)}
 
         result = await service.search(
             collection_name=collection_name,
@@ -312,6 +310,7 @@ async def weaviate_vector_search(
             offset=offset,
             return_properties=return_properties,
             include_vector=include_vector,
+            tenant=tenant,
         )
 
         logger.info(f"Vector search result: {result}")
@@ -320,8 +319,6 @@ async def weaviate_vector_search(
     except Exception as e:
         logger.error(f"Error in weaviate_vector_search: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
 
 
 @mcp.tool(
@@ -336,6 +333,7 @@ async def weaviate_hybrid_search(
     where_filter: dict[str, Any] | None = None,
     return_properties: list[str] | None = None,
     include_vector: bool = False,
+    tenant: str | None = None,
 ) -> dict[str, Any]:
     """
     Perform hybrid search (combining semantic and keyword search) in a Weaviate collection.
@@ -349,6 +347,7 @@ async def weaviate_hybrid_search(
         where_filter: Optional filter criteria (same format as weaviate_get_objects)
         return_properties: Optional list of specific properties to return
         include_vector: Whether to include vectors in the response
+        tenant: Optional tenant of a multi-tenant collection
 
     Returns:
         Dictionary containing search results with hybrid scores or error details.
@@ -363,45 +362,13 @@ async def weaviate_hybrid_search(
         )
         ```
     """
-    service = WeaviateService()
     try:
+        service = get_weaviate_service()
         # Convert simple filter dict to Weaviate Filter object if provided
-        filters = None
-        if where_filter:
-            property_name = where_filter.get("property")
-            operator = where_filter.get("operator", "equal")
-            value = where_filter.get("value")
-
-            # Validate filter format
-            if not property_name:
-                return {
-                    "error": True,
-                    "message": "Invalid filter format: missing 'property' field. "
-                    "Expected format: {'property': 'field_name', 'operator': 'equal', 'value': 'some_value'}",
-                }
-            if value is None:
-                return {
-                    "error": True,
-                    "message": "Invalid filter format: missing 'value' field. "
-                    "Expected format: {'property': 'field_name', 'operator': 'equal', 'value': 'some_value'}",
-                }
-
-            if operator == "equal":
-                filters = Filter.by_property(property_name).equal(value)
-            elif operator == "not_equal":
-                filters = Filter.by_property(property_name).not_equal(value)
-            elif operator == "greater_than":
-                filters = Filter.by_property(property_name).greater_than(value)
-            elif operator == "less_than":
-                filters = Filter.by_property(property_name).less_than(value)
-            elif operator == "like":
-                filters = Filter.by_property(property_name).like(value)
-            else:
-                return {
-                    "error": True,
-                    "message": f"Unsupported operator: {operator}. "
-                    "Supported: equal, not_equal, greater_than, less_than, like",
-                }
+        try:
+            filters = _build_filter(where_filter)
+        except ValueError as e:
+            return {"error": True, "message": str(e)}
 
         result = await service.hybrid_search(
             collection_name=collection_name,
@@ -411,6 +378,7 @@ async def weaviate_hybrid_search(
             alpha=alpha,
             return_properties=return_properties,
             include_vector=include_vector,
+            tenant=tenant,
         )
 
         logger.info(f"Hybrid search result: {result}")
@@ -419,8 +387,166 @@ async def weaviate_hybrid_search(
     except Exception as e:
         logger.error(f"Error in weaviate_hybrid_search: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
+
+
+@mcp.tool(
+    name="weaviate_multi_search",
+    description="Run several vector or hybrid searches, each with its own collection, filter and limit, concurrently in one call.",
+)
+async def weaviate_multi_search(
+    queries: list[dict[str, Any]],
+    concurrency: int = 8,
+    dedup: bool = False,
+) -> dict[str, Any]:
+    """
+    Run several searches concurrently and return their results grouped per query.
+
+    Args:
+        queries: List of searches, each a dictionary with:
+            - collection_name: Collection to search (required)
+            - query_text: Text query (required)
+            - mode: "vector" or "hybrid" (default: "hybrid")
+            - limit: Maximum number of results (default: 10)
+            - alpha: Hybrid balance between semantic (0.0) and keyword (1.0) (default: 0.5)
+            - where_filter: Optional filter (same format as weaviate_get_objects)
+            - return_properties: Optional list of properties to return
+            - include_vector: Whether to include vectors (default: False)
+            - tenant: Optional tenant of a multi-tenant collection
+        concurrency: Maximum number of searches running at once (default: 8)
+        dedup: Remove objects already returned by an earlier query in the list (default: False)
+
+    Returns:
+        Dictionary containing:
+            - results: One entry per query, in order, with objects and count, or error and message
+            - total_objects, failed_count, duplicates_removed, elapsed_seconds
+            - error: True if the request itself was invalid, with 'message' field
+
+    Example:
+        ```python
+        await weaviate_multi_search(
+            queries=[
+                {"collection_name": "Docs", "query_text": "install on linux", "limit": 5},
+                {"collection_name": "Docs", "query_text": "upgrade guide", "mode": "vector"},
+                {
+                    "collection_name": "Tickets",
+                    "query_text": "install fails",
+                    "where_filter": {"property": "status", "operator": "equal", "value": "open"}
+                },
+            ],
+            dedup=True
+        )
+        ```
+    """
+    try:
+        if not queries:
+            return {"error": True, "message": "queries cannot be empty"}
+        if len(queries) > MAX_MULTI_SEARCH_QUERIES:
+            return {"error": True, "message": f"At most {MAX_MULTI_SEARCH_QUERIES} queries are allowed per call"}
+        if concurrency <= 0:
+            return {"error": True, "message": "concurrency must be positive"}
+
+        searches = []
+        for index, query in enumerate(queries):
+            if not query.get("collection_name") or not query.get("query_text"):
+                return {"error": True, "message": f"Query {index} needs a collection_name and a query_text"}
+            try:
+                filters = _build_filter(query.get("where_filter"))
+            except ValueError as e:
+                return {"error": True, "message": f"Query {index}: {e}"}
+            search = {key: value for key, value in query.items() if key != "where_filter"}
+            search["filters"] = filters
+            searches.append(search)
+
+        service = get_weaviate_service()
+        result = await service.multi_search(queries=searches, concurrency=concurrency, dedup=dedup)
+
+        logger.info(
+            f"Multi-search of {len(queries)} queries: {result.get('total_objects', 0)} objects, "
+            f"{result.get('failed_count', 0)} failed queries"
+        )
+        return result
+
+    except Exception as e:
+        logger.error(f"Error in weaviate_multi_search: {e}")
+        return {"error": True, "message": str(e)}
+
+
+@mcp.tool(
+    name="weaviate_federated_search",
+    description="Hybrid search across several collections at once, merged into one ranked list.",
+)
+async def weaviate_federated_search(
+    collection_names: list[str],
+    query_text: str,
+    limit: int = 10,
+    alpha: float = 0.5,
+    fusion: str = "rrf",
+    where_filter: dict[str, Any] | None = None,
+    return_properties: list[str] | None = None,
+    tenant: str | None = None,
+) -> dict[str, Any]:
+    """
+    Search several collections concurrently and fuse the results into one ranking.
+
+    Args:
+        collection_names: Collections to search
+        query_text: Text query
+        limit: Maximum number of results in the merged list (default: 10)
+        alpha: Balance between semantic (0.0) and keyword (1.0) search (default: 0.5)
+        fusion: How to merge the per-collection rankings (default: "rrf"):
+            - "rrf": reciprocal rank fusion, robust when scores differ between collections
+            - "relative_score": per-collection scores normalized to [0, 1]
+        where_filter: Optional filter applied in every collection (same format as weaviate_get_objects)
+        return_properties: Optional list of properties to return
+        tenant: Optional tenant of a multi-tenant collection
+
+    Returns:
+        Dictionary containing:
+            - objects: Merged results, best first, each with collection_name and fused_score
+            - count, fusion, collections_searched, candidates, elapsed_seconds
+            - failed_collections: Collections whose search failed, if any
+            - error: True if the search failed, with 'message' field
+
+    Example:
+        ```python
+        await weaviate_federated_search(
+            collection_names=["WebPages", "PdfDocuments", "Tickets"],
+            query_text="reset a forgotten password",
+            limit=10
+        )
+        ```
+    """
+    try:
+        if not collection_names:
+            return {"error": True, "message": "collection_names cannot be empty"}
+        if len(set(collection_names)) != len(collection_names):
+            return {"error": True, "message": "collection_names contains duplicates"}
+        if limit <= 0:
+            return {"error": True, "message": "limit must be positive"}
+
+        try:
+            filters = _build_filter(where_filter)
+        except ValueError as e:
+            return {"error": True, "message": str(e)}
+
+        service = get_weaviate_service()
+        result = await service.federated_search(
+            collection_names=collection_names,
+            query_text=query_text,
+            filters=filters,
+            limit=limit,
+            alpha=alpha,
+            fusion=fusion,
+            return_properties=return_properties,
+            tenant=tenant,
+        )
+
+        logger.info(f"Federated search over {len(collection_names)} collections returned {result.get('count', 0)} objects")
+        return result
+
+    except Exception as e:
+        logger.error(f"Error in weaviate_federated_search: {e}")
+        return {"error": True, "message": str(e)}
 
 
 @mcp.tool(
@@ -431,6 +557,7 @@ async def weaviate_update_object(
     collection_name: str,
     uuid: str,
     data: dict[str, Any],
+    tenant: str | None = None,
 ) -> dict[str, Any]:
     """
     Update an existing object in a Weaviate collection.
@@ -439,6 +566,7 @@ async def weaviate_update_object(
         collection_name: Name of the collection
         uuid: UUID of the object to update
         data: Updated object data as key-value pairs
+        tenant: Optional tenant of a multi-tenant collection
 
     Returns:
         Dictionary with success status and message or error details.
@@ -455,12 +583,13 @@ async def weaviate_update_object(
         )
         ```
     """
-    service = WeaviateService()
     try:
+        service = get_weaviate_service()
         result = await service.update_object(
             collection_name=collection_name,
             uuid=uuid,
             data=data,
+            tenant=tenant,
         )
 
         logger.info(f"Object update result: {result}")
@@ -469,8 +598,6 @@ async def weaviate_update_object(
     except Exception as e:
         logger.error(f"Error in weaviate_update_object: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
 
 
 @mcp.tool(
@@ -480,6 +607,7 @@ async def weaviate_update_object(
 async def weaviate_delete_object(
     collection_name: str,
     uuid: str,
+    tenant: str | None = None,
 ) -> dict[str, Any]:
     """
     Delete an object from a Weaviate collection.
@@ -487,6 +615,7 @@ async def weaviate_delete_object(
     Args:
         collection_name: Name of the collection
         uuid: UUID of the object to delete
+        tenant: Optional tenant of a multi-tenant collection
 
     Returns:
         Dictionary with success status and message or error details.
@@ -499,11 +628,12 @@ async def weaviate_delete_object(
         )
         ```
     """
-    service = WeaviateService()
     try:
+        service = get_weaviate_service()
         result = await service.delete_object(
             collection_name=collection_name,
             uuid=uuid,
+            tenant=tenant,
         )
 
         logger.info(f"Object deletion result: {result}")
@@ -512,8 +642,146 @@ async def weaviate_delete_object(
     except Exception as e:
         logger.error(f"Error in weaviate_delete_object: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
+
+
+@mcp.tool(
+    name="weaviate_delete_many",
+    description="Delete all objects matching a filter from a Weaviate collection in bulk, with an optional dry run that only counts them.",
+)
+async def weaviate_delete_many(
+    collection_name: str,
+    where_filter: dict[str, Any],
+    dry_run: bool = False,
+    tenant: str | None = None,
+) -> dict[str, Any]:
+    """
+    Delete all objects matching a filter from a Weaviate collection.
+
+    The deletion runs on the server, so no object IDs have to be fetched first.
+    Run with dry_run=True to see how many objects would be deleted.
+
+    Args:
+        collection_name: Name of the collection
+        where_filter: Filter criteria (same format as weaviate_get_objects), required
+        dry_run: Only count the matching objects (default: False)
+        tenant: Optional tenant of a multi-tenant collection
+
+    Returns:
+        Dictionary containing matches, deleted_count and failed_count, or error details.
+
+    Example:
+        ```python
+        # Purge all chunks of a source
+        await weaviate_delete_many(
+            collection_name="Documents",
+            where_filter={
+                "property": "source_url",
+                "operator": "equal",
+                "value": "https://example.com/old-page"
+            }
+        )
+        ```
+    """
+    try:
+        if not where_filter:
+            return {
+                "error": True,
+                "message": "where_filter is required. Use weaviate_delete_collection to remove all objects",
+            }
+        try:
+            filters = _build_filter(where_filter)
+        except ValueError as e:
+            return {"error": True, "message": str(e)}
+
+        service = get_weaviate_service()
+        result = await service.delete_many(
+            collection_name=collection_name,
+            filters=filters,
+            dry_run=dry_run,
+            tenant=tenant,
+        )
+
+        logger.info(f"Delete by filter result: {result}")
+        return result
+
+    except Exception as e:
+        logger.error(f"Error in weaviate_delete_many: {e}")
+        return {"error": True, "message": str(e)}
+
+
+@mcp.tool(
+    name="weaviate_update_many",
+    description="Apply the same property changes to all objects matching a filter in a Weaviate collection, in concurrent batches.",
+)
+async def weaviate_update_many(
+    collection_name: str,
+    where_filter: dict[str, Any],
+    properties: dict[str, Any],
+    batch_size: int = 500,
+    concurrency: int = 16,
+    dry_run: bool = False,
+    tenant: str | None = None,
+) -> dict[str, Any]:
+    """
+    Update all objects matching a filter in a Weaviate collection.
+
+    Args:
+        collection_name: Name of the collection
+        where_filter: Filter criteria (same format as weaviate_get_objects), required
+        properties: Property values to set on every matching object
+        batch_size: Number of objects scanned per page (default: 500)
+        concurrency: Maximum number of updates in flight (default: 16)
+        dry_run: Only count the matching objects (default: False)
+        tenant: Optional tenant of a multi-tenant collection
+
+    Returns:
+        Dictionary containing matches, updated_count, failed_count and
+        throughput, or error details.
+
+    Example:
+        ```python
+        # Re-tag a category
+        await weaviate_update_many(
+            collection_name="Product",
+            where_filter={"property": "category", "operator": "equal", "value": "Audio"},
+            properties={"category": "Electronics & Audio"}
+        )
+        ```
+    """
+    try:
+        if not where_filter:
+            return {"error": True, "message": "where_filter is required"}
+        if not properties:
+            return {"error": True, "message": "properties cannot be empty"}
+        if batch_size <= 0:
+            return {"error": True, "message": "batch_size must be positive"}
+        if concurrency <= 0:
+            return {"error": True, "message": "concurrency must be positive"}
+        try:
+            filters = _build_filter(where_filter)
+        except ValueError as e:
+            return {"error": True, "message": str(e)}
+
+        service = get_weaviate_service()
+        result = await service.update_many(
+            collection_name=collection_name,
+            filters=filters,
+            properties=properties,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            dry_run=dry_run,
+            tenant=tenant,
+        )
+
+        logger.info(
+            f"Update by filter in collection '{collection_name}': "
+            f"{result.get('updated_count', 0)} of {result.get('matches', 0)} matching objects updated"
+        )
+        return result
+
+    except Exception as e:
+        logger.error(f"Error in weaviate_update_many: {e}")
+        return {"error": True, "message": str(e)}
 
 
 @mcp.tool(
@@ -525,18 +793,31 @@ async def weaviate_batch_insert_objects(
     objects: list[dict[str, Any]],
     unique_properties: list[str] | None = None,
     batch_size: int = 100,
+    concurrency: int = 4,
+    upsert: str | None = None,
+    tenant: str | None = None,
 ) -> dict[str, Any]:
     """
     Insert multiple objects into a Weaviate collection in batches.
 
+    Objects are sent with Weaviate's native batch API. Objects rejected by a
+    batch are retried individually before being reported as failed.
+
     Args:
         collection_name: Name of the collection to insert into
         objects: List of object data dictionaries
         unique_properties: Optional list of property names that should be unique
-        batch_size: Number of objects to process in each batch (default: 100)
+        batch_size: Number of objects to send in each batch request (default: 100)
+        concurrency: Maximum number of batch requests in flight (default: 4)
+        upsert: Optional deterministic-ID mode ("skip" or "replace"). Object IDs are
+               derived from the unique_properties values instead of querying for
+               duplicates: "skip" keeps existing objects, "replace" overwrites them.
+        tenant: Optional tenant of a multi-tenant collection
 
     Returns:
-        Dictionary with success status, inserted_ids, count, and message or error details.
+        Dictionary with success status, inserted_ids, count, elapsed_seconds and
+        objects_per_second. On partial failure, error is True and failed_objects
+        lists each failed object's index and error message.
 
     Example:
         ```python
@@ -548,17 +829,21 @@ async def weaviate_batch_insert_objects(
                 {"title": "Product 3", "price": 30.99}
             ],
             unique_properties=["title"],
-            batch_size=50
+            batch_size=50,
+            concurrency=4
         )
         ```
     """
-    service = WeaviateService()
     try:
+        service = get_weaviate_service()
         result = await service.batch_insert_objects(
             collection_name=collection_name,
             objects=objects,
             unique_properties=unique_properties,
             batch_size=batch_size,
+            concurrency=concurrency,
+            upsert=upsert,
+            tenant=tenant,
         )
 
         logger.info(f"Batch insertion result: {result}")
@@ -567,26 +852,26 @@ async def weaviate_batch_insert_objects(
     except Exception as e:
         logger.error(f"Error in weaviate_batch_insert_objects: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
 
 
 @mcp.tool(
     name="weaviate_batch_check_existing_files",
-    description="Efficiently check which files from a list already exist in a Weaviate collection. Returns files split into 'new' and 'existing' categories in a single query.",
+    description="Efficiently check which files from a list already exist in a Weaviate collection. Returns files split into 'new' and 'existing' categories using a few grouped aggregation queries.",
 )
 async def weaviate_batch_check_existing_files(
     collection_name: str,
     file_keys: list[str],
     source_field: str = "source_pdf",
+    tenant: str | None = None,
 ) -> dict[str, Any]:
     """
     Check which files from a list already exist in Weaviate.
 
     This tool enables efficient batch checking of multiple files against a Weaviate
     collection to determine which files are already indexed and which are new.
-    Instead of querying Weaviate once per file, this tool makes ONE query to check
-    all files at once, dramatically improving performance.
+    Instead of querying Weaviate once per file, this tool checks hundreds of files
+    per query with concurrent aggregations grouped by the source field, so only the
+    distinct matching file keys are transferred no matter how many chunks each has.
 
     IMPORTANT: This tool requires the collection schema to have a field that stores
     file identifiers (like 'source_pdf', 'source_file', 'file_key', etc.).
@@ -598,6 +883,7 @@ async def weaviate_batch_check_existing_files(
         source_field: Name of the field in Weaviate that contains the source file
                      identifier (default: "source_pdf"). This field must exist in
                      your collection schema.
+        tenant: Optional tenant of a multi-tenant collection
 
     Returns:
         Dictionary containing:
@@ -610,7 +896,8 @@ async def weaviate_batch_check_existing_files(
 
     Performance Benefits:
         - 20-100x faster than checking files individually
-        - Single network round-trip instead of N round-trips
+        - One round-trip per 500 files instead of one per file
+        - Stays correct for files with any number of chunks
         - Reduces API call overhead and costs
 
     Example:
@@ -642,12 +929,13 @@ async def weaviate_batch_check_existing_files(
         3. Process only the 'new_files' array
         4. Avoids re-processing and duplicate ingestion
     """
-    service = WeaviateService()
     try:
+        service = get_weaviate_service()
         result = await service.batch_check_existing_files(
             collection_name=collection_name,
             file_keys=file_keys,
             source_field=source_field,
+            tenant=tenant,
         )
 
         logger.info(
@@ -661,5 +949,174 @@ async def weaviate_batch_check_existing_files(
     except Exception as e:
         logger.error(f"Error in weaviate_batch_check_existing_files: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
+
+
+@mcp.tool(
+    name="weaviate_export_collection",
+    description="Export all objects of a Weaviate collection, optionally with vectors, to a local JSONL or Parquet file.",
+)
+async def weaviate_export_collection(
+    collection_name: str,
+    path: str,
+    file_format: str | None = None,
+    include_vector: bool = False,
+    return_properties: list[str] | None = None,
+    batch_size: int = 1000,
+    tenant: str | None = None,
+    overwrite: bool = False,
+) -> dict[str, Any]:
+    """
+    Export a whole collection to a local file.
+
+    Objects are read page by page with a cursor, so the export works for
+    collections of any size in bounded memory. Each object is written as a
+    record with its "id", "properties" and, if requested, "vector".
+
+    Missing parent directories of the path are created. If a file already
+    exists at the path, the export fails unless overwrite is True, in which
+    case the file is replaced once the export has completed.
+
+    Args:
+        collection_name: Name of the collection to export
+        path: Path of the file to write, e.g. "exports/products.jsonl"
+        file_format: "jsonl" or "parquet" (default: inferred from the file extension).
+                    Parquet requires the pyarrow package.
+        include_vector: Whether to export the objects' vectors (default: False)
+        return_properties: Optional list of properties to export (default: all)
+        batch_size: Number of objects fetched per page (default: 1000)
+        tenant: Optional tenant of a multi-tenant collection
+        overwrite: Whether to replace an existing file at the path (default: False)
+
+    Returns:
+        Dictionary containing:
+            - objects_exported: Number of objects written
+            - bytes_written: Size of the file
+            - elapsed_seconds, objects_per_second, megabytes_per_second: Throughput
+            - error: True if an error occurred, with 'message' field
+
+    Example:
+        ```python
+        await weaviate_export_collection(
+            collection_name="Product",
+            path="exports/products.parquet",
+            include_vector=True
+        )
+        ```
+    """
+    try:
+        if not path.strip():
+            return {"error": True, "message": "Export path cannot be empty"}
+        if batch_size <= 0:
+            return {"error": True, "message": "batch_size must be positive"}
+
+        service = get_weaviate_service()
+        result = await service.export_collection(
+            collection_name=collection_name,
+            path=path,
+            file_format=file_format,
+            include_vector=include_vector,
+            return_properties=return_properties,
+            batch_size=batch_size,
+            tenant=tenant,
+            overwrite=overwrite,
+        )
+
+        logger.info(
+            f"Export of collection '{collection_name}' to {path}: "
+            f"{result.get('objects_exported', 0)} objects, {result.get('bytes_written', 0)} bytes"
+        )
+        return result
+
+    except Exception as e:
+        logger.error(f"Error in weaviate_export_collection: {e}")
+        return {"error": True, "message": str(e)}
+
+
+@mcp.tool(
+    name="weaviate_import_file",
+    description="Bulk import objects, including precomputed vectors, from a local JSONL or Parquet file into a Weaviate collection. Resumable from the last committed offset.",
+)
+async def weaviate_import_file(
+    collection_name: str,
+    path: str,
+    file_format: str | None = None,
+    batch_size: int = 200,
+    concurrency: int = 4,
+    start_offset: int = 0,
+    tenant: str | None = None,
+) -> dict[str, Any]:
+    """
+    Import a local file into a collection with the batch API.
+
+    The file is streamed, so files of any size can be imported without sending
+    the objects through the conversation. Each record may have an "id",
+    "properties" and a "vector" (a list, or a mapping of vector name to list);
+    records without "properties" are imported as properties directly. Files
+    written by weaviate_export_collection can be imported as they are, and
+    their vectors are reused instead of being recomputed.
+
+    Args:
+        collection_name: Name of the collection to import into
+        path: Path of the file to read, e.g. "exports/products.jsonl"
+        file_format: "jsonl" or "parquet" (default: inferred from the file extension).
+                    Parquet requires the pyarrow package.
+        batch_size: Number of objects per batch request (default: 200)
+        concurrency: Maximum number of batch requests in flight (default: 4)
+        start_offset: Number of records to skip, e.g. the committed_offset of an
+                     interrupted import (default: 0)
+        tenant: Optional tenant of a multi-tenant collection
+
+    Returns:
+        Dictionary containing:
+            - objects_imported: Number of objects written
+            - failed_count / failed_objects: Objects rejected by Weaviate, with their offsets
+            - committed_offset: Number of records from the start of the file that were committed
+            - elapsed_seconds, objects_per_second: Throughput
+            - error: True if an error occurred, with 'message' field
+
+    Example:
+        ```python
+        result = await weaviate_import_file(
+            collection_name="Product",
+            path="exports/products.parquet",
+            concurrency=8
+        )
+        if result.get("error"):
+            # Resume after fixing the problem
+            await weaviate_import_file(
+                collection_name="Product",
+                path="exports/products.parquet",
+                start_offset=result["committed_offset"]
+            )
+        ```
+    """
+    try:
+        if not path.strip():
+            return {"error": True, "message": "Import path cannot be empty"}
+        if batch_size <= 0:
+            return {"error": True, "message": "batch_size must be positive"}
+        if concurrency <= 0:
+            return {"error": True, "message": "concurrency must be positive"}
+        if start_offset < 0:
+            return {"error": True, "message": "start_offset cannot be negative"}
+
+        service = get_weaviate_service()
+        result = await service.import_file(
+            collection_name=collection_name,
+            path=path,
+            file_format=file_format,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            start_offset=start_offset,
+            tenant=tenant,
+        )
+
+        logger.info(
+            f"Import of {path} into collection '{collection_name}': "
+            f"{result.get('objects_imported', 0)} objects, committed offset {result.get('committed_offset')}"
+        )
+        return result
+
+    except Exception as e:
+        logger.error(f"Error in weaviate_import_file: {e}")
+        return {"error": True, "message": str(e)}
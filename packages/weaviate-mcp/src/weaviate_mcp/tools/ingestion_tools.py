@@ -9,8 +9,9 @@ import logging
 from typing import Any
 
 from ..app import mcp  # Import from central app module
-from ..services.ingestion_service import IngestionService
-from ..services.weaviate_service import WeaviateService
+from ..services.crawl_service import CrawlService
+from ..services.ingestion_service import NEAR_DUPLICATE_COUNTS, IngestionService, validate_near_duplicate_options
+from ..services.weaviate_service import get_weaviate_service
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,9 @@ async def weaviate_ingest_from_url(
     chunk_size: int = 1000,
     chunk_overlap: int = 100,
     max_tokens_per_chunk: int = 500,
+    force: bool = False,
+    near_duplicates: str | None = None,
+    near_duplicate_scope: str = "collection",
 ) -> dict[str, Any]:
     """
     Ingest and vectorize content from a public URL into a Weaviate collection.
@@ -43,15 +47,27 @@ async def weaviate_ingest_from_url(
         chunk_size: Target character count per chunk (fallback, default: 1000)
         chunk_overlap: Character overlap between chunks (default: 100)
         max_tokens_per_chunk: Maximum tokens per chunk using GPT-4 tokenizer (default: 500)
+        force: Re-ingest even if the source is unchanged since the last ingestion (default: False)
+        near_duplicates: Optional near-duplicate chunk filter. Chunks that nearly
+            duplicate a chunk ingested with the filter before (boilerplate such as
+            headers and legal footers) are not vectorized: "skip" does not store
+            them, "link" stores them with a duplicate_of reference and the vector
+            of the chunk they duplicate (default: None, no filtering)
+        near_duplicate_scope: Where near-duplicates are looked for, "collection"
+            (default) or "source" (only chunks of the same URL)
 
     Returns:
         Dictionary with ingestion results including:
         - success: Boolean indicating success
+        - skipped: True if the source was unchanged and not re-ingested
         - chunks_ingested: Number of chunks created and inserted
         - collection_name: Target collection name
         - source_url: Source URL
         - inserted_ids: List of inserted object IDs
         - metadata: Extracted metadata (title, description, etc.)
+        - chunks_near_duplicate, chunks_linked, dedup_ratio: With near_duplicates,
+          the near-duplicate chunks found, how many were linked, and their share
+          of the new chunks
 
     Raises:
         ValueError: If the ingestion process fails
@@ -74,11 +90,13 @@ async def weaviate_ingest_from_url(
         - HTML content extraction with metadata (title, description, author)
         - Token-aware chunking using tiktoken for optimal context preservation
         - Semantic boundary detection (paragraphs, sentences)
-        - Duplicate prevention using source_url and chunk_index
+        - Idempotent re-ingestion via deterministic IDs from source_url and each chunk's content hash:
+          new chunks are inserted, removed chunks deleted, and moved chunks only
+          have their chunk_index updated, so unchanged text is not re-vectorized
+        - Conditional re-fetch (ETag, Last-Modified, content hash) skips unchanged sources
         - Comprehensive error handling and logging
         - Batch insertion for performance
     """
-    weaviate_service = None
     try:
         logger.info(f"Starting URL ingestion: {url} -> {collection_name}")
 
@@ -95,8 +113,11 @@ async def weaviate_ingest_from_url(
         if chunk_overlap < 0:
             raise ValueError("chunk_overlap cannot be negative")
 
+        if error := validate_near_duplicate_options(near_duplicates, near_duplicate_scope):
+            raise ValueError(error)
+
         # Initialize services
-        weaviate_service = WeaviateService()
+        weaviate_service = get_weaviate_service()
         ingestion_service = IngestionService(weaviate_service)
 
         # Perform synchronous ingestion
@@ -106,6 +127,9 @@ async def weaviate_ingest_from_url(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
             max_tokens_per_chunk=max_tokens_per_chunk,
+            force=force,
+            near_duplicates=near_duplicates,
+            near_duplicate_scope=near_duplicate_scope,
         )
 
         # Check for errors and raise ValueError if needed
@@ -126,9 +150,260 @@ async def weaviate_ingest_from_url(
     except Exception as e:
         logger.error(f"Unexpected error in weaviate_ingest_from_url: {e}")
         raise ValueError(f"Ingestion error: {str(e)}") from e
-    finally:
-        if weaviate_service:
-            await weaviate_service.close()
+
+
+@mcp.tool(
+    name="weaviate_ingest_urls",
+    description="Download, chunk, and ingest many URLs concurrently into Weaviate. Reports per-URL status and throughput.",
+)
+async def weaviate_ingest_urls(
+    urls: list[str],
+    collection_name: str,
+    max_tokens_per_chunk: int = 500,
+    chunk_overlap: int = 50,
+    concurrency: int = 16,
+    per_host_limit: int = 4,
+    force: bool = False,
+    near_duplicates: str | None = None,
+    near_duplicate_scope: str = "collection",
+) -> dict[str, Any]:
+    """
+    Ingest content from many public URLs into a Weaviate collection.
+
+    URLs are downloaded concurrently over a shared, pooled HTTP client (HTTP/2
+    when available), chunked in a worker pool, and batch-inserted while the
+    remaining downloads are still running. A failing URL does not stop the
+    others; its error is reported in the per-URL results. URLs that are
+    unchanged since their last ingestion are skipped.
+
+    Args:
+        urls: Public URLs to ingest (supports HTML, text, JSON)
+        collection_name: Name of the target Weaviate collection
+        max_tokens_per_chunk: Maximum tokens per chunk (default: 500)
+        chunk_overlap: Token overlap between chunks (default: 50)
+        concurrency: Maximum number of concurrent downloads (default: 16)
+        per_host_limit: Maximum number of concurrent downloads per host (default: 4)
+        force: Re-ingest sources even if they are unchanged (default: False)
+        near_duplicates: Optional near-duplicate chunk filter, "skip" or "link"
+            (see weaviate_ingest_from_url; default: None)
+        near_duplicate_scope: "collection" (default) or "source"
+
+    Returns:
+        Dictionary with ingestion results including:
+        - success: True if no URL failed
+        - total_urls, succeeded, unchanged, failed: URL counts
+        - chunks_ingested: Number of chunks inserted across all URLs
+        - bytes_downloaded, elapsed_seconds, urls_per_second, chunks_per_second: Throughput
+        - chunks_near_duplicate, chunks_linked, dedup_ratio: With near_duplicates, totals across URLs
+        - results: Per-URL status ("ingested", "unchanged" or "failed"), chunk count and message
+
+    Raises:
+        ValueError: If the inputs are invalid or the ingestion process fails
+
+    Example:
+        ```python
+        result = await weaviate_ingest_urls(
+            urls=["https://example.com/a", "https://example.com/b"],
+            collection_name="Documents",
+        )
+
+        for url_result in result["results"]:
+            if url_result["status"] == "failed":
+                print(url_result["url"], url_result["message"])
+        ```
+    """
+    try:
+        logger.info(f"Starting multi-URL ingestion: {len(urls)} URLs -> {collection_name}")
+
+        # Validate inputs
+        urls = [url.strip() for url in urls if url and url.strip()]
+        if not urls:
+            raise ValueError("At least one URL is required")
+
+        if not collection_name or not collection_name.strip():
+            raise ValueError("Collection name cannot be empty")
+
+        if max_tokens_per_chunk <= 0:
+            raise ValueError("max_tokens_per_chunk must be positive")
+
+        if chunk_overlap < 0:
+            raise ValueError("chunk_overlap cannot be negative")
+
+        if concurrency <= 0 or per_host_limit <= 0:
+            raise ValueError("concurrency and per_host_limit must be positive")
+
+        if error := validate_near_duplicate_options(near_duplicates, near_duplicate_scope):
+            raise ValueError(error)
+
+        # Initialize services
+        weaviate_service = get_weaviate_service()
+        ingestion_service = IngestionService(weaviate_service)
+
+        result = await ingestion_service.ingest_urls(
+            urls=urls,
+            collection_name=collection_name.strip(),
+            max_tokens_per_chunk=max_tokens_per_chunk,
+            chunk_overlap=chunk_overlap,
+            concurrency=concurrency,
+            per_host_limit=per_host_limit,
+            force=force,
+            near_duplicates=near_duplicates,
+            near_duplicate_scope=near_duplicate_scope,
+        )
+
+        logger.info(
+            f"Ingested {result['succeeded']}/{result['total_urls']} URLs "
+            f"({result['chunks_ingested']} chunks) into collection '{collection_name}'"
+        )
+
+        return result
+
+    except ValueError:
+        # Re-raise ValueError as expected by MCP error handling pattern
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error in weaviate_ingest_urls: {e}")
+        raise ValueError(f"Multi-URL ingestion error: {str(e)}") from e
+
+
+@mcp.tool(
+    name="weaviate_crawl_site",
+    description="Crawl a documentation site from a sitemap.xml or seed URL and ingest its pages into Weaviate. Supports depth/page/domain limits, URL patterns, robots.txt and resumable crawls.",
+)
+async def weaviate_crawl_site(
+    start_url: str,
+    collection_name: str,
+    max_depth: int = 2,
+    max_pages: int = 100,
+    allowed_domains: list[str] | None = None,
+    include_patterns: list[str] | None = None,
+    exclude_patterns: list[str] | None = None,
+    respect_robots: bool = True,
+    concurrency: int = 8,
+    per_host_limit: int = 4,
+    max_tokens_per_chunk: int = 500,
+    chunk_overlap: int = 50,
+    crawl_id: str | None = None,
+    force: bool = False,
+    near_duplicates: str | None = None,
+    near_duplicate_scope: str = "collection",
+) -> dict[str, Any]:
+    """
+    Crawl a site and ingest its pages into a Weaviate collection.
+
+    A sitemap.xml start URL seeds the crawl with the pages it lists; any other
+    start URL is crawled by following links. Pages are fetched by a bounded
+    pool of workers and chunked and inserted while the crawl continues.
+    Progress is checkpointed under crawl_id, so calling the tool again with
+    the same crawl_id resumes an interrupted crawl.
+
+    Args:
+        start_url: Seed page or sitemap.xml URL
+        collection_name: Name of the target Weaviate collection
+        max_depth: Maximum number of links followed from the start pages (default: 2)
+        max_pages: Maximum number of pages visited (default: 100)
+        allowed_domains: Domains that may be visited, including subdomains (default: the start URL's host)
+        include_patterns: Regular expressions; only URLs matching one of them are visited
+        exclude_patterns: Regular expressions; URLs matching any of them are not visited
+        respect_robots: Skip pages disallowed by robots.txt (default: True)
+        concurrency: Number of pages fetched concurrently (default: 8)
+        per_host_limit: Maximum number of concurrent fetches per host (default: 4)
+        max_tokens_per_chunk: Maximum tokens per chunk (default: 500)
+        chunk_overlap: Token overlap between chunks (default: 50)
+        crawl_id: Optional identifier for checkpointing and resuming the crawl
+        force: Re-ingest pages even if they are unchanged (default: False)
+        near_duplicates: Optional near-duplicate chunk filter, "skip" or "link"
+            (see weaviate_ingest_from_url; default: None). Useful against
+            navigation and footer text repeated on every page.
+        near_duplicate_scope: "collection" (default) or "source"
+
+    Returns:
+        Dictionary with the same fields as weaviate_ingest_urls, plus:
+        - start_url, pages_discovered, resumed
+        - skipped: Pages disallowed by robots.txt
+        - crawl_id, checkpoint_path: When checkpointing is enabled
+
+    Raises:
+        ValueError: If the inputs are invalid or the crawl fails
+
+    Example:
+        ```python
+        result = await weaviate_crawl_site(
+            start_url="https://docs.example.com/sitemap.xml",
+            collection_name="Docs",
+            max_depth=0,
+            include_patterns=[r"/guides/"],
+            crawl_id="example-docs",
+        )
+        ```
+    """
+    try:
+        logger.info(f"Starting crawl: {start_url} -> {collection_name}")
+
+        # Validate inputs
+        if not start_url or not start_url.strip():
+            raise ValueError("Start URL cannot be empty")
+
+        if not collection_name or not collection_name.strip():
+            raise ValueError("Collection name cannot be empty")
+
+        if max_depth < 0:
+            raise ValueError("max_depth cannot be negative")
+
+        if max_pages <= 0:
+            raise ValueError("max_pages must be positive")
+
+        if max_tokens_per_chunk <= 0:
+            raise ValueError("max_tokens_per_chunk must be positive")
+
+        if chunk_overlap < 0:
+            raise ValueError("chunk_overlap cannot be negative")
+
+        if concurrency <= 0 or per_host_limit <= 0:
+            raise ValueError("concurrency and per_host_limit must be positive")
+
+        if error := validate_near_duplicate_options(near_duplicates, near_duplicate_scope):
+            raise ValueError(error)
+
+        # Initialize services
+        weaviate_service = get_weaviate_service()
+        crawl_service = CrawlService(IngestionService(weaviate_service))
+
+        result = await crawl_service.crawl(
+            start_url=start_url.strip(),
+            collection_name=collection_name.strip(),
+            max_depth=max_depth,
+            max_pages=max_pages,
+            allowed_domains=allowed_domains,
+            include_patterns=include_patterns,
+            exclude_patterns=exclude_patterns,
+            respect_robots=respect_robots,
+            concurrency=concurrency,
+            per_host_limit=per_host_limit,
+            max_tokens_per_chunk=max_tokens_per_chunk,
+            chunk_overlap=chunk_overlap,
+            crawl_id=crawl_id,
+            force=force,
+            near_duplicates=near_duplicates,
+            near_duplicate_scope=near_duplicate_scope,
+        )
+
+        if result.get("error"):
+            raise ValueError(result.get("message", "Unknown crawl error"))
+
+        logger.info(
+            f"Crawled {result['succeeded']}/{result['total_urls']} pages "
+            f"({result['chunks_ingested']} chunks) into collection '{collection_name}'"
+        )
+
+        return result
+
+    except ValueError:
+        # Re-raise ValueError as expected by MCP error handling pattern
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error in weaviate_crawl_site: {e}")
+        raise ValueError(f"Crawl error: {str(e)}") from e
 
 
 @mcp.tool(
@@ -142,6 +417,8 @@ async def weaviate_ingest_text_content(
     title: str | None = None,
     max_tokens_per_chunk: int = 500,
     chunk_overlap: int = 50,
+    near_duplicates: str | None = None,
+    near_duplicate_scope: str = "collection",
 ) -> dict[str, Any]:
     """
     Ingest raw text content directly into a Weaviate collection.
@@ -156,6 +433,9 @@ async def weaviate_ingest_text_content(
         title: Optional title for the content
         max_tokens_per_chunk: Maximum tokens per chunk (default: 500)
         chunk_overlap: Token overlap between chunks (default: 50)
+        near_duplicates: Optional near-duplicate chunk filter, "skip" or "link"
+            (see weaviate_ingest_from_url; default: None)
+        near_duplicate_scope: "collection" (default) or "source"
 
     Returns:
         Dictionary with ingestion results
@@ -174,7 +454,6 @@ async def weaviate_ingest_text_content(
         )
         ```
     """
-    weaviate_service = None
     try:
         logger.info(
             f"Starting text content ingestion: {source_identifier} -> {collection_name}"
@@ -193,12 +472,15 @@ async def weaviate_ingest_text_content(
         if max_tokens_per_chunk <= 0:
             raise ValueError("max_tokens_per_chunk must be positive")
 
+        if error := validate_near_duplicate_options(near_duplicates, near_duplicate_scope):
+            raise ValueError(error)
+
         # Initialize services
-        weaviate_service = WeaviateService()
+        weaviate_service = get_weaviate_service()
         ingestion_service = IngestionService(weaviate_service)
 
         # Create chunks using the optimal chunking method
-        chunks = ingestion_service._create_optimal_chunks(
+        chunks = await ingestion_service.chunk_text(
             content.strip(),
             max_tokens=max_tokens_per_chunk,
             overlap_tokens=chunk_overlap,
@@ -210,24 +492,18 @@ async def weaviate_ingest_text_content(
         logger.info(f"Created {len(chunks)} chunks from text content")
 
         # Prepare objects for Weaviate insertion
-        objects = []
-        for i, chunk in enumerate(chunks):
-            obj = {
-                "content": chunk,
-                "source_url": source_identifier,
-                "chunk_index": i,
-                "total_chunks": len(chunks),
-                "content_type": "text/plain",
-                "title": title or f"Text Content {source_identifier}",
-            }
-            objects.append(obj)
-
-        # Batch insert into Weaviate
-        insert_result = await weaviate_service.batch_insert_objects(
+        title = title or f"Text Content {source_identifier}"
+        objects = ingestion_service.build_chunk_objects(
+            source_identifier, chunks, {"content_type": "text/plain", "title": title}
+        )
+
+        # Write only the chunks that changed since the source was last ingested
+        insert_result = await ingestion_service.sync_source_chunks(
             collection_name=collection_name.strip(),
+            source_url=source_identifier,
             objects=objects,
-            unique_properties=["source_url", "chunk_index"],
-            batch_size=50,
+            near_duplicates=near_duplicates,
+            near_duplicate_scope=near_duplicate_scope,
         )
 
         if insert_result.get("error"):
@@ -240,14 +516,18 @@ async def weaviate_ingest_text_content(
             f"from text content '{source_identifier}' into collection '{collection_name}'"
         )
 
-        return {
+        result = {
             "success": True,
             "chunks_ingested": len(chunks),
+            "chunks_inserted": insert_result["chunks_inserted"],
+            "chunks_deleted": insert_result["chunks_deleted"],
             "collection_name": collection_name,
             "source_identifier": source_identifier,
             "inserted_ids": insert_result.get("inserted_ids", []),
-            "title": title or f"Text Content {source_identifier}",
+            "title": title,
         }
+        result.update({key: insert_result[key] for key in NEAR_DUPLICATE_COUNTS if key in insert_result})
+        return result
 
     except ValueError:
         # Re-raise ValueError as expected by MCP error handling pattern
@@ -255,6 +535,3 @@ async def weaviate_ingest_text_content(
     except Exception as e:
         logger.error(f"Unexpected error in weaviate_ingest_text_content: {e}")
         raise ValueError(f"Text ingestion error: {str(e)}") from e
-    finally:
-        if weaviate_service:
-            await weaviate_service.close()
@@ -6,7 +6,7 @@ import logging
 from typing import Any
 
 from ..app import mcp  # Import from central app module
-from ..services.weaviate_service import WeaviateService
+from ..services.weaviate_service import get_weaviate_service
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +33,8 @@ async def weaviate_get_schema_info() -> dict[str, Any]:
             pass  # Schema info available in return value
         ```
     """
-    service = WeaviateService()
     try:
+        service = get_weaviate_service()
         schema_result = await service.get_schema()
 
         if schema_result.get("error"):
@@ -88,8 +88,6 @@ async def weaviate_get_schema_info() -> dict[str, Any]:
     except Exception as e:
         logger.error(f"Error in weaviate_get_schema_info: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
 
 
 @mcp.tool(
@@ -113,21 +111,17 @@ async def weaviate_validate_collection_exists(collection_name: str) -> dict[str,
             pass  # Collection info available in return value
         ```
     """
-    service = WeaviateService()
     try:
-        schema_result = await service.get_schema()
+        service = get_weaviate_service()
+        collection_result = await service.get_collection_schema(collection_name)
 
-        if schema_result.get("error"):
-            return schema_result
+        if collection_result.get("error") and "available_collections" not in collection_result:
+            return collection_result
 
-        exists = collection_name in schema_result
+        exists = not collection_result.get("error")
 
         if exists:
-            collection_info = schema_result[collection_name]
-            property_count = 0
-
-            if hasattr(collection_info, "properties") and collection_info.properties:
-                property_count = len(collection_info.properties)
+            property_count = len(collection_result["properties"])
 
             # Get object count
             count_result = await service.aggregate(collection_name)
@@ -146,14 +140,12 @@ async def weaviate_validate_collection_exists(collection_name: str) -> dict[str,
             "exists": False,
             "collection_name": collection_name,
             "message": f"Collection '{collection_name}' does not exist",
-            "available_collections": list(schema_result.keys()),
+            "available_collections": collection_result["available_collections"],
         }
 
     except Exception as e:
         logger.error(f"Error in weaviate_validate_collection_exists: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
 
 
 @mcp.tool(
@@ -178,41 +170,31 @@ async def weaviate_get_collection_properties(collection_name: str) -> dict[str,
             pass
         ```
     """
-    service = WeaviateService()
     try:
-        schema_result = await service.get_schema()
+        service = get_weaviate_service()
+        collection_result = await service.get_collection_schema(collection_name)
 
-        if schema_result.get("error"):
-            return schema_result
+        if collection_result.get("error"):
+            return collection_result
 
-        if collection_name not in schema_result:
-            return {
-                "error": True,
-                "message": f"Collection '{collection_name}' does not exist",
-                "available_collections": list(schema_result.keys()),
-            }
-
-        collection_info = schema_result[collection_name]
         properties = {}
+        for prop in collection_result["properties"].values():
+            prop_details = {
+                "name": prop.name,
+                "description": getattr(prop, "description", ""),
+            }
 
-        if hasattr(collection_info, "properties") and collection_info.properties:
-            for prop in collection_info.properties:
-                prop_details = {
-                    "name": prop.name,
-                    "description": getattr(prop, "description", ""),
-                }
-
-                # Add data type information
-                if hasattr(prop, "data_type"):
-                    prop_details["data_type"] = str(prop.data_type)
+            # Add data type information
+            if hasattr(prop, "data_type"):
+                prop_details["data_type"] = str(prop.data_type)
 
-                # Add indexing information
-                if hasattr(prop, "index_filterable"):
-                    prop_details["filterable"] = prop.index_filterable
-                if hasattr(prop, "index_searchable"):
-                    prop_details["searchable"] = prop.index_searchable
+            # Add indexing information
+            if hasattr(prop, "index_filterable"):
+                prop_details["filterable"] = prop.index_filterable
+            if hasattr(prop, "index_searchable"):
+                prop_details["searchable"] = prop.index_searchable
 
-                properties[prop.name] = prop_details
+            properties[prop.name] = prop_details
 
         return {
             "collection_name": collection_name,
@@ -224,8 +206,6 @@ async def weaviate_get_collection_properties(collection_name: str) -> dict[str,
     except Exception as e:
         logger.error(f"Error in weaviate_get_collection_properties: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
 
 
 @mcp.tool(
@@ -254,44 +234,44 @@ async def weaviate_compare_collections(
             pass
         ```
     """
-    service = WeaviateService()
     try:
-        schema_result = await service.get_schema()
+        service = get_weaviate_service()
+        collection1 = await service.get_collection_schema(collection1_name)
+        collection2 = await service.get_collection_schema(collection2_name)
 
-        if schema_result.get("error"):
-            return schema_result
+        for collection_result in (collection1, collection2):
+            if collection_result.get("error") and "available_collections" not in collection_result:
+                return collection_result
 
         # Validate both collections exist
         missing_collections = []
-        if collection1_name not in schema_result:
+        if collection1.get("error"):
             missing_collections.append(collection1_name)
-        if collection2_name not in schema_result:
+        if collection2.get("error"):
             missing_collections.append(collection2_name)
 
         if missing_collections:
             return {
                 "error": True,
                 "message": f"Collections not found: {missing_collections}",
-                "available_collections": list(schema_result.keys()),
+                "available_collections": (collection1 if collection1.get("error") else collection2)["available_collections"],
             }
 
         # Get properties for both collections
         coll1_props = {}
         coll2_props = {}
 
-        for collection_name, props_dict in [
-            (collection1_name, coll1_props),
-            (collection2_name, coll2_props),
+        for collection_result, props_dict in [
+            (collection1, coll1_props),
+            (collection2, coll2_props),
         ]:
-            collection_info = schema_result[collection_name]
-            if hasattr(collection_info, "properties") and collection_info.properties:
-                for prop in collection_info.properties:
-                    props_dict[prop.name] = {
-                        "data_type": str(getattr(prop, "data_type", "unknown")),
-                        "description": getattr(prop, "description", ""),
-                        "filterable": getattr(prop, "index_filterable", None),
-                        "searchable": getattr(prop, "index_searchable", None),
-                    }
+            for prop in collection_result["properties"].values():
+                props_dict[prop.name] = {
+                    "data_type": str(getattr(prop, "data_type", "unknown")),
+                    "description": getattr(prop, "description", ""),
+                    "filterable": getattr(prop, "index_filterable", None),
+                    "searchable": getattr(prop, "index_searchable", None),
+                }
 
         # Compare properties
         coll1_prop_names = set(coll1_props.keys())
@@ -336,20 +316,30 @@ async def weaviate_compare_collections(
     except Exception as e:
         logger.error(f"Error in weaviate_compare_collections: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
 
 
 @mcp.tool(
     name="weaviate_get_database_stats",
-    description="Get overall database statistics including total collections and objects.",
+    description="Get overall database statistics including total collections, objects and shards.",
 )
-async def weaviate_get_database_stats() -> dict[str, Any]:
+async def weaviate_get_database_stats(concurrency: int = 16, max_age_seconds: float = 0) -> dict[str, Any]:
     """
     Get overall database statistics including total collections and objects.
 
+    Collections are counted concurrently. Set max_age_seconds to accept a
+    recent snapshot instead of recounting, e.g. when polling.
+
+    Args:
+        concurrency: Maximum number of collections counted at once (default: 16)
+        max_age_seconds: Accept a snapshot up to this many seconds old (default: 0, always recount)
+
     Returns:
-        Dictionary containing database statistics or error information.
+        Dictionary containing database statistics or error information:
+            - total_collections, total_objects
+            - collection_stats: Object count per collection
+            - collection_details: Object and shard count per collection
+            - elapsed_seconds: Wall time of the count
+            - cached, snapshot_age_seconds: Whether a snapshot was returned, and its age
 
     Example:
         ```python
@@ -359,37 +349,33 @@ async def weaviate_get_database_stats() -> dict[str, Any]:
             pass
         ```
     """
-    service = WeaviateService()
     try:
-        schema_result = await service.get_schema()
+        if concurrency <= 0:
+            return {"error": True, "message": "concurrency must be positive"}
 
-        if schema_result.get("error"):
-            return schema_result
+        service = get_weaviate_service()
+        stats = await service.get_database_stats(concurrency=concurrency, max_age_seconds=max_age_seconds)
 
-        total_collections = len(schema_result)
-        total_objects = 0
-        collection_stats = {}
+        if stats.get("error"):
+            return stats
 
-        # Get object count for each collection
-        for collection_name in schema_result:
-            count_result = await service.aggregate(collection_name)
-            count = 0
-            if count_result.get("success") and count_result.get("results"):
-                count = count_result["results"].get("total_count", 0)
-
-            collection_stats[collection_name] = count
-            total_objects += count
-
-        return {
+        total_collections = stats["total_collections"]
+        total_objects = stats["total_objects"]
+        result = {
             "total_collections": total_collections,
             "total_objects": total_objects,
-            "collection_stats": collection_stats,
-            "collections": list(schema_result.keys()),
+            "collection_stats": {name: details["object_count"] for name, details in stats["collections"].items()},
+            "collection_details": stats["collections"],
+            "collections": list(stats["collections"]),
+            "elapsed_seconds": stats["elapsed_seconds"],
+            "cached": stats["cached"],
+            "snapshot_age_seconds": stats["snapshot_age_seconds"],
             "message": f"Database contains {total_collections} collections with {total_objects} total objects",
         }
+        if stats.get("failed_collections"):
+            result["failed_collections"] = stats["failed_collections"]
+        return result
 
     except Exception as e:
         logger.error(f"Error in weaviate_get_database_stats: {e}")
         return {"error": True, "message": str(e)}
-    finally:
-        await service.close()
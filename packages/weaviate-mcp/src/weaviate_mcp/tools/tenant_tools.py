@@ -0,0 +1,208 @@
+"""
+Tenant management tools for multi-tenant Weaviate collections.
+"""
+
+import logging
+import re
+from typing import Any
+
+from ..app import mcp  # Import from central app module
+from ..services.weaviate_service import TENANT_STATUSES, get_weaviate_service
+
+logger = logging.getLogger(__name__)
+
+# Tenant names accepted by Weaviate
+_TENANT_NAME = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+def _validate_tenant_names(tenants: list[str]) -> str | None:
+    """Return an error message if the tenant list is empty or has invalid names."""
+    if not tenants:
+        return "tenants cannot be empty"
+    invalid = [name for name in tenants if not isinstance(name, str) or not _TENANT_NAME.match(name)]
+    if invalid:
+        return f"Invalid tenant names: {invalid}. Use 1-64 letters, digits, '-' or '_'"
+    return None
+
+
+# --- Tenant Management Tool Functions --- #
+
+
+@mcp.tool(
+    name="weaviate_create_tenants",
+    description="Create tenants in a multi-tenant Weaviate collection.",
+)
+async def weaviate_create_tenants(
+    collection_name: str,
+    tenants: list[str],
+    activity_status: str = "active",
+) -> dict[str, Any]:
+    """
+    Create tenants in a multi-tenant collection.
+
+    Each tenant gets its own shard, so its searches never touch other tenants' data.
+
+    Args:
+        collection_name: Name of a collection created with multi_tenancy_config
+        tenants: Tenant names (1-64 letters, digits, '-' or '_')
+        activity_status: Initial status, "active" (default) or "inactive"
+
+    Returns:
+        Dictionary with success status and created_count, or error details.
+
+    Example:
+        ```python
+        await weaviate_create_tenants(
+            collection_name="CustomerDocs",
+            tenants=["acme", "globex"]
+        )
+        ```
+    """
+    try:
+        error = _validate_tenant_names(tenants)
+        if error:
+            return {"error": True, "message": error}
+
+        service = get_weaviate_service()
+        result = await service.create_tenants(
+            collection_name=collection_name,
+            tenants=tenants,
+            activity_status=activity_status,
+        )
+
+        logger.info(f"Tenant creation result: {result}")
+        return result
+
+    except Exception as e:
+        logger.error(f"Error in weaviate_create_tenants: {e}")
+        return {"error": True, "message": str(e)}
+
+
+@mcp.tool(
+    name="weaviate_list_tenants",
+    description="List the tenants of a multi-tenant Weaviate collection with their activity status.",
+)
+async def weaviate_list_tenants(collection_name: str) -> dict[str, Any]:
+    """
+    List the tenants of a multi-tenant collection.
+
+    Args:
+        collection_name: Name of the collection
+
+    Returns:
+        Dictionary containing:
+            - tenants: List of {name, activity_status}, sorted by name
+            - count: Number of tenants
+            - status_counts: Number of tenants per activity status
+            - error: True if listing failed, with 'message' field
+
+    Example:
+        ```python
+        await weaviate_list_tenants(collection_name="CustomerDocs")
+        ```
+    """
+    try:
+        service = get_weaviate_service()
+        result = await service.list_tenants(collection_name)
+
+        logger.info(f"Listed {result.get('count', 0)} tenants of '{collection_name}'")
+        return result
+
+    except Exception as e:
+        logger.error(f"Error in weaviate_list_tenants: {e}")
+        return {"error": True, "message": str(e)}
+
+
+@mcp.tool(
+    name="weaviate_update_tenant_status",
+    description="Activate, deactivate or offload tenants of a multi-tenant Weaviate collection.",
+)
+async def weaviate_update_tenant_status(
+    collection_name: str,
+    tenants: list[str],
+    activity_status: str,
+) -> dict[str, Any]:
+    """
+    Change the activity status of tenants to manage memory use.
+
+    Only active tenants can be read or written. Inactive tenants keep their
+    data on local disk without using memory; offloaded tenants are moved to
+    cloud storage and need an offload module (e.g. offload-s3) on the server.
+
+    Args:
+        collection_name: Name of the collection
+        tenants: Tenant names
+        activity_status: "active", "inactive" or "offloaded"
+
+    Returns:
+        Dictionary with success status and updated_count, or error details.
+
+    Example:
+        ```python
+        # Offload customers that have not been active this month
+        await weaviate_update_tenant_status(
+            collection_name="CustomerDocs",
+            tenants=["initech", "hooli"],
+            activity_status="offloaded"
+        )
+        ```
+    """
+    try:
+        error = _validate_tenant_names(tenants)
+        if error:
+            return {"error": True, "message": error}
+        if activity_status not in TENANT_STATUSES:
+            return {
+                "error": True,
+                "message": f"Unsupported tenant status: {activity_status}. Supported: {', '.join(TENANT_STATUSES)}",
+            }
+
+        service = get_weaviate_service()
+        result = await service.update_tenant_status(
+            collection_name=collection_name,
+            tenants=tenants,
+            activity_status=activity_status,
+        )
+
+        logger.info(f"Tenant status update result: {result}")
+        return result
+
+    except Exception as e:
+        logger.error(f"Error in weaviate_update_tenant_status: {e}")
+        return {"error": True, "message": str(e)}
+
+
+@mcp.tool(
+    name="weaviate_delete_tenants",
+    description="Delete tenants and all their objects from a multi-tenant Weaviate collection.",
+)
+async def weaviate_delete_tenants(collection_name: str, tenants: list[str]) -> dict[str, Any]:
+    """
+    Delete tenants from a multi-tenant collection, including all their objects.
+
+    Args:
+        collection_name: Name of the collection
+        tenants: Tenant names
+
+    Returns:
+        Dictionary with success status and deleted_count, or error details.
+
+    Example:
+        ```python
+        await weaviate_delete_tenants(collection_name="CustomerDocs", tenants=["globex"])
+        ```
+    """
+    try:
+        error = _validate_tenant_names(tenants)
+        if error:
+            return {"error": True, "message": error}
+
+        service = get_weaviate_service()
+        result = await service.delete_tenants(collection_name=collection_name, tenants=tenants)
+
+        logger.info(f"Tenant deletion result: {result}")
+        return result
+
+    except Exception as e:
+        logger.error(f"Error in weaviate_delete_tenants: {e}")
+        return {"error": True, "message": str(e)}
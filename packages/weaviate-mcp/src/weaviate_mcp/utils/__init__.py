@@ -0,0 +1 @@
+"""Utility functions for weaviate-mcp."""
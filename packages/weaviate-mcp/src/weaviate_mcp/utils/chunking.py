@@ -0,0 +1,345 @@
+"""
+Token-aware text chunking.
+
+The chunker encodes a document exactly once and then works purely on offsets:
+paragraph and sentence boundaries are precomputed as byte offsets into the
+UTF-8 encoded text, and the token count of any span is answered with a binary
+search over the token start offsets instead of re-encoding the span. This keeps
+chunking linear in the size of the document.
+"""
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from itertools import accumulate
+
+from .tokenizer import Tokenizer, get_tokenizer
+
+PARAGRAPH_SEPARATOR = "\n\n"
+SENTENCE_SEPARATOR = " "
+
+# Documents larger than this many characters are chunked in independent shards
+SHARD_SIZE = 1_000_000
+
+_PARAGRAPH_BREAK = re.compile(rb"\n\n")
+_SENTENCE_BREAK = re.compile(rb"(?<=[.!?])\s+")
+_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+_WORD_BREAKS = (b" ", b"\n", b"\t")
+
+# (start, end, separator placed before the span)
+Piece = tuple[int, int, str]
+Chunk = tuple[list[Piece], int]
+
+
+class _Document:
+    """A document encoded once, with token and sentence offsets precomputed."""
+
+    def __init__(self, text: str, tokenizer: Tokenizer):
+        self.data = text.encode("utf-8")
+
+        # Byte offset at which each token starts
+        self.token_starts = array("q", accumulate(tokenizer.token_lengths(text), initial=0))
+        self.token_starts.pop()
+
+        self.break_starts = array("q")
+        self.break_ends = array("q")
+        for match in _SENTENCE_BREAK.finditer(self.data):
+            self.break_starts.append(match.start())
+            self.break_ends.append(match.end())
+
+    def count_tokens(self, start: int, end: int) -> int:
+        """Count the tokens overlapping the byte span [start, end)."""
+        if end <= start:
+            return 0
+        first = max(bisect_right(self.token_starts, start) - 1, 0)
+        return bisect_left(self.token_starts, end) - first
+
+    def strip(self, start: int, end: int) -> tuple[int, int] | None:
+        """Trim surrounding whitespace from a span, returning None if nothing is left."""
+        data = self.data
+        while start < end and data[start] in _WHITESPACE:
+            start += 1
+        while end > start and data[end - 1] in _WHITESPACE:
+            end -= 1
+        return (start, end) if start < end else None
+
+    def paragraphs(self) -> list[tuple[int, int]]:
+        """Return the non-empty paragraph spans separated by blank lines."""
+        spans = []
+        position = 0
+        for match in _PARAGRAPH_BREAK.finditer(self.data):
+            span = self.strip(position, match.start())
+            if span:
+                spans.append(span)
+            position = match.end()
+
+        span = self.strip(position, len(self.data))
+        if span:
+            spans.append(span)
+        return spans
+
+    def sentences(self, start: int, end: int) -> list[tuple[int, int]]:
+        """Split a stripped span into sentence spans using the precomputed breaks."""
+        spans = []
+        index = bisect_right(self.break_starts, start)
+        while index < len(self.break_starts) and self.break_starts[index] < end:
+            spans.append((start, self.break_starts[index]))
+            start = self.break_ends[index]
+            index += 1
+        spans.append((start, end))
+        return spans
+
+    def window_end(self, start: int, end: int, max_tokens: int) -> int:
+        """Find where a window of at most max_tokens starting at start should be cut."""
+        limit_index = max(bisect_right(self.token_starts, start) - 1, 0) + max_tokens
+        if limit_index >= len(self.token_starts) or self.token_starts[limit_index] >= end:
+            return end
+
+        limit = self.token_starts[limit_index]
+
+        # Cut back to the last whitespace so that words stay intact
+        cut = max(self.data.rfind(word_break, start, limit) for word_break in _WORD_BREAKS)
+        if cut > start:
+            return cut
+
+        # A single word longer than the window: cut at the token boundary,
+        # moved onto a character boundary so the span still decodes
+        cut = limit
+        while cut > start and 0x80 <= self.data[cut] < 0xC0:
+            cut -= 1
+        if cut > start:
+            return cut
+        while limit < end and 0x80 <= self.data[limit] < 0xC0:
+            limit += 1
+        return limit
+
+    def render(self, pieces: list[Piece]) -> str:
+        """Join the pieces of a chunk back into text."""
+        return "".join(separator + self.data[start:end].decode("utf-8") for start, end, separator in pieces).strip()
+
+
+class TokenChunker:
+    """Split text into token-bounded chunks along paragraph and sentence boundaries."""
+
+    def __init__(self, tokenizer: Tokenizer, min_tokens: int = 10):
+        """
+        Initialize the chunker.
+
+        Args:
+            tokenizer: Tokenizer used to count tokens
+            min_tokens: Chunks with fewer tokens than this are dropped
+        """
+        self.tokenizer = tokenizer
+        self.min_tokens = min_tokens
+        # Token cost of the separator placed between two packed spans
+        self._separator_tokens = {
+            separator: tokenizer.count_tokens(separator) for separator in (PARAGRAPH_SEPARATOR, SENTENCE_SEPARATOR)
+        }
+
+    def chunk(self, text: str, max_tokens: int = 500, overlap_tokens: int = 50) -> list[str]:
+        """
+        Split text into chunks of at most max_tokens tokens.
+
+        Paragraphs are packed together while they fit. Paragraphs that are too
+        large on their own are split into sentences, and sentences that are
+        still too large are split into token windows cut at word boundaries.
+        Each new chunk starts with up to overlap_tokens tokens worth of
+        trailing sentences from the previous one.
+
+        Args:
+            text: Input text to chunk
+            max_tokens: Maximum tokens per chunk
+            overlap_tokens: Number of tokens to overlap between chunks
+
+        Returns:
+            List of text chunks
+
+        Raises:
+            ValueError: If max_tokens is not positive
+        """
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+
+        if not text or not text.strip():
+            return []
+
+        document = _Document(text, self.tokenizer)
+        chunks = self._pack(
+            document,
+            document.paragraphs(),
+            PARAGRAPH_SEPARATOR,
+            max_tokens,
+            overlap_tokens,
+            self._split_paragraph,
+        )
+
+        result = []
+        for pieces, token_count in chunks:
+            if token_count < self.min_tokens:
+                continue
+            chunk_text = document.render(pieces)
+            if chunk_text:
+                result.append(chunk_text)
+        return result
+
+    def _pack(
+        self,
+        document: _Document,
+        spans: list[tuple[int, int]],
+        separator: str,
+        max_tokens: int,
+        overlap_tokens: int,
+        split: Callable[[_Document, int, int, int, int], list[Chunk]],
+    ) -> list[Chunk]:
+        """Greedily pack spans into chunks, splitting spans that are too large."""
+        separator_tokens = self._separator_tokens[separator]
+        chunks: list[Chunk] = []
+        current: list[Piece] = []
+        current_tokens = 0
+
+        for start, end in spans:
+            span_tokens = document.count_tokens(start, end)
+
+            # If the span alone exceeds max_tokens, split it further
+            if span_tokens > max_tokens:
+                if current:
+                    chunks.append((current, current_tokens))
+                    current, current_tokens = [], 0
+                chunks.extend(split(document, start, end, max_tokens, overlap_tokens))
+                continue
+
+            if current and current_tokens + separator_tokens + span_tokens > max_tokens:
+                chunks.append((current, current_tokens))
+                # Start the next chunk with overlap, leaving room for the span itself
+                budget = min(overlap_tokens, max_tokens - span_tokens - separator_tokens)
+                current, current_tokens = self._overlap(document, current, budget)
+
+            if current:
+                current.append((start, end, separator))
+                current_tokens += separator_tokens + span_tokens
+            else:
+                current = [(start, end, "")]
+                current_tokens = span_tokens
+
+        if current:
+            chunks.append((current, current_tokens))
+
+        return chunks
+
+    def _overlap(self, document: _Document, pieces: list[Piece], budget: int) -> tuple[list[Piece], int]:
+        """Take trailing sentences of a chunk worth at most budget tokens."""
+        separator_tokens = self._separator_tokens[SENTENCE_SEPARATOR]
+        selected: list[tuple[int, int]] = []
+        total = 0
+
+        for start, end, _ in reversed(pieces):
+            for sentence_start, sentence_end in reversed(document.sentences(start, end)):
+                sentence_tokens = document.count_tokens(sentence_start, sentence_end)
+                if selected:
+                    sentence_tokens += separator_tokens
+                if total + sentence_tokens > budget:
+                    break
+                selected.append((sentence_start, sentence_end))
+                total += sentence_tokens
+            else:
+                continue
+            break
+
+        selected.reverse()
+        overlap = [(start, end, SENTENCE_SEPARATOR if index else "") for index, (start, end) in enumerate(selected)]
+        return overlap, total
+
+    def _split_paragraph(
+        self,
+        document: _Document,
+        start: int,
+        end: int,
+        max_tokens: int,
+        overlap_tokens: int,
+    ) -> list[Chunk]:
+        """Split a paragraph that is too large into chunks of sentences."""
+        return self._pack(
+            document,
+            document.sentences(start, end),
+            SENTENCE_SEPARATOR,
+            max_tokens,
+            overlap_tokens,
+            self._split_sentence,
+        )
+
+    def _split_sentence(
+        self,
+        document: _Document,
+        start: int,
+        end: int,
+        max_tokens: int,
+        overlap_tokens: int,
+    ) -> list[Chunk]:
+        """Split a sentence that is too large into token windows cut at word boundaries."""
+        chunks: list[Chunk] = []
+        while start < end:
+            cut = document.window_end(start, end, max_tokens)
+            span = document.strip(start, cut)
+            if span:
+                chunks.append(([(span[0], span[1], "")], document.count_tokens(*span)))
+            start = cut
+        return chunks
+
+
+def split_into_shards(text: str, shard_size: int = SHARD_SIZE) -> list[str]:
+    """
+    Split text into blocks of whole paragraphs of roughly shard_size characters.
+
+    Shards are only cut at paragraph breaks, so each one can be chunked
+    independently and the results concatenated in order.
+
+    Args:
+        text: Input text to shard
+        shard_size: Minimum number of characters per shard
+
+    Returns:
+        List of text shards
+    """
+    shards = []
+    start = 0
+    while len(text) - start > shard_size:
+        cut = text.find(PARAGRAPH_SEPARATOR, start + shard_size)
+        if cut == -1:
+            break
+        shards.append(text[start:cut])
+        start = cut + len(PARAGRAPH_SEPARATOR)
+
+    shards.append(text[start:])
+    return shards
+
+
+# Chunkers of the current process, keyed by tokenizer name
+_chunkers: dict[str, TokenChunker] = {}
+
+
+def get_chunker(tokenizer_name: str | None = None) -> TokenChunker:
+    """
+    Get a process-wide chunker for a tokenizer, creating it on first use.
+
+    Args:
+        tokenizer_name: Registered tokenizer name, defaults to the configured one
+
+    Returns:
+        The shared chunker instance
+    """
+    tokenizer = get_tokenizer(tokenizer_name)
+    chunker = _chunkers.get(tokenizer.name)
+    if chunker is None:
+        chunker = _chunkers[tokenizer.name] = TokenChunker(tokenizer)
+    return chunker
+
+
+def chunk_with_tokenizer(tokenizer_name: str | None, text: str, max_tokens: int, overlap_tokens: int) -> list[str]:
+    """
+    Chunk text with the process-wide chunker for a tokenizer.
+
+    This is the entry point used by pool workers: it only takes picklable
+    arguments and loads the tokenizer once per worker process.
+    """
+    return get_chunker(tokenizer_name).chunk(text, max_tokens=max_tokens, overlap_tokens=overlap_tokens)
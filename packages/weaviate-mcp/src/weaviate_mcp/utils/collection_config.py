@@ -0,0 +1,285 @@
+"""
+Validation of collection configuration options passed to the creation tools.
+
+Options arrive as plain dictionaries and are turned into the client's
+Configure objects here, so that mistakes (unknown options, out-of-range
+values, a quantizer the index type does not support) are reported before
+anything is sent to Weaviate. Every builder raises ValueError with a
+message naming the offending option.
+"""
+
+from typing import Any
+
+from weaviate.classes.config import Configure, VectorDistances
+
+VECTOR_INDEX_TYPES = ("hnsw", "flat", "dynamic")
+
+QUANTIZER_TYPES = ("pq", "bq", "sq")
+
+DISTANCE_METRICS = {distance.value: distance for distance in VectorDistances}
+
+# Options of each index type, besides "type", "distance" and "quantizer"
+_HNSW_OPTIONS = (
+    "ef",
+    "ef_construction",
+    "max_connections",
+    "dynamic_ef_min",
+    "dynamic_ef_max",
+    "dynamic_ef_factor",
+    "flat_search_cutoff",
+    "vector_cache_max_objects",
+    "cleanup_interval_seconds",
+)
+_FLAT_OPTIONS = ("vector_cache_max_objects",)
+_DYNAMIC_OPTIONS = ("threshold",)
+
+_QUANTIZER_OPTIONS = {
+    "pq": ("segments", "centroids", "training_limit", "bit_compression"),
+    "bq": ("cache", "rescore_limit"),
+    "sq": ("cache", "rescore_limit", "training_limit"),
+}
+
+# The flat index only supports binary quantization
+_FLAT_QUANTIZERS = ("bq",)
+
+_SHARDING_OPTIONS = ("desired_count", "virtual_per_physical", "desired_virtual_count")
+_REPLICATION_OPTIONS = ("factor", "async_enabled")
+_MULTI_TENANCY_OPTIONS = ("enabled", "auto_tenant_creation", "auto_tenant_activation")
+
+
+def _check_options(options: dict[str, Any], allowed: tuple[str, ...], name: str) -> None:
+    unknown = sorted(set(options) - set(allowed))
+    if unknown:
+        raise ValueError(f"Unknown {name} option(s): {', '.join(unknown)}. Supported: {', '.join(allowed)}")
+
+
+def _int_option(options: dict[str, Any], key: str, minimum: int, name: str, maximum: int | None = None) -> int | None:
+    """Read an optional integer option within bounds."""
+    value = options.get(key)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"{name}.{key} must be an integer, got {value!r}")
+    if value < minimum or (maximum is not None and value > maximum):
+        bounds = f"between {minimum} and {maximum}" if maximum is not None else f"at least {minimum}"
+        raise ValueError(f"{name}.{key} must be {bounds}, got {value}")
+    return value
+
+
+def _bool_option(options: dict[str, Any], key: str, name: str) -> bool | None:
+    value = options.get(key)
+    if value is not None and not isinstance(value, bool):
+        raise ValueError(f"{name}.{key} must be true or false, got {value!r}")
+    return value
+
+
+def build_quantizer(options: dict[str, Any] | None, index_type: str = "hnsw") -> Any | None:
+    """
+    Build a vector compression config.
+
+    Args:
+        options: Dictionary with "type" ("pq", "bq" or "sq") and its options:
+            - pq: segments, centroids (1-256), training_limit, bit_compression
+            - bq: cache, rescore_limit
+            - sq: cache, rescore_limit, training_limit
+        index_type: Index type the quantizer is for
+
+    Returns:
+        The quantizer config, or None if options is empty
+
+    Raises:
+        ValueError: If the options are invalid or the index type does not support the quantizer
+    """
+    if not options:
+        return None
+    quantizer_type = str(options.get("type", "")).lower()
+    if quantizer_type not in QUANTIZER_TYPES:
+        raise ValueError(f"Unsupported quantizer type: {options.get('type')!r}. Supported: {', '.join(QUANTIZER_TYPES)}")
+    if index_type == "flat" and quantizer_type not in _FLAT_QUANTIZERS:
+        raise ValueError(f"The flat index only supports {', '.join(_FLAT_QUANTIZERS)} quantization, not {quantizer_type}")
+
+    name = "quantizer"
+    settings = {key: value for key, value in options.items() if key != "type"}
+    _check_options(settings, _QUANTIZER_OPTIONS[quantizer_type], f"{quantizer_type} {name}")
+
+    if quantizer_type == "pq":
+        return Configure.VectorIndex.Quantizer.pq(
+            segments=_int_option(settings, "segments", 1, name),
+            centroids=_int_option(settings, "centroids", 1, name, maximum=256),
+            training_limit=_int_option(settings, "training_limit", 1, name),
+            bit_compression=_bool_option(settings, "bit_compression", name),
+        )
+    if quantizer_type == "bq":
+        return Configure.VectorIndex.Quantizer.bq(
+            cache=_bool_option(settings, "cache", name),
+            rescore_limit=_int_option(settings, "rescore_limit", 1, name),
+        )
+    return Configure.VectorIndex.Quantizer.sq(
+        cache=_bool_option(settings, "cache", name),
+        rescore_limit=_int_option(settings, "rescore_limit", 1, name),
+        training_limit=_int_option(settings, "training_limit", 1, name),
+    )
+
+
+def _hnsw_config(options: dict[str, Any], distance: VectorDistances | None, quantizer: Any | None) -> Any:
+    name = "vector_index_config"
+    ef = options.get("ef")
+    if ef is not None and ef != -1:
+        # -1 lets Weaviate pick ef dynamically from the query limit
+        _int_option(options, "ef", 1, name)
+    dynamic_ef_min = _int_option(options, "dynamic_ef_min", 1, name)
+    dynamic_ef_max = _int_option(options, "dynamic_ef_max", 1, name)
+    if dynamic_ef_min is not None and dynamic_ef_max is not None and dynamic_ef_min > dynamic_ef_max:
+        raise ValueError(f"{name}.dynamic_ef_min ({dynamic_ef_min}) cannot exceed dynamic_ef_max ({dynamic_ef_max})")
+
+    return Configure.VectorIndex.hnsw(
+        distance_metric=distance,
+        ef=ef,
+        ef_construction=_int_option(options, "ef_construction", 1, name),
+        max_connections=_int_option(options, "max_connections", 1, name),
+        dynamic_ef_min=dynamic_ef_min,
+        dynamic_ef_max=dynamic_ef_max,
+        dynamic_ef_factor=_int_option(options, "dynamic_ef_factor", 1, name),
+        flat_search_cutoff=_int_option(options, "flat_search_cutoff", 0, name),
+        vector_cache_max_objects=_int_option(options, "vector_cache_max_objects", 0, name),
+        cleanup_interval_seconds=_int_option(options, "cleanup_interval_seconds", 1, name),
+        quantizer=quantizer,
+    )
+
+
+def _flat_config(options: dict[str, Any], distance: VectorDistances | None, quantizer: Any | None) -> Any:
+    return Configure.VectorIndex.flat(
+        distance_metric=distance,
+        vector_cache_max_objects=_int_option(options, "vector_cache_max_objects", 0, "vector_index_config"),
+        quantizer=quantizer,
+    )
+
+
+def build_vector_index_config(options: dict[str, Any] | None) -> Any | None:
+    """
+    Build a vector index config.
+
+    Args:
+        options: Dictionary with:
+            - type: "hnsw" (default), "flat" or "dynamic" (flat that switches
+              to hnsw past `threshold` objects; needs async indexing on the server)
+            - distance: "cosine", "dot", "l2-squared", "hamming" or "manhattan"
+            - hnsw options: ef (-1 for dynamic ef), ef_construction, max_connections,
+              dynamic_ef_min, dynamic_ef_max, dynamic_ef_factor, flat_search_cutoff,
+              vector_cache_max_objects, cleanup_interval_seconds
+            - flat options: vector_cache_max_objects
+            - dynamic options: threshold, plus the hnsw options for its hnsw stage
+            - quantizer: Optional compression, see build_quantizer. For a dynamic
+              index, pq and sq apply to the hnsw stage and bq to both stages.
+
+    Returns:
+        The vector index config, or None if options is empty
+
+    Raises:
+        ValueError: If an option is unknown or invalid
+    """
+    if not options:
+        return None
+    index_type = str(options.get("type", "hnsw")).lower()
+    if index_type not in VECTOR_INDEX_TYPES:
+        raise ValueError(f"Unsupported vector index type: {options.get('type')!r}. Supported: {', '.join(VECTOR_INDEX_TYPES)}")
+
+    allowed = {"hnsw": _HNSW_OPTIONS, "flat": _FLAT_OPTIONS, "dynamic": _DYNAMIC_OPTIONS + _HNSW_OPTIONS}[index_type]
+    _check_options(options, ("type", "distance", "quantizer", *allowed), f"{index_type} vector_index_config")
+
+    distance = None
+    if options.get("distance") is not None:
+        distance = DISTANCE_METRICS.get(str(options["distance"]).lower())
+        if distance is None:
+            raise ValueError(f"Unsupported distance metric: {options['distance']!r}. Supported: {', '.join(DISTANCE_METRICS)}")
+
+    quantizer = build_quantizer(options.get("quantizer"), index_type)
+
+    if index_type == "hnsw":
+        return _hnsw_config(options, distance, quantizer)
+    if index_type == "flat":
+        return _flat_config(options, distance, quantizer)
+
+    flat_quantizer = quantizer if str((options.get("quantizer") or {}).get("type", "")).lower() in _FLAT_QUANTIZERS else None
+    return Configure.VectorIndex.dynamic(
+        distance_metric=distance,
+        threshold=_int_option(options, "threshold", 1, "vector_index_config"),
+        hnsw=_hnsw_config({key: value for key, value in options.items() if key in _HNSW_OPTIONS}, None, quantizer),
+        flat=_flat_config({}, None, flat_quantizer),
+    )
+
+
+def build_sharding_config(options: dict[str, Any] | None) -> Any | None:
+    """
+    Build a sharding config.
+
+    Args:
+        options: Dictionary with desired_count (number of shards),
+            virtual_per_physical and desired_virtual_count
+
+    Returns:
+        The sharding config, or None if options is empty
+
+    Raises:
+        ValueError: If an option is unknown or invalid
+    """
+    if not options:
+        return None
+    name = "sharding_config"
+    _check_options(options, _SHARDING_OPTIONS, name)
+    return Configure.sharding(
+        desired_count=_int_option(options, "desired_count", 1, name),
+        virtual_per_physical=_int_option(options, "virtual_per_physical", 1, name),
+        desired_virtual_count=_int_option(options, "desired_virtual_count", 1, name),
+    )
+
+
+def build_replication_config(options: dict[str, Any] | None) -> Any | None:
+    """
+    Build a replication config.
+
+    Args:
+        options: Dictionary with factor (number of copies of each shard) and
+            async_enabled (asynchronous replica repair)
+
+    Returns:
+        The replication config, or None if options is empty
+
+    Raises:
+        ValueError: If an option is unknown or invalid
+    """
+    if not options:
+        return None
+    name = "replication_config"
+    _check_options(options, _REPLICATION_OPTIONS, name)
+    return Configure.replication(
+        factor=_int_option(options, "factor", 1, name),
+        async_enabled=_bool_option(options, "async_enabled", name),
+    )
+
+
+def build_multi_tenancy_config(options: dict[str, Any] | None) -> Any | None:
+    """
+    Build a multi-tenancy config.
+
+    Args:
+        options: Dictionary with enabled (default: True when options are given),
+            auto_tenant_creation (create unknown tenants on insert) and
+            auto_tenant_activation (activate inactive tenants when accessed)
+
+    Returns:
+        The multi-tenancy config, or None if options is empty
+
+    Raises:
+        ValueError: If an option is unknown or invalid
+    """
+    if not options:
+        return None
+    name = "multi_tenancy_config"
+    _check_options(options, _MULTI_TENANCY_OPTIONS, name)
+    enabled = _bool_option(options, "enabled", name)
+    return Configure.multi_tenancy(
+        enabled=True if enabled is None else enabled,
+        auto_tenant_creation=_bool_option(options, "auto_tenant_creation", name),
+        auto_tenant_activation=_bool_option(options, "auto_tenant_activation", name),
+    )
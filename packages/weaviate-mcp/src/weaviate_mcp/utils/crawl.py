@@ -0,0 +1,186 @@
+"""
+Helpers for crawling sites: URL normalization and filtering, link and sitemap
+extraction, and the checkpoints that make a crawl resumable.
+"""
+
+import json
+import os
+import re
+import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
+from typing import Any
+from urllib.parse import urldefrag, urljoin, urlparse
+
+# User agent matched against robots.txt rules
+CRAWLER_USER_AGENT = "weaviate-mcp"
+
+# Links to files with these extensions are never followed
+SKIPPED_EXTENSIONS = frozenset(
+    {
+        ".7z",
+        ".avi",
+        ".css",
+        ".doc",
+        ".docx",
+        ".exe",
+        ".gif",
+        ".gz",
+        ".ico",
+        ".jpeg",
+        ".jpg",
+        ".js",
+        ".mov",
+        ".mp3",
+        ".mp4",
+        ".pdf",
+        ".png",
+        ".svg",
+        ".tar",
+        ".webp",
+        ".woff",
+        ".woff2",
+        ".zip",
+    }
+)
+
+
+def normalize_url(url: str, base_url: str | None = None) -> str | None:
+    """
+    Resolve a URL against a base and normalize it for de-duplication.
+
+    The fragment is dropped and the host is lowercased. Non-HTTP URLs and links
+    to binary files are rejected.
+
+    Args:
+        url: Absolute or relative URL
+        base_url: URL the link was found on
+
+    Returns:
+        The normalized absolute URL, or None if it should not be crawled
+    """
+    absolute, _ = urldefrag(urljoin(base_url, url.strip()) if base_url else url.strip())
+    parsed = urlparse(absolute)
+    if parsed.scheme not in ("http", "https") or not parsed.netloc:
+        return None
+    if os.path.splitext(parsed.path)[1].lower() in SKIPPED_EXTENSIONS:
+        return None
+    return parsed._replace(netloc=parsed.netloc.lower(), path=parsed.path or "/").geturl()
+
+
+class _LinkParser(HTMLParser):
+    """Collect the href of every anchor and the document's base URL."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.hrefs: list[str] = []
+        self.base: str | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag not in ("a", "base"):
+            return
+        href = dict(attrs).get("href")
+        if not href:
+            return
+        if tag == "a":
+            self.hrefs.append(href)
+        elif self.base is None:
+            self.base = href
+
+
+def extract_html_links(html: str, base_url: str) -> list[str]:
+    """
+    Extract the crawlable links of an HTML page.
+
+    Args:
+        html: HTML content
+        base_url: URL the page was served from, used to resolve relative links
+
+    Returns:
+        Normalized absolute links, de-duplicated in document order
+    """
+    parser = _LinkParser()
+    parser.feed(html)
+    parser.close()
+
+    base = urljoin(base_url, parser.base) if parser.base else base_url
+    links = (normalize_url(href, base) for href in parser.hrefs)
+    return list(dict.fromkeys(link for link in links if link))
+
+
+def parse_sitemap(xml: str | bytes) -> tuple[list[str], list[str]]:
+    """
+    Parse a sitemap or sitemap index.
+
+    Args:
+        xml: Sitemap XML
+
+    Returns:
+        Tuple of (page URLs, nested sitemap URLs)
+
+    Raises:
+        ET.ParseError: If the XML is malformed
+    """
+    root = ET.fromstring(xml)
+    locations = [element.text.strip() for element in root.iter() if element.tag.rsplit("}", 1)[-1] == "loc" and element.text]
+    if root.tag.rsplit("}", 1)[-1] == "sitemapindex":
+        return [], locations
+    return locations, []
+
+
+class UrlFilter:
+    """Decide which URLs a crawl may visit based on domains and patterns."""
+
+    def __init__(
+        self,
+        allowed_domains: list[str],
+        include_patterns: list[str] | None = None,
+        exclude_patterns: list[str] | None = None,
+    ):
+        """
+        Initialize the filter.
+
+        Args:
+            allowed_domains: Domains whose pages (including subdomains) may be visited
+            include_patterns: Regular expressions of which a URL must match at least one
+            exclude_patterns: Regular expressions of which a URL must match none
+
+        Raises:
+            ValueError: If a pattern is not a valid regular expression
+        """
+        self.allowed_domains = [domain.lower().strip(".") for domain in allowed_domains if domain]
+        try:
+            self.include = [re.compile(pattern) for pattern in include_patterns or []]
+            self.exclude = [re.compile(pattern) for pattern in exclude_patterns or []]
+        except re.error as e:
+            raise ValueError(f"Invalid URL pattern: {e}") from e
+
+    def allows(self, url: str) -> bool:
+        """Check whether a normalized URL may be visited."""
+        host = urlparse(url).hostname or ""
+        if not any(host == domain or host.endswith(f".{domain}") for domain in self.allowed_domains):
+            return False
+        if self.include and not any(pattern.search(url) for pattern in self.include):
+            return False
+        return not any(pattern.search(url) for pattern in self.exclude)
+
+
+def checkpoint_path(checkpoint_dir: str, crawl_id: str) -> str:
+    """Return the checkpoint file of a crawl, with the ID made safe for use as a file name."""
+    return os.path.join(checkpoint_dir, re.sub(r"[^A-Za-z0-9_.-]", "_", crawl_id) + ".json")
+
+
+def load_checkpoint(path: str) -> dict[str, Any] | None:
+    """Load a crawl checkpoint, returning None if there is none."""
+    if not os.path.isfile(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_checkpoint(path: str, state: dict[str, Any]) -> None:
+    """Write a crawl checkpoint atomically, so an interrupted write never corrupts it."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(temp_path, path)
@@ -0,0 +1,394 @@
+"""
+Pluggable extraction of main-content text and metadata from HTML pages.
+
+Every backend removes boilerplate elements, picks the main content area and
+returns its text with one blank line between block-level elements, so that
+the chunker can still split on paragraph boundaries. Available backends:
+
+- "stdlib": a single streaming pass over the page with the standard
+  library's HTML tokenizer; no parse tree is built (default)
+- "lxml": lxml's C parser, used by default when lxml is installed
+- "beautifulsoup": BeautifulSoup with html.parser, the original implementation
+"""
+
+import importlib.util
+import logging
+import re
+import threading
+from collections.abc import Callable
+from html.parser import HTMLParser
+from typing import Any, Protocol
+
+from ..config import get_html_extractor_name
+
+logger = logging.getLogger(__name__)
+
+# Elements whose content is never part of the extracted text
+REMOVED_TAGS = frozenset({"script", "style", "nav", "footer", "header", "noscript", "template"})
+
+# Candidates for the main content area, in order of preference
+MAIN_CONTENT_SELECTORS = ("main", "article", ".content", "#content", ".post-content")
+
+# Elements that start a new block of text
+BLOCK_TAGS = frozenset(
+    {
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "body",
+        "dd",
+        "details",
+        "div",
+        "dl",
+        "dt",
+        "fieldset",
+        "figcaption",
+        "figure",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "hr",
+        "li",
+        "main",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "summary",
+        "table",
+        "td",
+        "th",
+        "tr",
+        "ul",
+    }
+)
+
+# Elements that never have an end tag
+VOID_TAGS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"}
+)
+
+BLOCK_BREAK = "\n\n"
+_BLOCK_SPLIT = re.compile(r"\n\s*\n")
+
+ExtractedHtml = tuple[str, dict[str, Any]]
+
+
+class HtmlExtractor(Protocol):
+    """Interface of an HTML extraction backend."""
+
+    name: str
+
+    def extract(self, html: str) -> ExtractedHtml:
+        """
+        Extract the main-content text and metadata of a page.
+
+        Returns:
+            Tuple of (text with blocks separated by blank lines, metadata with
+            title, description and author when present)
+        """
+        ...
+
+
+def normalize_blocks(text: str) -> str:
+    """Collapse whitespace within blocks and separate non-empty blocks by one blank line."""
+    blocks = (" ".join(block.split()) for block in _BLOCK_SPLIT.split(text))
+    return BLOCK_BREAK.join(block for block in blocks if block)
+
+
+def _matches(selector: str, tag: str, attrs: dict[str, str | None]) -> bool:
+    """Match a tag, .class or #id selector against an element."""
+    if selector.startswith("."):
+        return selector[1:] in (attrs.get("class") or "").split()
+    if selector.startswith("#"):
+        return attrs.get("id") == selector[1:]
+    return tag == selector
+
+
+class _StreamingExtractor(HTMLParser):
+    """Collect body text, main-content candidates and metadata in one pass."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        # Open elements as (tag, capture index or None, removed)
+        self.stack: list[tuple[str, int | None, bool]] = []
+        self.removed_depth = 0
+        self.in_title = False
+        self.title: list[str] | None = None
+        self.metadata: dict[str, Any] = {}
+        self.body: list[str] = []
+        # Text of the first element matching each main-content selector
+        self.captures: list[list[str] | None] = [None] * len(MAIN_CONTENT_SELECTORS)
+        self.active: list[list[str]] = [self.body]
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "meta":
+            attributes = dict(attrs)
+            name = (attributes.get("name") or "").lower()
+            if name in ("description", "author") and name not in self.metadata:
+                self.metadata[name] = (attributes.get("content") or "").strip()
+            return
+        if tag == "title" and self.title is None:
+            self.title = []
+            self.in_title = True
+            return
+        if tag in VOID_TAGS:
+            if tag in ("br", "hr") and not self.removed_depth:
+                self._write(BLOCK_BREAK if tag == "hr" else " ")
+            return
+
+        removed = tag in REMOVED_TAGS
+        capture = None
+        if not removed and not self.removed_depth:
+            attributes = dict(attrs)
+            for index, selector in enumerate(MAIN_CONTENT_SELECTORS):
+                if self.captures[index] is None and _matches(selector, tag, attributes):
+                    capture = index
+                    self.captures[index] = []
+                    self.active.append(self.captures[index])
+                    break
+            if tag in BLOCK_TAGS:
+                self._write(BLOCK_BREAK)
+
+        self.stack.append((tag, capture, removed))
+        if removed:
+            self.removed_depth += 1
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS and tag not in ("meta", "title"):
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title":
+            self.in_title = False
+            return
+
+        # Close the innermost open element with this tag, and any left open inside it
+        for position in range(len(self.stack) - 1, -1, -1):
+            if self.stack[position][0] == tag:
+                break
+        else:
+            return
+
+        while len(self.stack) > position:
+            open_tag, capture, removed = self.stack.pop()
+            if removed:
+                self.removed_depth -= 1
+            elif not self.removed_depth and open_tag in BLOCK_TAGS:
+                self._write(BLOCK_BREAK)
+            if capture is not None:
+                buffer = self.captures[capture]
+                self.active = [active for active in self.active if active is not buffer]
+
+    def handle_data(self, data: str) -> None:
+        if self.in_title:
+            self.title.append(data)
+        elif not self.removed_depth:
+            self._write(data)
+
+    def _write(self, text: str) -> None:
+        for buffer in self.active:
+            buffer.append(text)
+
+
+class StdlibHtmlExtractor:
+    """Single-pass extraction with the standard library's HTML tokenizer."""
+
+    name = "stdlib"
+
+    def extract(self, html: str) -> ExtractedHtml:
+        """Extract the main-content text and metadata of a page."""
+        parser = _StreamingExtractor()
+        parser.feed(html)
+        parser.close()
+
+        metadata = dict(parser.metadata)
+        if parser.title is not None:
+            metadata["title"] = "".join(parser.title).strip()
+
+        main = next((capture for capture in parser.captures if capture is not None), parser.body)
+        return normalize_blocks("".join(main)), metadata
+
+
+class LxmlHtmlExtractor:
+    """Extraction with lxml's C parser. Requires the optional lxml package."""
+
+    name = "lxml"
+
+    # XPath equivalents of MAIN_CONTENT_SELECTORS
+    MAIN_CONTENT_XPATHS = (
+        "//main",
+        "//article",
+        "//*[contains(concat(' ', normalize-space(@class), ' '), ' content ')]",
+        "//*[@id='content']",
+        "//*[contains(concat(' ', normalize-space(@class), ' '), ' post-content ')]",
+    )
+
+    def __init__(self):
+        """
+        Initialize the extractor.
+
+        Raises:
+            ImportError: If lxml is not installed
+        """
+        from lxml import etree
+        from lxml import html as lxml_html
+
+        self._etree = etree
+        self._parser = lxml_html.HTMLParser(encoding="utf-8", remove_comments=True)
+        self._document_fromstring = lxml_html.document_fromstring
+
+    def extract(self, html: str) -> ExtractedHtml:
+        """Extract the main-content text and metadata of a page."""
+        if not html.strip():
+            return "", {}
+
+        # Parsing bytes avoids lxml rejecting strings that carry an encoding declaration
+        root = self._document_fromstring(html.encode("utf-8"), parser=self._parser)
+
+        metadata: dict[str, Any] = {}
+        title = root.find(".//title")
+        if title is not None:
+            metadata["title"] = (title.text_content() or "").strip()
+        for name in ("description", "author"):
+            content = root.xpath(
+                f"//meta[translate(@name, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')='{name}']"
+            )
+            if content:
+                metadata[name] = (content[0].get("content") or "").strip()
+
+        for element in root.xpath("|".join(f"//{tag}" for tag in sorted(REMOVED_TAGS))):
+            element.drop_tree()
+
+        main = None
+        for xpath in self.MAIN_CONTENT_XPATHS:
+            found = root.xpath(xpath)
+            if found:
+                main = found[0]
+                break
+        if main is None:
+            main = root.find("body")
+            if main is None:
+                main = root
+
+        parts: list[str] = []
+        for event, element in self._etree.iterwalk(main, events=("start", "end")):
+            tag = element.tag if isinstance(element.tag, str) else None
+            if event == "start":
+                if tag in BLOCK_TAGS or tag == "hr":
+                    parts.append(BLOCK_BREAK)
+                elif tag == "br":
+                    parts.append(" ")
+                if tag and tag not in ("title", "head"):
+                    parts.append(element.text or "")
+            else:
+                if tag in BLOCK_TAGS:
+                    parts.append(BLOCK_BREAK)
+                if element is not main:
+                    parts.append(element.tail or "")
+        return normalize_blocks("".join(parts)), metadata
+
+
+class BeautifulSoupHtmlExtractor:
+    """Extraction with BeautifulSoup and html.parser, kept for compatibility."""
+
+    name = "beautifulsoup"
+
+    def extract(self, html: str) -> ExtractedHtml:
+        """Extract the main-content text and metadata of a page."""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, "html.parser")
+
+        metadata: dict[str, Any] = {}
+        title_tag = soup.find("title")
+        if title_tag:
+            metadata["title"] = title_tag.get_text().strip()
+        for name in ("description", "author"):
+            meta = soup.find("meta", attrs={"name": re.compile(f"^{name}$", re.IGNORECASE)})
+            if meta:
+                metadata[name] = meta.get("content", "").strip()
+
+        for element in soup(list(REMOVED_TAGS)):
+            element.decompose()
+
+        main_content = None
+        for selector in MAIN_CONTENT_SELECTORS:
+            main_content = soup.select_one(selector)
+            if main_content:
+                break
+        if not main_content:
+            main_content = soup.find("body") or soup
+
+        for element in main_content.find_all("br"):
+            element.replace_with(" ")
+        for element in main_content.find_all(list(BLOCK_TAGS)):
+            element.insert_before(BLOCK_BREAK)
+            element.insert_after(BLOCK_BREAK)
+        return normalize_blocks(main_content.get_text()), metadata
+
+
+def _default_extractor() -> HtmlExtractor:
+    """Use lxml when it is installed, and the streaming stdlib extractor otherwise."""
+    if importlib.util.find_spec("lxml") is not None:
+        return LxmlHtmlExtractor()
+    return StdlibHtmlExtractor()
+
+
+_extractor_factories: dict[str, Callable[[], HtmlExtractor]] = {
+    "auto": _default_extractor,
+    "stdlib": StdlibHtmlExtractor,
+    "lxml": LxmlHtmlExtractor,
+    "beautifulsoup": BeautifulSoupHtmlExtractor,
+}
+_extractors: dict[str, HtmlExtractor] = {}
+_extractors_lock = threading.Lock()
+
+
+def register_html_extractor(name: str, factory: Callable[[], HtmlExtractor]) -> None:
+    """
+    Register an extraction backend under a name usable with get_html_extractor.
+
+    Args:
+        name: Name to register the backend under
+        factory: Callable returning the extractor, invoked on first use
+    """
+    with _extractors_lock:
+        _extractor_factories[name] = factory
+        _extractors.pop(name, None)
+
+
+def get_html_extractor(name: str | None = None) -> HtmlExtractor:
+    """
+    Get a process-wide HTML extractor, creating it on first use.
+
+    Args:
+        name: Registered backend name ("auto", "stdlib", "lxml" or "beautifulsoup").
+            Defaults to WEAVIATE_HTML_EXTRACTOR, or "auto" if unset.
+
+    Returns:
+        The shared extractor instance
+
+    Raises:
+        ValueError: If no backend is registered under the name
+        ImportError: If the backend's optional dependency is not installed
+    """
+    name = name or get_html_extractor_name()
+    extractor = _extractors.get(name)
+    if extractor is not None:
+        return extractor
+
+    with _extractors_lock:
+        if name not in _extractors:
+            factory = _extractor_factories.get(name)
+            if factory is None:
+                raise ValueError(f"Unknown HTML extractor '{name}'. Available extractors: {sorted(_extractor_factories)}")
+            _extractors[name] = factory()
+            logger.info(f"Using HTML extractor '{_extractors[name].name}'")
+        return _extractors[name]
@@ -0,0 +1,220 @@
+"""
+Near-duplicate detection of chunks with MinHash signatures.
+
+A chunk's signature is the MinHash of its set of word shingles: the share of
+signature values two chunks have in common estimates the Jaccard similarity
+of their shingle sets, so boilerplate that recurs with small changes (page
+numbers, dates) is still recognized. Signatures are kept in a SQLite file
+per collection and source. For lookup they are split into bands (locality
+sensitive hashing): only chunks that agree on all values of at least one
+band are compared, so a lookup does not scan the index.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from array import array
+from typing import Any
+
+from .query_cache import normalize_collection_name
+
+# Number of MinHash values per signature
+NUM_HASHES = 64
+
+# Lookup bands of NUM_HASHES // SIGNATURE_BANDS values each. With 16 bands of
+# 4 values, chunks with a similarity of 0.8 are compared with a probability
+# above 99.9%, and chunks with a similarity of 0.3 with a probability of 12%.
+SIGNATURE_BANDS = 16
+
+# Words per shingle
+SHINGLE_SIZE = 3
+
+# Estimated Jaccard similarity from which chunks count as near-duplicates
+DEFAULT_SIMILARITY_THRESHOLD = 0.8
+
+_WORD = re.compile(r"\w+")
+
+_BAND_SIZE = NUM_HASHES // SIGNATURE_BANDS
+
+
+def minhash(text: str, shingle_size: int = SHINGLE_SIZE) -> array:
+    """
+    Compute the MinHash signature of a text's lowercased word shingles.
+
+    Each shingle is hashed once with SHAKE-128 into NUM_HASHES independent
+    32-bit values; the signature holds the minimum of each.
+
+    Args:
+        text: Text to sign
+        shingle_size: Words per shingle; texts with fewer words are one shingle
+
+    Returns:
+        Array of NUM_HASHES unsigned 32-bit values
+    """
+    words = _WORD.findall(text.lower())
+    shingles = {" ".join(words[i : i + shingle_size]) for i in range(max(len(words) - shingle_size + 1, 1))}
+    rows = [array("I", hashlib.shake_128(shingle.encode("utf-8")).digest(4 * NUM_HASHES)) for shingle in shingles]
+    return array("I", [min(column) for column in zip(*rows, strict=True)])
+
+
+def similarity(a: array, b: array) -> float:
+    """Estimated Jaccard similarity of the shingle sets of two signatures."""
+    return sum(x == y for x, y in zip(a, b, strict=True)) / len(a)
+
+
+def _band_keys(signature: array) -> list[int]:
+    """One key per band, hashing the band's number and values into a non-negative SQLite integer."""
+    keys = []
+    for band, start in enumerate(range(0, NUM_HASHES, _BAND_SIZE)):
+        values = signature[start : start + _BAND_SIZE].tobytes()
+        digest = hashlib.blake2b(values, digest_size=8, salt=band.to_bytes(16, "big")).digest()
+        keys.append(int.from_bytes(digest, "big") >> 1)
+    return keys
+
+
+class SignatureIndex:
+    """Persistent index of chunk signatures per collection and source, in a SQLite file."""
+
+    def __init__(self, path: str):
+        """
+        Open or create the index.
+
+        Args:
+            path: Path of the SQLite file
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS chunks (id INTEGER PRIMARY KEY, collection TEXT NOT NULL, "
+            "source_url TEXT NOT NULL, chunk_hash TEXT NOT NULL, object_id TEXT NOT NULL, signature BLOB NOT NULL, "
+            "UNIQUE (collection, source_url, chunk_hash))"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS bands (collection TEXT NOT NULL, band_key INTEGER NOT NULL, chunk_id INTEGER NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS bands_lookup ON bands (collection, band_key)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS bands_chunk ON bands (chunk_id)")
+        self._db.commit()
+
+    def _find(
+        self,
+        collection: str,
+        signature: array,
+        threshold: float,
+        source_url: str | None,
+        exclude: tuple[str, str] | None = None,
+    ) -> dict[str, Any] | None:
+        keys = _band_keys(signature)
+        query = (
+            "SELECT DISTINCT chunks.source_url, chunks.chunk_hash, chunks.object_id, chunks.signature "
+            "FROM bands JOIN chunks ON chunks.id = bands.chunk_id "
+            f"WHERE bands.collection = ? AND bands.band_key IN ({', '.join('?' * len(keys))})"
+        )
+        params: list[Any] = [collection, *keys]
+        if source_url is not None:
+            query += " AND chunks.source_url = ?"
+            params.append(source_url)
+
+        best = None
+        for match_source, chunk_hash, object_id, stored in self._db.execute(query, params):
+            if (match_source, chunk_hash) == exclude:
+                continue
+            score = similarity(signature, array("I", stored))
+            if score >= threshold and (best is None or score > best["similarity"]):
+                best = {"source_url": match_source, "chunk_hash": chunk_hash, "object_id": object_id, "similarity": score}
+        return best
+
+    def _remove(self, collection: str, source_url: str, chunk_hashes: list[str]) -> None:
+        for chunk_hash in chunk_hashes:
+            row = self._db.execute(
+                "SELECT id FROM chunks WHERE collection = ? AND source_url = ? AND chunk_hash = ?",
+                (collection, source_url, chunk_hash),
+            ).fetchone()
+            if row is not None:
+                self._db.execute("DELETE FROM bands WHERE chunk_id = ?", row)
+                self._db.execute("DELETE FROM chunks WHERE id = ?", row)
+
+    def find(
+        self,
+        collection: str,
+        signature: array,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        source_url: str | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Find the most similar indexed chunk.
+
+        Args:
+            collection: Collection to search
+            signature: Signature to match
+            threshold: Smallest estimated Jaccard similarity counted as a match
+            source_url: Only match chunks of this source
+
+        Returns:
+            The match's source_url, chunk_hash, object_id and similarity, or None
+        """
+        with self._lock:
+            return self._find(normalize_collection_name(collection), signature, threshold, source_url)
+
+    def filter(
+        self,
+        collection: str,
+        chunks: list[dict[str, Any]],
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        per_source: bool = False,
+    ) -> list[dict[str, Any] | None]:
+        """
+        Match chunks against the index, adding those that match nothing.
+
+        Chunks are processed in order, so a chunk also matches the chunks
+        before it in the same call. A chunk never matches its own entry.
+
+        Args:
+            collection: Collection the chunks are stored in
+            chunks: Dictionaries with source_url, chunk_hash, object_id and signature
+            threshold: Smallest estimated Jaccard similarity counted as a match
+            per_source: Only match chunks of the same source
+
+        Returns:
+            The match of each chunk (see find), or None for chunks that were added
+        """
+        collection = normalize_collection_name(collection)
+        results: list[dict[str, Any] | None] = []
+        with self._lock:
+            for chunk in chunks:
+                key = (chunk["source_url"], chunk["chunk_hash"])
+                source_url = chunk["source_url"] if per_source else None
+                match = self._find(collection, chunk["signature"], threshold, source_url, exclude=key)
+                if match is None:
+                    self._remove(collection, key[0], [key[1]])
+                    cursor = self._db.execute(
+                        "INSERT INTO chunks (collection, source_url, chunk_hash, object_id, signature) VALUES (?, ?, ?, ?, ?)",
+                        (collection, *key, chunk["object_id"], chunk["signature"].tobytes()),
+                    )
+                    self._db.executemany(
+                        "INSERT INTO bands (collection, band_key, chunk_id) VALUES (?, ?, ?)",
+                        [(collection, band_key, cursor.lastrowid) for band_key in _band_keys(chunk["signature"])],
+                    )
+                results.append(match)
+            self._db.commit()
+        return results
+
+    def remove(self, collection: str, source_url: str, chunk_hashes: list[str]) -> None:
+        """Remove the signatures of chunks of a source."""
+        with self._lock:
+            self._remove(normalize_collection_name(collection), source_url, chunk_hashes)
+            self._db.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,235 @@
+"""
+Local object files for exporting and importing collections.
+
+Every object is stored as a record with its "id", its "properties" and,
+optionally, its "vector" (a mapping of vector name to vector). When reading,
+records without a "properties" field are taken to be the properties
+themselves, apart from their "id" and "vector". Two formats are supported:
+
+- "jsonl": one JSON record per line
+- "parquet": one row per record, with the properties JSON-encoded (their
+  schema varies between collections) and the vectors as a map column.
+  Requires the optional pyarrow package.
+"""
+
+import json
+import os
+from collections.abc import Iterator
+from datetime import date, datetime
+from typing import Any, Protocol
+
+FILE_FORMATS = ("jsonl", "parquet")
+
+_EXTENSIONS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}
+
+
+def detect_file_format(path: str, file_format: str | None = None) -> str:
+    """
+    Resolve the format of an object file.
+
+    Args:
+        path: Path of the file
+        file_format: Explicit format ("jsonl" or "parquet"), inferred from the extension if omitted
+
+    Returns:
+        The file format
+
+    Raises:
+        ValueError: If the format is unknown or cannot be inferred
+    """
+    if file_format:
+        if file_format not in FILE_FORMATS:
+            raise ValueError(f"Unsupported file format '{file_format}'. Supported: {', '.join(FILE_FORMATS)}")
+        return file_format
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in _EXTENSIONS:
+        raise ValueError(f"Cannot infer the file format of '{path}'. Use a .jsonl or .parquet file, or pass file_format")
+    return _EXTENSIONS[extension]
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values json does not handle, keeping dates in RFC 3339 form."""
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_json(value: Any) -> str:
+    """Encode a value as compact JSON."""
+    return json.dumps(value, default=_json_default, ensure_ascii=False, separators=(",", ":"))
+
+
+class ObjectWriter(Protocol):
+    """Interface of an object file writer."""
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        """Append records to the file."""
+        ...
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        ...
+
+
+class JsonlObjectWriter:
+    """Write records as JSON lines."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "w", encoding="utf-8")  # noqa: SIM115
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        """Append records to the file."""
+        self._file.write("".join(encode_json(record) + "\n" for record in records))
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+
+class ParquetObjectWriter:
+    """Write records as Parquet rows, one row group per write. Requires pyarrow."""
+
+    def __init__(self, path: str):
+        """
+        Open a Parquet file for writing.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("id", pa.string()),
+                ("properties", pa.string()),
+                ("vector", pa.map_(pa.string(), pa.list_(pa.float32()))),
+            ]
+        )
+        self._writer = pq.ParquetWriter(path, self._schema, compression="zstd")
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        """Append records to the file as one row group."""
+        table = self._pa.Table.from_pydict(
+            {
+                "id": [record["id"] for record in records],
+                "properties": [encode_json(record["properties"]) for record in records],
+                "vector": [list(record["vector"].items()) if record.get("vector") else None for record in records],
+            },
+            schema=self._schema,
+        )
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        """Write the footer and close the file."""
+        self._writer.close()
+
+
+def open_object_writer(path: str, file_format: str) -> ObjectWriter:
+    """
+    Open a writer for an object file.
+
+    Args:
+        path: Path of the file, which is overwritten
+        file_format: "jsonl" or "parquet"
+
+    Returns:
+        The writer
+
+    Raises:
+        ImportError: If the format's optional dependency is not installed
+    """
+    if file_format == "parquet":
+        return ParquetObjectWriter(path)
+    return JsonlObjectWriter(path)
+
+
+def _to_record(data: dict[str, Any]) -> dict[str, Any]:
+    """Normalize a row read from a file to a record with id, properties and vector."""
+    properties = data.get("properties")
+    if isinstance(properties, str):
+        properties = json.loads(properties)
+    if not isinstance(properties, dict):
+        properties = {key: value for key, value in data.items() if key not in ("id", "vector")}
+
+    vector = data.get("vector")
+    if isinstance(vector, list) and vector and isinstance(vector[0], tuple):
+        # Parquet map columns are read as (key, value) pairs
+        vector = dict(vector)
+    return {"id": data.get("id"), "properties": properties, "vector": vector or None}
+
+
+def _read_jsonl_batches(path: str, batch_size: int, start_offset: int) -> Iterator[list[dict[str, Any]]]:
+    batch: list[dict[str, Any]] = []
+    offset = 0
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            offset += 1
+            if offset <= start_offset:
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {line_number} of {path}: {e}") from e
+            if not isinstance(data, dict):
+                raise ValueError(f"Line {line_number} of {path} is not a JSON object")
+            batch.append(_to_record(data))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def _read_parquet_batches(path: str, batch_size: int, start_offset: int) -> Iterator[list[dict[str, Any]]]:
+    import pyarrow.parquet as pq
+
+    with pq.ParquetFile(path) as parquet_file:
+        # Skip whole row groups before the start offset without reading them
+        row_groups = []
+        skip = start_offset
+        for index in range(parquet_file.num_row_groups):
+            num_rows = parquet_file.metadata.row_group(index).num_rows
+            if row_groups or skip < num_rows:
+                # The first group read may start part-way in; every later group is read whole
+                row_groups.append(index)
+            else:
+                skip -= num_rows
+
+        batch: list[dict[str, Any]] = []
+        for record_batch in parquet_file.iter_batches(batch_size=batch_size, row_groups=row_groups):
+            rows = record_batch.to_pylist()
+            if skip:
+                rows, skip = rows[skip:], max(skip - len(rows), 0)
+            batch.extend(_to_record(row) for row in rows)
+            while len(batch) >= batch_size:
+                yield batch[:batch_size]
+                batch = batch[batch_size:]
+        if batch:
+            yield batch
+
+
+def read_object_batches(path: str, file_format: str, batch_size: int, start_offset: int = 0) -> Iterator[list[dict[str, Any]]]:
+    """
+    Stream the records of an object file in batches.
+
+    Args:
+        path: Path of the file
+        file_format: "jsonl" or "parquet"
+        batch_size: Maximum number of records per batch
+        start_offset: Number of records to skip from the start of the file
+
+    Yields:
+        Lists of records with "id", "properties" and "vector" (None if absent)
+
+    Raises:
+        ValueError: If a JSON line is invalid
+        ImportError: If the format's optional dependency is not installed
+    """
+    if file_format == "parquet":
+        return _read_parquet_batches(path, batch_size, start_offset)
+    return _read_jsonl_batches(path, batch_size, start_offset)
@@ -0,0 +1,96 @@
+"""
+In-process cache of query results with write-aware invalidation.
+
+Entries are evicted least recently used first and expire after a TTL. Every
+collection has a generation counter that the service bumps after each write
+to it; keys include the generation at query time, so results cached before a
+write are never served after it and simply age out.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+def normalize_collection_name(name: str) -> str:
+    """Weaviate capitalizes the first letter of collection names, so "docs" and "Docs" are the same collection."""
+    return name[:1].upper() + name[1:]
+
+
+def filter_cache_key(filters: Any) -> Hashable:
+    """Build a deterministic, hashable key for a Weaviate filter."""
+    if filters is None:
+        return None
+    nested = getattr(filters, "filters", None)
+    if nested is not None:
+        return (type(filters).__name__, tuple(filter_cache_key(item) for item in nested))
+    return repr(filters)
+
+
+class QueryCache:
+    """LRU cache with a TTL and per-collection generation counters."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached results, 0 disables the cache
+            ttl_seconds: Seconds after which a cached result expires, 0 disables the cache
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether results are cached at all."""
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def generation(self, collection_name: str) -> int:
+        """Current generation of a collection."""
+        return self._generations.get(normalize_collection_name(collection_name), 0)
+
+    def invalidate(self, collection_name: str) -> None:
+        """Bump a collection's generation so that results cached before now are no longer served."""
+        name = normalize_collection_name(collection_name)
+        self._generations[name] = self._generations.get(name, 0) + 1
+
+    def key(self, collection_name: str, *parts: Hashable) -> Hashable:
+        """Build the key of a query on a collection at its current generation."""
+        return (normalize_collection_name(collection_name), self.generation(collection_name), *parts)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return a copy of the cached result for a key, or None if absent or expired."""
+        if not self.enabled:
+            return None
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry[1])
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a copy of a result, evicting the least recently used entries beyond max_entries."""
+        if not self.enabled:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,82 @@
+"""
+Fusion of ranked result lists into one ranking.
+
+Used to merge the results of the same query over several collections. Two
+methods are supported, named after Weaviate's own hybrid fusion types:
+
+- "rrf": reciprocal rank fusion, each list contributes 1 / (k + rank). Only
+  ranks matter, so lists with incomparable scores merge fairly.
+- "relative_score": each list's scores are min-max normalized to [0, 1]
+  and summed. Keeps how far ahead a strong match is within its list.
+"""
+
+import heapq
+from collections.abc import Callable, Hashable
+from typing import Any
+
+FUSION_METHODS = ("rrf", "relative_score")
+
+# Damping constant of reciprocal rank fusion, as in the original paper
+DEFAULT_RRF_K = 60
+
+
+def _object_key(obj: dict[str, Any]) -> Hashable:
+    return obj.get("collection_name"), obj.get("id")
+
+
+def _relative_scores(objects: list[dict[str, Any]]) -> list[float]:
+    """Min-max normalize the scores of one list, falling back to rank order when scores are missing."""
+    scores = [obj.get("score") for obj in objects]
+    if any(score is None for score in scores):
+        return [1.0 - rank / len(objects) for rank in range(len(objects))]
+    low, high = min(scores), max(scores)
+    if high == low:
+        return [1.0] * len(objects)
+    return [(score - low) / (high - low) for score in scores]
+
+
+def fuse_ranked_lists(
+    ranked_lists: list[list[dict[str, Any]]],
+    method: str = "rrf",
+    limit: int = 10,
+    rrf_k: int = DEFAULT_RRF_K,
+    key: Callable[[dict[str, Any]], Hashable] = _object_key,
+) -> list[dict[str, Any]]:
+    """
+    Merge ranked lists of objects into one ranking.
+
+    Objects with the same key in several lists are merged and their
+    contributions summed. Ties keep the order of the lists and ranks.
+
+    Args:
+        ranked_lists: Lists of objects, each sorted best first
+        method: "rrf" or "relative_score"
+        limit: Maximum number of objects to return
+        rrf_k: Damping constant of reciprocal rank fusion
+        key: Identity of an object, by default its collection_name and id
+
+    Returns:
+        The best objects, each with a "fused_score", best first
+
+    Raises:
+        ValueError: If the method is unknown
+    """
+    if method not in FUSION_METHODS:
+        raise ValueError(f"Unsupported fusion method: {method}. Supported: {', '.join(FUSION_METHODS)}")
+
+    fused: dict[Hashable, list[Any]] = {}
+    for list_index, objects in enumerate(ranked_lists):
+        if method == "rrf":
+            contributions = [1.0 / (rrf_k + rank) for rank in range(1, len(objects) + 1)]
+        else:
+            contributions = _relative_scores(objects) if objects else []
+        for rank, (obj, contribution) in enumerate(zip(objects, contributions, strict=True)):
+            entry = fused.get(key(obj))
+            if entry is None:
+                # Score, then the position of first appearance for stable tie-breaking
+                fused[key(obj)] = [contribution, (rank, list_index), obj]
+            else:
+                entry[0] += contribution
+
+    best = heapq.nsmallest(max(limit, 0), fused.values(), key=lambda entry: (-entry[0], entry[1]))
+    return [{**obj, "fused_score": score} for score, _, obj in best]
@@ -0,0 +1,183 @@
+"""
+Process-wide tokenizers for token-aware chunking.
+
+Tokenizers are loaded lazily on first use and shared by the whole process, so
+constructing services stays cheap and the BPE file is read at most once. The
+tiktoken encoding can be loaded from a local BPE file for air-gapped
+deployments, and a byte-length estimator is available when exact token counts
+are not needed.
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Callable, Iterable
+from itertools import chain, repeat
+from typing import Protocol
+
+import tiktoken
+
+from ..config import get_tokenizer_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "cl100k_base"  # GPT-4 encoding
+
+# Split pattern and special tokens of cl100k_base, used when loading its ranks from a local file
+CL100K_PAT_STR = r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}++|\p{N}{1,3}+| ?[^\s\p{L}\p{N}]++[\r\n]*+|\s++$|\s*[\r\n]|\s+(?!\S)|\s"""
+CL100K_SPECIAL_TOKENS = {
+    "<|endoftext|>": 100257,
+    "<|fim_prefix|>": 100258,
+    "<|fim_middle|>": 100259,
+    "<|fim_suffix|>": 100260,
+    "<|endofprompt|>": 100276,
+}
+
+
+class Tokenizer(Protocol):
+    """Interface the chunker needs from a tokenizer."""
+
+    name: str
+
+    def token_lengths(self, text: str) -> Iterable[int]:
+        """Return the UTF-8 byte length of each token of text, in order."""
+        ...
+
+    def count_tokens(self, text: str) -> int:
+        """Return the number of tokens in text."""
+        ...
+
+
+class TiktokenTokenizer:
+    """Exact token counts from a tiktoken encoding."""
+
+    def __init__(self, encoding: tiktoken.Encoding):
+        """
+        Initialize the tokenizer.
+
+        Args:
+            encoding: tiktoken encoding to wrap
+        """
+        self.encoding = encoding
+        self.name = f"tiktoken:{encoding.name}"
+        # Byte length of every token seen so far
+        self._lengths: dict[int, int] = {}
+
+    def token_lengths(self, text: str) -> Iterable[int]:
+        """Return the UTF-8 byte length of each token of text, in order."""
+        tokens = self.encoding.encode_ordinary(text)
+        for token in set(tokens).difference(self._lengths):
+            self._lengths[token] = len(self.encoding.decode_single_token_bytes(token))
+        return map(self._lengths.__getitem__, tokens)
+
+    def count_tokens(self, text: str) -> int:
+        """Return the number of tokens in text."""
+        return len(self.encoding.encode_ordinary(text))
+
+
+class ByteLengthEstimator:
+    """
+    Approximate token counts from the UTF-8 length of the text.
+
+    Needs no BPE data and costs a single encode of the text. English prose
+    averages about four bytes per token with GPT-4 style encodings.
+    """
+
+    name = "bytes"
+
+    def __init__(self, bytes_per_token: int = 4):
+        """
+        Initialize the estimator.
+
+        Args:
+            bytes_per_token: Number of bytes counted as one token
+        """
+        if bytes_per_token <= 0:
+            raise ValueError("bytes_per_token must be positive")
+        self.bytes_per_token = bytes_per_token
+
+    def token_lengths(self, text: str) -> Iterable[int]:
+        """Return the UTF-8 byte length of each estimated token of text, in order."""
+        full_tokens, remainder = divmod(len(text.encode("utf-8")), self.bytes_per_token)
+        return chain(repeat(self.bytes_per_token, full_tokens), [remainder] if remainder else [])
+
+    def count_tokens(self, text: str) -> int:
+        """Return the estimated number of tokens in text."""
+        return -(-len(text.encode("utf-8")) // self.bytes_per_token)
+
+
+def load_tiktoken_tokenizer() -> TiktokenTokenizer:
+    """
+    Load the cl100k_base encoding.
+
+    If WEAVIATE_TIKTOKEN_BPE_FILE points to a local cl100k_base.tiktoken file,
+    the ranks are read from it and nothing is downloaded. Otherwise tiktoken's
+    own loader is used, which honours TIKTOKEN_CACHE_DIR.
+    """
+    bpe_file = get_tokenizer_config()["bpe_file"]
+    if not bpe_file:
+        return TiktokenTokenizer(tiktoken.get_encoding(DEFAULT_ENCODING))
+
+    from tiktoken.load import load_tiktoken_bpe
+
+    if not os.path.isfile(bpe_file):
+        raise FileNotFoundError(f"BPE file not found: {bpe_file}")
+
+    logger.info(f"Loading {DEFAULT_ENCODING} ranks from local BPE file: {bpe_file}")
+    encoding = tiktoken.Encoding(
+        name=DEFAULT_ENCODING,
+        pat_str=CL100K_PAT_STR,
+        mergeable_ranks=load_tiktoken_bpe(bpe_file),
+        special_tokens=CL100K_SPECIAL_TOKENS,
+    )
+    return TiktokenTokenizer(encoding)
+
+
+_tokenizer_factories: dict[str, Callable[[], Tokenizer]] = {
+    "tiktoken": load_tiktoken_tokenizer,
+    "bytes": ByteLengthEstimator,
+}
+_tokenizers: dict[str, Tokenizer] = {}
+_tokenizers_lock = threading.Lock()
+
+
+def register_tokenizer(name: str, factory: Callable[[], Tokenizer]) -> None:
+    """
+    Register a tokenizer factory under a name usable with get_tokenizer.
+
+    Args:
+        name: Name to register the tokenizer under
+        factory: Callable returning the tokenizer, invoked on first use
+    """
+    with _tokenizers_lock:
+        _tokenizer_factories[name] = factory
+        _tokenizers.pop(name, None)
+
+
+def get_tokenizer(name: str | None = None) -> Tokenizer:
+    """
+    Get a process-wide tokenizer, loading it on first use.
+
+    Args:
+        name: Registered tokenizer name ("tiktoken" or "bytes" by default).
+            Defaults to WEAVIATE_TOKENIZER, or "tiktoken" if unset.
+
+    Returns:
+        The shared tokenizer instance
+
+    Raises:
+        ValueError: If no tokenizer is registered under the name
+    """
+    name = name or get_tokenizer_config()["tokenizer"]
+    tokenizer = _tokenizers.get(name)
+    if tokenizer is not None:
+        return tokenizer
+
+    with _tokenizers_lock:
+        if name not in _tokenizers:
+            factory = _tokenizer_factories.get(name)
+            if factory is None:
+                raise ValueError(f"Unknown tokenizer '{name}'. Available tokenizers: {sorted(_tokenizer_factories)}")
+            _tokenizers[name] = factory()
+            logger.info(f"Loaded tokenizer '{name}'")
+        return _tokenizers[name]
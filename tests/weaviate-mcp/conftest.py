@@ -186,6 +186,107 @@ def sample_search_response():
     return mock_response
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_weaviate_service():
+    """Drop the process-wide WeaviateService so tests don't share clients."""
+    from weaviate_mcp.services import weaviate_service
+
+    weaviate_service._shared_service = None
+    yield
+    weaviate_service._shared_service = None
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_http_client():
+    """Drop the process-wide HTTP client so tests don't share connections."""
+    from weaviate_mcp.services import ingestion_service
+
+    ingestion_service._http_client = None
+    yield
+    ingestion_service._http_client = None
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_tokenizers():
+    """Drop process-wide tokenizers and chunkers so tests don't share them."""
+    from weaviate_mcp.utils import chunking, tokenizer
+
+    tokenizer._tokenizers.clear()
+    chunking._chunkers.clear()
+    yield
+    tokenizer._tokenizers.clear()
+    chunking._chunkers.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_html_extractors():
+    """Drop process-wide HTML extractors so tests don't share them."""
+    from weaviate_mcp.utils import html_extraction
+
+    html_extraction._extractors.clear()
+    yield
+    html_extraction._extractors.clear()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def reset_query_embedder():
+    """Drop the process-wide query embedder so tests don't share its configuration."""
+    from weaviate_mcp.services.embedding_service import close_query_embedder
+
+    await close_query_embedder()
+    yield
+    await close_query_embedder()
+
+
+@pytest.fixture(scope="session")
+def byte_encoding():
+    """A byte-level tiktoken encoding that works offline (one token per byte)."""
+    import tiktoken
+
+    return tiktoken.Encoding(
+        name="test_bytes",
+        pat_str=r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}+|\p{N}{1,3}| ?[^\s\p{L}\p{N}]++[\r\n]*|\s*[\r\n]|\s+(?!\S)|\s+""",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={},
+    )
+
+
+@pytest.fixture
+def byte_tokenizer(byte_encoding):
+    """A tokenizer over the offline byte-level encoding."""
+    from weaviate_mcp.utils.tokenizer import TiktokenTokenizer
+
+    return TiktokenTokenizer(byte_encoding)
+
+
+@pytest.fixture
+def mock_stream():
+    """
+    Build a mock of the HTTP client's stream() method that serves a mock response.
+
+    The response's content is served by aiter_bytes in chunks of chunk_size bytes.
+    """
+
+    def build(response, chunk_size=64):
+        body = response.content if isinstance(response.content, bytes) else b""
+
+        async def aiter_bytes():
+            for start in range(0, len(body), chunk_size):
+                yield body[start : start + chunk_size]
+
+        response.aiter_bytes = aiter_bytes
+        if not isinstance(getattr(response, "encoding", None), str):
+            response.encoding = "utf-8"
+
+        @contextlib.asynccontextmanager
+        async def stream(method, url, **kwargs):
+            yield response
+
+        return MagicMock(side_effect=stream)
+
+    return build
+
+
 # Remove custom event_loop fixture to avoid deprecation warning
 # pytest-asyncio will handle event loop creation automatically
 
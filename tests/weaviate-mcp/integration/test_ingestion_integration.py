@@ -4,6 +4,7 @@ Integration tests for ingestion functionality.
 Tests the complete ingestion pipeline from URL to Weaviate storage.
 """
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -23,10 +24,14 @@ class TestIngestionIntegration:
         """Create a mock WeaviateService for integration tests."""
         service = MagicMock(spec=WeaviateService)
         service.batch_insert_objects = AsyncMock()
+        service.get_objects = AsyncMock(return_value={"objects": [], "count": 0})
+        service.get_all_objects = AsyncMock(return_value={"objects": [], "count": 0})
+        service.delete_objects = AsyncMock(return_value={"success": True, "deleted_count": 0})
+        service.update_object = AsyncMock(return_value={"success": True})
         return service
 
     @pytest.mark.asyncio
-    async def test_end_to_end_url_ingestion_html(self, mock_weaviate_service):
+    async def test_end_to_end_url_ingestion_html(self, mock_weaviate_service, mock_stream):
         """Test complete URL ingestion pipeline with HTML content."""
         # Mock HTTP response with realistic HTML
         mock_response = MagicMock()
@@ -83,8 +88,8 @@ class TestIngestionIntegration:
         # Create ingestion service
         ingestion_service = IngestionService(mock_weaviate_service)
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+        with patch("weaviate_mcp.services.ingestion_service.get_http_client") as mock_client:
+            mock_client.return_value.stream = mock_stream(mock_response)
 
             # Perform ingestion
             result = await ingestion_service.ingest_from_url(
@@ -125,7 +130,7 @@ class TestIngestionIntegration:
         assert first_object["author"] == "Dr. Jane Smith"
 
     @pytest.mark.asyncio
-    async def test_end_to_end_url_ingestion_json(self, mock_weaviate_service):
+    async def test_end_to_end_url_ingestion_json(self, mock_weaviate_service, mock_stream):
         """Test complete URL ingestion pipeline with JSON content."""
         # Mock HTTP response with JSON data
         json_data = {
@@ -150,8 +155,7 @@ class TestIngestionIntegration:
         }
 
         mock_response = MagicMock()
-        mock_response.json.return_value = json_data
-        mock_response.text = '{"title": "API Documentation", "version": "1.0", ...}'
+        mock_response.text = json.dumps(json_data)
         mock_response.headers = {"content-type": "application/json"}
         mock_response.status_code = 200
         mock_response.content = mock_response.text.encode()
@@ -167,8 +171,8 @@ class TestIngestionIntegration:
         # Create ingestion service
         ingestion_service = IngestionService(mock_weaviate_service)
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+        with patch("weaviate_mcp.services.ingestion_service.get_http_client") as mock_client:
+            mock_client.return_value.stream = mock_stream(mock_response)
 
             # Perform ingestion
             result = await ingestion_service.ingest_from_url(
@@ -201,7 +205,7 @@ class TestIngestionIntegration:
         }
 
         with (
-            patch("weaviate_mcp.tools.ingestion_tools.WeaviateService") as mock_weaviate_service,
+            patch("weaviate_mcp.tools.ingestion_tools.get_weaviate_service") as mock_weaviate_service,
             patch("weaviate_mcp.tools.ingestion_tools.IngestionService") as mock_ingestion_service,
         ):
             # Setup service mocks
@@ -229,27 +233,21 @@ class TestIngestionIntegration:
                 chunk_size=1000,
                 chunk_overlap=50,
                 max_tokens_per_chunk=400,
+                force=False,
             )
 
     @pytest.mark.asyncio
-    async def test_text_content_integration(self):
+    async def test_text_content_integration(self, mock_weaviate_service):
         """Test text content ingestion integration."""
         # Mock batch insertion
-        mock_batch_result = {
+        mock_weaviate_service.batch_insert_objects.return_value = {
             "success": True,
             "inserted_ids": ["text_id1", "text_id2", "text_id3"],
             "count": 3,
         }
+        mock_weaviate_instance = mock_weaviate_service
 
-        with (
-            patch("weaviate_mcp.tools.ingestion_tools.WeaviateService") as mock_weaviate_service,
-            patch("weaviate_mcp.tools.ingestion_tools.IngestionService") as mock_ingestion_service,
-        ):
-            # Setup mocks
-            mock_weaviate_instance = MagicMock()
-            mock_weaviate_instance.batch_insert_objects = AsyncMock(return_value=mock_batch_result)
-            mock_weaviate_service.return_value = mock_weaviate_instance
-
+        with patch("weaviate_mcp.tools.ingestion_tools.get_weaviate_service", return_value=mock_weaviate_service):
             # Create realistic chunking behavior
             long_content = """
             This is a comprehensive document about machine learning algorithms.
@@ -268,25 +266,22 @@ class TestIngestionIntegration:
             Reinforcement learning algorithms learn through interaction with an environment.
             """
 
-            mock_ingestion_instance = MagicMock()
             # Simulate realistic chunking
             mock_chunks = [
                 "This is a comprehensive document about machine learning algorithms. Machine learning is a subset of artificial intelligence that focuses on the development of algorithms that can learn and make decisions from data.",
                 "There are several types of machine learning algorithms including supervised learning, unsupervised learning, and reinforcement learning. Supervised learning algorithms learn from labeled training data to make predictions on new, unseen data.",
                 "Unsupervised learning algorithms find patterns in data without labeled examples. Reinforcement learning algorithms learn through interaction with an environment.",
             ]
-            mock_ingestion_instance._create_optimal_chunks = MagicMock(return_value=mock_chunks)
-            mock_ingestion_service.return_value = mock_ingestion_instance
-
             # Call the tool
-            result = await weaviate_ingest_text_content(
-                content=long_content,
-                collection_name="ml_documents",
-                source_identifier="ml_guide_001",
-                title="Machine Learning Guide",
-                max_tokens_per_chunk=200,
-                chunk_overlap=30,
-            )
+            with patch.object(IngestionService, "chunk_text", new=AsyncMock(return_value=mock_chunks)):
+                result = await weaviate_ingest_text_content(
+                    content=long_content,
+                    collection_name="ml_documents",
+                    source_identifier="ml_guide_001",
+                    title="Machine Learning Guide",
+                    max_tokens_per_chunk=200,
+                    chunk_overlap=30,
+                )
 
             # Verify successful integration
             assert result["success"] is True
@@ -316,7 +311,7 @@ class TestIngestionIntegration:
         """Test error propagation through the integration layers."""
         # Test service layer error propagation
         with (
-            patch("weaviate_mcp.tools.ingestion_tools.WeaviateService") as mock_weaviate_service,
+            patch("weaviate_mcp.tools.ingestion_tools.get_weaviate_service") as mock_weaviate_service,
             patch("weaviate_mcp.tools.ingestion_tools.IngestionService") as mock_ingestion_service,
         ):
             # Setup service to return error
@@ -337,7 +332,7 @@ class TestIngestionIntegration:
                 )
 
         # Test unexpected exception propagation
-        with patch("weaviate_mcp.tools.ingestion_tools.WeaviateService") as mock_weaviate_service:
+        with patch("weaviate_mcp.tools.ingestion_tools.get_weaviate_service") as mock_weaviate_service:
             # Setup service to raise unexpected exception
             mock_weaviate_service.side_effect = ConnectionError("Database unreachable")
 
@@ -0,0 +1,97 @@
+"""Stress tests benchmarking the token-aware chunker on large documents."""
+
+import os
+import random
+import time
+
+import pytest
+from weaviate_mcp.utils.chunking import TokenChunker
+from weaviate_mcp.utils.tokenizer import get_tokenizer
+
+MEGABYTE = 1_000_000
+
+WORDS = [
+    "vector",
+    "database",
+    "semantic",
+    "search",
+    "embedding",
+    "collection",
+    "tokenizer",
+    "paragraph",
+    "überprüfung",
+    "café",
+]
+
+
+def generate_document(size_bytes: int, seed: int = 42) -> str:
+    """Generate a document of roughly size_bytes with sentences and paragraphs."""
+    rng = random.Random(seed)
+    paragraphs = []
+    size = 0
+    while size < size_bytes:
+        sentences = []
+        for _ in range(rng.randint(1, 12)):
+            words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 30)))
+            sentences.append(words.capitalize() + rng.choice(".!?"))
+        paragraph = " ".join(sentences)
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+
+class TestChunkingStress:
+    """Benchmarks validating that chunking scales linearly with input size."""
+
+    @pytest.fixture(scope="class")
+    def chunker(self) -> TokenChunker:
+        """Provides a class-scoped chunker using the production encoding."""
+        return TokenChunker(get_tokenizer("tiktoken"))
+
+    @pytest.mark.stress
+    @pytest.mark.parametrize(
+        "size_mb",
+        [
+            1,
+            pytest.param(10, marks=pytest.mark.skipif(not os.getenv("RUN_STRESS_TESTS"), reason="Stress tests not enabled")),
+            pytest.param(50, marks=pytest.mark.skipif(not os.getenv("RUN_STRESS_TESTS"), reason="Stress tests not enabled")),
+        ],
+    )
+    def test_chunking_throughput(self, chunker: TokenChunker, size_mb: int):
+        """Chunk 1 MB to 50 MB documents and report throughput."""
+        text = generate_document(size_mb * MEGABYTE)
+
+        start_time = time.perf_counter()
+        chunks = chunker.chunk(text, max_tokens=500, overlap_tokens=50)
+        processing_time = time.perf_counter() - start_time
+
+        throughput = size_mb / processing_time
+        print(f"Chunking {size_mb} MB into {len(chunks)} chunks took {processing_time:.2f}s ({throughput:.2f} MB/s).")
+
+        assert chunks
+        assert processing_time < size_mb * 5.0, "Chunking should stay linear in the input size."
+
+    @pytest.mark.stress
+    def test_chunking_scales_linearly(self, chunker: TokenChunker):
+        """Quadrupling the input should roughly quadruple the chunking time."""
+        timings = {}
+        for size_mb in (1, 4):
+            text = generate_document(size_mb * MEGABYTE)
+            start_time = time.perf_counter()
+            chunker.chunk(text, max_tokens=500, overlap_tokens=50)
+            timings[size_mb] = time.perf_counter() - start_time
+
+        ratio = timings[4] / timings[1]
+        print(f"Chunking 4 MB took {ratio:.2f}x as long as 1 MB.")
+
+        assert ratio < 8.0, "Chunking time should grow linearly, not quadratically."
+
+    @pytest.mark.stress
+    def test_chunks_respect_token_limit(self, chunker: TokenChunker):
+        """No chunk of a large document should exceed the token limit."""
+        text = generate_document(MEGABYTE, seed=7)
+
+        chunks = chunker.chunk(text, max_tokens=300, overlap_tokens=30)
+
+        assert chunks
+        assert max(chunker.tokenizer.count_tokens(chunk) for chunk in chunks) <= 300
@@ -0,0 +1,95 @@
+"""Stress tests benchmarking the HTML extraction backends on large pages."""
+
+import importlib.util
+import os
+import random
+import time
+
+import pytest
+from weaviate_mcp.utils.html_extraction import get_html_extractor
+
+MEGABYTE = 1_000_000
+
+WORDS = ["vector", "database", "semantic", "search", "embedding", "collection", "überprüfung", "café"]
+
+
+def generate_page(size_bytes: int, seed: int = 42) -> str:
+    """Generate an HTML page of roughly size_bytes with boilerplate and nested main content."""
+    rng = random.Random(seed)
+    parts = [
+        "<!DOCTYPE html><html><head><title>Large page</title>",
+        "<script>" + "var x = 1;" * 100 + "</script></head><body>",
+        "<header>Header</header><nav>" + "<a href='/page'>Page</a>" * 200 + "</nav><main>",
+    ]
+    size = sum(len(part) for part in parts)
+    while size < size_bytes:
+        paragraphs = "".join(
+            f"<p>{' '.join(rng.choice(WORDS) for _ in range(rng.randint(10, 60)))} <a href='/link'>link</a> <b>bold</b>.</p>"
+            for _ in range(rng.randint(1, 6))
+        )
+        items = "".join(f"<li>{rng.choice(WORDS)}</li>" for _ in range(rng.randint(0, 5)))
+        section = f"<section><h2>{rng.choice(WORDS)}</h2>{paragraphs}<ul>{items}</ul></section>"
+        parts.append(section)
+        size += len(section)
+    parts.append("</main><footer>Footer</footer></body></html>")
+    return "".join(parts)
+
+
+def backend(name: str):
+    """Parametrize a backend, skipping lxml when it is not installed."""
+    if name == "lxml":
+        return pytest.param(name, marks=pytest.mark.skipif(not _has_lxml(), reason="lxml not installed"))
+    return name
+
+
+def _has_lxml() -> bool:
+    return importlib.util.find_spec("lxml") is not None
+
+
+def measure(name: str, html: str) -> tuple[str, float]:
+    """Extract a page with a backend and return the text and elapsed seconds."""
+    extractor = get_html_extractor(name)
+    start_time = time.perf_counter()
+    text, _ = extractor.extract(html)
+    return text, time.perf_counter() - start_time
+
+
+class TestHtmlExtractionStress:
+    """Benchmarks comparing extraction throughput of the backends."""
+
+    @pytest.mark.stress
+    @pytest.mark.parametrize("name", [backend("stdlib"), backend("lxml"), backend("beautifulsoup")])
+    @pytest.mark.parametrize(
+        "size_mb",
+        [
+            1,
+            pytest.param(10, marks=pytest.mark.skipif(not os.getenv("RUN_STRESS_TESTS"), reason="Stress tests not enabled")),
+        ],
+    )
+    def test_extraction_throughput(self, name: str, size_mb: int):
+        """Extract 1 MB and 10 MB pages and report throughput per backend."""
+        html = generate_page(size_mb * MEGABYTE)
+
+        text, processing_time = measure(name, html)
+
+        print(f"{name}: extracting {size_mb} MB took {processing_time:.2f}s ({size_mb / processing_time:.2f} MB/s).")
+        assert "\n\n" in text
+        assert "Header" not in text
+        assert "Footer" not in text
+
+    @pytest.mark.stress
+    def test_backends_agree_and_beat_beautifulsoup(self):
+        """All backends extract the same text; the streaming and lxml backends are faster than BeautifulSoup."""
+        html = generate_page(2 * MEGABYTE)
+        names = ["stdlib", "beautifulsoup"] + (["lxml"] if _has_lxml() else [])
+
+        results = {name: measure(name, html) for name in names}
+        for name, (_, elapsed) in results.items():
+            print(f"{name}: {2 / elapsed:.2f} MB/s")
+
+        texts = {text for text, _ in results.values()}
+        assert len(texts) == 1, "Backends should extract identical text"
+        baseline = results["beautifulsoup"][1]
+        for name in names:
+            if name != "beautifulsoup":
+                assert results[name][1] < baseline / 2, f"{name} should be at least twice as fast as BeautifulSoup"
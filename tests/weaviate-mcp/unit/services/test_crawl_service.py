@@ -0,0 +1,191 @@
+"""
+Unit tests for CrawlService.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from weaviate_mcp.services.crawl_service import CrawlService
+from weaviate_mcp.services.ingestion_service import IngestionService
+from weaviate_mcp.services.weaviate_service import WeaviateService
+from weaviate_mcp.utils.crawl import checkpoint_path, load_checkpoint, save_checkpoint
+
+SITE = {
+    "https://example.com/": ["https://example.com/a", "https://example.com/b", "https://other.com/x"],
+    "https://example.com/a": ["https://example.com/a/deep", "https://example.com/private/page"],
+    "https://example.com/b": ["https://example.com/"],
+    "https://example.com/a/deep": ["https://example.com/a/deeper"],
+    "https://example.com/private/page": [],
+}
+
+
+def make_response(status_code=200, text="", content=b"", headers=None):
+    """Create a mock HTTP response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = content or text.encode()
+    response.raise_for_status = MagicMock()
+    return response
+
+
+class TestCrawlService:
+    """Test cases for CrawlService."""
+
+    @pytest.fixture
+    def mock_weaviate_service(self):
+        """Create a mock WeaviateService."""
+        service = MagicMock(spec=WeaviateService)
+        service.batch_insert_objects = AsyncMock(return_value={"success": True, "inserted_ids": ["id"]})
+        service.get_objects = AsyncMock(return_value={"objects": [], "count": 0})
+        service.get_all_objects = AsyncMock(return_value={"objects": [], "count": 0})
+        service.delete_objects = AsyncMock(return_value={"success": True, "deleted_count": 0})
+        service.update_object = AsyncMock(return_value={"success": True})
+        return service
+
+    @pytest.fixture
+    def ingestion_service(self, mock_weaviate_service):
+        """Create an IngestionService whose downloads are served from SITE."""
+        service = IngestionService(mock_weaviate_service)
+
+        async def fake_download(url, previous_state=None, extract_links=False):
+            result = {"content": f"Content of {url}", "metadata": {"title": url, "content_length": 10}}
+            if extract_links:
+                result["links"] = SITE.get(url, [])
+            return result
+
+        service._download_and_extract_content = AsyncMock(side_effect=fake_download)
+        service.chunk_text = AsyncMock(return_value=["chunk"])
+        return service
+
+    @pytest.fixture
+    def http_client(self, mock_stream):
+        """Patch the shared HTTP client used for robots.txt and sitemaps; its `respond` maps URLs to responses."""
+        with patch("weaviate_mcp.services.ingestion_service.get_http_client") as mock_client:
+            client = mock_client.return_value
+            client.respond = lambda url: make_response(404)
+            client.stream = MagicMock(side_effect=lambda method, url, **kwargs: mock_stream(client.respond(url))(method, url))
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_crawl_follows_links_within_limits(self, ingestion_service, http_client):
+        """Test that links are followed up to max_depth, on allowed domains, honouring robots.txt."""
+        http_client.respond = lambda url: make_response(text="User-agent: *\nDisallow: /private/")
+
+        result = await CrawlService(ingestion_service).crawl(
+            "https://example.com/", "Docs", max_depth=2, max_pages=10, concurrency=2
+        )
+
+        statuses = {item["url"]: item for item in result["results"]}
+        assert result["success"] is True
+        assert set(statuses) == {
+            "https://example.com/",
+            "https://example.com/a",
+            "https://example.com/b",
+            "https://example.com/a/deep",
+            "https://example.com/private/page",
+        }
+        assert statuses["https://example.com/a/deep"]["depth"] == 2
+        assert statuses["https://example.com/private/page"]["status"] == "skipped"
+        assert result["succeeded"] == 4
+        assert result["skipped"] == 1
+        # robots.txt is fetched once per origin
+        assert http_client.stream.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_crawl_respects_max_pages_and_patterns(self, ingestion_service, http_client):
+        """Test that the page limit and exclude patterns bound the crawl."""
+        result = await CrawlService(ingestion_service).crawl(
+            "https://example.com/", "Docs", max_depth=5, max_pages=2, exclude_patterns=[r"/a$"]
+        )
+
+        assert [item["url"] for item in result["results"]] == ["https://example.com/", "https://example.com/b"]
+        assert result["pages_discovered"] == 2
+
+    @pytest.mark.asyncio
+    async def test_crawl_from_sitemap_index(self, ingestion_service, http_client):
+        """Test that a sitemap index is expanded into depth-0 pages."""
+        documents = {
+            "https://example.com/sitemap.xml": b"""<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+                <sitemap><loc>https://example.com/sitemap-docs.xml</loc></sitemap>
+            </sitemapindex>""",
+            "https://example.com/sitemap-docs.xml": b"""<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+                <url><loc>https://example.com/a</loc></url>
+                <url><loc>https://example.com/b</loc></url>
+                <url><loc>https://other.com/x</loc></url>
+            </urlset>""",
+        }
+        http_client.respond = lambda url: make_response(content=documents[url]) if url in documents else make_response(404)
+
+        result = await CrawlService(ingestion_service).crawl(
+            "https://example.com/sitemap.xml", "Docs", max_depth=0, respect_robots=False
+        )
+
+        assert sorted(item["url"] for item in result["results"]) == ["https://example.com/a", "https://example.com/b"]
+        assert all(item["depth"] == 0 for item in result["results"])
+
+    @pytest.mark.asyncio
+    async def test_crawl_rejects_oversized_sitemap(self, ingestion_service, http_client, monkeypatch):
+        """Test that a sitemap larger than WEAVIATE_MAX_DOWNLOAD_BYTES is not read into memory."""
+        monkeypatch.setenv("WEAVIATE_MAX_DOWNLOAD_BYTES", "1000")
+        urls = "".join(f"<url><loc>https://example.com/page-{i}</loc></url>" for i in range(1000))
+        sitemap = f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'.encode()
+        http_client.respond = lambda url: make_response(content=sitemap, headers={"content-type": "application/xml"})
+
+        result = await CrawlService(ingestion_service).crawl(
+            "https://example.com/sitemap.xml", "Docs", max_depth=0, respect_robots=False
+        )
+
+        assert result["error"] is True
+        assert "Failed to read sitemap https://example.com/sitemap.xml" in result["message"]
+        assert "exceeds the download limit of 1000 bytes" in result["message"]
+        ingestion_service._download_and_extract_content.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_crawl_resumes_from_checkpoint(self, ingestion_service, http_client, tmp_path):
+        """Test that a crawl with an unfinished checkpoint only visits the remaining pages."""
+        path = checkpoint_path(str(tmp_path), "docs")
+        save_checkpoint(
+            path,
+            {
+                "start_url": "https://example.com/",
+                "collection_name": "Docs",
+                "completed": False,
+                "discovered": {"https://example.com/": 0, "https://example.com/b": 1},
+                "pages": {"https://example.com/": {"url": "https://example.com/", "status": "ingested", "depth": 0}},
+            },
+        )
+
+        with patch.dict("os.environ", {"WEAVIATE_CRAWL_CHECKPOINT_DIR": str(tmp_path)}):
+            result = await CrawlService(ingestion_service).crawl("https://example.com/", "Docs", max_depth=1, crawl_id="docs")
+
+        assert result["resumed"] is True
+        assert result["total_urls"] == 2
+        fetched = [call.args[0] for call in ingestion_service._download_and_extract_content.call_args_list]
+        assert fetched == ["https://example.com/b"]
+
+        checkpoint = load_checkpoint(path)
+        assert checkpoint["completed"] is True
+        assert checkpoint["pages"]["https://example.com/b"]["status"] == "ingested"
+
+    @pytest.mark.asyncio
+    async def test_crawl_consumer_failure_stops_workers(self, ingestion_service, http_client):
+        """Test that a failing inserter ends the crawl instead of leaving workers blocked on the full queue."""
+        ingestion_service.consume_source_queue = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await asyncio.wait_for(
+                CrawlService(ingestion_service).crawl(
+                    "https://example.com/", "Docs", max_depth=2, max_pages=10, concurrency=1, respect_robots=False
+                ),
+                timeout=5,
+            )
+
+    @pytest.mark.asyncio
+    async def test_crawl_invalid_start_url(self, ingestion_service):
+        """Test that a non-HTTP start URL is rejected."""
+        result = await CrawlService(ingestion_service).crawl("ftp://example.com/", "Docs")
+
+        assert result["error"] is True
+        assert "Invalid start URL" in result["message"]
@@ -0,0 +1,160 @@
+"""
+Unit tests for client-side query embedding.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from weaviate_mcp.services.embedding_service import (
+    HashEmbeddingProvider,
+    QueryEmbedder,
+    VectorCache,
+    get_query_embedder,
+    register_embedding_provider,
+)
+from weaviate_mcp.services.weaviate_service import WeaviateService
+
+
+@pytest.fixture(autouse=True)
+def restore_embedding_providers():
+    """Remove providers registered by a test."""
+    with patch.dict("weaviate_mcp.services.embedding_service._provider_factories"):
+        yield
+
+
+class TestHashEmbeddingProvider:
+    """Test cases for the deterministic local provider."""
+
+    @pytest.mark.asyncio
+    async def test_deterministic_and_normalized(self):
+        """Test that equal texts get equal unit vectors and different texts differ."""
+        provider = HashEmbeddingProvider(dimensions=32)
+
+        first, same, other = await provider.embed(["Vector search", "vector  SEARCH", "keyword search"])
+
+        assert first == same
+        assert first != other
+        assert len(first) == 32
+        assert sum(value * value for value in first) == pytest.approx(1.0)
+
+
+class TestVectorCache:
+    """Test cases for the persistent vector cache."""
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that stored vectors are read back as float32 after reopening."""
+        path = str(tmp_path / "vectors.sqlite3")
+        cache = VectorCache(path, max_bytes=1_000)
+        cache.put("key", [0.5, -0.25])
+        cache.close()
+
+        reopened = VectorCache(path, max_bytes=1_000)
+
+        assert reopened.get("key") == [0.5, -0.25]
+        assert reopened.get("missing") is None
+        assert reopened.size_bytes == 8
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test that vectors beyond the size bound are evicted, least recently used first."""
+        cache = VectorCache(str(tmp_path / "vectors.sqlite3"), max_bytes=24)
+        with patch("weaviate_mcp.services.embedding_service.time.time", side_effect=[1.0, 2.0, 3.0, 4.0, 5.0]):
+            cache.put("a", [1.0, 1.0])
+            cache.put("b", [2.0, 2.0])
+            cache.put("c", [3.0, 3.0])
+            cache.get("a")
+            cache.put("d", [4.0, 4.0])
+
+        assert cache.get("b") is None
+        assert [cache.get(key) for key in ("a", "c", "d")] == [[1.0, 1.0], [3.0, 3.0], [4.0, 4.0]]
+        assert cache.size_bytes == 24
+        assert len(cache) == 3
+
+
+class TestQueryEmbedder:
+    """Test cases for QueryEmbedder."""
+
+    @pytest.mark.asyncio
+    async def test_cached_and_concurrent_queries_embed_once(self, tmp_path):
+        """Test that repeated and concurrent identical queries call the provider once."""
+        provider = HashEmbeddingProvider(dimensions=8)
+        provider.embed = AsyncMock(side_effect=provider.embed)
+        embedder = QueryEmbedder(provider, VectorCache(str(tmp_path / "vectors.sqlite3"), max_bytes=10_000))
+
+        vectors = await asyncio.gather(*(embedder.embed("wireless speakers") for _ in range(3)))
+        again = await embedder.embed("wireless speakers")
+
+        assert provider.embed.call_count == 1
+        assert all(vector == pytest.approx(vectors[0]) for vector in vectors + [again])
+        assert embedder.hits == 1
+        await embedder.aclose()
+
+    @pytest.mark.asyncio
+    async def test_get_query_embedder_from_environment(self, tmp_path):
+        """Test that the configured provider and cache directory are used, and unknown providers disable embedding."""
+        register_embedding_provider("test", lambda: HashEmbeddingProvider(dimensions=4))
+        with patch.dict("os.environ", {"WEAVIATE_QUERY_EMBEDDING": "test", "WEAVIATE_EMBEDDING_CACHE_DIR": str(tmp_path)}):
+            embedder = get_query_embedder()
+
+        assert embedder.provider.name == "hash:4"
+        assert embedder.cache.path == str(tmp_path / "query_vectors.sqlite3")
+        assert get_query_embedder() is embedder
+
+
+class TestClientSideQueryEmbedding:
+    """Test cases for searches with client-side query embedding."""
+
+    @pytest.mark.asyncio
+    async def test_search_uses_near_vector_with_cached_vector(self, mock_env_vars, tmp_path):
+        """Test that searches send the embedded vector instead of the text, embedding each text once."""
+        # Arrange
+        env = {"WEAVIATE_QUERY_EMBEDDING": "hash", "WEAVIATE_EMBEDDING_CACHE_DIR": str(tmp_path)}
+        with (
+            patch.dict("os.environ", env),
+            patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class,
+        ):
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            mock_collection.query.near_vector = AsyncMock(return_value=MagicMock(objects=[]))
+            mock_collection.query.near_text = AsyncMock()
+            mock_collection.query.hybrid = AsyncMock(return_value=MagicMock(objects=[]))
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+            service = WeaviateService()
+
+            # Act
+            await service.search("Docs", "wireless speakers", limit=5)
+            await service.search("Docs", "wireless speakers", limit=10)
+            await service.hybrid_search("Docs", "wireless speakers")
+
+        # Assert
+        expected = HashEmbeddingProvider().embed_one("wireless speakers")
+        assert mock_collection.query.near_vector.call_args.kwargs["near_vector"] == pytest.approx(expected)
+        assert mock_collection.query.hybrid.call_args.kwargs["vector"] == pytest.approx(expected)
+        mock_collection.query.near_text.assert_not_called()
+        assert get_query_embedder().hits == 2
+
+    @pytest.mark.asyncio
+    async def test_search_falls_back_to_vectorizer_when_embedding_fails(self, mock_env_vars, tmp_path):
+        """Test that a failing provider falls back to near_text."""
+        # Arrange
+        failing = HashEmbeddingProvider()
+        failing.embed = AsyncMock(side_effect=RuntimeError("rate limited"))
+        register_embedding_provider("failing", lambda: failing)
+        env = {"WEAVIATE_QUERY_EMBEDDING": "failing", "WEAVIATE_EMBEDDING_CACHE_SIZE_MB": "0"}
+        with (
+            patch.dict("os.environ", env),
+            patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class,
+        ):
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            mock_collection.query.near_text = AsyncMock(return_value=MagicMock(objects=[]))
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+
+            # Act
+            result = await WeaviateService().search("Docs", "wireless speakers")
+
+        # Assert
+        assert result == {"objects": [], "count": 0}
+        mock_collection.query.near_text.assert_called_once()
@@ -5,11 +5,15 @@ Tests the ingestion service functionality including URL downloading,
 content extraction, optimal chunking, and batch insertion.
 """
 
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from weaviate_mcp.services.ingestion_service import IngestionService
-from weaviate_mcp.services.weaviate_service import WeaviateService
+from weaviate_mcp.services.ingestion_service import CHUNK_UNIQUE_PROPERTIES, IngestionService
+from weaviate_mcp.services.weaviate_service import WeaviateService, generate_object_uuid
+from weaviate_mcp.utils.near_duplicates import SignatureIndex
 
 
 class TestIngestionService:
@@ -20,6 +24,10 @@ class TestIngestionService:
         """Create a mock WeaviateService."""
         service = MagicMock(spec=WeaviateService)
         service.batch_insert_objects = AsyncMock()
+        service.get_objects = AsyncMock(return_value={"objects": [], "count": 0})
+        service.get_all_objects = AsyncMock(return_value={"objects": [], "count": 0})
+        service.delete_objects = AsyncMock(return_value={"success": True, "deleted_count": 0})
+        service.update_object = AsyncMock(return_value={"success": True})
         return service
 
     @pytest.fixture
@@ -29,12 +37,17 @@ class TestIngestionService:
 
     def test_init(self, mock_weaviate_service):
         """Test IngestionService initialization."""
-        service = IngestionService(mock_weaviate_service)
+        with patch("weaviate_mcp.services.ingestion_service.get_tokenizer") as mock_get_tokenizer:
+            service = IngestionService(mock_weaviate_service)
+
         assert service.weaviate_service == mock_weaviate_service
-        assert service._encoding is not None
+        assert service.tokenizer_name is None
+        # The shared tokenizer is loaded on first use, not on construction
+        mock_get_tokenizer.assert_not_called()
+        assert service.tokenizer is not None
 
     @pytest.mark.asyncio
-    async def test_ingest_from_url_success_html(self, ingestion_service, mock_weaviate_service):
+    async def test_ingest_from_url_success_html(self, ingestion_service, mock_weaviate_service, mock_stream):
         """Test successful URL ingestion with HTML content."""
         # Mock HTTP response
         mock_response = MagicMock()
@@ -62,8 +75,8 @@ class TestIngestionService:
             "count": 2,
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+        with patch("weaviate_mcp.services.ingestion_service.get_http_client") as mock_client:
+            mock_client.return_value.stream = mock_stream(mock_response)
 
             result = await ingestion_service.ingest_from_url(
                 url="https://example.com/article",
@@ -85,7 +98,7 @@ class TestIngestionService:
         assert len(call_args[1]["objects"]) > 0
 
     @pytest.mark.asyncio
-    async def test_ingest_from_url_success_plain_text(self, ingestion_service, mock_weaviate_service):
+    async def test_ingest_from_url_success_plain_text(self, ingestion_service, mock_weaviate_service, mock_stream):
         """Test successful URL ingestion with plain text content."""
         # Mock HTTP response
         mock_response = MagicMock()
@@ -102,8 +115,8 @@ class TestIngestionService:
             "count": 3,
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+        with patch("weaviate_mcp.services.ingestion_service.get_http_client") as mock_client:
+            mock_client.return_value.stream = mock_stream(mock_response)
 
             result = await ingestion_service.ingest_from_url(
                 url="https://example.com/document.txt",
@@ -117,8 +130,8 @@ class TestIngestionService:
     @pytest.mark.asyncio
     async def test_ingest_from_url_http_error(self, ingestion_service):
         """Test URL ingestion with HTTP error."""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(side_effect=Exception("HTTP 404 Not Found"))
+        with patch("weaviate_mcp.services.ingestion_service.get_http_client") as mock_client:
+            mock_client.return_value.stream = MagicMock(side_effect=Exception("HTTP 404 Not Found"))
 
             result = await ingestion_service.ingest_from_url(
                 url="https://example.com/nonexistent",
@@ -129,7 +142,7 @@ class TestIngestionService:
         assert "HTTP 404 Not Found" in result["message"]
 
     @pytest.mark.asyncio
-    async def test_ingest_from_url_empty_content(self, ingestion_service):
+    async def test_ingest_from_url_empty_content(self, ingestion_service, mock_stream):
         """Test URL ingestion with empty content."""
         # Mock HTTP response with empty content
         mock_response = MagicMock()
@@ -139,8 +152,8 @@ class TestIngestionService:
         mock_response.content = b""
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+        with patch("weaviate_mcp.services.ingestion_service.get_http_client") as mock_client:
+            mock_client.return_value.stream = mock_stream(mock_response)
 
             result = await ingestion_service.ingest_from_url(
                 url="https://example.com/empty",
@@ -151,7 +164,83 @@ class TestIngestionService:
         assert "No meaningful content" in result["message"]
 
     @pytest.mark.asyncio
-    async def test_ingest_from_url_batch_insert_error(self, ingestion_service, mock_weaviate_service):
+    async def test_download_rejects_non_text_content_type_before_reading(self, ingestion_service, mock_stream):
+        """Test that a binary Content-Type is rejected from the headers, without reading the body."""
+        mock_response = MagicMock()
+        mock_response.headers = {"content-type": "application/octet-stream"}
+        mock_response.status_code = 200
+        mock_response.content = b"\x00" * 1000
+        mock_response.raise_for_status = MagicMock()
+
+        with patch("weaviate_mcp.services.ingestion_service.get_http_client") as mock_client:
+            mock_client.return_value.stream = mock_stream(mock_response)
+            mock_response.aiter_bytes = MagicMock(side_effect=AssertionError("body was read"))
+
+            result = await ingestion_service._download_and_extract_content("https://example.com/file.bin")
+
+        assert result == {"error": True, "message": "Unsupported content type: application/octet-stream"}
+
+    @pytest.mark.asyncio
+    async def test_download_rejects_binary_body_without_content_type(self, ingestion_service, mock_stream):
+        """Test that a body without Content-Type is sniffed and rejected if it contains NUL bytes."""
+        mock_response = MagicMock()
+        mock_response.headers = {}
+        mock_response.status_code = 200
+        mock_response.content = b"PK\x03\x04\x00\x00" * 100
+        mock_response.raise_for_status = MagicMock()
+
+        with patch("weaviate_mcp.services.ingestion_service.get_http_client") as mock_client:
+            mock_client.return_value.stream = mock_stream(mock_response)
+
+            result = await ingestion_service._download_and_extract_content("https://example.com/archive")
+
+        assert result["error"] is True
+        assert "Unsupported binary content" in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_download_enforces_byte_limit(self, ingestion_service, mock_stream, monkeypatch):
+        """Test that bodies over WEAVIATE_MAX_DOWNLOAD_BYTES are rejected, by declared length or while streaming."""
+        monkeypatch.setenv("WEAVIATE_MAX_DOWNLOAD_BYTES", "100")
+        mock_response = MagicMock()
+        mock_response.headers = {"content-type": "text/plain"}
+        mock_response.status_code = 200
+        mock_response.content = b"x" * 1000
+        mock_response.raise_for_status = MagicMock()
+
+        with patch("weaviate_mcp.services.ingestion_service.get_http_client") as mock_client:
+            mock_client.return_value.stream = mock_stream(mock_response, chunk_size=30)
+            streamed = await ingestion_service._download_and_extract_content("https://example.com/big.txt")
+
+            mock_response.headers = {"content-type": "text/plain", "content-length": "1000"}
+            mock_client.return_value.stream = mock_stream(mock_response)
+            mock_response.aiter_bytes = MagicMock(side_effect=AssertionError("body was read"))
+            declared = await ingestion_service._download_and_extract_content("https://example.com/big.txt")
+
+        assert streamed["error"] is True
+        assert "exceeds the download limit of 100 bytes" in streamed["message"]
+        assert declared["error"] is True
+        assert "Content length 1000 exceeds the download limit of 100 bytes" in declared["message"]
+
+    @pytest.mark.asyncio
+    async def test_download_decodes_characters_split_across_chunks(self, ingestion_service, mock_stream):
+        """Test that multi-byte characters split between streamed chunks are decoded intact."""
+        text = "Grüße aus Köln, naïve café — 日本語のテキスト. " * 10
+        mock_response = MagicMock()
+        mock_response.headers = {"content-type": "text/plain; charset=utf-8"}
+        mock_response.status_code = 200
+        mock_response.content = text.encode("utf-8")
+        mock_response.raise_for_status = MagicMock()
+
+        with patch("weaviate_mcp.services.ingestion_service.get_http_client") as mock_client:
+            mock_client.return_value.stream = mock_stream(mock_response, chunk_size=7)
+
+            result = await ingestion_service._download_and_extract_content("https://example.com/doc.txt")
+
+        assert result["content"] == text
+        assert result["metadata"]["content_length"] == len(text.encode("utf-8"))
+
+    @pytest.mark.asyncio
+    async def test_ingest_from_url_batch_insert_error(self, ingestion_service, mock_weaviate_service, mock_stream):
         """Test URL ingestion with batch insertion error."""
         # Mock HTTP response
         mock_response = MagicMock()
@@ -167,8 +256,8 @@ class TestIngestionService:
             "message": "Database connection failed",
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+        with patch("weaviate_mcp.services.ingestion_service.get_http_client") as mock_client:
+            mock_client.return_value.stream = mock_stream(mock_response)
 
             result = await ingestion_service.ingest_from_url(
                 url="https://example.com/test",
@@ -178,6 +267,412 @@ class TestIngestionService:
         assert result["error"] is True
         assert "Database connection failed" in result["message"]
 
+    @pytest.mark.asyncio
+    async def test_ingest_from_url_stores_source_validators(self, ingestion_service, mock_weaviate_service, mock_stream):
+        """Test that ETag, Last-Modified and content hash are stored with every chunk."""
+        mock_response = MagicMock()
+        mock_response.text = "This is a plain text document with multiple sentences. " * 5
+        mock_response.headers = {
+            "content-type": "text/plain",
+            "etag": '"v1"',
+            "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        mock_response.status_code = 200
+        mock_response.content = mock_response.text.encode()
+        mock_response.raise_for_status = MagicMock()
+
+        mock_weaviate_service.get_objects.return_value = {"objects": [], "count": 0}
+        mock_weaviate_service.batch_insert_objects.return_value = {"success": True, "inserted_ids": ["id1"]}
+
+        with (
+            patch("weaviate_mcp.services.ingestion_service.get_http_client") as mock_client,
+            patch.object(ingestion_service, "chunk_text", new=AsyncMock(return_value=["chunk"])),
+        ):
+            mock_client.return_value.stream = mock_stream(mock_response)
+
+            result = await ingestion_service.ingest_from_url(url="https://example.com/doc", collection_name="test_collection")
+
+        assert result["success"] is True
+        # No stored state, so the request is unconditional
+        assert mock_client.return_value.stream.call_args.kwargs["headers"] == {}
+
+        stored = mock_weaviate_service.batch_insert_objects.call_args.kwargs["objects"][0]
+        assert stored["source_etag"] == '"v1"'
+        assert stored["source_last_modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert len(stored["source_hash"]) == 64
+
+    @pytest.mark.asyncio
+    async def test_ingest_from_url_skips_not_modified(self, ingestion_service, mock_weaviate_service, mock_stream):
+        """Test that a 304 response to a conditional request skips re-ingestion."""
+        mock_response = MagicMock()
+        mock_response.status_code = 304
+
+        mock_weaviate_service.get_objects.return_value = {
+            "objects": [{"source_etag": '"v1"', "source_last_modified": "Mon, 01 Jan 2024 00:00:00 GMT"}],
+            "count": 1,
+        }
+
+        with patch("weaviate_mcp.services.ingestion_service.get_http_client") as mock_client:
+            mock_client.return_value.stream = mock_stream(mock_response)
+
+            result = await ingestion_service.ingest_from_url(url="https://example.com/doc", collection_name="test_collection")
+
+        assert result["success"] is True
+        assert result["skipped"] is True
+        assert result["chunks_ingested"] == 0
+        assert mock_client.return_value.stream.call_args.kwargs["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        mock_weaviate_service.batch_insert_objects.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ingest_from_url_skips_unchanged_content_hash(self, ingestion_service, mock_weaviate_service, mock_stream):
+        """Test that a source whose extracted content hash matches is skipped, unless forced."""
+        text = "Unchanged document content for hashing."
+        mock_response = MagicMock()
+        mock_response.text = text
+        mock_response.headers = {"content-type": "text/plain"}
+        mock_response.status_code = 200
+        mock_response.content = text.encode()
+        mock_response.raise_for_status = MagicMock()
+
+        mock_weaviate_service.get_objects.return_value = {
+            "objects": [{"id": "stored-id", "source_hash": hashlib.sha256(text.encode()).hexdigest()}],
+            "count": 1,
+        }
+        mock_weaviate_service.get_all_objects.return_value = mock_weaviate_service.get_objects.return_value
+        mock_weaviate_service.batch_insert_objects.return_value = {"success": True, "inserted_ids": ["id1"]}
+
+        with (
+            patch("weaviate_mcp.services.ingestion_service.get_http_client") as mock_client,
+            patch.object(ingestion_service, "chunk_text", new=AsyncMock(return_value=["chunk"])),
+        ):
+            mock_client.return_value.stream = mock_stream(mock_response)
+
+            skipped = await ingestion_service.ingest_from_url(url="https://example.com/doc", collection_name="test_collection")
+            forced = await ingestion_service.ingest_from_url(
+                url="https://example.com/doc", collection_name="test_collection", force=True
+            )
+
+        assert skipped["skipped"] is True
+        assert skipped["reason"] == "Content hash unchanged"
+        assert forced["success"] is True
+        assert forced["chunks_ingested"] == 1
+        mock_weaviate_service.batch_insert_objects.assert_called_once()
+        mock_weaviate_service.delete_objects.assert_called_once_with("test_collection", ["stored-id"])
+
+    @pytest.mark.asyncio
+    async def test_ingest_urls_reports_per_url_status(self, ingestion_service, mock_weaviate_service):
+        """Test that multi-URL ingestion reports each URL and keeps going after failures."""
+
+        async def fake_download(url, previous_state=None, extract_links=False):
+            if url.endswith("/broken"):
+                return {"error": True, "message": f"HTTP error 404 for {url}"}
+            if url.endswith("/same"):
+                return {"not_modified": True, "reason": "HTTP 304 Not Modified"}
+            return {"content": f"Content of {url}", "metadata": {"title": url, "content_length": 100}}
+
+        mock_weaviate_service.batch_insert_objects.return_value = {"success": True, "inserted_ids": ["id"], "count": 1}
+
+        with (
+            patch.object(ingestion_service, "_download_and_extract_content", side_effect=fake_download),
+            patch.object(ingestion_service, "chunk_text", new=AsyncMock(return_value=["chunk one", "chunk two"])),
+        ):
+            result = await ingestion_service.ingest_urls(
+                urls=[
+                    "https://a.example.com/1",
+                    "https://b.example.com/broken",
+                    "https://a.example.com/1",
+                    "https://a.example.com/same",
+                ],
+                collection_name="test_collection",
+            )
+
+        assert result["success"] is False
+        assert result["total_urls"] == 3
+        assert result["succeeded"] == 1
+        assert result["unchanged"] == 1
+        assert result["failed"] == 1
+        assert result["chunks_ingested"] == 2
+        assert result["bytes_downloaded"] == 100
+        assert result["elapsed_seconds"] >= 0
+
+        statuses = {item["url"]: item for item in result["results"]}
+        assert statuses["https://a.example.com/1"]["status"] == "ingested"
+        assert statuses["https://a.example.com/1"]["chunks_ingested"] == 2
+        assert statuses["https://b.example.com/broken"]["status"] == "failed"
+        assert "404" in statuses["https://b.example.com/broken"]["message"]
+        assert statuses["https://a.example.com/same"]["status"] == "unchanged"
+
+        call_kwargs = mock_weaviate_service.batch_insert_objects.call_args.kwargs
+        assert call_kwargs["upsert"] == "replace"
+        assert call_kwargs["unique_properties"] == ["source_url", "chunk_hash"]
+
+    @pytest.mark.asyncio
+    async def test_ingest_urls_maps_insert_failures_to_urls(self, ingestion_service, mock_weaviate_service):
+        """Test that failed chunk inserts are attributed to the URL they came from."""
+        urls = ["https://example.com/1", "https://example.com/2"]
+
+        async def fake_download(url, previous_state=None, extract_links=False):
+            return {"content": url, "metadata": {"content_length": 10}}
+
+        async def fake_insert(collection_name, objects, **kwargs):
+            failed = [
+                {"index": index, "message": "boom", "batch_error": False}
+                for index, obj in enumerate(objects)
+                if obj["source_url"] == urls[1]
+            ]
+            return {"error": bool(failed), "failed_objects": failed, "inserted_ids": []}
+
+        mock_weaviate_service.batch_insert_objects.side_effect = fake_insert
+
+        with (
+            patch.object(ingestion_service, "_download_and_extract_content", side_effect=fake_download),
+            patch.object(ingestion_service, "chunk_text", new=AsyncMock(return_value=["a", "b"])),
+        ):
+            result = await ingestion_service.ingest_urls(urls=urls, collection_name="test_collection")
+
+        statuses = {item["url"]: item for item in result["results"]}
+        assert statuses[urls[0]]["status"] == "ingested"
+        assert statuses[urls[1]]["status"] == "failed"
+        assert "2 of 2 chunks failed to insert" in statuses[urls[1]]["message"]
+
+    @pytest.mark.asyncio
+    async def test_ingest_urls_respects_per_host_limit(self, ingestion_service, mock_weaviate_service):
+        """Test that concurrent downloads to one host stay within per_host_limit."""
+        active = 0
+        peak = 0
+
+        async def fake_download(url, previous_state=None, extract_links=False):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"content": url, "metadata": {}}
+
+        mock_weaviate_service.batch_insert_objects.return_value = {"success": True, "inserted_ids": []}
+
+        with (
+            patch.object(ingestion_service, "_download_and_extract_content", side_effect=fake_download),
+            patch.object(ingestion_service, "chunk_text", new=AsyncMock(return_value=["chunk"])),
+        ):
+            result = await ingestion_service.ingest_urls(
+                urls=[f"https://example.com/{i}" for i in range(10)],
+                collection_name="test_collection",
+                concurrency=8,
+                per_host_limit=2,
+            )
+
+        assert result["succeeded"] == 10
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_ingest_urls_consumer_failure_does_not_block_producers(self, ingestion_service):
+        """Test that a failing inserter stops the downloads instead of leaving them blocked on the full queue."""
+
+        async def fake_download(url, previous_state=None, extract_links=False):
+            return {"content": url, "metadata": {}}
+
+        with (
+            patch.object(ingestion_service, "_download_and_extract_content", side_effect=fake_download),
+            patch.object(ingestion_service, "chunk_text", new=AsyncMock(return_value=["chunk"])),
+            patch.object(ingestion_service, "consume_source_queue", new=AsyncMock(side_effect=RuntimeError("boom"))),
+            pytest.raises(RuntimeError, match="boom"),
+        ):
+            await asyncio.wait_for(
+                ingestion_service.ingest_urls(
+                    urls=[f"https://example.com/{i}" for i in range(20)],
+                    collection_name="test_collection",
+                    concurrency=1,
+                ),
+                timeout=5,
+            )
+
+    @pytest.mark.asyncio
+    async def test_ingest_urls_busy_host_does_not_hold_global_slots(self, ingestion_service, mock_weaviate_service):
+        """Test that downloads waiting on a busy host don't keep other hosts from downloading."""
+        release = asyncio.Event()
+        other_host_done = asyncio.Event()
+
+        async def fake_download(url, previous_state=None, extract_links=False):
+            if "busy.example.com" in url:
+                await release.wait()
+            else:
+                other_host_done.set()
+            return {"content": url, "metadata": {}}
+
+        async def unblock() -> None:
+            await other_host_done.wait()
+            release.set()
+
+        mock_weaviate_service.batch_insert_objects.return_value = {"success": True, "inserted_ids": []}
+
+        with (
+            patch.object(ingestion_service, "_download_and_extract_content", side_effect=fake_download),
+            patch.object(ingestion_service, "chunk_text", new=AsyncMock(return_value=["chunk"])),
+        ):
+            unblocker = asyncio.create_task(unblock())
+            result = await asyncio.wait_for(
+                ingestion_service.ingest_urls(
+                    urls=[f"https://busy.example.com/{i}" for i in range(3)] + ["https://other.example.com/"],
+                    collection_name="test_collection",
+                    concurrency=2,
+                    per_host_limit=1,
+                ),
+                timeout=5,
+            )
+            await unblocker
+
+        assert result["succeeded"] == 4
+
+    @pytest.mark.asyncio
+    async def test_sync_source_chunks_writes_only_the_diff(self, ingestion_service, mock_weaviate_service):
+        """Test that re-ingestion inserts new chunks, deletes removed ones and re-indexes moved ones."""
+        url = "https://example.com/doc"
+        old_objects = ingestion_service.build_chunk_objects(
+            url, ["Intro.", "Body.", "Removed.", "Outro."], {"title": "Doc", "source_hash": "v1", "content_length": 30}
+        )
+        new_objects = ingestion_service.build_chunk_objects(
+            url, ["Intro.", "Inserted.", "Body.", "Outro."], {"title": "Doc", "source_hash": "v2", "content_length": 32}
+        )
+
+        stored = [{**obj, "id": generate_object_uuid(obj, CHUNK_UNIQUE_PROPERTIES)} for obj in old_objects]
+        mock_weaviate_service.get_all_objects.return_value = {"objects": stored, "count": len(stored)}
+        mock_weaviate_service.batch_insert_objects.return_value = {"success": True, "inserted_ids": ["new-id"]}
+        mock_weaviate_service.delete_objects.return_value = {"success": True, "deleted_count": 1}
+
+        result = await ingestion_service.sync_source_chunks("test_collection", url, new_objects)
+
+        assert result["success"] is True
+        assert result["chunks_inserted"] == 1
+        assert result["chunks_deleted"] == 1
+        assert result["chunks_updated"] == 1
+        assert result["chunks_unchanged"] == 2
+
+        inserted = mock_weaviate_service.batch_insert_objects.call_args.kwargs["objects"]
+        assert [obj["content"] for obj in inserted] == ["Inserted."]
+        mock_weaviate_service.delete_objects.assert_called_once_with("test_collection", [stored[2]["id"]])
+        # Only the moved chunk and the source state on the first chunk are patched; "Outro." is not touched
+        assert sorted(call.args[1:] for call in mock_weaviate_service.update_object.call_args_list) == sorted(
+            [
+                (stored[1]["id"], {"chunk_index": 2}),
+                (stored[0]["id"], {"source_hash": "v2", "content_length": 32}),
+            ]
+        )
+
+    @pytest.mark.asyncio
+    async def test_sync_source_chunks_fails_when_stored_chunks_cannot_be_read(self, ingestion_service, mock_weaviate_service):
+        """Test that a failed lookup of stored chunks fails the sync instead of leaving stale chunks."""
+        url = "https://example.com/doc"
+        mock_weaviate_service.get_all_objects.return_value = {"error": True, "message": "query timed out"}
+
+        result = await ingestion_service.sync_source_chunks(
+            "test_collection", url, ingestion_service.build_chunk_objects(url, ["Text."], {})
+        )
+
+        assert result["error"] is True
+        assert "query timed out" in result["message"]
+        mock_weaviate_service.batch_insert_objects.assert_not_called()
+        mock_weaviate_service.delete_objects.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sync_source_chunks_keeps_stored_chunks_on_insert_failure(self, ingestion_service, mock_weaviate_service):
+        """Test that stale chunks are not deleted when the new chunks fail to insert."""
+        url = "https://example.com/doc"
+        old_objects = ingestion_service.build_chunk_objects(url, ["Old text."], {})
+        stored = [{**obj, "id": generate_object_uuid(obj, CHUNK_UNIQUE_PROPERTIES)} for obj in old_objects]
+        mock_weaviate_service.get_all_objects.return_value = {"objects": stored, "count": 1}
+        mock_weaviate_service.batch_insert_objects.return_value = {"error": True, "message": "Insert failed"}
+
+        new_objects = ingestion_service.build_chunk_objects(url, ["New text."], {})
+        result = await ingestion_service.sync_source_chunks("test_collection", url, new_objects)
+
+        assert result["error"] is True
+        mock_weaviate_service.delete_objects.assert_not_called()
+
+    @pytest.fixture
+    def signature_index(self, tmp_path):
+        """Use a signature index in a temporary directory."""
+        index = SignatureIndex(str(tmp_path / "signatures.sqlite3"))
+        with patch("weaviate_mcp.services.ingestion_service.get_signature_index", return_value=index):
+            yield index
+        index.close()
+
+    @pytest.mark.asyncio
+    async def test_sync_source_chunks_skips_near_duplicates(self, ingestion_service, mock_weaviate_service, signature_index):
+        """Test that chunks nearly duplicating another source's chunks are neither inserted nor vectorized."""
+        footer = "Copyright 2024 Example Corporation. All rights reserved. Use is subject to the terms of service. Page 1"
+        mock_weaviate_service.batch_insert_objects.return_value = {"success": True, "inserted_ids": ["id"]}
+
+        first = ingestion_service.build_chunk_objects("https://example.com/a", ["About the first page.", footer], {})
+        await ingestion_service.sync_source_chunks("test_collection", "https://example.com/a", first, near_duplicates="skip")
+        second = ingestion_service.build_chunk_objects(
+            "https://example.com/b", ["About the second page.", footer.replace("Page 1", "Page 2")], {}
+        )
+        result = await ingestion_service.sync_source_chunks(
+            "test_collection", "https://example.com/b", second, near_duplicates="skip"
+        )
+
+        assert result["success"] is True
+        assert result["chunks_inserted"] == 1
+        assert result["chunks_near_duplicate"] == 1
+        assert result["chunks_linked"] == 0
+        assert result["dedup_ratio"] == 0.5
+        inserted = mock_weaviate_service.batch_insert_objects.call_args.kwargs["objects"]
+        assert [obj["content"] for obj in inserted] == ["About the second page."]
+
+    @pytest.mark.asyncio
+    async def test_sync_source_chunks_links_near_duplicates(self, ingestion_service, mock_weaviate_service, signature_index):
+        """Test that linked near-duplicates are stored with the vector of the chunk they duplicate."""
+        url = "https://example.com/doc"
+        header = "Example Docs: Guides, Reference, Blog and Support for the Example platform"
+        objects = ingestion_service.build_chunk_objects(
+            url, [header, "The body of the document.", header + " (continued)"], {}
+        )
+        original_id = generate_object_uuid(objects[0], CHUNK_UNIQUE_PROPERTIES)
+        mock_weaviate_service.batch_insert_objects.return_value = {"success": True, "inserted_ids": ["id"]}
+        mock_weaviate_service.get_vectors = AsyncMock(return_value={"vectors": {original_id: [0.1, 0.2]}})
+
+        result = await ingestion_service.sync_source_chunks(
+            "test_collection", url, objects, near_duplicates="link", near_duplicate_scope="source"
+        )
+
+        assert result["chunks_inserted"] == 2
+        assert result["chunks_linked"] == 1
+        mock_weaviate_service.get_vectors.assert_called_once_with("test_collection", [original_id])
+        link_call = mock_weaviate_service.batch_insert_objects.call_args_list[1].kwargs
+        assert link_call["objects"][0]["duplicate_of"] == original_id
+        assert link_call["vectors"] == [[0.1, 0.2]]
+
+    @pytest.mark.asyncio
+    async def test_sync_source_chunks_forgets_signatures_on_insert_failure(
+        self, ingestion_service, mock_weaviate_service, signature_index
+    ):
+        """Test that chunks that failed to insert do not suppress later copies of themselves."""
+        objects = ingestion_service.build_chunk_objects("https://example.com/a", ["A chunk that fails to insert."], {})
+        mock_weaviate_service.batch_insert_objects.return_value = {"error": True, "message": "Insert failed"}
+
+        result = await ingestion_service.sync_source_chunks(
+            "test_collection", "https://example.com/a", objects, near_duplicates="skip"
+        )
+
+        assert result["error"] is True
+        assert len(signature_index) == 0
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_options_are_validated(self, ingestion_service):
+        """Test that unknown near-duplicate modes and scopes are rejected."""
+        result = await ingestion_service.ingest_urls(["https://example.com"], "test_collection", near_duplicates="drop")
+        scope_result = await ingestion_service.sync_source_chunks(
+            "test_collection", "https://example.com", [], near_duplicates="skip", near_duplicate_scope="site"
+        )
+
+        assert result["error"] is True
+        assert "near_duplicates" in result["message"]
+        assert scope_result["error"] is True
+
     def test_create_optimal_chunks_basic(self, ingestion_service):
         """Test basic text chunking functionality."""
         text = "This is a test paragraph.\n\nThis is another paragraph with more content."
@@ -207,9 +702,57 @@ class TestIngestionService:
         assert len(chunks) > 1
         # Verify no chunk is too large (approximate check)
         for chunk in chunks:
-            token_count = len(ingestion_service._encoding.encode(chunk))
+            token_count = ingestion_service.tokenizer.count_tokens(chunk)
             assert token_count <= 150  # Allow some buffer
 
+    @pytest.mark.asyncio
+    async def test_chunk_text_small_text_inline(self, ingestion_service):
+        """Test that small texts are chunked inline without the worker pool."""
+        with patch("weaviate_mcp.services.ingestion_service.get_chunking_executor") as mock_get_executor:
+            chunks = await ingestion_service.chunk_text("Short paragraph with enough words to keep.", max_tokens=50)
+
+        assert chunks == ["Short paragraph with enough words to keep."]
+        mock_get_executor.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_chunk_text_shards_large_text_in_pool(self, ingestion_service):
+        """Test that large texts are sharded and chunked in the worker pool, in order."""
+        text = "\n\n".join(f"Paragraph {i}." for i in range(10))
+
+        def fake_chunk(tokenizer_name, shard, max_tokens, overlap_tokens):
+            return [shard.upper()]
+
+        with (
+            ThreadPoolExecutor(max_workers=2) as executor,
+            patch("weaviate_mcp.services.ingestion_service.INLINE_CHUNKING_LIMIT", 10),
+            patch("weaviate_mcp.services.ingestion_service.get_chunking_executor", return_value=executor),
+            patch(
+                "weaviate_mcp.services.ingestion_service.split_into_shards",
+                return_value=["first shard", "second shard"],
+            ),
+            patch("weaviate_mcp.services.ingestion_service.chunk_with_tokenizer", side_effect=fake_chunk) as mock_chunk,
+        ):
+            chunks = await ingestion_service.chunk_text(text, max_tokens=100, overlap_tokens=5)
+
+        assert chunks == ["FIRST SHARD", "SECOND SHARD"]
+        assert mock_chunk.call_count == 2
+        mock_chunk.assert_any_call(None, "first shard", 100, 5)
+
+    @pytest.mark.asyncio
+    async def test_chunk_text_typical_page_in_pool(self, ingestion_service):
+        """Test that a page-sized text is chunked in the worker pool rather than on the event loop."""
+        text = "A sentence of a typical web page. " * 300
+
+        with (
+            ThreadPoolExecutor(max_workers=1) as executor,
+            patch("weaviate_mcp.services.ingestion_service.get_chunking_executor", return_value=executor),
+            patch("weaviate_mcp.services.ingestion_service.chunk_with_tokenizer", return_value=["chunk"]) as mock_chunk,
+        ):
+            chunks = await ingestion_service.chunk_text(text, max_tokens=100)
+
+        assert chunks == ["chunk"]
+        mock_chunk.assert_called_once_with(None, text, 100, 50)
+
     def test_extract_html_content(self, ingestion_service):
         """Test HTML content extraction."""
         html = """
@@ -254,31 +797,3 @@ class TestIngestionService:
         # Test with no path
         title = ingestion_service._extract_title_from_url("https://example.com")
         assert title == "example.com"
-
-    def test_split_into_sentences(self, ingestion_service):
-        """Test sentence splitting functionality."""
-        text = "First sentence. Second sentence! Third sentence? Fourth sentence."
-        sentences = ingestion_service._split_into_sentences(text)
-
-        assert len(sentences) == 4
-        assert sentences[0] == "First sentence."
-        assert sentences[1] == "Second sentence!"
-        assert sentences[2] == "Third sentence?"
-        assert sentences[3] == "Fourth sentence."
-
-    def test_get_overlap_text(self, ingestion_service):
-        """Test overlap text generation."""
-        text = "First sentence. Second sentence. Third sentence. Fourth sentence."
-
-        # Test with reasonable overlap
-        overlap = ingestion_service._get_overlap_text(text, overlap_tokens=10)
-        assert len(overlap) > 0
-        assert overlap in text
-
-        # Test with zero overlap
-        overlap = ingestion_service._get_overlap_text(text, overlap_tokens=0)
-        assert overlap == ""
-
-        # Test with very large overlap
-        overlap = ingestion_service._get_overlap_text(text, overlap_tokens=1000)
-        assert len(overlap) > 0
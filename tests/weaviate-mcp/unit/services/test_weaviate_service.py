@@ -2,10 +2,19 @@
 Unit tests for WeaviateService.
 """
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
 
 import pytest
-from weaviate_mcp.services.weaviate_service import WeaviateService
+from weaviate.classes.query import Filter
+from weaviate.classes.tenants import Tenant, TenantActivityStatus
+from weaviate_mcp.services.weaviate_service import (
+    WeaviateService,
+    close_weaviate_service,
+    generate_object_uuid,
+    get_weaviate_service,
+)
 
 
 class TestWeaviateService:
@@ -292,6 +301,28 @@ class TestWeaviateService:
             assert "deleted successfully" in result["message"]
             mock_collection.data.delete_by_id.assert_called_once_with("test-uuid")
 
+    @pytest.mark.asyncio
+    async def test_delete_objects_in_batches(self, mock_env_vars):
+        """Test that many objects are deleted with one delete_many call per batch."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            mock_collection.data.delete_many = AsyncMock(side_effect=[MagicMock(successful=2), MagicMock(successful=1)])
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+
+            service = WeaviateService()
+
+            # Act
+            result = await service.delete_objects("TestCollection", [str(uuid4()) for _ in range(3)], batch_size=2)
+            empty_result = await service.delete_objects("TestCollection", [])
+
+            # Assert
+            assert result == {"success": True, "deleted_count": 3}
+            assert empty_result == {"success": True, "deleted_count": 0}
+            assert mock_collection.data.delete_many.call_count == 2
+
     @pytest.mark.asyncio
     async def test_aggregate_success(self, mock_env_vars):
         """Test successful aggregation."""
@@ -319,3 +350,942 @@ class TestWeaviateService:
             assert result["success"] is True
             assert result["results"]["total_count"] == 100
             mock_query.over_all.assert_called_once_with(total_count=True)
+
+    @pytest.mark.asyncio
+    async def test_batch_check_existing_files_groups_batches(self, mock_env_vars):
+        """Test that keys are checked in grouped aggregations, retrying batches whose group limit was filled."""
+        # Arrange
+        stored = ["a.pdf", "b.pdf", "d.pdf", "a b.pdf"]
+
+        async def over_all(filters, group_by, total_count):
+            keys = filters.value
+            # Word tokenization: "a b.pdf" also matches a filter on "a.pdf"
+            values = [value for value in stored if value in keys or (value == "a b.pdf" and "a.pdf" in keys)]
+            groups = [MagicMock(grouped_by=MagicMock(value=value), total_count=5000) for value in values]
+            return MagicMock(groups=groups[: group_by.limit])
+
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            mock_collection.aggregate.over_all = AsyncMock(side_effect=over_all)
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+
+            service = WeaviateService()
+
+            # Act
+            result = await service.batch_check_existing_files(
+                "TestCollection", ["c.pdf", "a.pdf", "b.pdf", "d.pdf", "a.pdf"], batch_size=2
+            )
+
+            # Assert
+            assert result == {
+                "new_files": ["c.pdf"],
+                "existing_files": ["a.pdf", "b.pdf", "d.pdf"],
+                "new_count": 1,
+                "existing_count": 3,
+                "total_checked": 5,
+            }
+            # Two batches, and a retry for ["c.pdf", "a.pdf"] whose limit was filled by "a b.pdf"
+            assert mock_collection.aggregate.over_all.call_count == 3
+            mock_collection.query.fetch_objects.assert_not_called()
+
+
+class TestSharedWeaviateService:
+    """Test cases for the process-wide shared WeaviateService."""
+
+    def test_get_weaviate_service_returns_singleton(self):
+        """Test that all callers share one service instance."""
+        # Act
+        first = get_weaviate_service()
+        second = get_weaviate_service()
+
+        # Assert
+        assert first is second
+
+    @pytest.mark.asyncio
+    async def test_close_weaviate_service_resets_singleton(self):
+        """Test that closing the shared service creates a fresh one on next use."""
+        # Arrange
+        first = get_weaviate_service()
+
+        # Act
+        await close_weaviate_service()
+
+        # Assert
+        assert get_weaviate_service() is not first
+
+    @pytest.mark.asyncio
+    async def test_connection_reused_across_calls(self, mock_env_vars):
+        """Test that repeated operations connect only once."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.collections.list_all.return_value = {}
+            mock_client_class.return_value = mock_client
+
+            service = get_weaviate_service()
+
+            # Act
+            await service.get_schema(use_cache=False)
+            await service.get_schema(use_cache=False)
+
+            # Assert
+            mock_client_class.assert_called_once()
+            mock_client.connect.assert_called_once()
+            assert mock_client.collections.list_all.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reconnect_when_health_check_fails(self, mock_env_vars):
+        """Test that a client failing its liveness probe is replaced."""
+        # Arrange
+        with (
+            patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class,
+            patch("weaviate_mcp.services.weaviate_service.HEALTH_CHECK_INTERVAL", 0),
+        ):
+            stale_client = AsyncMock()
+            stale_client.is_live.return_value = False
+            fresh_client = AsyncMock()
+            fresh_client.collections.list_all.return_value = {"Collection1": {}}
+            mock_client_class.side_effect = [stale_client, fresh_client]
+
+            service = get_weaviate_service()
+            await service._ensure_connected()
+
+            # Act
+            result = await service.get_schema()
+
+            # Assert
+            assert result == {"Collection1": {}}
+            stale_client.close.assert_called_once()
+            fresh_client.connect.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_closes_client_of_another_event_loop(self, mock_env_vars):
+        """Test that a client connected on another event loop is closed before reconnecting."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            old_client = AsyncMock()
+            new_client = AsyncMock()
+            mock_client_class.side_effect = [old_client, new_client]
+
+            service = get_weaviate_service()
+            await service._ensure_connected()
+            service._loop = object()
+
+            # Act
+            connected = await service._ensure_connected()
+
+            # Assert
+            assert connected is True
+            old_client.close.assert_called_once()
+            assert service._client is new_client
+
+
+class TestBatchInsertObjects:
+    """Test cases for WeaviateService.batch_insert_objects."""
+
+    @staticmethod
+    def _batch_response(uuids, errors=None):
+        response = MagicMock()
+        response.uuids = uuids
+        response.errors = errors or {}
+        return response
+
+    @pytest.mark.asyncio
+    async def test_batch_insert_uses_insert_many(self, mock_env_vars):
+        """Test that objects are sent in native batches, not one by one."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            mock_collection.data.insert_many = AsyncMock(
+                side_effect=[
+                    self._batch_response({0: "uuid-0", 1: "uuid-1"}),
+                    self._batch_response({0: "uuid-2"}),
+                ]
+            )
+            mock_collection.data.insert = AsyncMock()
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+
+            service = WeaviateService()
+            objects = [{"title": f"Product {i}"} for i in range(3)]
+
+            # Act
+            result = await service.batch_insert_objects("TestCollection", objects, batch_size=2, concurrency=1)
+
+            # Assert
+            assert result["success"] is True
+            assert result["inserted_ids"] == ["uuid-0", "uuid-1", "uuid-2"]
+            assert result["count"] == 3
+            assert "objects_per_second" in result
+            assert mock_collection.data.insert_many.call_count == 2
+            mock_collection.data.insert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_insert_retries_failed_objects_individually(self, mock_env_vars):
+        """Test that objects rejected by a batch are retried and reported per object."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            batch_error = MagicMock()
+            batch_error.message = "transient"
+            mock_collection.data.insert_many = AsyncMock(
+                return_value=self._batch_response({0: "uuid-0"}, {1: batch_error, 2: batch_error})
+            )
+            mock_collection.data.insert = AsyncMock(side_effect=["uuid-1", Exception("invalid property")])
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+
+            service = WeaviateService()
+            objects = [{"title": f"Product {i}"} for i in range(3)]
+
+            # Act
+            result = await service.batch_insert_objects("TestCollection", objects)
+
+            # Assert
+            assert result["error"] is True
+            assert result["inserted_ids"] == ["uuid-0", "uuid-1"]
+            assert result["failed_count"] == 1
+            assert result["failed_objects"][0]["index"] == 2
+            assert "invalid property" in result["failed_objects"][0]["message"]
+            assert mock_collection.data.insert.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_insert_upsert_replace_uses_deterministic_ids(self, mock_env_vars):
+        """Test that replace mode sends derived IDs without any duplicate queries."""
+        # Arrange
+        objects = [{"source_url": "u", "chunk_index": 0}, {"source_url": "u", "chunk_index": 1}]
+        expected_ids = [generate_object_uuid(obj, ["source_url", "chunk_index"]) for obj in objects]
+
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            mock_collection.data.insert_many = AsyncMock(return_value=self._batch_response(dict(enumerate(expected_ids))))
+            mock_collection.query.fetch_objects = AsyncMock()
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+
+            service = WeaviateService()
+
+            # Act
+            result = await service.batch_insert_objects(
+                "TestCollection", objects, unique_properties=["source_url", "chunk_index"], upsert="replace"
+            )
+
+            # Assert
+            assert result["success"] is True
+            assert result["inserted_ids"] == expected_ids
+            sent = mock_collection.data.insert_many.call_args[0][0]
+            assert [str(data_object.uuid) for data_object in sent] == expected_ids
+            mock_collection.query.fetch_objects.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_insert_upsert_skip_omits_existing_ids(self, mock_env_vars):
+        """Test that skip mode looks up IDs once per batch and only sends new objects."""
+        # Arrange
+        objects = [{"title": "Existing"}, {"title": "New"}]
+        existing_id = generate_object_uuid(objects[0], ["title"])
+
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            existing_obj = MagicMock()
+            existing_obj.uuid = existing_id
+            mock_collection.query.fetch_objects = AsyncMock(return_value=MagicMock(objects=[existing_obj]))
+            mock_collection.data.insert_many = AsyncMock(return_value=self._batch_response({0: "new-id"}))
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+
+            service = WeaviateService()
+
+            # Act
+            result = await service.batch_insert_objects("TestCollection", objects, unique_properties=["title"], upsert="skip")
+
+            # Assert
+            assert result["success"] is True
+            assert result["existing_count"] == 1
+            assert result["inserted_ids"][0] == existing_id
+            mock_collection.query.fetch_objects.assert_called_once()
+            sent = mock_collection.data.insert_many.call_args[0][0]
+            assert [data_object.properties for data_object in sent] == [{"title": "New"}]
+
+    @pytest.mark.asyncio
+    async def test_batch_insert_upsert_requires_unique_properties(self):
+        """Test that upsert without unique properties is rejected."""
+        # Act
+        result = await WeaviateService().batch_insert_objects("TestCollection", [{"title": "x"}], upsert="replace")
+
+        # Assert
+        assert result["error"] is True
+        assert "unique_properties" in result["message"]
+
+
+class TestExportCollection:
+    """Test cases for WeaviateService.export_collection."""
+
+    @staticmethod
+    def _paged_collection(count):
+        """Create a mock collection whose fetch_objects pages through `count` objects by cursor."""
+        objects = [
+            MagicMock(uuid=UUID(int=index + 1), properties={"title": f"Doc {index}"}, vector={"default": [0.5, float(index)]})
+            for index in range(count)
+        ]
+
+        async def fetch_objects(limit, after, return_properties, include_vector):
+            start = 0 if after is None else next(i for i, obj in enumerate(objects) if obj.uuid == after) + 1
+            return MagicMock(objects=objects[start : start + limit])
+
+        collection = MagicMock()
+        collection.query.fetch_objects = AsyncMock(side_effect=fetch_objects)
+        return collection
+
+    @pytest.mark.asyncio
+    async def test_export_jsonl_with_cursor(self, mock_env_vars, tmp_path):
+        """Test that all pages are fetched by cursor and written as JSON lines."""
+        # Arrange
+        path = tmp_path / "export" / "docs.jsonl"
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = self._paged_collection(5)
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+
+            # Act
+            result = await WeaviateService().export_collection("Docs", str(path), include_vector=True, batch_size=2)
+
+        # Assert
+        assert result["success"] is True
+        assert result["objects_exported"] == 5
+        assert result["bytes_written"] == path.stat().st_size
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [record["properties"]["title"] for record in records] == [f"Doc {i}" for i in range(5)]
+        assert records[1] == {"id": str(UUID(int=2)), "properties": {"title": "Doc 1"}, "vector": {"default": [0.5, 1.0]}}
+        afters = [call.kwargs["after"] for call in mock_collection.query.fetch_objects.call_args_list]
+        assert afters == [None, UUID(int=2), UUID(int=4)]
+        assert not (tmp_path / "export" / "docs.jsonl.partial").exists()
+
+    @pytest.mark.asyncio
+    async def test_export_parquet(self, mock_env_vars, tmp_path):
+        """Test that objects are written as Parquet rows with JSON properties and a vector map."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        # Arrange
+        path = tmp_path / "docs.parquet"
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.collections.get = MagicMock(return_value=self._paged_collection(3))
+            mock_client_class.return_value = mock_client
+
+            # Act
+            result = await WeaviateService().export_collection("Docs", str(path), include_vector=True, batch_size=2)
+
+        # Assert
+        assert result["objects_exported"] == 3
+        table = pq.read_table(path)
+        assert table.column("id").to_pylist() == [str(UUID(int=i)) for i in (1, 2, 3)]
+        assert json.loads(table.column("properties")[2].as_py()) == {"title": "Doc 2"}
+        assert table.column("vector")[2].as_py() == [("default", [0.5, 2.0])]
+
+    @pytest.mark.asyncio
+    async def test_export_failure_removes_partial_file(self, mock_env_vars, tmp_path):
+        """Test that a failed export reports the error and leaves no file behind."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            mock_collection.query.fetch_objects = AsyncMock(side_effect=Exception("Collection not found"))
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+
+            # Act
+            result = await WeaviateService().export_collection("Missing", str(tmp_path / "out.jsonl"))
+            invalid = await WeaviateService().export_collection("Docs", str(tmp_path / "out.csv"))
+
+        # Assert
+        assert result == {"error": True, "message": "Collection not found"}
+        assert "Cannot infer the file format" in invalid["message"]
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_export_refuses_to_overwrite_existing_file(self, mock_env_vars, tmp_path):
+        """Test that an existing file is only replaced when overwrite is set."""
+        # Arrange
+        path = tmp_path / "docs.jsonl"
+        path.write_text("keep me\n")
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = self._paged_collection(2)
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+
+            # Act
+            refused = await WeaviateService().export_collection("Docs", str(path))
+            kept = path.read_text()
+            replaced = await WeaviateService().export_collection("Docs", str(path), overwrite=True)
+
+        # Assert
+        assert refused["error"] is True
+        assert "already exists" in refused["message"]
+        assert kept == "keep me\n"
+        assert replaced["objects_exported"] == 2
+        assert len(path.read_text().splitlines()) == 2
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestImportFile:
+    """Test cases for WeaviateService.import_file."""
+
+    @staticmethod
+    def _write_jsonl(path, count):
+        records = [
+            {"id": str(UUID(int=index + 1)), "properties": {"title": f"Doc {index}"}, "vector": {"default": [float(index)]}}
+            for index in range(count)
+        ]
+        path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+    @pytest.mark.asyncio
+    async def test_import_sends_batches_with_vectors(self, mock_env_vars, tmp_path):
+        """Test that records are sent with insert_many, with vectors, and rejected objects are reported."""
+        # Arrange
+        path = tmp_path / "docs.jsonl"
+        self._write_jsonl(path, 5)
+
+        async def insert_many(objects):
+            errors = {0: MagicMock(message="invalid property")} if objects[0].properties["title"] == "Doc 2" else {}
+            return MagicMock(errors=errors)
+
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            mock_collection.data.insert_many = AsyncMock(side_effect=insert_many)
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+
+            # Act
+            result = await WeaviateService().import_file("Docs", str(path), batch_size=2, concurrency=2)
+
+        # Assert
+        assert result["objects_imported"] == 4
+        assert result["committed_offset"] == 5
+        assert result["failed_objects"] == [{"offset": 2, "id": str(UUID(int=3)), "message": "invalid property"}]
+        assert result["error"] is True
+        assert mock_collection.data.insert_many.call_count == 3
+        first = mock_collection.data.insert_many.call_args_list[0].args[0][1]
+        assert (str(first.uuid), first.properties, first.vector) == (str(UUID(int=2)), {"title": "Doc 1"}, [1.0])
+
+    @pytest.mark.asyncio
+    async def test_import_stops_at_failed_request_and_resumes(self, mock_env_vars, tmp_path):
+        """Test that a failed request stops the import at the committed offset, from which it can resume."""
+        # Arrange
+        path = tmp_path / "docs.jsonl"
+        self._write_jsonl(path, 7)
+        sent_titles = []
+
+        async def insert_many(objects):
+            titles = [obj.properties["title"] for obj in objects]
+            if titles[0] == "Doc 2" and "Doc 2" not in sent_titles:
+                sent_titles.extend(titles)
+                raise ConnectionError("connection reset")
+            sent_titles.extend(titles)
+            return MagicMock(errors={})
+
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            mock_collection.data.insert_many = AsyncMock(side_effect=insert_many)
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+            service = WeaviateService()
+
+            # Act
+            failed = await service.import_file("Docs", str(path), batch_size=2, concurrency=1)
+            resumed = await service.import_file("Docs", str(path), batch_size=2, start_offset=failed["committed_offset"])
+
+        # Assert
+        assert failed["error"] is True
+        assert failed["committed_offset"] == 2
+        assert "Resume with start_offset=2" in failed["message"]
+        assert resumed["success"] is True
+        assert resumed["objects_imported"] == 5
+        assert resumed["committed_offset"] == 7
+        assert sent_titles[-5:] == [f"Doc {i}" for i in range(2, 7)]
+
+    @pytest.mark.asyncio
+    async def test_import_missing_file(self, mock_env_vars, tmp_path):
+        """Test that a missing file is reported without connecting."""
+        # Act
+        result = await WeaviateService().import_file("Docs", str(tmp_path / "missing.jsonl"))
+
+        # Assert
+        assert result["error"] is True
+        assert "File not found" in result["message"]
+
+
+class TestBulkFilterOperations:
+    """Test cases for WeaviateService.delete_many and update_many."""
+
+    @pytest.mark.asyncio
+    async def test_delete_many_repeats_until_nothing_matches(self, mock_env_vars):
+        """Test that deletes are repeated past the per-request limit, and a dry run only counts."""
+        # Arrange
+        filters = Filter.by_property("source_url").equal("https://example.com/")
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            mock_collection.data.delete_many = AsyncMock(
+                side_effect=[
+                    MagicMock(matches=12000, successful=10000, failed=0),
+                    MagicMock(matches=2000, successful=2000, failed=0),
+                    MagicMock(matches=0, successful=0, failed=0),
+                ]
+            )
+            mock_collection.aggregate.over_all = AsyncMock(return_value=MagicMock(total_count=12000))
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+            service = WeaviateService()
+
+            # Act
+            dry_run = await service.delete_many("Docs", filters, dry_run=True)
+            result = await service.delete_many("Docs", filters)
+
+        # Assert
+        assert dry_run == {"success": True, "dry_run": True, "matches": 12000, "deleted_count": 0}
+        assert result["deleted_count"] == 12000
+        assert result["matches"] == 12000
+        assert result["success"] is True
+        assert mock_collection.data.delete_many.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_update_many_scans_by_cursor(self, mock_env_vars):
+        """Test that matches are found page by page and patched, stopping once all matches were found."""
+        # Arrange
+        ids = [UUID(int=index + 1) for index in range(6)]
+        matching = {ids[1], ids[2]}
+        pages = {None: ids[:2], ids[1]: ids[2:4], ids[3]: ids[4:]}
+
+        async def fetch_objects(limit, return_properties, after=None, filters=None):
+            if filters is None:
+                return MagicMock(objects=[MagicMock(uuid=object_id) for object_id in pages[after]])
+            page_ids = filters.filters[1].value
+            return MagicMock(objects=[MagicMock(uuid=object_id) for object_id in page_ids if UUID(object_id) in matching])
+
+        filters = Filter.by_property("category").equal("Audio")
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            mock_collection.aggregate.over_all = AsyncMock(return_value=MagicMock(total_count=2))
+            mock_collection.query.fetch_objects = AsyncMock(side_effect=fetch_objects)
+            mock_collection.data.update = AsyncMock()
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+
+            # Act
+            result = await WeaviateService().update_many("Products", filters, {"category": "Electronics"}, batch_size=2)
+
+        # Assert
+        assert result["success"] is True
+        assert result["updated_count"] == 2
+        updated = sorted(str(call.args[0]) for call in mock_collection.data.update.call_args_list)
+        assert updated == sorted(str(object_id) for object_id in matching)
+        assert all(call.args[1] == {"category": "Electronics"} for call in mock_collection.data.update.call_args_list)
+        # The last page is never read because both matches were found in the first two pages
+        assert mock_collection.query.fetch_objects.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_get_all_objects_scans_by_cursor_past_one_page(self, mock_env_vars):
+        """Test that more matches than fit in one page are read by cursor, and a failing page fails the read."""
+        # Arrange
+        ids = [UUID(int=index + 1) for index in range(6)]
+        matching = [ids[1], ids[2], ids[5]]
+        pages = {None: ids[:2], ids[1]: ids[2:4], ids[3]: ids[4:]}
+        filters = Filter.by_property("source_url").equal("https://example.com/doc")
+
+        def objects(object_ids):
+            return MagicMock(objects=[MagicMock(uuid=object_id, properties={"n": object_id.int}) for object_id in object_ids])
+
+        async def fetch_objects(limit, return_properties, after=None, filters=None):
+            if filters is None:
+                return objects(pages[after])
+            if not hasattr(filters, "filters"):
+                return objects(matching[:limit])
+            page_ids = {UUID(object_id) for object_id in filters.filters[1].value}
+            return objects([object_id for object_id in matching if object_id in page_ids])
+
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            mock_collection.aggregate.over_all = AsyncMock(return_value=MagicMock(total_count=3))
+            mock_collection.query.fetch_objects = AsyncMock(side_effect=fetch_objects)
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+            service = WeaviateService()
+
+            # Act
+            result = await service.get_all_objects("Docs", filters, batch_size=2)
+            mock_collection.query.fetch_objects = AsyncMock(side_effect=[objects(matching[:2]), Exception("timed out")])
+            failed = await service.get_all_objects("Docs", filters, batch_size=2)
+
+        # Assert
+        assert result["count"] == 3
+        assert [obj["id"] for obj in result["objects"]] == [str(object_id) for object_id in matching]
+        assert failed == {"error": True, "message": "timed out"}
+
+
+class TestQueryCaching:
+    """Test cases for caching of search results."""
+
+    @pytest.mark.asyncio
+    async def test_search_results_cached_until_write(self, mock_env_vars):
+        """Test that repeated searches are served from the cache until the collection is written."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            hit = MagicMock(uuid=UUID(int=1), properties={"title": "Doc"}, metadata=MagicMock(distance=0.1, certainty=0.9))
+            mock_collection.query.near_text = AsyncMock(return_value=MagicMock(objects=[hit]))
+            mock_collection.query.hybrid = AsyncMock(return_value=MagicMock(objects=[]))
+            mock_collection.data.update = AsyncMock()
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+            service = WeaviateService()
+            filters = Filter.by_property("category").equal("Audio")
+
+            # Act
+            first = await service.search("Docs", "speakers", filters=filters, limit=5)
+            first["objects"].clear()
+            second = await service.search("Docs", "speakers", filters=Filter.by_property("category").equal("Audio"), limit=5)
+            await service.search("Docs", "speakers", filters=filters, limit=10)
+            await service.hybrid_search("Docs", "speakers", alpha=0.5)
+            await service.hybrid_search("Docs", "speakers", alpha=0.5)
+            await service.update_object("Docs", str(UUID(int=1)), {"title": "Changed"})
+            await service.search("Docs", "speakers", filters=filters, limit=5)
+
+        # Assert
+        assert second["count"] == 1
+        assert second["objects"][0]["title"] == "Doc"
+        # limit=5 twice before the write (one call), limit=10, and limit=5 again after the write
+        assert mock_collection.query.near_text.call_count == 3
+        assert mock_collection.query.hybrid.call_count == 1
+
+
+class TestMultiSearch:
+    """Test cases for running several searches or collections in one call."""
+
+    @staticmethod
+    def _hit(number: int) -> MagicMock:
+        return MagicMock(
+            uuid=UUID(int=number),
+            properties={"title": f"Doc {number}"},
+            metadata=MagicMock(distance=0.1, certainty=0.9, score=0.5, explain_score=""),
+        )
+
+    @pytest.mark.asyncio
+    async def test_multi_search_groups_results_and_dedups(self, mock_env_vars):
+        """Test that queries run per mode, keep their order and drop objects seen in earlier queries."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            mock_collection.query.near_text = AsyncMock(return_value=MagicMock(objects=[self._hit(1), self._hit(2)]))
+            mock_collection.query.hybrid = AsyncMock(return_value=MagicMock(objects=[self._hit(2), self._hit(3)]))
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+            service = WeaviateService()
+
+            # Act
+            result = await service.multi_search(
+                [
+                    {"collection_name": "Docs", "query_text": "speakers", "mode": "vector", "limit": 2},
+                    {"collection_name": "docs", "query_text": "headphones", "alpha": 0.3},
+                    {"collection_name": "Docs", "query_text": "amps", "mode": "keyword"},
+                ],
+                dedup=True,
+            )
+
+        # Assert
+        first, second, third = result["results"]
+        assert [obj["title"] for obj in first["objects"]] == ["Doc 1", "Doc 2"]
+        assert [obj["title"] for obj in second["objects"]] == ["Doc 3"]
+        assert third["error"] is True
+        assert "Unsupported search mode: keyword" in third["message"]
+        assert result["success"] is False
+        assert result["failed_count"] == 1
+        assert result["total_objects"] == 3
+        assert result["duplicates_removed"] == 1
+        assert mock_collection.query.hybrid.call_args.kwargs["alpha"] == 0.3
+
+    @pytest.mark.asyncio
+    async def test_federated_search_fuses_collections(self, mock_env_vars):
+        """Test that collections are searched with the same query and merged into one ranking."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            pages = MagicMock()
+            pages.query.hybrid = AsyncMock(return_value=MagicMock(objects=[self._hit(1), self._hit(2)]))
+            tickets = MagicMock()
+            tickets.query.hybrid = AsyncMock(return_value=MagicMock(objects=[self._hit(3)]))
+            broken = MagicMock()
+            broken.query.hybrid = AsyncMock(side_effect=Exception("no such property"))
+            collections = {"Pages": pages, "Tickets": tickets, "Broken": broken}
+            mock_client.collections.get = MagicMock(side_effect=collections.get)
+            mock_client_class.return_value = mock_client
+            service = WeaviateService()
+
+            # Act
+            result = await service.federated_search(["Pages", "Tickets", "Broken"], "reset password", limit=2)
+            unknown = await service.federated_search(["Pages"], "reset password", fusion="borda")
+
+        # Assert
+        assert [(obj["collection_name"], obj["title"]) for obj in result["objects"]] == [
+            ("Pages", "Doc 1"),
+            ("Tickets", "Doc 3"),
+        ]
+        assert result["objects"][0]["fused_score"] == pytest.approx(1 / 61)
+        assert result["collections_searched"] == 2
+        assert result["candidates"] == 3
+        assert result["failed_collections"] == [{"collection_name": "Broken", "message": "no such property"}]
+        assert tickets.query.hybrid.call_args.kwargs["limit"] == 2
+        assert unknown["error"] is True
+
+
+class TestSchemaCache:
+    """Test cases for caching of the collection schema."""
+
+    @pytest.mark.asyncio
+    async def test_schema_cached_until_collection_created(self, mock_env_vars):
+        """Test that the schema is fetched once and refetched after a collection is created."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            title = MagicMock()
+            title.name = "title"
+            mock_client.collections.list_all.return_value = {"Product": MagicMock(properties=[title])}
+            mock_client_class.return_value = mock_client
+            service = WeaviateService()
+
+            # Act
+            first = await service.get_schema()
+            first.clear()
+            second = await service.get_schema()
+            collection = await service.get_collection_schema("product")
+            missing = await service.get_collection_schema("Order")
+            await service.create_collection("Order", "Orders", [])
+            await service.get_schema()
+
+        # Assert
+        assert list(second) == ["Product"]
+        assert collection["name"] == "Product"
+        assert list(collection["properties"]) == ["title"]
+        assert missing["error"] is True
+        assert missing["available_collections"] == ["Product"]
+        assert mock_client.collections.list_all.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_schema_cache_disabled(self, mock_env_vars, monkeypatch):
+        """Test that a TTL of 0 fetches the schema on every lookup."""
+        # Arrange
+        monkeypatch.setenv("WEAVIATE_SCHEMA_CACHE_TTL", "0")
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.collections.list_all.return_value = {"Product": MagicMock(properties=[])}
+            mock_client_class.return_value = mock_client
+            service = WeaviateService()
+
+            # Act
+            await service.get_schema()
+            collection = await service.get_collection_schema("Product")
+
+        # Assert
+        assert collection["success"] is True
+        assert mock_client.collections.list_all.call_count == 2
+
+
+class TestDatabaseStats:
+    """Test cases for database statistics."""
+
+    @pytest.mark.asyncio
+    async def test_database_stats_counts_concurrently_and_snapshots(self, mock_env_vars):
+        """Test that collections are counted with their shards and the result can be reused as a snapshot."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.collections.list_all.return_value = {"Product": MagicMock(), "Order": MagicMock()}
+            shards = [
+                MagicMock(collection="Product", name="s1"),
+                MagicMock(collection="Product", name="s2"),
+                MagicMock(collection="Product", name="s1"),
+                MagicMock(collection="Order", name="s3"),
+            ]
+            for shard, name in zip(shards, ["s1", "s2", "s1", "s3"], strict=True):
+                shard.name = name
+            mock_client.cluster.nodes.return_value = [MagicMock(shards=shards[:2]), MagicMock(shards=shards[2:])]
+            mock_client_class.return_value = mock_client
+            service = WeaviateService()
+            counts = {"Product": 120, "Order": 7}
+
+            async def aggregate(collection_name):
+                if collection_name == "Order":
+                    return {"error": True, "message": "timeout"}
+                return {"success": True, "results": {"total_count": counts[collection_name]}}
+
+            # Act
+            with patch.object(service, "aggregate", side_effect=aggregate) as mock_aggregate:
+                fresh = await service.get_database_stats()
+                cached = await service.get_database_stats(max_age_seconds=60)
+
+        # Assert
+        assert fresh["collections"] == {
+            "Product": {"object_count": 120, "shard_count": 2},
+            "Order": {"object_count": 0, "shard_count": 1},
+        }
+        assert fresh["total_objects"] == 120
+        assert fresh["failed_collections"] == [{"collection_name": "Order", "message": "timeout"}]
+        assert fresh["cached"] is False
+        assert cached["cached"] is True
+        assert cached["collections"] == fresh["collections"]
+        assert mock_aggregate.call_count == 2
+        mock_client.cluster.nodes.assert_called_once_with(output="verbose")
+
+    @pytest.mark.asyncio
+    async def test_database_stats_reconnects_with_cached_schema(self, mock_env_vars):
+        """Test that shards are listed on a live client when the schema is served from the cache."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.collections.list_all.return_value = {"Product": MagicMock()}
+            mock_client.cluster.nodes.return_value = [MagicMock(shards=[])]
+            mock_client_class.return_value = mock_client
+            service = WeaviateService()
+            await service.get_schema()
+            await service.close()
+
+            # Act
+            with patch.object(service, "aggregate", AsyncMock(return_value={"success": True, "results": {"total_count": 3}})):
+                result = await service.get_database_stats()
+
+        # Assert
+        assert result["collections"] == {"Product": {"object_count": 3, "shard_count": 0}}
+        assert mock_client.connect.call_count == 2
+        mock_client.collections.list_all.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_database_stats_reports_shard_listing_failure(self, mock_env_vars):
+        """Test that a failed cluster nodes request is reported instead of returning unknown shard counts."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.collections.list_all.return_value = {"Product": MagicMock()}
+            mock_client.cluster.nodes.side_effect = Exception("nodes unavailable")
+            mock_client_class.return_value = mock_client
+            service = WeaviateService()
+
+            # Act
+            with patch.object(service, "aggregate", AsyncMock(return_value={"success": True, "results": {"total_count": 3}})):
+                result = await service.get_database_stats()
+
+        # Assert
+        assert result == {"error": True, "message": "Failed to get shard information: nodes unavailable"}
+        assert service._stats_snapshot is None
+
+
+class TestMultiTenancy:
+    """Test cases for tenant-scoped operations and tenant management."""
+
+    @pytest.mark.asyncio
+    async def test_operations_scoped_to_tenant(self, mock_env_vars):
+        """Test that a tenant scopes the collection handle and separates cached results."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            tenant_collections = {"acme": MagicMock(), "globex": MagicMock()}
+            for tenant_collection in tenant_collections.values():
+                tenant_collection.query.near_text = AsyncMock(return_value=MagicMock(objects=[]))
+            tenant_collections["acme"].data.delete_by_id = AsyncMock()
+            mock_collection.with_tenant = MagicMock(side_effect=tenant_collections.get)
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+            service = WeaviateService()
+
+            # Act
+            await service.search("Docs", "invoices", tenant="acme")
+            await service.search("Docs", "invoices", tenant="globex")
+            await service.search("Docs", "invoices", tenant="acme")
+            await service.delete_object("Docs", str(UUID(int=1)), tenant="acme")
+
+        # Assert
+        assert tenant_collections["acme"].query.near_text.call_count == 1
+        assert tenant_collections["globex"].query.near_text.call_count == 1
+        tenant_collections["acme"].data.delete_by_id.assert_called_once_with(str(UUID(int=1)))
+
+    @pytest.mark.asyncio
+    async def test_duplicate_lookup_scoped_to_tenant(self, mock_env_vars):
+        """Test that unique_properties look up duplicates in the tenant and fail if the lookup fails."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            tenant_collection = MagicMock()
+            tenant_collection.data.insert = AsyncMock()
+            tenant_collection.data.insert_many = AsyncMock()
+            mock_collection.with_tenant = MagicMock(return_value=tenant_collection)
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+            service = WeaviateService()
+
+            async def get_objects(collection_name, filters=None, limit=20, tenant=None, **kwargs):
+                if tenant is None:
+                    return {"error": True, "message": "has multi-tenancy enabled, but request was without tenant"}
+                return {"objects": [{"id": "existing-id"}], "count": 1}
+
+            # Act
+            with patch.object(service, "get_objects", side_effect=get_objects) as mock_get_objects:
+                inserted = await service.insert_object("Docs", {"sku": "A1"}, unique_properties=["sku"], tenant="acme")
+                failed = await service.batch_insert_objects("Docs", [{"sku": "A1"}], unique_properties=["sku"])
+
+        # Assert
+        assert inserted == {"success": True, "object_id": "existing-id"}
+        assert mock_get_objects.call_args_list[0].kwargs["tenant"] == "acme"
+        tenant_collection.data.insert.assert_not_called()
+        assert failed["error"] is True
+        assert "Duplicate lookup failed" in failed["message"]
+        mock_collection.data.insert_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tenant_management(self, mock_env_vars):
+        """Test creating, listing and offloading tenants."""
+        # Arrange
+        with patch("weaviate_mcp.services.weaviate_service.WeaviateAsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_collection = MagicMock()
+            mock_collection.tenants.create = AsyncMock()
+            mock_collection.tenants.update = AsyncMock()
+            mock_collection.tenants.get = AsyncMock(
+                return_value={
+                    "globex": Tenant(name="globex", activity_status=TenantActivityStatus.OFFLOADED),
+                    "acme": Tenant(name="acme"),
+                }
+            )
+            mock_client.collections.get = MagicMock(return_value=mock_collection)
+            mock_client_class.return_value = mock_client
+            service = WeaviateService()
+
+            # Act
+            created = await service.create_tenants("Docs", ["acme", "globex"])
+            offloaded = await service.update_tenant_status("Docs", ["globex"], "offloaded")
+            listed = await service.list_tenants("Docs")
+            invalid = await service.create_tenants("Docs", ["initech"], activity_status="offloaded")
+
+        # Assert
+        assert created["created_count"] == 2
+        assert [tenant.name for tenant in mock_collection.tenants.create.call_args.args[0]] == ["acme", "globex"]
+        assert offloaded["updated_count"] == 1
+        assert mock_collection.tenants.update.call_args.args[0][0].activity_status == TenantActivityStatus.OFFLOADED
+        assert listed["tenants"] == [
+            {"name": "acme", "activity_status": "active"},
+            {"name": "globex", "activity_status": "offloaded"},
+        ]
+        assert listed["status_counts"] == {"active": 1, "offloaded": 1}
+        assert invalid["error"] is True
@@ -16,7 +16,7 @@ class TestCollectionTools:
     """Test cases for collection management tools."""
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_weaviate_create_collection_success(
         self, mock_service_class, sample_properties
     ):
@@ -42,7 +42,7 @@ class TestCollectionTools:
         mock_service.create_collection.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_weaviate_create_collection_with_vectorizer(
         self, mock_service_class, sample_properties
     ):
@@ -78,7 +78,7 @@ class TestCollectionTools:
         assert call_args.kwargs["generative_config"] is not None
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_weaviate_create_collection_invalid_data_type(
         self, mock_service_class
     ):
@@ -107,7 +107,7 @@ class TestCollectionTools:
         assert "invalid_type" in result["message"]
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_weaviate_create_collection_unsupported_vectorizer(
         self, mock_service_class, sample_properties
     ):
@@ -130,7 +130,7 @@ class TestCollectionTools:
         assert "Unsupported vectorizer type" in result["message"]
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_weaviate_create_collection_service_error(
         self, mock_service_class, sample_properties
     ):
@@ -155,7 +155,7 @@ class TestCollectionTools:
         assert "Failed to create collection" in result["message"]
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_weaviate_create_collection_exception(
         self, mock_service_class, sample_properties
     ):
@@ -175,7 +175,7 @@ class TestCollectionTools:
         assert "Connection error" in result["message"]
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_weaviate_delete_collection_success(self, mock_service_class):
         """Test successful collection deletion."""
         # Arrange
@@ -195,7 +195,7 @@ class TestCollectionTools:
         mock_service.delete_collection.assert_called_once_with("TestCollection")
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_weaviate_delete_collection_error(self, mock_service_class):
         """Test collection deletion with error."""
         # Arrange
@@ -214,7 +214,7 @@ class TestCollectionTools:
         assert "Collection not found" in result["message"]
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_weaviate_get_schema_success(self, mock_service_class):
         """Test successful schema retrieval."""
         # Arrange
@@ -234,7 +234,7 @@ class TestCollectionTools:
         mock_service.get_schema.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_weaviate_get_schema_error(self, mock_service_class):
         """Test schema retrieval with error."""
         # Arrange
@@ -253,7 +253,7 @@ class TestCollectionTools:
         assert "Failed to retrieve schema" in result["message"]
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_weaviate_get_schema_exception(self, mock_service_class):
         """Test schema retrieval with exception."""
         # Arrange
@@ -269,7 +269,7 @@ class TestCollectionTools:
     # --- Tests for index_searchable Bug Fix ---
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_index_searchable_defaults_for_text_type(self, mock_service_class):
         """Test that index_searchable defaults to True for text types when omitted."""
         # Arrange
@@ -305,7 +305,7 @@ class TestCollectionTools:
         assert created_properties[0].indexSearchable is True
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_index_searchable_defaults_for_number_type(self, mock_service_class):
         """Test that index_searchable defaults to False for number types when omitted."""
         # Arrange
@@ -341,7 +341,7 @@ class TestCollectionTools:
         assert created_properties[0].indexSearchable is False
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_index_searchable_defaults_for_int_type(self, mock_service_class):
         """Test that index_searchable defaults to False for int types when omitted."""
         # Arrange
@@ -377,7 +377,7 @@ class TestCollectionTools:
         assert created_properties[0].indexSearchable is False
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_index_searchable_error_for_number_with_true(
         self, mock_service_class
     ):
@@ -408,7 +408,7 @@ class TestCollectionTools:
         assert "number" in result["message"]
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_index_searchable_error_for_int_with_true(self, mock_service_class):
         """Test that setting index_searchable=True on int type returns error."""
         # Arrange
@@ -437,7 +437,7 @@ class TestCollectionTools:
         assert "int" in result["message"]
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_index_searchable_error_for_boolean_with_true(
         self, mock_service_class
     ):
@@ -468,7 +468,7 @@ class TestCollectionTools:
         assert "boolean" in result["message"]
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_index_searchable_defaults_for_text_array(self, mock_service_class):
         """Test that index_searchable defaults to True for text_array types when omitted."""
         # Arrange
@@ -504,7 +504,7 @@ class TestCollectionTools:
         assert created_properties[0].indexSearchable is True
 
     @pytest.mark.asyncio
-    @patch("weaviate_mcp.tools.collection_tools.WeaviateService")
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
     async def test_mixed_properties_with_correct_index_searchable(
         self, mock_service_class
     ):
@@ -570,3 +570,54 @@ class TestCollectionTools:
 
         assert created_properties[3].name == "title"
         assert created_properties[3].indexSearchable is True  # text default
+
+
+class TestCollectionIndexOptions:
+    """Test cases for vector index, sharding and replication options of collection creation."""
+
+    @pytest.mark.asyncio
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
+    async def test_create_collection_passes_index_options(self, mock_service_class, sample_properties):
+        """Test that index, sharding and replication options reach the service as configs."""
+        # Arrange
+        mock_service = AsyncMock()
+        mock_service.create_collection.return_value = {"success": True, "message": "created"}
+        mock_service_class.return_value = mock_service
+
+        # Act
+        result = await weaviate_create_collection(
+            name="Passages",
+            description="Passages",
+            properties=sample_properties,
+            vector_index_config={"max_connections": 32, "quantizer": {"type": "sq"}},
+            sharding_config={"desired_count": 4},
+            replication_config={"factor": 3},
+        )
+
+        # Assert
+        assert result["success"] is True
+        call = mock_service.create_collection.call_args.kwargs
+        assert call["vector_index_config"].maxConnections == 32
+        assert call["sharding_config"].desiredCount == 4
+        assert call["replication_config"].factor == 3
+
+    @pytest.mark.asyncio
+    @patch("weaviate_mcp.tools.collection_tools.get_weaviate_service")
+    async def test_create_collection_rejects_invalid_index_options(self, mock_service_class, sample_properties):
+        """Test that invalid options are reported without creating the collection."""
+        # Arrange
+        mock_service = AsyncMock()
+        mock_service_class.return_value = mock_service
+
+        # Act
+        result = await weaviate_create_collection(
+            name="Passages",
+            description="Passages",
+            properties=sample_properties,
+            vector_index_config={"type": "flat", "quantizer": {"type": "pq"}},
+        )
+
+        # Assert
+        assert result["error"] is True
+        assert "flat index only supports bq" in result["message"]
+        mock_service.create_collection.assert_not_called()
@@ -0,0 +1,120 @@
+"""
+Unit tests for data management tools.
+
+Tests the MCP tool layer for bulk data operations and multi-collection search.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from weaviate_mcp.tools.data_tools import (
+    weaviate_delete_many,
+    weaviate_federated_search,
+    weaviate_multi_search,
+    weaviate_update_many,
+)
+
+
+class TestBulkDataTools:
+    """Test cases for the delete and update by filter tools."""
+
+    @pytest.mark.asyncio
+    async def test_weaviate_delete_many_builds_filter(self):
+        """Test that the filter dictionary is converted and passed to the service."""
+        with patch("weaviate_mcp.tools.data_tools.get_weaviate_service") as mock_get_service:
+            mock_service = mock_get_service.return_value
+            mock_service.delete_many = AsyncMock(return_value={"success": True, "matches": 3, "deleted_count": 3})
+
+            result = await weaviate_delete_many(
+                collection_name="Documents",
+                where_filter={"property": "source_url", "operator": "contains_any", "value": ["a", "b"]},
+                dry_run=True,
+            )
+
+            assert result["deleted_count"] == 3
+            call = mock_service.delete_many.call_args.kwargs
+            assert call["dry_run"] is True
+            assert call["filters"].target == "source_url"
+            assert call["filters"].value == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_weaviate_delete_many_requires_filter(self):
+        """Test that deleting without a filter is refused."""
+        with patch("weaviate_mcp.tools.data_tools.get_weaviate_service") as mock_get_service:
+            result = await weaviate_delete_many(collection_name="Documents", where_filter={})
+
+            assert result["error"] is True
+            assert "where_filter is required" in result["message"]
+            mock_get_service.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_weaviate_update_many_validation(self):
+        """Test that invalid filters and empty patches are rejected."""
+        invalid_operator = await weaviate_update_many(
+            collection_name="Product",
+            where_filter={"property": "category", "operator": "between", "value": 1},
+            properties={"category": "Audio"},
+        )
+        empty_patch = await weaviate_update_many(
+            collection_name="Product",
+            where_filter={"property": "category", "value": "Audio"},
+            properties={},
+        )
+
+        assert "Unsupported operator: between" in invalid_operator["message"]
+        assert empty_patch == {"error": True, "message": "properties cannot be empty"}
+
+
+class TestMultiSearchTool:
+    """Test cases for the multi-query and federated search tools."""
+
+    @pytest.mark.asyncio
+    async def test_weaviate_multi_search_converts_filters(self):
+        """Test that each query's filter is converted before the searches run."""
+        with patch("weaviate_mcp.tools.data_tools.get_weaviate_service") as mock_get_service:
+            mock_service = mock_get_service.return_value
+            mock_service.multi_search = AsyncMock(return_value={"success": True, "results": [], "total_objects": 0})
+
+            await weaviate_multi_search(
+                queries=[
+                    {"collection_name": "Docs", "query_text": "install"},
+                    {
+                        "collection_name": "Tickets",
+                        "query_text": "install fails",
+                        "where_filter": {"property": "status", "value": "open"},
+                    },
+                ],
+                concurrency=2,
+                dedup=True,
+            )
+
+            call = mock_service.multi_search.call_args.kwargs
+            assert call["concurrency"] == 2
+            assert call["dedup"] is True
+            assert call["queries"][0]["filters"] is None
+            assert call["queries"][1]["filters"].target == "status"
+            assert "where_filter" not in call["queries"][1]
+
+    @pytest.mark.asyncio
+    async def test_weaviate_multi_search_validation(self):
+        """Test that empty, oversized and incomplete query lists are rejected."""
+        with patch("weaviate_mcp.tools.data_tools.get_weaviate_service") as mock_get_service:
+            empty = await weaviate_multi_search(queries=[])
+            too_many = await weaviate_multi_search(queries=[{"collection_name": "Docs", "query_text": "q"}] * 51)
+            incomplete = await weaviate_multi_search(queries=[{"collection_name": "Docs"}])
+
+            assert empty["message"] == "queries cannot be empty"
+            assert "At most 50 queries" in too_many["message"]
+            assert incomplete["message"] == "Query 0 needs a collection_name and a query_text"
+            mock_get_service.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_weaviate_federated_search_validation(self):
+        """Test that federated search rejects empty or duplicate collection lists."""
+        with patch("weaviate_mcp.tools.data_tools.get_weaviate_service") as mock_get_service:
+            empty = await weaviate_federated_search(collection_names=[], query_text="q")
+            duplicates = await weaviate_federated_search(collection_names=["Docs", "Docs"], query_text="q")
+
+            assert empty["message"] == "collection_names cannot be empty"
+            assert duplicates["message"] == "collection_names contains duplicates"
+            mock_get_service.assert_not_called()
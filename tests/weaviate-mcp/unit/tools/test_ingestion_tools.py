@@ -8,8 +8,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from weaviate_mcp.tools.ingestion_tools import (
+    weaviate_crawl_site,
     weaviate_ingest_from_url,
     weaviate_ingest_text_content,
+    weaviate_ingest_urls,
 )
 
 
@@ -30,7 +32,7 @@ class TestIngestionTools:
         }
 
         with (
-            patch("weaviate_mcp.tools.ingestion_tools.WeaviateService"),
+            patch("weaviate_mcp.tools.ingestion_tools.get_weaviate_service"),
             patch("weaviate_mcp.tools.ingestion_tools.IngestionService") as mock_ingestion_service,
         ):
             # Setup mocks
@@ -59,6 +61,9 @@ class TestIngestionTools:
                 chunk_size=1000,  # default value
                 chunk_overlap=50,
                 max_tokens_per_chunk=400,
+                force=False,
+                near_duplicates=None,
+                near_duplicate_scope="collection",
             )
 
     @pytest.mark.asyncio
@@ -71,7 +76,7 @@ class TestIngestionTools:
         }
 
         with (
-            patch("weaviate_mcp.tools.ingestion_tools.WeaviateService"),
+            patch("weaviate_mcp.tools.ingestion_tools.get_weaviate_service"),
             patch("weaviate_mcp.tools.ingestion_tools.IngestionService") as mock_ingestion_service,
         ):
             # Setup mocks
@@ -123,7 +128,7 @@ class TestIngestionTools:
     async def test_weaviate_ingest_from_url_unexpected_error(self):
         """Test URL ingestion tool with unexpected error."""
         with (
-            patch("weaviate_mcp.tools.ingestion_tools.WeaviateService"),
+            patch("weaviate_mcp.tools.ingestion_tools.get_weaviate_service"),
             patch("weaviate_mcp.tools.ingestion_tools.IngestionService") as mock_ingestion_service,
         ):
             # Setup mocks to raise unexpected error
@@ -139,24 +144,29 @@ class TestIngestionTools:
     @pytest.mark.asyncio
     async def test_weaviate_ingest_text_content_success(self):
         """Test successful text content ingestion tool."""
-        # Mock the batch insertion result
-        mock_batch_result = {
+        # Mock the chunk sync result
+        mock_sync_result = {
             "success": True,
-            "inserted_ids": ["id1", "id2"],
-            "count": 2,
+            "inserted_ids": ["id1"],
+            "chunks_ingested": 2,
+            "chunks_inserted": 1,
+            "chunks_deleted": 3,
+            "chunks_updated": 1,
+            "chunks_unchanged": 0,
         }
 
         with (
-            patch("weaviate_mcp.tools.ingestion_tools.WeaviateService") as mock_weaviate_service,
+            patch("weaviate_mcp.tools.ingestion_tools.get_weaviate_service"),
             patch("weaviate_mcp.tools.ingestion_tools.IngestionService") as mock_ingestion_service,
         ):
             # Setup mocks
-            mock_weaviate_instance = MagicMock()
-            mock_weaviate_instance.batch_insert_objects = AsyncMock(return_value=mock_batch_result)
-            mock_weaviate_service.return_value = mock_weaviate_instance
-
             mock_ingestion_instance = MagicMock()
-            mock_ingestion_instance._create_optimal_chunks = MagicMock(return_value=["Chunk 1 content", "Chunk 2 content"])
+            mock_ingestion_instance.chunk_text = AsyncMock(return_value=["Chunk 1 content", "Chunk 2 content"])
+            mock_ingestion_instance.build_chunk_objects.return_value = [
+                {"content": "Chunk 1 content"},
+                {"content": "Chunk 2 content"},
+            ]
+            mock_ingestion_instance.sync_source_chunks = AsyncMock(return_value=mock_sync_result)
             mock_ingestion_service.return_value = mock_ingestion_instance
 
             # Call the tool
@@ -174,11 +184,19 @@ class TestIngestionTools:
             assert result["collection_name"] == "test_collection"
             assert result["source_identifier"] == "manual_input_001"
             assert result["title"] == "Test Document"
+            assert result["chunks_inserted"] == 1
+            assert result["chunks_deleted"] == 3
 
             # Verify service calls
-            mock_weaviate_instance.batch_insert_objects.assert_called_once()
-            call_args = mock_weaviate_instance.batch_insert_objects.call_args
+            mock_ingestion_instance.build_chunk_objects.assert_called_once_with(
+                "manual_input_001",
+                ["Chunk 1 content", "Chunk 2 content"],
+                {"content_type": "text/plain", "title": "Test Document"},
+            )
+            mock_ingestion_instance.sync_source_chunks.assert_called_once()
+            call_args = mock_ingestion_instance.sync_source_chunks.call_args
             assert call_args[1]["collection_name"] == "test_collection"
+            assert call_args[1]["source_url"] == "manual_input_001"
             assert len(call_args[1]["objects"]) == 2
 
     @pytest.mark.asyncio
@@ -221,12 +239,12 @@ class TestIngestionTools:
     async def test_weaviate_ingest_text_content_no_chunks_created(self):
         """Test text content ingestion when no chunks are created."""
         with (
-            patch("weaviate_mcp.tools.ingestion_tools.WeaviateService"),
+            patch("weaviate_mcp.tools.ingestion_tools.get_weaviate_service"),
             patch("weaviate_mcp.tools.ingestion_tools.IngestionService") as mock_ingestion_service,
         ):
             # Setup mocks
             mock_ingestion_instance = MagicMock()
-            mock_ingestion_instance._create_optimal_chunks = MagicMock(return_value=[])
+            mock_ingestion_instance.chunk_text = AsyncMock(return_value=[])
             mock_ingestion_service.return_value = mock_ingestion_instance
 
             # Call the tool and expect ValueError
@@ -247,16 +265,13 @@ class TestIngestionTools:
         }
 
         with (
-            patch("weaviate_mcp.tools.ingestion_tools.WeaviateService") as mock_weaviate_service,
+            patch("weaviate_mcp.tools.ingestion_tools.get_weaviate_service"),
             patch("weaviate_mcp.tools.ingestion_tools.IngestionService") as mock_ingestion_service,
         ):
             # Setup mocks
-            mock_weaviate_instance = MagicMock()
-            mock_weaviate_instance.batch_insert_objects = AsyncMock(return_value=mock_batch_result)
-            mock_weaviate_service.return_value = mock_weaviate_instance
-
             mock_ingestion_instance = MagicMock()
-            mock_ingestion_instance._create_optimal_chunks = MagicMock(return_value=["Chunk 1 content"])
+            mock_ingestion_instance.chunk_text = AsyncMock(return_value=["Chunk 1 content"])
+            mock_ingestion_instance.sync_source_chunks = AsyncMock(return_value=mock_batch_result)
             mock_ingestion_service.return_value = mock_ingestion_instance
 
             # Call the tool and expect ValueError
@@ -270,24 +285,22 @@ class TestIngestionTools:
     @pytest.mark.asyncio
     async def test_weaviate_ingest_text_content_default_title(self):
         """Test text content ingestion with default title generation."""
-        # Mock the batch insertion result
-        mock_batch_result = {
+        # Mock the chunk sync result
+        mock_sync_result = {
             "success": True,
             "inserted_ids": ["id1"],
-            "count": 1,
+            "chunks_inserted": 1,
+            "chunks_deleted": 0,
         }
 
         with (
-            patch("weaviate_mcp.tools.ingestion_tools.WeaviateService") as mock_weaviate_service,
+            patch("weaviate_mcp.tools.ingestion_tools.get_weaviate_service"),
             patch("weaviate_mcp.tools.ingestion_tools.IngestionService") as mock_ingestion_service,
         ):
             # Setup mocks
-            mock_weaviate_instance = MagicMock()
-            mock_weaviate_instance.batch_insert_objects = AsyncMock(return_value=mock_batch_result)
-            mock_weaviate_service.return_value = mock_weaviate_instance
-
             mock_ingestion_instance = MagicMock()
-            mock_ingestion_instance._create_optimal_chunks = MagicMock(return_value=["Single chunk content"])
+            mock_ingestion_instance.chunk_text = AsyncMock(return_value=["Single chunk content"])
+            mock_ingestion_instance.sync_source_chunks = AsyncMock(return_value=mock_sync_result)
             mock_ingestion_service.return_value = mock_ingestion_instance
 
             # Call the tool without title
@@ -300,7 +313,118 @@ class TestIngestionTools:
             # Verify default title is generated
             assert result["title"] == "Text Content manual_input_123"
 
-            # Verify the object has the correct title
-            call_args = mock_weaviate_instance.batch_insert_objects.call_args
-            objects = call_args[1]["objects"]
-            assert objects[0]["title"] == "Text Content manual_input_123"
+            # Verify the objects get the correct title
+            metadata = mock_ingestion_instance.build_chunk_objects.call_args[0][2]
+            assert metadata["title"] == "Text Content manual_input_123"
+
+    @pytest.mark.asyncio
+    async def test_weaviate_ingest_urls_success(self):
+        """Test multi-URL ingestion tool passes cleaned inputs to the service."""
+        mock_result = {
+            "success": True,
+            "total_urls": 2,
+            "succeeded": 2,
+            "failed": 0,
+            "chunks_ingested": 5,
+            "results": [],
+        }
+
+        with (
+            patch("weaviate_mcp.tools.ingestion_tools.get_weaviate_service"),
+            patch("weaviate_mcp.tools.ingestion_tools.IngestionService") as mock_ingestion_service,
+        ):
+            mock_ingestion_instance = MagicMock()
+            mock_ingestion_instance.ingest_urls = AsyncMock(return_value=mock_result)
+            mock_ingestion_service.return_value = mock_ingestion_instance
+
+            result = await weaviate_ingest_urls(
+                urls=[" https://example.com/a ", "", "https://example.com/b"],
+                collection_name=" test_collection ",
+                concurrency=8,
+            )
+
+            assert result == mock_result
+            mock_ingestion_instance.ingest_urls.assert_called_once_with(
+                urls=["https://example.com/a", "https://example.com/b"],
+                collection_name="test_collection",
+                max_tokens_per_chunk=500,
+                chunk_overlap=50,
+                concurrency=8,
+                per_host_limit=4,
+                force=False,
+                near_duplicates=None,
+                near_duplicate_scope="collection",
+            )
+
+    @pytest.mark.asyncio
+    async def test_weaviate_ingest_urls_validation_errors(self):
+        """Test multi-URL ingestion tool input validation."""
+        with pytest.raises(ValueError, match="At least one URL is required"):
+            await weaviate_ingest_urls(urls=["", "  "], collection_name="test_collection")
+
+        with pytest.raises(ValueError, match="Collection name cannot be empty"):
+            await weaviate_ingest_urls(urls=["https://example.com"], collection_name="")
+
+        with pytest.raises(ValueError, match="concurrency and per_host_limit must be positive"):
+            await weaviate_ingest_urls(urls=["https://example.com"], collection_name="test_collection", per_host_limit=0)
+
+        with pytest.raises(ValueError, match="Unsupported near_duplicates mode"):
+            await weaviate_ingest_urls(urls=["https://example.com"], collection_name="test_collection", near_duplicates="drop")
+
+    @pytest.mark.asyncio
+    async def test_weaviate_crawl_site_success(self):
+        """Test crawl tool passes cleaned inputs to the crawl service."""
+        mock_result = {
+            "success": True,
+            "total_urls": 3,
+            "succeeded": 3,
+            "failed": 0,
+            "chunks_ingested": 9,
+            "results": [],
+        }
+
+        with (
+            patch("weaviate_mcp.tools.ingestion_tools.get_weaviate_service"),
+            patch("weaviate_mcp.tools.ingestion_tools.IngestionService"),
+            patch("weaviate_mcp.tools.ingestion_tools.CrawlService") as mock_crawl_service,
+        ):
+            mock_crawl_instance = MagicMock()
+            mock_crawl_instance.crawl = AsyncMock(return_value=mock_result)
+            mock_crawl_service.return_value = mock_crawl_instance
+
+            result = await weaviate_crawl_site(
+                start_url=" https://docs.example.com/sitemap.xml ",
+                collection_name=" Docs ",
+                max_depth=0,
+                include_patterns=["/guides/"],
+                crawl_id="docs",
+            )
+
+            assert result == mock_result
+            call_kwargs = mock_crawl_instance.crawl.call_args.kwargs
+            assert call_kwargs["start_url"] == "https://docs.example.com/sitemap.xml"
+            assert call_kwargs["collection_name"] == "Docs"
+            assert call_kwargs["max_depth"] == 0
+            assert call_kwargs["include_patterns"] == ["/guides/"]
+            assert call_kwargs["crawl_id"] == "docs"
+
+    @pytest.mark.asyncio
+    async def test_weaviate_crawl_site_errors(self):
+        """Test crawl tool input validation and service error propagation."""
+        with pytest.raises(ValueError, match="Start URL cannot be empty"):
+            await weaviate_crawl_site(start_url=" ", collection_name="Docs")
+
+        with pytest.raises(ValueError, match="max_pages must be positive"):
+            await weaviate_crawl_site(start_url="https://example.com", collection_name="Docs", max_pages=0)
+
+        with (
+            patch("weaviate_mcp.tools.ingestion_tools.get_weaviate_service"),
+            patch("weaviate_mcp.tools.ingestion_tools.IngestionService"),
+            patch("weaviate_mcp.tools.ingestion_tools.CrawlService") as mock_crawl_service,
+        ):
+            mock_crawl_service.return_value.crawl = AsyncMock(
+                return_value={"error": True, "message": "Invalid URL pattern: missing )"}
+            )
+
+            with pytest.raises(ValueError, match="Invalid URL pattern"):
+                await weaviate_crawl_site(start_url="https://example.com", collection_name="Docs", include_patterns=["("])
@@ -0,0 +1,47 @@
+"""
+Unit tests for tenant management tools.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from weaviate_mcp.tools.tenant_tools import weaviate_create_tenants, weaviate_update_tenant_status
+
+
+class TestTenantTools:
+    """Test cases for tenant management tools."""
+
+    @pytest.mark.asyncio
+    @patch("weaviate_mcp.tools.tenant_tools.get_weaviate_service")
+    async def test_weaviate_create_tenants_success(self, mock_service_class):
+        """Test that valid tenant names are passed to the service."""
+        # Arrange
+        mock_service = AsyncMock()
+        mock_service.create_tenants.return_value = {"success": True, "created_count": 2}
+        mock_service_class.return_value = mock_service
+
+        # Act
+        result = await weaviate_create_tenants(collection_name="CustomerDocs", tenants=["acme", "globex-2"])
+
+        # Assert
+        assert result["created_count"] == 2
+        mock_service.create_tenants.assert_called_once_with(
+            collection_name="CustomerDocs", tenants=["acme", "globex-2"], activity_status="active"
+        )
+
+    @pytest.mark.asyncio
+    @patch("weaviate_mcp.tools.tenant_tools.get_weaviate_service")
+    async def test_tenant_tools_validation(self, mock_service_class):
+        """Test that empty or invalid tenant names and unknown statuses are rejected."""
+        # Act
+        empty = await weaviate_create_tenants(collection_name="CustomerDocs", tenants=[])
+        invalid_name = await weaviate_create_tenants(collection_name="CustomerDocs", tenants=["acme corp"])
+        invalid_status = await weaviate_update_tenant_status(
+            collection_name="CustomerDocs", tenants=["acme"], activity_status="frozen"
+        )
+
+        # Assert
+        assert empty["message"] == "tenants cannot be empty"
+        assert "Invalid tenant names: ['acme corp']" in invalid_name["message"]
+        assert "Unsupported tenant status: frozen" in invalid_status["message"]
+        mock_service_class.assert_not_called()
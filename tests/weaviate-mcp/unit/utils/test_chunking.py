@@ -0,0 +1,130 @@
+"""
+Unit tests for the token-aware TokenChunker.
+"""
+
+import pytest
+from weaviate_mcp.utils.chunking import TokenChunker, split_into_shards
+from weaviate_mcp.utils.tokenizer import ByteLengthEstimator
+
+
+class TestTokenChunker:
+    """Test cases for TokenChunker."""
+
+    @pytest.fixture
+    def chunker(self, byte_tokenizer):
+        """Create a TokenChunker over the offline byte-level encoding."""
+        return TokenChunker(byte_tokenizer, min_tokens=1)
+
+    def test_empty_text(self, chunker):
+        """Test chunking with empty text."""
+        assert chunker.chunk("", max_tokens=100) == []
+        assert chunker.chunk("  \n\n  ", max_tokens=100) == []
+
+    def test_invalid_max_tokens(self, chunker):
+        """Test that max_tokens must be positive."""
+        with pytest.raises(ValueError, match="max_tokens must be positive"):
+            chunker.chunk("Some text.", max_tokens=0)
+
+    def test_packs_paragraphs_that_fit(self, chunker):
+        """Test that small paragraphs are packed into a single chunk."""
+        text = "  First paragraph.\n\nSecond paragraph.  \n\n\n\nThird paragraph."
+
+        chunks = chunker.chunk(text, max_tokens=100, overlap_tokens=0)
+
+        assert chunks == ["First paragraph.\n\nSecond paragraph.\n\nThird paragraph."]
+
+    def test_splits_large_paragraph_into_sentences(self, chunker):
+        """Test that a paragraph over the limit is split at sentence boundaries."""
+        text = "First sentence. Second sentence! Third sentence? Fourth sentence."
+
+        chunks = chunker.chunk(text, max_tokens=20, overlap_tokens=0)
+
+        assert chunks == ["First sentence.", "Second sentence!", "Third sentence?", "Fourth sentence."]
+
+    def test_overlap_carries_trailing_sentences(self, chunker, byte_encoding):
+        """Test that each chunk starts with trailing sentences of the previous one."""
+        paragraphs = [f"Sentence {i} of the text." for i in range(10)]
+        text = "\n\n".join(paragraphs)
+
+        chunks = chunker.chunk(text, max_tokens=60, overlap_tokens=25)
+
+        assert len(chunks) > 1
+        for previous, chunk in zip(chunks, chunks[1:], strict=False):
+            first_sentence = chunk.split("\n\n")[0]
+            assert previous.endswith(first_sentence)
+        for chunk in chunks:
+            assert len(byte_encoding.encode(chunk)) <= 60
+
+    def test_zero_overlap(self, chunker):
+        """Test that chunks do not repeat content when overlap is disabled."""
+        paragraphs = [f"Sentence {i} of the text." for i in range(10)]
+        text = "\n\n".join(paragraphs)
+
+        chunks = chunker.chunk(text, max_tokens=60, overlap_tokens=0)
+
+        assert "\n\n".join(chunks) == text
+
+    def test_splits_long_sentence_at_word_boundaries(self, chunker, byte_encoding):
+        """Test that a sentence over the limit is split into word-aligned windows."""
+        text = " ".join(f"word{i}" for i in range(100))
+
+        chunks = chunker.chunk(text, max_tokens=50, overlap_tokens=10)
+
+        assert len(chunks) > 1
+        assert " ".join(chunks) == text
+        for chunk in chunks:
+            assert len(byte_encoding.encode(chunk)) <= 50
+
+    def test_splits_unbroken_text_on_character_boundaries(self, chunker):
+        """Test that text without whitespace is split without breaking characters."""
+        text = "é" * 100
+
+        chunks = chunker.chunk(text, max_tokens=15, overlap_tokens=0)
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == text
+
+    def test_drops_chunks_below_min_tokens(self, byte_tokenizer):
+        """Test that chunks under min_tokens are filtered out."""
+        chunker = TokenChunker(byte_tokenizer, min_tokens=10)
+        text = "A long enough first sentence.\n\nTiny."
+
+        chunks = chunker.chunk(text, max_tokens=30, overlap_tokens=0)
+
+        assert chunks == ["A long enough first sentence."]
+
+    def test_byte_length_estimator(self):
+        """Test chunking with the byte-length estimator instead of a BPE encoding."""
+        chunker = TokenChunker(ByteLengthEstimator(bytes_per_token=4), min_tokens=1)
+        text = "\n\n".join(f"Paragraph number {i} of the document." for i in range(20))
+
+        chunks = chunker.chunk(text, max_tokens=30, overlap_tokens=0)
+
+        assert len(chunks) > 1
+        assert "\n\n".join(chunks) == text
+        assert all(len(chunk.encode("utf-8")) <= 30 * 4 for chunk in chunks)
+
+
+class TestSplitIntoShards:
+    """Test cases for split_into_shards."""
+
+    def test_small_text_is_a_single_shard(self):
+        """Test that text under the shard size is not split."""
+        assert split_into_shards("One.\n\nTwo.", shard_size=100) == ["One.\n\nTwo."]
+
+    def test_shards_end_at_paragraph_breaks(self):
+        """Test that shards are cut only at paragraph breaks and keep every paragraph."""
+        paragraphs = [f"Paragraph {i} " + "x" * i for i in range(50)]
+        text = "\n\n".join(paragraphs)
+
+        shards = split_into_shards(text, shard_size=200)
+
+        assert len(shards) > 1
+        assert all(len(shard) >= 200 for shard in shards[:-1])
+        assert "\n\n".join(shards) == text
+
+    def test_text_without_paragraph_breaks(self):
+        """Test that text without paragraph breaks stays in one shard."""
+        text = "word " * 100
+
+        assert split_into_shards(text, shard_size=50) == [text]
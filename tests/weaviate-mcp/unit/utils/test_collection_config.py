@@ -0,0 +1,90 @@
+"""
+Unit tests for validation of collection configuration options.
+"""
+
+import re
+
+import pytest
+from weaviate.classes.config import VectorDistances
+from weaviate_mcp.utils.collection_config import (
+    build_multi_tenancy_config,
+    build_replication_config,
+    build_sharding_config,
+    build_vector_index_config,
+)
+
+
+class TestBuildVectorIndexConfig:
+    """Test cases for build_vector_index_config."""
+
+    def test_hnsw_with_product_quantization(self):
+        """Test that HNSW options and a PQ quantizer are passed through."""
+        config = build_vector_index_config(
+            {
+                "ef": -1,
+                "ef_construction": 256,
+                "max_connections": 64,
+                "distance": "dot",
+                "quantizer": {"type": "pq", "segments": 96, "centroids": 256},
+            }
+        )
+
+        assert (config.ef, config.efConstruction, config.maxConnections) == (-1, 256, 64)
+        assert config.distance == VectorDistances.DOT
+        assert (config.quantizer.segments, config.quantizer.centroids) == (96, 256)
+
+    def test_dynamic_applies_binary_quantization_to_both_stages(self):
+        """Test that a dynamic index gets its threshold and BQ on both the flat and hnsw stage."""
+        config = build_vector_index_config({"type": "dynamic", "threshold": 10000, "quantizer": {"type": "bq"}})
+        sq_config = build_vector_index_config({"type": "dynamic", "quantizer": {"type": "sq"}})
+
+        assert config.threshold == 10000
+        assert config.hnsw.quantizer is not None
+        assert config.flat.quantizer is not None
+        assert sq_config.hnsw.quantizer is not None
+        assert sq_config.flat.quantizer is None
+
+    @pytest.mark.parametrize(
+        ("options", "message"),
+        [
+            ({"type": "ivf"}, "Unsupported vector index type: 'ivf'"),
+            ({"ef_constructoin": 128}, "Unknown hnsw vector_index_config option(s): ef_constructoin"),
+            ({"type": "flat", "max_connections": 32}, "Unknown flat vector_index_config option(s): max_connections"),
+            ({"max_connections": 0}, "vector_index_config.max_connections must be at least 1, got 0"),
+            ({"ef": "100"}, "vector_index_config.ef must be an integer"),
+            ({"dynamic_ef_min": 500, "dynamic_ef_max": 100}, "dynamic_ef_min (500) cannot exceed dynamic_ef_max (100)"),
+            ({"distance": "euclid"}, "Unsupported distance metric: 'euclid'"),
+            ({"type": "flat", "quantizer": {"type": "pq"}}, "The flat index only supports bq quantization, not pq"),
+            ({"quantizer": {"type": "pq", "centroids": 512}}, "quantizer.centroids must be between 1 and 256, got 512"),
+            ({"quantizer": {"type": "bq", "segments": 8}}, "Unknown bq quantizer option(s): segments"),
+        ],
+    )
+    def test_invalid_options(self, options, message):
+        """Test that invalid options are rejected with a message naming them."""
+        with pytest.raises(ValueError, match=re.escape(message)):
+            build_vector_index_config(options)
+
+
+class TestBuildClusterConfigs:
+    """Test cases for the sharding, replication and multi-tenancy builders."""
+
+    def test_sharding_and_replication(self):
+        """Test sharding and replication configs and their validation."""
+        sharding = build_sharding_config({"desired_count": 4})
+        replication = build_replication_config({"factor": 3, "async_enabled": True})
+
+        assert sharding.desiredCount == 4
+        assert (replication.factor, replication.asyncEnabled) == (3, True)
+        assert build_sharding_config(None) is None
+        with pytest.raises(ValueError, match="replication_config.factor must be at least 1"):
+            build_replication_config({"factor": 0})
+        with pytest.raises(ValueError, match="replication_config.async_enabled must be true or false"):
+            build_replication_config({"async_enabled": "yes"})
+
+    def test_multi_tenancy(self):
+        """Test that multi-tenancy is enabled by default when options are given."""
+        config = build_multi_tenancy_config({"auto_tenant_creation": True})
+
+        assert (config.enabled, config.autoTenantCreation) == (True, True)
+        with pytest.raises(ValueError, match="Unknown multi_tenancy_config option"):
+            build_multi_tenancy_config({"tenants": ["acme"]})
@@ -0,0 +1,108 @@
+"""
+Unit tests for the crawl helpers.
+"""
+
+import pytest
+from weaviate_mcp.utils.crawl import (
+    UrlFilter,
+    checkpoint_path,
+    extract_html_links,
+    load_checkpoint,
+    normalize_url,
+    parse_sitemap,
+    save_checkpoint,
+)
+
+
+class TestNormalizeUrl:
+    """Test cases for normalize_url."""
+
+    def test_resolves_relative_links_and_drops_fragments(self):
+        """Test that links are made absolute and fragments removed."""
+        assert normalize_url("../guide#install", "https://Docs.Example.com/a/b/") == "https://docs.example.com/a/guide"
+        assert normalize_url("https://example.com") == "https://example.com/"
+
+    def test_rejects_uncrawlable_urls(self):
+        """Test that non-HTTP links and binary files are rejected."""
+        assert normalize_url("mailto:team@example.com") is None
+        assert normalize_url("javascript:void(0)", "https://example.com/") is None
+        assert normalize_url("/logo.png", "https://example.com/") is None
+
+
+class TestExtractHtmlLinks:
+    """Test cases for extract_html_links."""
+
+    def test_extracts_unique_links_in_order(self):
+        """Test that anchors are resolved against the page and de-duplicated."""
+        html = """
+        <nav><a href="/docs/">Docs</a></nav>
+        <a href="intro">Intro</a>
+        <a href="/docs/#top">Docs again</a>
+        <a>No href</a>
+        """
+
+        links = extract_html_links(html, "https://example.com/guide/")
+
+        assert links == ["https://example.com/docs/", "https://example.com/guide/intro"]
+
+    def test_honours_base_element(self):
+        """Test that a <base> element changes how relative links resolve."""
+        html = '<head><base href="https://cdn.example.com/v2/"></head><a href="page">Page</a>'
+
+        assert extract_html_links(html, "https://example.com/") == ["https://cdn.example.com/v2/page"]
+
+
+class TestParseSitemap:
+    """Test cases for parse_sitemap."""
+
+    def test_urlset(self):
+        """Test that page URLs are read from a urlset."""
+        xml = """<?xml version="1.0" encoding="UTF-8"?>
+        <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+            <url><loc>https://example.com/a</loc><lastmod>2024-01-01</lastmod></url>
+            <url><loc> https://example.com/b </loc></url>
+        </urlset>"""
+
+        assert parse_sitemap(xml) == (["https://example.com/a", "https://example.com/b"], [])
+
+    def test_sitemap_index(self):
+        """Test that nested sitemaps are read from a sitemap index."""
+        xml = b"""<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+            <sitemap><loc>https://example.com/sitemap-docs.xml</loc></sitemap>
+        </sitemapindex>"""
+
+        assert parse_sitemap(xml) == ([], ["https://example.com/sitemap-docs.xml"])
+
+
+class TestUrlFilter:
+    """Test cases for UrlFilter."""
+
+    def test_domains_and_patterns(self):
+        """Test that domain, include and exclude rules are all applied."""
+        url_filter = UrlFilter(["example.com"], include_patterns=[r"/docs/"], exclude_patterns=[r"/docs/archive/"])
+
+        assert url_filter.allows("https://example.com/docs/intro")
+        assert url_filter.allows("https://api.example.com/docs/intro")
+        assert not url_filter.allows("https://notexample.com/docs/intro")
+        assert not url_filter.allows("https://example.com/blog/post")
+        assert not url_filter.allows("https://example.com/docs/archive/old")
+
+    def test_invalid_pattern(self):
+        """Test that an invalid regular expression raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid URL pattern"):
+            UrlFilter(["example.com"], include_patterns=["("])
+
+
+class TestCheckpoints:
+    """Test cases for crawl checkpoints."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a saved checkpoint is loaded back unchanged."""
+        path = checkpoint_path(str(tmp_path / "crawls"), "docs/site v1")
+        state = {"completed": False, "discovered": {"https://example.com/": 0}, "pages": {}}
+
+        assert load_checkpoint(path) is None
+        save_checkpoint(path, state)
+
+        assert path.endswith("docs_site_v1.json")
+        assert load_checkpoint(path) == state
@@ -0,0 +1,117 @@
+"""
+Unit tests for the HTML extraction backends.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from weaviate_mcp.utils.html_extraction import (
+    BeautifulSoupHtmlExtractor,
+    StdlibHtmlExtractor,
+    get_html_extractor,
+    normalize_blocks,
+)
+
+PAGE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title> Test Page </title>
+    <meta name="description" content="Test description">
+    <meta name="Author" content="Test Author">
+    <style>body { color: red; }</style>
+</head>
+<body>
+    <header>Site header</header>
+    <nav><a href="/">Navigation</a></nav>
+    <div class="content">Secondary content area</div>
+    <main>
+        <h1>Main   Content</h1>
+        <p>This is the <b>first</b>
+           paragraph.</p>
+        <p>Second paragraph<br>with a line break.</p>
+        <ul><li>Item one</li><li>Item two</li></ul>
+        <script>var ignored = true;</script>
+    </main>
+    <footer>Footer</footer>
+</body>
+</html>
+"""
+
+
+@pytest.fixture(params=["stdlib", "beautifulsoup", "lxml"])
+def extractor(request):
+    """Provide each extraction backend, skipping lxml when it is not installed."""
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    return get_html_extractor(request.param)
+
+
+class TestHtmlExtractors:
+    """Behaviour shared by every extraction backend."""
+
+    def test_extracts_main_content_with_block_boundaries(self, extractor):
+        """Test that the main element is extracted with one blank line between blocks."""
+        text, metadata = extractor.extract(PAGE)
+
+        assert text == (
+            "Main Content\n\nThis is the first paragraph.\n\nSecond paragraph with a line break.\n\nItem one\n\nItem two"
+        )
+        assert metadata == {"title": "Test Page", "description": "Test description", "author": "Test Author"}
+
+    def test_falls_back_to_body(self, extractor):
+        """Test that the body is used when no main-content element exists, without boilerplate."""
+        html = "<html><body><nav>Menu</nav><p>First.</p><div>Second.</div><footer>Footer</footer></body></html>"
+
+        text, metadata = extractor.extract(html)
+
+        assert text == "First.\n\nSecond."
+        assert "title" not in metadata
+
+    def test_selector_priority(self, extractor):
+        """Test that an article is preferred over a .content element that comes first."""
+        html = '<body><div class="wrapper content">Wrapper</div><article><p>Article text.</p></article></body>'
+
+        text, _ = extractor.extract(html)
+
+        assert text == "Article text."
+
+    def test_unclosed_tags(self, extractor):
+        """Test that paragraphs without end tags are still separated."""
+        html = "<body><main><p>One<p>Two<div>Three</div></main><p>Outside</body>"
+
+        text, _ = extractor.extract(html)
+
+        assert text == "One\n\nTwo\n\nThree"
+
+
+class TestNormalizeBlocks:
+    """Test cases for normalize_blocks."""
+
+    def test_collapses_whitespace_within_blocks(self):
+        """Test that whitespace is collapsed inside blocks but blank lines separate them."""
+        assert normalize_blocks("  a \n b \n\n\n\n  c\t d \n \n ") == "a b\n\nc d"
+
+
+class TestGetHtmlExtractor:
+    """Test cases for the process-wide extractor registry."""
+
+    def test_auto_without_lxml(self):
+        """Test that "auto" falls back to the stdlib extractor when lxml is missing."""
+        with patch("weaviate_mcp.utils.html_extraction.importlib.util.find_spec", return_value=None):
+            extractor = get_html_extractor("auto")
+
+        assert isinstance(extractor, StdlibHtmlExtractor)
+
+    def test_backend_from_environment(self):
+        """Test that WEAVIATE_HTML_EXTRACTOR selects the default backend and is shared."""
+        with patch.dict("os.environ", {"WEAVIATE_HTML_EXTRACTOR": "beautifulsoup"}):
+            extractor = get_html_extractor()
+
+            assert isinstance(extractor, BeautifulSoupHtmlExtractor)
+            assert get_html_extractor() is extractor
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend name raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown HTML extractor 'missing'"):
+            get_html_extractor("missing")
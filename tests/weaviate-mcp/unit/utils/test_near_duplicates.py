@@ -0,0 +1,95 @@
+"""
+Unit tests for near-duplicate detection with MinHash signatures.
+"""
+
+import pytest
+from weaviate_mcp.utils.near_duplicates import SignatureIndex, minhash, similarity
+
+FOOTER = (
+    "Copyright 2024 Example Corporation. All rights reserved. Use of this documentation is subject "
+    "to the terms of service and the privacy policy published on our website. Example and the Example "
+    "logo are trademarks of Example Corporation registered in many jurisdictions worldwide. Page 1 of 40"
+)
+
+OTHER = "Weaviate stores objects together with their vectors and combines keyword and vector search in hybrid queries."
+
+
+def chunk(source_url: str, chunk_hash: str, text: str) -> dict:
+    return {"source_url": source_url, "chunk_hash": chunk_hash, "object_id": f"id-{chunk_hash}", "signature": minhash(text)}
+
+
+class TestMinhash:
+    """Test cases for MinHash signatures."""
+
+    def test_similar_texts_have_similar_signatures(self):
+        """Test that a small edit keeps the estimated similarity high and unrelated text scores low."""
+        signature = minhash(FOOTER)
+
+        assert similarity(signature, minhash(FOOTER.upper())) == 1.0
+        assert similarity(signature, minhash(FOOTER.replace("Page 1", "Page 17"))) >= 0.8
+        assert similarity(signature, minhash(OTHER)) < 0.2
+
+    def test_short_text_is_one_shingle(self):
+        """Test that texts with fewer words than a shingle still get a signature."""
+        assert similarity(minhash("Next page"), minhash("next  PAGE")) == 1.0
+
+
+class TestSignatureIndex:
+    """Test cases for SignatureIndex."""
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        index = SignatureIndex(str(tmp_path / "signatures.sqlite3"))
+        yield index
+        index.close()
+
+    def test_filter_matches_earlier_chunks(self, index):
+        """Test that near-duplicates match the first occurrence and only new chunks are added."""
+        chunks = [
+            chunk("https://a.example/1", "h1", FOOTER),
+            chunk("https://a.example/2", "h2", OTHER),
+            chunk("https://a.example/2", "h3", FOOTER.replace("Page 1", "Page 2")),
+        ]
+
+        matches = index.filter("docs", chunks)
+
+        assert matches[:2] == [None, None]
+        assert matches[2]["object_id"] == "id-h1"
+        assert matches[2]["source_url"] == "https://a.example/1"
+        assert len(index) == 2
+
+    def test_source_scope_only_matches_the_same_source(self, index):
+        """Test that per-source filtering ignores other sources and the collection name is normalized."""
+        index.filter("docs", [chunk("https://a.example/1", "h1", FOOTER)])
+
+        other_source = index.filter("Docs", [chunk("https://b.example/1", "h2", FOOTER)], per_source=True)
+        same_source = index.filter("Docs", [chunk("https://a.example/1", "h3", FOOTER)], per_source=True)
+
+        assert other_source == [None]
+        assert same_source[0]["object_id"] == "id-h1"
+
+    def test_chunk_does_not_match_itself(self, index):
+        """Test that re-filtering an indexed chunk does not report it as its own duplicate."""
+        index.filter("docs", [chunk("https://a.example/1", "h1", FOOTER)])
+
+        assert index.filter("docs", [chunk("https://a.example/1", "h1", FOOTER)]) == [None]
+        assert len(index) == 1
+
+    def test_remove_and_persistence(self, tmp_path):
+        """Test that signatures survive reopening the index and can be removed."""
+        path = str(tmp_path / "signatures.sqlite3")
+        index = SignatureIndex(path)
+        index.filter("docs", [chunk("https://a.example/1", "h1", FOOTER)])
+        index.close()
+
+        reopened = SignatureIndex(path)
+        try:
+            assert reopened.find("docs", minhash(FOOTER))["chunk_hash"] == "h1"
+            assert reopened.find("other", minhash(FOOTER)) is None
+
+            reopened.remove("docs", "https://a.example/1", ["h1"])
+
+            assert reopened.find("docs", minhash(FOOTER)) is None
+            assert len(reopened) == 0
+        finally:
+            reopened.close()
@@ -0,0 +1,108 @@
+"""
+Unit tests for the object file helpers.
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+from weaviate_mcp.utils.object_files import detect_file_format, open_object_writer, read_object_batches
+
+
+class TestDetectFileFormat:
+    """Test cases for detect_file_format."""
+
+    def test_infers_format_from_extension(self):
+        """Test that the format follows the extension unless given explicitly."""
+        assert detect_file_format("exports/docs.jsonl") == "jsonl"
+        assert detect_file_format("exports/docs.NDJSON") == "jsonl"
+        assert detect_file_format("exports/docs.parquet") == "parquet"
+        assert detect_file_format("exports/docs.out", "parquet") == "parquet"
+
+    def test_rejects_unknown_formats(self):
+        """Test that unknown formats and extensions raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported file format"):
+            detect_file_format("docs.jsonl", "csv")
+        with pytest.raises(ValueError, match="Cannot infer the file format"):
+            detect_file_format("docs.csv")
+
+
+class TestJsonlObjectWriter:
+    """Test cases for writing JSON lines."""
+
+    def test_writes_one_record_per_line(self, tmp_path):
+        """Test that records are appended as JSON lines with dates in ISO form."""
+        path = tmp_path / "docs.jsonl"
+        created = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+
+        writer = open_object_writer(str(path), "jsonl")
+        writer.write([{"id": "a", "properties": {"title": "Café", "created": created}, "vector": None}])
+        writer.write([{"id": "b", "properties": {}, "vector": {"default": [0.1]}}])
+        writer.close()
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert json.loads(lines[0])["properties"] == {"title": "Café", "created": "2024-05-01T12:30:00+00:00"}
+        assert json.loads(lines[1]) == {"id": "b", "properties": {}, "vector": {"default": [0.1]}}
+
+
+class TestReadObjectBatches:
+    """Test cases for read_object_batches."""
+
+    def test_jsonl_batches_from_offset(self, tmp_path):
+        """Test that JSON lines are read in batches from an offset, with flat records as properties."""
+        path = tmp_path / "docs.jsonl"
+        lines = [json.dumps({"id": f"id-{i}", "properties": {"n": i}, "vector": [float(i)]}) for i in range(4)]
+        lines.insert(2, "")
+        lines.append(json.dumps({"id": "flat", "title": "Flat", "vector": {"default": [1.0]}}))
+        path.write_text("\n".join(lines) + "\n")
+
+        batches = list(read_object_batches(str(path), "jsonl", batch_size=2, start_offset=1))
+
+        assert [[record["id"] for record in batch] for batch in batches] == [["id-1", "id-2"], ["id-3", "flat"]]
+        assert batches[0][0] == {"id": "id-1", "properties": {"n": 1}, "vector": [1.0]}
+        assert batches[1][1] == {"id": "flat", "properties": {"title": "Flat"}, "vector": {"default": [1.0]}}
+
+    def test_jsonl_invalid_line(self, tmp_path):
+        """Test that an invalid line is reported with its line number."""
+        path = tmp_path / "docs.jsonl"
+        path.write_text('{"id": "a"}\nnot json\n')
+
+        with pytest.raises(ValueError, match="line 2"):
+            list(read_object_batches(str(path), "jsonl", batch_size=10))
+
+    def test_parquet_round_trip_from_offset(self, tmp_path):
+        """Test that exported Parquet rows are read back across row groups from an offset."""
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "docs.parquet"
+        writer = open_object_writer(str(path), "parquet")
+        for start in (0, 3):
+            writer.write(
+                [
+                    {"id": f"id-{i}", "properties": {"n": i}, "vector": {"default": [0.5, float(i)]}}
+                    for i in range(start, start + 3)
+                ]
+            )
+        writer.close()
+
+        batches = list(read_object_batches(str(path), "parquet", batch_size=2, start_offset=4))
+        records = [record for batch in batches for record in batch]
+
+        assert [len(batch) for batch in batches] == [2]
+        assert records[0] == {"id": "id-4", "properties": {"n": 4}, "vector": {"default": [0.5, 4.0]}}
+        assert records[1]["id"] == "id-5"
+
+    def test_parquet_from_offset_with_uneven_row_groups(self, tmp_path):
+        """Test that every row group after the one the offset falls into is read in full."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "docs.parquet"
+        writer = open_object_writer(str(path), "parquet")
+        for start, count in ((0, 100), (100, 100), (200, 30)):
+            writer.write([{"id": f"id-{i}", "properties": {"n": i}, "vector": None} for i in range(start, start + count)])
+        writer.close()
+        assert [pq.ParquetFile(path).metadata.row_group(i).num_rows for i in range(3)] == [100, 100, 30]
+
+        batches = list(read_object_batches(str(path), "parquet", batch_size=64, start_offset=150))
+        records = [record for batch in batches for record in batch]
+
+        assert [record["id"] for record in records] == [f"id-{i}" for i in range(150, 230)]
+        assert [len(batch) for batch in batches] == [64, 16]
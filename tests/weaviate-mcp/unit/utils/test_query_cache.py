@@ -0,0 +1,70 @@
+"""
+Unit tests for the query result cache.
+"""
+
+from unittest.mock import patch
+
+from weaviate.classes.query import Filter
+from weaviate_mcp.utils.query_cache import QueryCache, filter_cache_key
+
+
+class TestQueryCache:
+    """Test cases for QueryCache."""
+
+    def test_lru_eviction_and_copies(self):
+        """Test that the least recently used entry is evicted and cached values are copied."""
+        cache = QueryCache(max_entries=2, ttl_seconds=60)
+        result = {"objects": [{"title": "A"}]}
+        cache.set("a", result)
+        cache.set("b", {"objects": []})
+
+        cache.get("a")["objects"].clear()
+        cache.set("c", {"objects": []})
+
+        assert cache.get("a") == {"objects": [{"title": "A"}]}
+        assert cache.get("b") is None
+        assert len(cache) == 2
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are not served once their TTL has passed."""
+        cache = QueryCache(max_entries=10, ttl_seconds=5)
+        with patch("weaviate_mcp.utils.query_cache.time.monotonic", side_effect=[100.0, 104.0, 106.0]):
+            cache.set("key", "value")
+            assert cache.get("key") == "value"
+            assert cache.get("key") is None
+
+    def test_invalidate_changes_keys_of_collection(self):
+        """Test that invalidating a collection changes its keys only, regardless of name casing."""
+        cache = QueryCache()
+        docs_key = cache.key("docs", "query")
+        cache.set(docs_key, "result")
+        other_key = cache.key("Other", "query")
+
+        cache.invalidate("Docs")
+
+        assert cache.key("docs", "query") != docs_key
+        assert cache.get(cache.key("Docs", "query")) is None
+        assert cache.key("Other", "query") == other_key
+
+    def test_disabled_cache(self):
+        """Test that a cache without entries or TTL stores nothing."""
+        cache = QueryCache(max_entries=0)
+        cache.set("key", "value")
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+
+class TestFilterCacheKey:
+    """Test cases for filter_cache_key."""
+
+    def test_equal_filters_have_equal_keys(self):
+        """Test that separately built but equal filters produce the same key."""
+
+        def build(value):
+            return Filter.all_of([Filter.by_property("category").equal(value), Filter.by_property("price").less_than(10)])
+
+        assert filter_cache_key(build("Audio")) == filter_cache_key(build("Audio"))
+        assert filter_cache_key(build("Audio")) != filter_cache_key(build("Video"))
+        assert filter_cache_key(None) is None
@@ -0,0 +1,47 @@
+"""
+Unit tests for rank fusion of result lists.
+"""
+
+import pytest
+from weaviate_mcp.utils.rank_fusion import fuse_ranked_lists
+
+
+def ranked(collection: str, *scores: float) -> list[dict]:
+    return [{"collection_name": collection, "id": f"{collection}-{rank}", "score": score} for rank, score in enumerate(scores)]
+
+
+class TestFuseRankedLists:
+    """Test cases for fuse_ranked_lists."""
+
+    def test_rrf_interleaves_by_rank(self):
+        """Test that reciprocal rank fusion orders by rank and breaks ties by list order."""
+        fused = fuse_ranked_lists([ranked("A", 0.9, 0.8), ranked("B", 0.2, 0.1)], method="rrf", limit=3)
+
+        assert [obj["id"] for obj in fused] == ["A-0", "B-0", "A-1"]
+        assert fused[0]["fused_score"] == pytest.approx(1 / 61)
+
+    def test_rrf_sums_objects_found_in_several_lists(self):
+        """Test that an object appearing in several lists gets their contributions summed."""
+        shared = {"collection_name": "A", "id": "x", "score": 0.1}
+        fused = fuse_ranked_lists([ranked("A", 0.9) + [shared], [shared]], method="rrf", limit=10)
+
+        assert fused[0]["id"] == "x"
+        assert fused[0]["fused_score"] == pytest.approx(1 / 62 + 1 / 61)
+        assert len(fused) == 2
+
+    def test_relative_score_normalizes_per_list(self):
+        """Test that relative score fusion keeps score gaps within each list."""
+        fused = fuse_ranked_lists(
+            [ranked("A", 10.0, 9.9, 1.0), ranked("B", 0.5, 0.1)],
+            method="relative_score",
+            limit=10,
+        )
+
+        assert [obj["id"] for obj in fused] == ["A-0", "B-0", "A-1", "B-1", "A-2"]
+        assert fused[2]["fused_score"] == pytest.approx(8.9 / 9)
+        assert fused[-1]["fused_score"] == 0.0
+
+    def test_unknown_method(self):
+        """Test that an unknown fusion method is rejected."""
+        with pytest.raises(ValueError, match="Unsupported fusion method: borda"):
+            fuse_ranked_lists([], method="borda")
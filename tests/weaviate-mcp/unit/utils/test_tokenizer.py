@@ -0,0 +1,90 @@
+"""
+Unit tests for the shared tokenizers.
+"""
+
+import base64
+from unittest.mock import MagicMock, patch
+
+import pytest
+from weaviate_mcp.utils.tokenizer import (
+    ByteLengthEstimator,
+    TiktokenTokenizer,
+    get_tokenizer,
+    register_tokenizer,
+)
+
+
+class TestTokenizers:
+    """Test cases for the tokenizer implementations."""
+
+    def test_tiktoken_token_lengths(self, byte_tokenizer):
+        """Test that token lengths add up to the UTF-8 length of the text."""
+        text = "Héllo wörld"
+
+        lengths = list(byte_tokenizer.token_lengths(text))
+
+        assert sum(lengths) == len(text.encode("utf-8"))
+        assert byte_tokenizer.count_tokens(text) == len(lengths)
+
+    def test_byte_length_estimator(self):
+        """Test that the estimator counts one token per bytes_per_token bytes."""
+        estimator = ByteLengthEstimator(bytes_per_token=4)
+
+        assert estimator.count_tokens("abcdefghij") == 3
+        assert list(estimator.token_lengths("abcdefghij")) == [4, 4, 2]
+        assert estimator.count_tokens("") == 0
+
+    def test_byte_length_estimator_invalid(self):
+        """Test that bytes_per_token must be positive."""
+        with pytest.raises(ValueError, match="bytes_per_token must be positive"):
+            ByteLengthEstimator(bytes_per_token=0)
+
+
+class TestGetTokenizer:
+    """Test cases for the process-wide tokenizer registry."""
+
+    def test_tokenizer_is_loaded_once(self):
+        """Test that a tokenizer is created on first use and then shared."""
+        factory = MagicMock(return_value=ByteLengthEstimator())
+        register_tokenizer("test_once", factory)
+
+        first = get_tokenizer("test_once")
+        second = get_tokenizer("test_once")
+
+        assert first is second
+        factory.assert_called_once()
+
+    def test_default_tokenizer_from_environment(self):
+        """Test that WEAVIATE_TOKENIZER selects the default tokenizer."""
+        with patch.dict("os.environ", {"WEAVIATE_TOKENIZER": "bytes"}):
+            tokenizer = get_tokenizer()
+
+        assert isinstance(tokenizer, ByteLengthEstimator)
+
+    def test_unknown_tokenizer(self):
+        """Test that an unknown tokenizer name raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown tokenizer 'missing'"):
+            get_tokenizer("missing")
+
+    def test_local_bpe_file(self, tmp_path):
+        """Test that the tiktoken encoding is loaded from a local BPE file without downloading."""
+        bpe_file = tmp_path / "cl100k_base.tiktoken"
+        bpe_file.write_text("".join(f"{base64.b64encode(bytes([i])).decode()} {i}\n" for i in range(256)))
+
+        with (
+            patch.dict("os.environ", {"WEAVIATE_TIKTOKEN_BPE_FILE": str(bpe_file)}),
+            patch("tiktoken.get_encoding") as mock_get_encoding,
+        ):
+            tokenizer = get_tokenizer("tiktoken")
+
+        mock_get_encoding.assert_not_called()
+        assert isinstance(tokenizer, TiktokenTokenizer)
+        assert tokenizer.count_tokens("abc") == 3
+
+    def test_missing_bpe_file(self, tmp_path):
+        """Test that a missing local BPE file raises FileNotFoundError."""
+        with (
+            patch.dict("os.environ", {"WEAVIATE_TIKTOKEN_BPE_FILE": str(tmp_path / "missing.tiktoken")}),
+            pytest.raises(FileNotFoundError),
+        ):
+            get_tokenizer("tiktoken")